@@ -10,6 +10,8 @@ import textwrap
 # https://www.elastic.co/guide/en/elasticsearch/reference/current/analysis-simple-analyzer.html
 # Standard Analyzer is used for all text fields that don't explicitly specify an analyzer
 # https://www.elastic.co/guide/en/elasticsearch/reference/current/analysis-standard-analyzer.html
+# The suggest subfields of the names are completion fields, prefix matched by the suggest endpoint of search
+# https://www.elastic.co/guide/en/elasticsearch/reference/current/search-suggesters.html#completion-suggester
 TABLE_INDEX_MAP = textwrap.dedent(
     """
     {
@@ -31,6 +33,10 @@ TABLE_INDEX_MAP = textwrap.dedent(
                     "fields": {
                         "raw": {
                             "type": "keyword"
+                        },
+                        "suggest": {
+                            "type": "completion",
+                            "analyzer": "standard"
                         }
                     }
                 },
@@ -144,6 +150,10 @@ DASHBOARD_ELASTICSEARCH_INDEX_MAPPING = textwrap.dedent(
                         "raw": {
                             "type": "keyword",
                             "normalizer": "lowercase_normalizer"
+                        },
+                        "suggest": {
+                            "type": "completion",
+                            "analyzer": "standard"
                         }
                     }
                 },
@@ -233,6 +243,10 @@ USER_INDEX_MAP = textwrap.dedent(
                     "fields": {
                         "raw": {
                             "type": "keyword"
+                        },
+                        "suggest": {
+                            "type": "completion",
+                            "analyzer": "standard"
                         }
                     }
                 },
@@ -283,6 +297,10 @@ FEATURE_INDEX_MAP = textwrap.dedent(
                     "raw": {
                         "type": "keyword",
                         "normalizer": "lowercase_normalizer"
+                    },
+                    "suggest": {
+                        "type": "completion",
+                        "analyzer": "standard"
                     }
                 }
             },
@@ -1,12 +1,18 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import logging
+import random
+import time
+from itertools import islice
+from operator import itemgetter
 from typing import (
-    Any, Callable, Dict, List, Optional, Tuple,
+    Any, Callable, Dict, Iterable, List, Optional, Tuple, Union,
 )
 
 from amundsen_gremlin.neptune_bulk_loader import api as neptune_bulk_loader_api
 from boto3.session import Session
+from gremlin_python.driver.protocol import GremlinServerError
 from gremlin_python.process.graph_traversal import (
     GraphTraversal, GraphTraversalSource, __,
 )
@@ -15,6 +21,13 @@ from pyhocon import ConfigFactory, ConfigTree
 
 from databuilder import Scoped
 
+LOGGER = logging.getLogger(__name__)
+
+# (node id, node label, node properties)
+NodeUpsert = Tuple[str, str, Dict[str, Any]]
+# (start node id, end node id, edge id, edge label, edge properties)
+EdgeUpsert = Tuple[str, str, str, str, Dict[str, Any]]
+
 
 class NeptuneSessionClient(Scoped):
     """
@@ -30,18 +43,36 @@ class NeptuneSessionClient(Scoped):
 
     WEBSOCKET_OPTIONS = 'websocket_options'
 
+    # Number of nodes or edges upserted by each traversal of upsert_nodes and upsert_edges
+    UPSERT_BATCH_SIZE = 'upsert_batch_size'
+    # Number of times a batch is retried when it fails on a concurrent modification, with an exponential backoff
+    MAX_RETRIES = 'max_retries'
+    RETRY_BACKOFF_SEC = 'retry_backoff_sec'
+
     DEFAULT_CONFIG = ConfigFactory.from_dict(
         {
             AWS_SESSION_TOKEN: None,
             WEBSOCKET_OPTIONS: {},
+            UPSERT_BATCH_SIZE: 50,
+            MAX_RETRIES: 5,
+            RETRY_BACKOFF_SEC: 0.1,
         }
     )
 
-    def __init__(self) -> None:
-        self._graph = None
+    def __init__(self, graph: Optional[GraphTraversalSource] = None) -> None:
+        """
+        :param graph: traversal source to use instead of connecting to Neptune in init, e.g. of a local Gremlin Server
+        """
+        self._graph = graph
+        self.upsert_batch_size = NeptuneSessionClient.DEFAULT_CONFIG.get_int(NeptuneSessionClient.UPSERT_BATCH_SIZE)
+        self.max_retries = NeptuneSessionClient.DEFAULT_CONFIG.get_int(NeptuneSessionClient.MAX_RETRIES)
+        self.retry_backoff_sec = NeptuneSessionClient.DEFAULT_CONFIG.get_float(NeptuneSessionClient.RETRY_BACKOFF_SEC)
 
     def init(self, conf: ConfigTree) -> None:
         conf = conf.with_fallback(NeptuneSessionClient.DEFAULT_CONFIG)
+        self.upsert_batch_size = conf.get_int(NeptuneSessionClient.UPSERT_BATCH_SIZE)
+        self.max_retries = conf.get_int(NeptuneSessionClient.MAX_RETRIES)
+        self.retry_backoff_sec = conf.get_float(NeptuneSessionClient.RETRY_BACKOFF_SEC)
 
         boto_session = Session(
             aws_access_key_id=conf.get_string(NeptuneSessionClient.AWS_ACCESS_KEY, default=None),
@@ -65,32 +96,121 @@ class NeptuneSessionClient(Scoped):
     def get_graph(self) -> GraphTraversalSource:
         return self._graph
 
-    def upsert_node(self, node_id: str, node_label: str, node_properties: Dict[str, Any]) -> None:
+    @staticmethod
+    def _add_node_upsert(
+            graph_traversal: Union[GraphTraversalSource, GraphTraversal],
+            node_id: str,
+            node_label: str,
+            node_properties: Dict[str, Any]
+    ) -> GraphTraversal:
         create_traversal = __.addV(node_label).property(T.id, node_id)
-        node_traversal = self.get_graph().V().has(T.id, node_id). \
+        node_traversal = graph_traversal.V().has(T.id, node_id). \
             fold().coalesce(__.unfold(), create_traversal)
 
-        node_traversal = NeptuneSessionClient.update_entity_properties_on_traversal(node_traversal, node_properties)
-        node_traversal.next()
+        return NeptuneSessionClient.update_entity_properties_on_traversal(node_traversal, node_properties)
 
-    def upsert_edge(
-            self,
+    @staticmethod
+    def _add_edge_upsert(
+            graph_traversal: Union[GraphTraversalSource, GraphTraversal],
             start_node_id: str,
             end_node_id: str,
             edge_id: str,
             edge_label: str,
             edge_properties: Dict[str, Any]
-    ) -> None:
+    ) -> GraphTraversal:
         create_traversal = __.V().has(
             T.id, start_node_id
         ).addE(edge_label).to(__.V().has(T.id, end_node_id)).property(T.id, edge_id)
-        edge_traversal = self.get_graph().V().has(T.id, start_node_id).outE(edge_label).has(T.id, edge_id). \
+        edge_traversal = graph_traversal.V().has(T.id, start_node_id).outE(edge_label).has(T.id, edge_id). \
             fold(). \
             coalesce(__.unfold(), create_traversal)
 
-        edge_traversal = NeptuneSessionClient.update_entity_properties_on_traversal(edge_traversal, edge_properties)
+        return NeptuneSessionClient.update_entity_properties_on_traversal(edge_traversal, edge_properties)
+
+    def upsert_node(self, node_id: str, node_label: str, node_properties: Dict[str, Any]) -> None:
+        node_traversal = NeptuneSessionClient._add_node_upsert(self.get_graph(), node_id, node_label, node_properties)
+        node_traversal.next()
+
+    def upsert_edge(
+            self,
+            start_node_id: str,
+            end_node_id: str,
+            edge_id: str,
+            edge_label: str,
+            edge_properties: Dict[str, Any]
+    ) -> None:
+        edge_traversal = NeptuneSessionClient._add_edge_upsert(
+            self.get_graph(), start_node_id, end_node_id, edge_id, edge_label, edge_properties
+        )
         edge_traversal.next()
 
+    def upsert_nodes(self, nodes: Iterable[NodeUpsert]) -> int:
+        """
+        Upserts the nodes like upsert_node, in traversals of upsert_batch_size nodes
+        :param nodes: (node id, node label, node properties) of each node
+        :return: the number of nodes upserted
+        """
+        return self._upsert_in_batches('nodes', nodes, NeptuneSessionClient._add_node_upsert, itemgetter(0))
+
+    def upsert_edges(self, edges: Iterable[EdgeUpsert]) -> int:
+        """
+        Upserts the edges like upsert_edge, in traversals of upsert_batch_size edges
+        :param edges: (start node id, end node id, edge id, edge label, edge properties) of each edge
+        :return: the number of edges upserted
+        :raises RuntimeError: if edges of a batch were not upserted because their start node does not exist, once the
+        other edges of the batch are
+        """
+        return self._upsert_in_batches('edges', edges, NeptuneSessionClient._add_edge_upsert, itemgetter(2))
+
+    def _upsert_in_batches(
+            self,
+            kind: str,
+            elements: Iterable[Tuple],
+            add_upsert: Callable[..., GraphTraversal],
+            get_id: Callable[[Tuple], str]
+    ) -> int:
+        start = time.monotonic()
+        count = 0
+        elements = iter(elements)
+        while True:
+            batch = list(islice(elements, self.upsert_batch_size))
+            if not batch:
+                break
+
+            def build_traversal() -> GraphTraversal:
+                # each upsert is a branch of its own, so that one that does not find its element (e.g. the start node
+                # of an edge) does not stop the ones after it, and gives back the id of the element it upserted
+                return self.get_graph().inject(0).union(
+                    *[add_upsert(__.start(), *element).constant(get_id(element)) for element in batch])
+
+            upserted_ids = set(self._run_with_retry(build_traversal))
+            missing_ids = [get_id(element) for element in batch if get_id(element) not in upserted_ids]
+            count += len(batch) - len(missing_ids)
+            if missing_ids:
+                raise RuntimeError(f'Could not upsert the {kind} {missing_ids} ({count} {kind} were upserted)')
+
+        elapsed = time.monotonic() - start
+        LOGGER.info(f'Upserted {count} {kind} in {elapsed:.2f}s ({count / max(elapsed, 1e-6):.0f} {kind}/sec)')
+        return count
+
+    def _run_with_retry(self, build_traversal: Callable[[], GraphTraversal]) -> List[Any]:
+        """
+        Runs the traversal, built again for each attempt, retrying when it conflicts with a concurrent write
+        :return: the results of the traversal
+        """
+        attempt = 0
+        while True:
+            try:
+                return build_traversal().toList()
+            except GremlinServerError as e:
+                if 'ConcurrentModificationException' not in str(e) or attempt == self.max_retries:
+                    raise
+                # with jitter, so that the conflicting writers don't retry at the same time
+                backoff = self.retry_backoff_sec * 2 ** attempt * random.uniform(1, 2)
+                LOGGER.info(f'Retrying in {backoff:.2f}s after a concurrent modification: {e}')
+                time.sleep(backoff)
+                attempt += 1
+
     @staticmethod
     def update_entity_properties_on_traversal(
             graph_traversal: GraphTraversal,
@@ -2,13 +2,17 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import importlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
-    Any, Dict, List, Optional,
+    Any, Callable, Deque, Dict, Iterator, List, Optional,
 )
 
-from gremlin_python.process.graph_traversal import GraphTraversalSource, __
+from gremlin_python.process.graph_traversal import (
+    GraphTraversal, GraphTraversalSource, __,
+)
 from gremlin_python.process.traversal import (
-    Order, T, TextP,
+    Order, P, T, TextP,
 )
 from pyhocon import ConfigTree
 
@@ -30,11 +34,38 @@ from databuilder.models.usage.usage_constants import (
 from databuilder.models.user import User
 from databuilder.serializers.neptune_serializer import METADATA_KEY_PROPERTY_NAME
 
+# the ids of the vertices of a page
+Page = List[str]
+
 
-def _table_search_query(graph: GraphTraversalSource, tag_filter: str) -> List[Dict]:
+def _page(traversal: GraphTraversal, page: Optional[Page]) -> GraphTraversal:
+    """
+    Restricts the traversal to the vertices of a page, looked up by id, so that only they are projected
+    """
+    if page is None:
+        return traversal
+    return traversal.hasId(*page)
+
+
+def _page_ids(vertices: GraphTraversal, after_id: Optional[str], page_size: int) -> Page:
+    """
+    :return: the ids of the next page of the vertices, the page_size smallest ids greater than after_id.  Paging by
+    id instead of by offset leaves the vertices of the previous pages out of the sort
+    """
+    if after_id is not None:
+        vertices = vertices.has(T.id, P.gt(after_id))
+    return vertices.id().order().limit(page_size).toList()
+
+
+def _table_vertices(graph: GraphTraversalSource, tag_filter: str) -> GraphTraversal:
     traversal = graph.V().hasLabel(TableMetadata.TABLE_NODE_LABEL)
     if tag_filter:
         traversal = traversal.has('published_tag', tag_filter)
+    return traversal
+
+
+def _table_search_query(graph: GraphTraversalSource, tag_filter: str, page: Optional[Page] = None) -> List[Dict]:
+    traversal = _page(_table_vertices(graph, tag_filter), page)
     traversal = traversal.project(
         'database',
         'cluster',
@@ -100,11 +131,16 @@ def _table_search_query(graph: GraphTraversalSource, tag_filter: str) -> List[Di
     return traversal.toList()
 
 
-def _user_search_query(graph: GraphTraversalSource, tag_filter: str) -> List[Dict]:
+def _user_vertices(graph: GraphTraversalSource, tag_filter: str) -> GraphTraversal:
     traversal = graph.V().hasLabel(User.USER_NODE_LABEL)
     traversal = traversal.has(User.USER_NODE_FULL_NAME)
     if tag_filter:
         traversal = traversal.where('published_tag', tag_filter)
+    return traversal
+
+
+def _user_search_query(graph: GraphTraversalSource, tag_filter: str, page: Optional[Page] = None) -> List[Dict]:
+    traversal = _page(_user_vertices(graph, tag_filter), page)
     traversal = traversal.project(
         'email',
         'first_name',
@@ -146,11 +182,16 @@ def _user_search_query(graph: GraphTraversalSource, tag_filter: str) -> List[Dic
     return traversal.toList()
 
 
-def _dashboard_search_query(graph: GraphTraversalSource, tag_filter: str) -> List[Dict]:
+def _dashboard_vertices(graph: GraphTraversalSource, tag_filter: str) -> GraphTraversal:
     traversal = graph.V().hasLabel(DashboardMetadata.DASHBOARD_NODE_LABEL)
     traversal = traversal.has('name')
     if tag_filter:
         traversal = traversal.where('published_tag', tag_filter)
+    return traversal
+
+
+def _dashboard_search_query(graph: GraphTraversalSource, tag_filter: str, page: Optional[Page] = None) -> List[Dict]:
+    traversal = _page(_dashboard_vertices(graph, tag_filter), page)
 
     traversal = traversal.project(
         'group_name',
@@ -231,13 +272,25 @@ def _dashboard_search_query(graph: GraphTraversalSource, tag_filter: str) -> Lis
 
 class NeptuneSearchDataExtractor(Extractor):
     """
-    Extractor to fetch data required to support search from Neptune's graph database
+    Extractor to fetch data required to support search from Neptune's graph database.
+
+    By default the whole catalog of the entity is fetched in a single response. With page_size set, it is fetched in
+    pages of page_size vertices instead, page_concurrency of them at a time, and streamed as the pages arrive.
+    The ids of the next page, the page_size smallest ids after the last one of the previous page, are listed by a
+    light traversal of the vertices that vertices_function gives, and the page is then projected concurrently with the
+    others by looking its vertices up by id. Each listing sorts the ids it filters, so on a graph without an ordered
+    index of the ids the listings cost O(pages x N log N) for N vertices, but over their ids only.
+    A query function configured with query_function needs to accept the page to fetch (see _page), and
+    vertices_function to give the vertices it projects if they are not those of the entity_type.
     """
     QUERY_FUNCTION_CONFIG_KEY = 'query_function'
+    VERTICES_FUNCTION_CONFIG_KEY = 'vertices_function'
     QUERY_FUNCTION_KWARGS_CONFIG_KEY = 'query_function_kwargs'
     ENTITY_TYPE_CONFIG_KEY = 'entity_type'
     JOB_PUBLISH_TAG_CONFIG_KEY = 'job_publish_tag'
     MODEL_CLASS_CONFIG_KEY = 'model_class'
+    PAGE_SIZE_CONFIG_KEY = 'page_size'
+    PAGE_CONCURRENCY_CONFIG_KEY = 'page_concurrency'
 
     DEFAULT_QUERY_BY_ENTITY = {
         'table': _table_search_query,
@@ -245,6 +298,12 @@ class NeptuneSearchDataExtractor(Extractor):
         'dashboard': _dashboard_search_query
     }
 
+    DEFAULT_VERTICES_BY_ENTITY = {
+        'table': _table_vertices,
+        'user': _user_vertices,
+        'dashboard': _dashboard_vertices
+    }
+
     def init(self, conf: ConfigTree) -> None:
         self.conf = conf
         self.entity = conf.get_string(NeptuneSearchDataExtractor.ENTITY_TYPE_CONFIG_KEY, default='table').lower()
@@ -254,7 +313,14 @@ class NeptuneSearchDataExtractor(Extractor):
         else:
             self.query_function = NeptuneSearchDataExtractor.DEFAULT_QUERY_BY_ENTITY[self.entity]
 
+        self.vertices_function: Optional[Callable[[GraphTraversalSource, str], GraphTraversal]] = conf.get(
+            NeptuneSearchDataExtractor.VERTICES_FUNCTION_CONFIG_KEY,
+            NeptuneSearchDataExtractor.DEFAULT_VERTICES_BY_ENTITY.get(self.entity)
+        )
+
         self.job_publish_tag = conf.get_string(NeptuneSearchDataExtractor.JOB_PUBLISH_TAG_CONFIG_KEY, '')
+        self.page_size = conf.get_int(NeptuneSearchDataExtractor.PAGE_SIZE_CONFIG_KEY, 0)
+        self.page_concurrency = conf.get_int(NeptuneSearchDataExtractor.PAGE_CONCURRENCY_CONFIG_KEY, 4)
         self.neptune_client = NeptuneSessionClient()
 
         neptune_client_conf = Scoped.get_scoped_conf(conf, self.neptune_client.get_scope())
@@ -281,15 +347,51 @@ class NeptuneSearchDataExtractor(Extractor):
             return None
 
     def _get_extract_iter(self) -> Any:
-        if not hasattr(self, 'results'):
-            self.results = self.query_function(self.neptune_client.get_graph(), tag_filter=self.job_publish_tag)
+        if self.page_size:
+            results: Iterator[Dict] = self._get_paged_results()
+        else:
+            if not hasattr(self, 'results'):
+                self.results = self.query_function(self.neptune_client.get_graph(), tag_filter=self.job_publish_tag)
+            results = iter(self.results)
 
-        for result in self.results:
+        for result in results:
             if hasattr(self, 'model_class'):
                 obj = self.model_class(**result)
                 yield obj
             else:
                 yield result
 
+    def _get_paged_results(self) -> Iterator[Dict]:
+        """
+        Lists the ids of the pages one after the other and fetches the pages concurrently, keeping page_concurrency
+        of them in flight, and yields their results in order until a page isn't full
+        """
+        if self.vertices_function is None:
+            raise ValueError(f'{NeptuneSearchDataExtractor.VERTICES_FUNCTION_CONFIG_KEY} is required to page '
+                             f'the {self.entity} entity')
+        graph = self.neptune_client.get_graph()
+
+        def fetch_page(page: Page) -> List[Dict]:
+            return self.query_function(graph, tag_filter=self.job_publish_tag, page=page)
+
+        with ThreadPoolExecutor(max_workers=self.page_concurrency, thread_name_prefix='neptune-page') as executor:
+            pages: Deque = deque()
+            last_id: Optional[str] = None
+            is_listed = False
+            try:
+                while True:
+                    while not is_listed and len(pages) < self.page_concurrency:
+                        page = _page_ids(self.vertices_function(graph, self.job_publish_tag), last_id, self.page_size)
+                        if page:
+                            pages.append(executor.submit(fetch_page, page))
+                            last_id = page[-1]
+                        is_listed = len(page) < self.page_size
+                    if not pages:
+                        break
+                    yield from pages.popleft().result()
+            finally:
+                for pending in pages:
+                    pending.cancel()
+
     def get_scope(self) -> str:
         return 'extractor.neptune_search_data'
@@ -1,6 +1,7 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import gzip
 import os
 
 from pyhocon import ConfigTree
@@ -11,10 +12,13 @@ from databuilder.models.elasticsearch_document import ElasticsearchDocument
 
 class FSElasticsearchJSONLoader(Loader):
     """
-    Loader class to produce Elasticsearch bulk load file to Local FileSystem
+    Loader class to produce Elasticsearch bulk load file to Local FileSystem.
+    The file has one json document per line, and is gzip compressed when its path ends with .gz
     """
     FILE_PATH_CONFIG_KEY = 'file_path'
     FILE_MODE_CONFIG_KEY = 'mode'
+    # size of the write buffer of the file, in bytes
+    BUFFER_SIZE_CONFIG_KEY = 'buffer_size'
 
     def init(self, conf: ConfigTree) -> None:
         """
@@ -25,10 +29,15 @@ class FSElasticsearchJSONLoader(Loader):
         self.conf = conf
         self.file_path = self.conf.get_string(FSElasticsearchJSONLoader.FILE_PATH_CONFIG_KEY)
         self.file_mode = self.conf.get_string(FSElasticsearchJSONLoader.FILE_MODE_CONFIG_KEY, 'w')
+        self.buffer_size = self.conf.get_int(FSElasticsearchJSONLoader.BUFFER_SIZE_CONFIG_KEY, 1024 * 1024)
 
         file_dir = self.file_path.rsplit('/', 1)[0]
         self._ensure_directory_exists(file_dir)
-        self.file_handler = open(self.file_path, self.file_mode)
+        if self.file_path.endswith('.gz'):
+            # the compressor buffers the compressed output itself
+            self.file_handler = gzip.open(self.file_path, self.file_mode.replace('t', '') + 't', encoding='utf-8')
+        else:
+            self.file_handler = open(self.file_path, self.file_mode, buffering=self.buffer_size)
 
     def _ensure_directory_exists(self, path: str) -> None:
         """
@@ -53,8 +62,8 @@ class FSElasticsearchJSONLoader(Loader):
         if not isinstance(record, ElasticsearchDocument):
             raise Exception("Record not of type 'ElasticsearchDocument'!")
 
+        # the documents are flushed to the file as the buffer fills up and on close
         self.file_handler.write(record.to_json())
-        self.file_handler.flush()
 
     def close(self) -> None:
         """
@@ -0,0 +1,66 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+from typing import (
+    Any, Dict, FrozenSet, List, Tuple,
+)
+
+from pyhocon import ConfigTree
+
+from databuilder.loader.base_loader import Loader
+from databuilder.models.graph_serializable import GraphSerializable
+from databuilder.serializers import neo4_serializer
+
+LOGGER = logging.getLogger(__name__)
+
+# (label, property keys) of the nodes
+NodeGroupKey = Tuple[str, FrozenSet[str]]
+# (start label, end label, type, property keys) of the relations
+RelationGroupKey = Tuple[str, str, str, FrozenSet[str]]
+
+
+class InMemoryNeo4jLoader(Loader):
+    """
+    Keeps the nodes and relations of the GraphSerializable records in memory, serialized as FsNeo4jCSVLoader
+    serializes them into CSV rows, for Neo4jUnwindPublisher to publish them without staging CSV files.
+    The records are grouped the way FsNeo4jCSVLoader groups them into files: nodes by label and property keys,
+    relations by start label, end label, type and property keys.
+    As all of them are held until the job publishes, it suits the jobs extracting a moderate amount of metadata,
+    such as incremental jobs.
+    """
+
+    def __init__(self) -> None:
+        self.node_groups: Dict[NodeGroupKey, List[Dict[str, Any]]] = {}
+        self.relation_groups: Dict[RelationGroupKey, List[Dict[str, Any]]] = {}
+
+    def init(self, conf: ConfigTree) -> None:
+        self.clear()
+
+    def load(self, csv_serializable: GraphSerializable) -> None:
+        node = csv_serializable.next_node()
+        while node:
+            node_dict = self._to_row(neo4_serializer.serialize_node(node))
+            self.node_groups.setdefault((node.label, frozenset(node_dict.keys())), []).append(node_dict)
+            node = csv_serializable.next_node()
+
+        relation = csv_serializable.next_relation()
+        while relation:
+            relation_dict = self._to_row(neo4_serializer.serialize_relationship(relation))
+            key = (relation.start_label, relation.end_label, relation.type, frozenset(relation_dict.keys()))
+            self.relation_groups.setdefault(key, []).append(relation_dict)
+            relation = csv_serializable.next_relation()
+
+    def _to_row(self, record_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replaces the None values by the empty strings that a CSV row read back with pandas holds,
+        so that the PRESERVE_EMPTY_PROPS behavior of the publisher applies to them
+        """
+        return {key: '' if value is None else value for key, value in record_dict.items()}
+
+    def clear(self) -> None:
+        self.node_groups = {}
+        self.relation_groups = {}
+
+    def get_scope(self) -> str:
+        return 'loader.in_memory_neo4j'
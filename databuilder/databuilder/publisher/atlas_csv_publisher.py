@@ -1,13 +1,18 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 import logging
+import re
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from os import listdir
 from os.path import isfile, join
 from typing import (
-    Any, Dict, Iterator, List, Tuple,
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple,
 )
 
 import pandas
+import requests
 from amundsen_common.utils.atlas import AtlasCommonParams, AtlasCommonTypes
 from apache_atlas.exceptions import AtlasServiceException
 from apache_atlas.model.glossary import (
@@ -41,6 +46,11 @@ class AtlasCSVPublisher(Publisher):
     ATLAS_ENTITY_CREATE_BATCH_SIZE = 'batch_size'
     # whether entity types should be registered before data is synced to Atlas
     REGISTER_ENTITY_TYPES = 'register_entity_types'
+    # number of calls made to atlas at the same time
+    ATLAS_WORKER_COUNT = 'worker_count'
+    # number of times a call failing because of the connection or of the server is retried, with an exponential backoff
+    ATLAS_MAX_RETRIES = 'max_retries'
+    ATLAS_RETRY_BACKOFF_SEC = 'retry_backoff_sec'
 
     def __init__(self) -> None:
         super().__init__()
@@ -51,6 +61,9 @@ class AtlasCSVPublisher(Publisher):
         self._config = conf
         self._atlas_client = self._config.get(AtlasCSVPublisher.ATLAS_CLIENT)
         self._register_entity_types = self._config.get_bool(AtlasCSVPublisher.REGISTER_ENTITY_TYPES, True)
+        self._worker_count = self._config.get_int(AtlasCSVPublisher.ATLAS_WORKER_COUNT, 4)
+        self._max_retries = self._config.get_int(AtlasCSVPublisher.ATLAS_MAX_RETRIES, 3)
+        self._retry_backoff_sec = self._config.get_float(AtlasCSVPublisher.ATLAS_RETRY_BACKOFF_SEC, 1)
 
         if self._register_entity_types:
             LOGGER.info('Registering Atlas Entity Types.')
@@ -94,30 +107,110 @@ class AtlasCSVPublisher(Publisher):
         for relation_file in self._relationship_files:
             self._create_relations(relation_file=relation_file)
 
+    def _status(self, error: Exception) -> Optional[int]:
+        """
+        The atlas client only gives the status of a failed call in the message of its exception
+        """
+        match = re.search(r'failed with status (\d+)', str(error)) if isinstance(error, AtlasServiceException) else None
+        return int(match.group(1)) if match else None
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """
+        Connection errors, server errors and throttling may be transient
+        """
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True
+        status = self._status(error)
+        return status is not None and (status >= 500 or status == 429)
+
+    def _is_client_error(self, error: Exception) -> bool:
+        """
+        Client errors other than throttling, e.g. a conflict with an existing entity, fail the same way when retried
+        """
+        status = self._status(error)
+        return status is not None and 400 <= status < 500 and status != 429
+
+    def _call_with_retry(self, description: str, function: Callable, *args: Any) -> Optional[Any]:
+        """
+        Calls atlas, retrying the failures that may be transient. A call failing with a client error is logged and
+        skipped, any other error is raised, including a transient one still failing on the last attempt
+        :return: result of the call, None when it was skipped
+        """
+        attempt = 0
+        while True:
+            try:
+                return function(*args)
+            except Exception as e:
+                if self._is_client_error(e):
+                    LOGGER.error(f'Fail to {description}', exc_info=True)
+                    return None
+                if attempt == self._max_retries or not self._is_retryable(e):
+                    raise
+                backoff = self._retry_backoff_sec * 2 ** attempt
+                LOGGER.info(f'Retrying to {description} in {backoff}s after: {e}')
+                time.sleep(backoff)
+                attempt += 1
+
+    def _run_concurrently(self, description: str, function: Callable, calls: Iterable[Tuple]) -> None:
+        """
+        Runs the calls to atlas on worker_count threads, each one with the retries of _call_with_retry.
+        The first error of a call is raised once all the calls are done
+        :param calls: arguments of each call
+        """
+        with ThreadPoolExecutor(max_workers=self._worker_count, thread_name_prefix='atlas-publisher') as executor:
+            for future in [executor.submit(self._call_with_retry, description, function, *args) for args in calls]:
+                future.result()
+
     def _update_entities(self, entities_to_update: List[AtlasEntity]) -> None:
         """
-        Go over the entities list , create atlas relationships instances and sync them with atlas
+        Go over the entities list, fetch the existing entities in chunks of each type and update them in bulk
         :param entities_to_update:
         :return:
         """
+        entities_by_type: Dict[str, List[AtlasEntity]] = defaultdict(list)
         for entity_to_update in entities_to_update:
-            existing_entity = self._atlas_client.entity.get_entity_by_attribute(
-                entity_to_update.attributes[AtlasCommonParams.type_name],
-                [(AtlasCommonParams.qualified_name, entity_to_update.attributes[AtlasCommonParams.qualified_name])],
-            )
-            existing_entity.entity.attributes.update(entity_to_update.attributes)
-            try:
-                self._atlas_client.entity.update_entity(existing_entity)
-            except AtlasServiceException:
-                LOGGER.error('Fail to update entity', exc_info=True)
+            entities_by_type[entity_to_update.attributes[AtlasCommonParams.type_name]].append(entity_to_update)
+
+        self._run_concurrently('update entities', self._update_entity_chunk, (
+            (type_name, entity_chunk)
+            for type_name, entities in entities_by_type.items()
+            for entity_chunk in self._chunks(entities)
+        ))
+
+    def _update_entity_chunk(self, type_name: str, entity_chunk: List[AtlasEntity]) -> None:
+        LOGGER.info(f'Updating chunk of {len(entity_chunk)} {type_name} entities in atlas')
+        existing_entities = self._atlas_client.entity.get_entities_by_attribute(type_name, [
+            {AtlasCommonParams.qualified_name: entity.attributes[AtlasCommonParams.qualified_name]}
+            for entity in entity_chunk
+        ])
+        existing_entities_by_qn = {
+            existing_entity.attributes.get(AtlasCommonParams.qualified_name): existing_entity
+            for existing_entity in existing_entities.entities or []
+        }
+
+        updated_entities = []
+        for entity_to_update in entity_chunk:
+            qualified_name = entity_to_update.attributes[AtlasCommonParams.qualified_name]
+            existing_entity = existing_entities_by_qn.get(qualified_name)
+            if existing_entity is None:
+                LOGGER.warning(f'Entity {qualified_name} to update does not exist')
+                continue
+            existing_entity.attributes.update(entity_to_update.attributes)
+            updated_entities.append(existing_entity)
+
+        if updated_entities:
+            chunk = AtlasEntitiesWithExtInfo()
+            chunk.entities = updated_entities
+            self._atlas_client.entity.create_entities(chunk)
 
     def _create_relations(self, relation_file: str) -> None:
         """
-        Go over the relation file, create atlas relationships instances and sync them with atlas
+        Go over the relation file, create atlas relationships instances and sync them with atlas.
+        Atlas has no bulk api for relationships, so they are created concurrently instead.
         :param relation_file:
         :return:
         """
-
+        relations = []
         with open(relation_file, encoding='utf8') as relation_csv:
             for relation_record in pandas.read_csv(relation_csv, na_filter=False).to_dict(orient='records'):
                 if relation_record[AtlasSerializedRelationshipFields.relation_type] == AtlasRelationshipTypes.tag:
@@ -127,13 +220,11 @@ class AtlasCSVPublisher(Publisher):
                     self._assign_classification(relation_record)
                     continue
 
-                relation = self._create_relation(relation_record)
-                try:
-                    self._atlas_client.relationship.create_relationship(relation)
-                except AtlasServiceException:
-                    LOGGER.error('Fail to create atlas relationship', exc_info=True)
-                except Exception as e:
-                    LOGGER.error(e)
+                relations.append(self._create_relation(relation_record))
+
+        LOGGER.info(f'Syncing {len(relations)} relationships with atlas')
+        self._run_concurrently('create atlas relationship', self._atlas_client.relationship.create_relationship,
+                               ((relation,) for relation in relations))
 
     def _render_unique_attributes(self, entity_type: str, qualified_name: str) -> Dict[Any, Any]:
         """
@@ -242,19 +333,18 @@ class AtlasCSVPublisher(Publisher):
 
     def _sync_entities_to_atlas(self, entities: List[AtlasEntity]) -> None:
         """
-        Sync entities instances with atlas
+        Sync entities instances with atlas, a chunk per call
         :param entities: list of entities
         :return:
         """
-        entities_chunks = self._chunks(entities)
-        for entity_chunk in entities_chunks:
-            LOGGER.info(f'Syncing chunk of {len(entity_chunk)} entities with atlas')
-            chunk = AtlasEntitiesWithExtInfo()
-            chunk.entities = entity_chunk
-            try:
-                self._atlas_client.entity.create_entities(chunk)
-            except AtlasServiceException:
-                LOGGER.error('Error during entity syncing', exc_info=True)
+        self._run_concurrently('sync entities', self._sync_entity_chunk,
+                               ((entity_chunk,) for entity_chunk in self._chunks(entities)))
+
+    def _sync_entity_chunk(self, entity_chunk: List[AtlasEntity]) -> None:
+        LOGGER.info(f'Syncing chunk of {len(entity_chunk)} entities with atlas')
+        chunk = AtlasEntitiesWithExtInfo()
+        chunk.entities = entity_chunk
+        self._atlas_client.entity.create_entities(chunk)
 
     def _create_glossary_terms(self, glossary_terms: List[Dict]) -> None:
         for glossary_term_spec in glossary_terms:
@@ -1,15 +1,19 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import gzip
 import json
 import logging
-from typing import List
+from typing import (
+    Iterator, List, Optional,
+)
 
 from amundsen_common.models.index_map import TABLE_INDEX_MAP
 from elasticsearch.exceptions import NotFoundError
 from pyhocon import ConfigTree
 
 from databuilder.publisher.base_publisher import Publisher
+from databuilder.utils.elasticsearch_bulk import BulkIndexer, BulkLines
 
 LOGGER = logging.getLogger(__name__)
 
@@ -23,7 +27,8 @@ LOGGER = logging.getLogger(__name__)
 
 class ElasticsearchPublisher(Publisher):
     """
-    Elasticsearch Publisher uses Bulk API to load data from JSON file.
+    Elasticsearch Publisher uses Bulk API to load data from JSON file, gzip compressed when its path ends with .gz.
+    The file is streamed line by line into the bulk requests.
     A new index is created and data is uploaded into it. After the upload
     is complete, index alias is swapped to point to new index from old index
     and traffic is routed to new index.
@@ -41,6 +46,8 @@ class ElasticsearchPublisher(Publisher):
 
     # config to control how many max documents to publish at a time
     ELASTICSEARCH_PUBLISHER_BATCH_SIZE = 'batch_size'
+    # config to control the max size in bytes of a bulk request
+    ELASTICSEARCH_MAX_CHUNK_BYTES = 'max_chunk_bytes'
 
     DEFAULT_ELASTICSEARCH_INDEX_MAPPING = TABLE_INDEX_MAP
 
@@ -62,7 +69,15 @@ class ElasticsearchPublisher(Publisher):
                                                    ElasticsearchPublisher.DEFAULT_ELASTICSEARCH_INDEX_MAPPING)
         self.elasticsearch_batch_size = self.conf.get(ElasticsearchPublisher.ELASTICSEARCH_PUBLISHER_BATCH_SIZE,
                                                       10000)
-        self.file_handler = open(self.file_path, self.file_mode)
+        self.elasticsearch_max_chunk_bytes = self.conf.get_int(ElasticsearchPublisher.ELASTICSEARCH_MAX_CHUNK_BYTES,
+                                                               10 * 1024 * 1024)
+        if self.file_path.endswith('.gz'):
+            self.file_handler = gzip.open(self.file_path, self.file_mode.replace('t', '') + 't', encoding='utf-8')
+        else:
+            self.file_handler = open(self.file_path, self.file_mode)
+
+        # the resource type is appended as is to the serialized documents
+        self._resource_type_suffix = f',"resource_type":{json.dumps(self.elasticsearch_type)}}}'
 
     def _fetch_old_index(self) -> List[str]:
         """
@@ -78,6 +93,31 @@ class ElasticsearchPublisher(Publisher):
             # return empty list on exception
             return []
 
+    def _to_source_line(self, line: str) -> Optional[str]:
+        """
+        Adds the resource type to a document of the file, without parsing it unless it already has one
+        :return: the source line of the document in the bulk request, None for blank lines
+        """
+        line = line.strip()
+        if not line:
+            return None
+        if line.endswith('}') and line != '{}' and '"resource_type"' not in line:
+            return line[:-1] + self._resource_type_suffix
+
+        document = json.loads(line)
+        document['resource_type'] = self.elasticsearch_type
+        return json.dumps(document)
+
+    def _generate_bulk_lines(self, first_line: str, lines: Iterator[str]) -> Iterator[BulkLines]:
+        # Bulk load JSON format is defined here:
+        # https://www.elastic.co/guide/en/elasticsearch/reference/6.2/docs-bulk.html
+        action_line = json.dumps({'index': {'_index': self.elasticsearch_new_index}})
+        yield action_line, first_line
+        for line in lines:
+            source_line = self._to_source_line(line)
+            if source_line is not None:
+                yield action_line, source_line
+
     def publish_impl(self) -> None:
         """
         Use Elasticsearch Bulk API to load data from file to a {new_index}.
@@ -88,37 +128,21 @@ class ElasticsearchPublisher(Publisher):
         LOGGER.warn('ElasticsearchPublisher is being deprecated in favor of using SearchMetadatatoElasticasearchTask\
             which publishes ES metadata with mappings compatible with amundsensearch >= 4.0.0')
 
-        actions = [json.loads(line) for line in self.file_handler.readlines()]
+        lines = iter(self.file_handler)
+        first_line = next(filter(None, map(self._to_source_line, lines)), None)
         # ensure new data exists
-        if not actions:
+        if first_line is None:
             LOGGER.warning("received no data to upload to Elasticsearch!")
             return
 
-        # Convert object to json for elasticsearch bulk upload
-        # Bulk load JSON format is defined here:
-        # https://www.elastic.co/guide/en/elasticsearch/reference/6.2/docs-bulk.html
-        bulk_actions = []
-        cnt = 0
-
         # create new index with mapping
         self.elasticsearch_client.indices.create(index=self.elasticsearch_new_index, body=self.elasticsearch_mapping)
 
-        for action in actions:
-            index_row = dict(index=dict(_index=self.elasticsearch_new_index))
-            action['resource_type'] = self.elasticsearch_type
-
-            bulk_actions.append(index_row)
-            bulk_actions.append(action)
-            cnt += 1
-            if cnt == self.elasticsearch_batch_size:
-                self.elasticsearch_client.bulk(bulk_actions)
-                LOGGER.info('Publish %i of records to ES', cnt)
-                cnt = 0
-                bulk_actions = []
-
-        # Do the final bulk actions
-        if bulk_actions:
-            self.elasticsearch_client.bulk(bulk_actions)
+        indexer = BulkIndexer(self.elasticsearch_client,
+                              chunk_size=self.elasticsearch_batch_size,
+                              max_chunk_bytes=self.elasticsearch_max_chunk_bytes)
+        stats = indexer.index(self._generate_bulk_lines(first_line, lines))
+        LOGGER.info(f'Bulk indexing to ES completed: {stats}')
 
         # fetch indices that have {elasticsearch_alias} as alias
         elasticsearch_old_indices = self._fetch_old_index()
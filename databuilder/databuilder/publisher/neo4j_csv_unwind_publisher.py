@@ -69,13 +69,23 @@ class Neo4jCsvUnwindPublisher(Publisher):
     def init(self, conf: ConfigTree) -> None:
         conf = conf.with_fallback(DEFAULT_CONFIG)
 
-        self._count: int = 0
         self._node_files = list_files(conf, PublisherConfigs.NODE_FILES_DIR)
         self._node_files_iter = iter(self._node_files)
 
         self._relation_files = list_files(conf, PublisherConfigs.RELATION_FILES_DIR)
         self._relation_files_iter = iter(self._relation_files)
 
+        self._init_neo4j(conf)
+
+        LOGGER.info('Publishing Node csv files %s, and Relation CSV files %s',
+                    self._node_files,
+                    self._relation_files)
+
+    def _init_neo4j(self, conf: ConfigTree) -> None:
+        """
+        Connects to Neo4j and reads the configs of the merge statements
+        """
+        self._count: int = 0
         self._driver = self._driver_init(conf)
         self._db_name = conf.get_string(Neo4jCsvPublisherConfigs.NEO4J_DATABASE_NAME)
         self._transaction_size = conf.get_int(Neo4jCsvPublisherConfigs.NEO4J_TRANSACTION_SIZE)
@@ -96,10 +106,6 @@ class Neo4jCsvUnwindPublisher(Publisher):
         if self._add_publisher_metadata and not self._publish_tag:
             raise Exception(f'{PublisherConfigs.JOB_PUBLISH_TAG} should not be empty')
 
-        LOGGER.info('Publishing Node csv files %s, and Relation CSV files %s',
-                    self._node_files,
-                    self._relation_files)
-
     def _driver_init(self, conf: ConfigTree) -> Neo4jDriver:
         uri = conf.get_string(Neo4jCsvPublisherConfigs.NEO4J_END_POINT_KEY)
         driver_args = {
@@ -0,0 +1,62 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import time
+
+from pyhocon import ConfigTree
+
+from databuilder.loader.in_memory_neo4j_loader import InMemoryNeo4jLoader
+from databuilder.models.graph_serializable import RELATION_REVERSE_TYPE
+from databuilder.publisher.neo4j_csv_unwind_publisher import DEFAULT_CONFIG, Neo4jCsvUnwindPublisher
+from databuilder.utils.publisher_utils import create_neo4j_label_key_constraints
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Neo4jUnwindPublisher(Neo4jCsvUnwindPublisher):
+    """
+    Publishes to Neo4j the nodes and relations kept in memory by the InMemoryNeo4jLoader of the job,
+    instead of reading them back from the CSV files of FsNeo4jCSVLoader.
+
+    It takes the same configs as Neo4jCsvUnwindPublisher except for the node and relation folders, and merges
+    each group of nodes or relations with the same UNWIND statements, publisher metadata and create only nodes.
+    All the nodes are written before the relations, so that the nodes a relation links are merged when it is.
+    """
+
+    def __init__(self, loader: InMemoryNeo4jLoader) -> None:
+        super().__init__()
+        self._loader = loader
+
+    def init(self, conf: ConfigTree) -> None:
+        self._init_neo4j(conf.with_fallback(DEFAULT_CONFIG))
+
+    def publish_impl(self) -> None:
+        """
+        Publishes Nodes first and then Relations, one group at a time
+        """
+        start = time.time()
+
+        self._labels = create_neo4j_label_key_constraints((label for label, _ in self._loader.node_groups),
+                                                          self._labels, self._driver, self._db_name)
+
+        LOGGER.info('Publishing %i groups of nodes', len(self._loader.node_groups))
+        for (node_label, node_keys), node_records in self._loader.node_groups.items():
+            merge_stmt = self._create_node_merge_statement(node_keys=list(node_keys), node_label=node_label)
+            self._write_transactions(merge_stmt, node_records)
+
+        LOGGER.info('Publishing %i groups of relations', len(self._loader.relation_groups))
+        for (start_label, end_label, relation_type, rel_keys), rel_records in self._loader.relation_groups.items():
+            merge_stmt = self._create_relationship_merge_statement(
+                rel_keys=list(rel_keys),
+                start_label=start_label,
+                end_label=end_label,
+                relation_type=relation_type,
+                relation_reverse_type=rel_records[0][RELATION_REVERSE_TYPE]
+            )
+            self._write_transactions(merge_stmt, rel_records)
+
+        self._loader.clear()
+
+        LOGGER.info('Committed total %i statements', self._count)
+        LOGGER.info('Successfully published. Elapsed: %i seconds', time.time() - start)
@@ -2,16 +2,23 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import datetime
+import gzip
 import logging
 import os
+import shutil
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from os import listdir
 from os.path import isfile, join
-from typing import List, Tuple
+from typing import (
+    IO, Iterator, List, Tuple,
+)
 
 from amundsen_gremlin.neptune_bulk_loader.api import NeptuneBulkLoaderApi, NeptuneBulkLoaderLoadStatusErrorLogEntry
+from boto3.s3.transfer import TransferConfig
 from boto3.session import Session
-from pyhocon import ConfigTree
+from pyhocon import ConfigFactory, ConfigTree
 
 from databuilder.publisher.base_publisher import Publisher
 
@@ -51,13 +58,45 @@ class NeptuneCSVPublisher(Publisher):
     AWS_SESSION_TOKEN = 'aws_session_token'
     AWS_IAM_ROLE_NAME = 'aws_iam_role_name'
     AWS_STS_ENDPOINT_URL = 'aws_sts_endpoint_url'
+    # S3 compatible endpoint to upload files to instead of AWS, e.g. a local stand-in to measure the uploads
+    AWS_S3_ENDPOINT_URL = 'aws_s3_endpoint_url'
     FAIL_ON_ERROR = "fail_on_error"
+    # Seconds before the first poll of the load status, growing by STATUS_POLLING_BACKOFF_FACTOR after each poll
+    # up to MAX_STATUS_POLLING_PERIOD, so that short loads are noticed quickly and long ones polled sparingly
     STATUS_POLLING_PERIOD = "status_polling_period"
+    MAX_STATUS_POLLING_PERIOD = "max_status_polling_period"
+    STATUS_POLLING_BACKOFF_FACTOR = "status_polling_backoff_factor"
+
+    # --- UPLOAD CONFIGURATION ---
+    # Whether the files are gzipped before being uploaded, which the bulk loader reads as is
+    COMPRESS_FILES = 'compress_files'
+    # Files larger than this are split into parts of at most this size, each with the header of the file,
+    # so that the bulk loader can read them in parallel
+    MAX_FILE_PART_BYTES = 'max_file_part_bytes'
+    # Number of files or parts uploaded concurrently
+    UPLOAD_CONCURRENCY = 'upload_concurrency'
+    # Size of the parts of the multipart uploads, and size above which an upload is done in parts
+    MULTIPART_CHUNK_BYTES = 'multipart_chunk_bytes'
+    # Number of threads uploading the parts of a single multipart upload
+    MULTIPART_CONCURRENCY = 'multipart_concurrency'
+
+    DEFAULT_CONFIG = ConfigFactory.from_dict({
+        FAIL_ON_ERROR: False,
+        STATUS_POLLING_PERIOD: 1,
+        MAX_STATUS_POLLING_PERIOD: 30,
+        STATUS_POLLING_BACKOFF_FACTOR: 1.5,
+        COMPRESS_FILES: True,
+        MAX_FILE_PART_BYTES: 256 * 1024 * 1024,
+        UPLOAD_CONCURRENCY: 4,
+        MULTIPART_CHUNK_BYTES: 16 * 1024 * 1024,
+        MULTIPART_CONCURRENCY: 4,
+    })
 
     def __init__(self) -> None:
         super(NeptuneCSVPublisher, self).__init__()
 
     def init(self, conf: ConfigTree) -> None:
+        conf = conf.with_fallback(NeptuneCSVPublisher.DEFAULT_CONFIG)
         self._boto_session = Session(
             aws_access_key_id=conf.get_string(NeptuneCSVPublisher.AWS_ACCESS_KEY, default=None),
             aws_secret_access_key=conf.get_string(NeptuneCSVPublisher.AWS_SECRET_ACCESS_KEY, default=None),
@@ -84,8 +123,23 @@ class NeptuneCSVPublisher(Publisher):
             sts_endpoint=conf.get_string(NeptuneCSVPublisher.AWS_STS_ENDPOINT_URL, default=None),
         )
         self.base_amundsen_data_path = conf.get_string(NeptuneCSVPublisher.AWS_BASE_S3_DATA_PATH)
-        self.fail_on_error = conf.get_bool(NeptuneCSVPublisher.FAIL_ON_ERROR, default=False)
-        self.status_polling_period = conf.get_int(NeptuneCSVPublisher.STATUS_POLLING_PERIOD, default=5)
+        self.fail_on_error = conf.get_bool(NeptuneCSVPublisher.FAIL_ON_ERROR)
+        self.status_polling_period = conf.get_float(NeptuneCSVPublisher.STATUS_POLLING_PERIOD)
+        self.max_status_polling_period = conf.get_float(NeptuneCSVPublisher.MAX_STATUS_POLLING_PERIOD)
+        self.status_polling_backoff_factor = conf.get_float(NeptuneCSVPublisher.STATUS_POLLING_BACKOFF_FACTOR)
+
+        self.compress_files = conf.get_bool(NeptuneCSVPublisher.COMPRESS_FILES)
+        self.max_file_part_bytes = conf.get_int(NeptuneCSVPublisher.MAX_FILE_PART_BYTES)
+        self.upload_concurrency = conf.get_int(NeptuneCSVPublisher.UPLOAD_CONCURRENCY)
+        multipart_chunk_bytes = conf.get_int(NeptuneCSVPublisher.MULTIPART_CHUNK_BYTES)
+        self._s3_client = self._boto_session.client(
+            's3', endpoint_url=conf.get_string(NeptuneCSVPublisher.AWS_S3_ENDPOINT_URL, default=None)
+        )
+        self._s3_transfer_config = TransferConfig(
+            multipart_threshold=multipart_chunk_bytes,
+            multipart_chunksize=multipart_chunk_bytes,
+            max_concurrency=conf.get_int(NeptuneCSVPublisher.MULTIPART_CONCURRENCY),
+        )
 
     def publish_impl(self) -> None:
         if not self._is_upload_required():
@@ -97,6 +151,7 @@ class NeptuneCSVPublisher(Publisher):
             datetime_portion=datetime_portion,
         )
 
+        start = time.monotonic()
         self.upload_files(s3_folder_location)
 
         bulk_upload_response = self.neptune_api_client.load(
@@ -108,13 +163,17 @@ class NeptuneCSVPublisher(Publisher):
             load_id = bulk_upload_response['payload']['loadId']
         except KeyError:
             raise Exception("Failed to load csv. Response: {0}".format(str(bulk_upload_response)))
+        LOGGER.info(f'Started load {load_id} {time.monotonic() - start:.2f}s after the upload started')
 
         load_status = "LOAD_NOT_STARTED"
         all_errors: List[NeptuneBulkLoaderLoadStatusErrorLogEntry] = []
+        polling_period = self.status_polling_period
         while load_status in ("LOAD_IN_PROGRESS", "LOAD_NOT_STARTED", "LOAD_IN_QUEUE"):
-            time.sleep(self.status_polling_period)
+            time.sleep(polling_period)
             load_status, errors = self._poll_status(load_id)
             all_errors.extend(errors)
+            polling_period = min(polling_period * self.status_polling_backoff_factor, self.max_status_polling_period)
+        LOGGER.info(f'Load {load_id} ended with {load_status} {time.monotonic() - start:.2f}s after the upload started')
 
         for error in all_errors:
             exception_message = """
@@ -159,18 +218,82 @@ class NeptuneCSVPublisher(Publisher):
         return len(file_names) > 0
 
     def upload_files(self, s3_folder_location: str) -> None:
+        """
+        Uploads the files of the nodes and relationships concurrently, split into parts and gzipped as configured
+        """
+        start = time.monotonic()
         file_paths = self._get_file_paths()
-        for file_location in file_paths:
-            with open(file_location, 'rb') as file_csv:
-                file_name = os.path.basename(file_location)
-                s3_object_key = "{s3_folder_location}/{file_name}".format(
-                    s3_folder_location=s3_folder_location,
-                    file_name=file_name
-                )
-                self.neptune_api_client.upload(
-                    f=file_csv,
-                    s3_object_key=s3_object_key
-                )
+        with ThreadPoolExecutor(max_workers=self.upload_concurrency) as executor:
+            futures = [executor.submit(self._upload_file, file_location, s3_folder_location)
+                       for file_location in file_paths]
+            uploaded_bytes = sum(future.result() for future in futures)
+        LOGGER.info(f'Uploaded {len(file_paths)} files ({uploaded_bytes / 1024 / 1024:.1f} MB) '
+                    f'to {s3_folder_location} in {time.monotonic() - start:.2f}s')
+
+    def _upload_file(self, file_location: str, s3_folder_location: str) -> int:
+        """
+        :return: number of bytes uploaded
+        """
+        file_name = os.path.basename(file_location)
+        file_stem, file_extension = os.path.splitext(file_name)
+        uploaded_bytes = 0
+        with open(file_location, 'rb') as file_csv:
+            for index, part in enumerate(split_csv(file_csv, self.max_file_part_bytes)):
+                # a file that doesn't need to be split is uploaded under its own name
+                part_name = file_name if part is file_csv else f'{file_stem}_part{index:05d}{file_extension}'
+                uploaded_bytes += self._upload_part(part, f'{s3_folder_location}/{part_name}')
+        return uploaded_bytes
+
+    def _upload_part(self, part: IO[bytes], s3_object_key: str) -> int:
+        if not self.compress_files:
+            self._s3_client.upload_fileobj(part, self.bucket_name, s3_object_key, Config=self._s3_transfer_config)
+            return part.seek(0, os.SEEK_END)
+
+        with tempfile.TemporaryFile() as compressed:
+            # a fast level, as the upload is what takes time
+            with gzip.GzipFile(fileobj=compressed, mode='wb', compresslevel=1) as gzip_file:
+                shutil.copyfileobj(part, gzip_file)
+            size = compressed.tell()
+            compressed.seek(0)
+            self._s3_client.upload_fileobj(compressed, self.bucket_name, f'{s3_object_key}.gz',
+                                           Config=self._s3_transfer_config)
+        return size
 
     def get_scope(self) -> str:
         return 'publisher.neptune_csv_publisher'
+
+
+def split_csv(file_csv: IO[bytes], max_part_bytes: int) -> Iterator[IO[bytes]]:
+    """
+    Splits a CSV file into parts of about max_part_bytes each, cut between records and starting with the header of
+    the file. A file smaller than max_part_bytes is yielded as is.
+    Records span several lines when quoted values have line breaks, so a line only ends a record when the quotes
+    seen so far are balanced.
+    """
+    file_csv.seek(0, os.SEEK_END)
+    if file_csv.tell() <= max_part_bytes:
+        file_csv.seek(0)
+        yield file_csv
+        return
+
+    file_csv.seek(0)
+    header = file_csv.readline()
+    part = tempfile.TemporaryFile()
+    try:
+        part.write(header)
+        has_records = False
+        quotes = 0
+        for line in file_csv:
+            if quotes % 2 == 0 and has_records and part.tell() + len(line) > max_part_bytes:
+                part.seek(0)
+                yield part
+                part.close()
+                part = tempfile.TemporaryFile()
+                part.write(header)
+            part.write(line)
+            has_records = True
+            quotes += line.count(b'"')
+        part.seek(0)
+        yield part
+    finally:
+        part.close()
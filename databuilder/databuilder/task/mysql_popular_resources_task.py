@@ -0,0 +1,187 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import math
+from collections import defaultdict
+from typing import (
+    Any, Dict, List, Tuple, Type,
+)
+
+from amundsen_rds.models import RDSModel
+from amundsen_rds.models.base import INDEX_KEY_COLLATION_ARGS, KEY_LEN
+from amundsen_rds.models.dashboard import DashboardUsage
+from amundsen_rds.models.table import TableUsage
+from pyhocon import ConfigFactory, ConfigTree
+from sqlalchemy import (
+    Column, Integer, MetaData, String, Table, create_engine, func,
+)
+from sqlalchemy.orm import sessionmaker
+
+from databuilder import Scoped
+from databuilder.task.base_task import Task
+
+LOGGER = logging.getLogger(__name__)
+
+# User key of the rows holding the global ranking
+GLOBAL_USER_RK = ''
+
+popular_resource_rank_table = Table(
+    'popular_resource_rank',
+    MetaData(),
+    Column('resource_type', String(32, **INDEX_KEY_COLLATION_ARGS), primary_key=True),
+    Column('user_rk', String(KEY_LEN, **INDEX_KEY_COLLATION_ARGS), primary_key=True),
+    Column('popularity_rank', Integer, primary_key=True, autoincrement=False),
+    Column('resource_rk', String(KEY_LEN, **INDEX_KEY_COLLATION_ARGS), nullable=False)
+)
+
+_USAGE_MODELS: Dict[str, Type[RDSModel]] = {
+    'table': TableUsage,
+    'dashboard': DashboardUsage
+}
+
+
+class MySQLPopularResourcesTask(Task):
+    """
+    A task that precomputes popular resources in MySQL and stores the ranking in the "popular_resource_rank"
+    table, so that the metadata service does not need to scan the usage tables on each cold cache.
+
+    The popularity score is the same one the metadata service MySQLProxy uses:
+    number of distinct readers * log(total number of reads).
+    Rows with an empty user_rk hold the global ranking, the others hold the personalized ranking of that user.
+    The ranking of a resource type is replaced within a single transaction.
+    Enable POPULAR_RESOURCES_MATERIALIZED in the metadata service config to serve popular resources from it.
+    """
+    # Connection string
+    CONN_STRING = 'conn_string'
+    # If its value is true, SQLAlchemy engine will log all statements
+    ENGINE_ECHO = 'engine_echo'
+    # Additional arguments used for engine
+    CONNECT_ARGS = 'connect_args'
+
+    # Resource types to materialize popularity for, e.g. ['table', 'dashboard']
+    RESOURCE_TYPES = 'resource_types'
+    # Number of ranked resources stored, globally and per user. Should be at least the number of popular
+    # resources requested by the frontend.
+    NUM_ENTRIES = 'num_entries'
+    # Should match POPULAR_RESOURCES_MINIMUM_READER_COUNT of the metadata service
+    MINIMUM_READER_COUNT = 'minimum_reader_count'
+    # Whether to also materialize personalized popular resources
+    MATERIALIZE_PERSONAL = 'materialize_personal'
+    # Number of rows inserted per statement
+    INSERT_BATCH_SIZE = 'insert_batch_size'
+
+    _DEFAULT_CONFIG = ConfigFactory.from_dict({RESOURCE_TYPES: ['table', 'dashboard'],
+                                               NUM_ENTRIES: 500,
+                                               MINIMUM_READER_COUNT: 10,
+                                               MATERIALIZE_PERSONAL: True,
+                                               INSERT_BATCH_SIZE: 1000,
+                                               ENGINE_ECHO: False})
+
+    def get_scope(self) -> str:
+        return 'task.mysql_popular_resources'
+
+    def init(self, conf: ConfigTree) -> None:
+        conf = Scoped.get_scoped_conf(conf, self.get_scope()) \
+            .with_fallback(conf) \
+            .with_fallback(MySQLPopularResourcesTask._DEFAULT_CONFIG)
+        self.resource_types = [resource_type.lower()
+                               for resource_type in conf.get_list(MySQLPopularResourcesTask.RESOURCE_TYPES)]
+        for resource_type in self.resource_types:
+            if resource_type not in _USAGE_MODELS:
+                raise Exception(f'Popular resources are not supported for {resource_type}')
+        self.num_entries = conf.get_int(MySQLPopularResourcesTask.NUM_ENTRIES)
+        self.num_readers = conf.get_int(MySQLPopularResourcesTask.MINIMUM_READER_COUNT)
+        self.materialize_personal = conf.get_bool(MySQLPopularResourcesTask.MATERIALIZE_PERSONAL)
+        self.insert_batch_size = conf.get_int(MySQLPopularResourcesTask.INSERT_BATCH_SIZE)
+
+        connect_args = {k: v for k, v in conf.get_config(MySQLPopularResourcesTask.CONNECT_ARGS,
+                                                         default=ConfigTree()).items()}
+        self._engine = create_engine(conf.get_string(MySQLPopularResourcesTask.CONN_STRING),
+                                     echo=conf.get_bool(MySQLPopularResourcesTask.ENGINE_ECHO),
+                                     connect_args=connect_args)
+        self._session_factory = sessionmaker(bind=self._engine)
+        self._session = self._session_factory()
+
+    def run(self) -> None:
+        """
+        Creates the ranking table if needed, then replaces the ranking of each resource type.
+        :return:
+        """
+        popular_resource_rank_table.create(bind=self._engine, checkfirst=True)
+        try:
+            for resource_type in self.resource_types:
+                rows = self._get_global_ranking_rows(resource_type=resource_type)
+                if self.materialize_personal:
+                    rows.extend(self._get_personal_ranking_rows(resource_type=resource_type))
+                self._replace_ranking(resource_type=resource_type, rows=rows)
+        except Exception as e:
+            self._session.rollback()
+            raise e
+        finally:
+            self._session.close()
+
+    def _get_global_ranking_rows(self, resource_type: str) -> List[Dict[str, Any]]:
+        usage_model = _USAGE_MODELS[resource_type]
+        res_attr = getattr(usage_model, f'{resource_type}_rk')
+
+        readers = func.count(usage_model.user_rk).label('readers')
+        usages = self._session.query(
+            res_attr.label('res_key'),
+            readers,
+            func.sum(usage_model.read_count).label('total_reads')
+        ).group_by(res_attr).having(readers >= self.num_readers).all()
+
+        ranked = self._rank([(usage.res_key, usage.readers, usage.total_reads) for usage in usages])
+        LOGGER.info('Computed %i global popular %s', len(ranked), resource_type)
+        return self._to_rows(resource_type=resource_type, user_rk=GLOBAL_USER_RK, ranked=ranked)
+
+    def _get_personal_ranking_rows(self, resource_type: str) -> List[Dict[str, Any]]:
+        """
+        Mirrors MySQLProxy._get_personal_popular_resources_uris for every user in a single scan of the usage table.
+        """
+        usage_model = _USAGE_MODELS[resource_type]
+        res_attr = getattr(usage_model, f'{resource_type}_rk')
+
+        readers = func.count(usage_model.user_rk).label('readers')
+        usages = self._session.query(
+            usage_model.user_rk.label('user_rk'),
+            res_attr.label('res_key'),
+            readers,
+            func.sum(usage_model.read_count).label('total_reads')
+        ).group_by(usage_model.user_rk, res_attr).having(readers >= self.num_readers).all()
+
+        usages_by_user: Dict[str, List[Tuple[str, int, int]]] = defaultdict(list)
+        for usage in usages:
+            usages_by_user[usage.user_rk].append((usage.res_key, usage.readers, usage.total_reads))
+
+        rows: List[Dict[str, Any]] = []
+        for user_rk, user_usages in usages_by_user.items():
+            rows.extend(self._to_rows(resource_type=resource_type, user_rk=user_rk, ranked=self._rank(user_usages)))
+        LOGGER.info('Computed personal popular %s for %i users', resource_type, len(usages_by_user))
+        return rows
+
+    def _rank(self, usages: List[Tuple[str, int, int]]) -> List[str]:
+        """
+        Orders resource keys by popularity score = readers * log(total reads), keeping the top entries.
+        :param usages: list of (resource key, readers, total reads)
+        :return:
+        """
+        scored = [(res_key, readers * math.log(total_reads) if total_reads > 0 else float('-inf'))
+                  for res_key, readers, total_reads in usages]
+        scored.sort(key=lambda usage: usage[1], reverse=True)
+        return [res_key for res_key, _ in scored[:self.num_entries]]
+
+    def _to_rows(self, resource_type: str, user_rk: str, ranked: List[str]) -> List[Dict[str, Any]]:
+        return [{'resource_type': resource_type,
+                 'user_rk': user_rk,
+                 'popularity_rank': rank,
+                 'resource_rk': res_key} for rank, res_key in enumerate(ranked, start=1)]
+
+    def _replace_ranking(self, resource_type: str, rows: List[Dict[str, Any]]) -> None:
+        self._session.execute(popular_resource_rank_table.delete().where(
+            popular_resource_rank_table.c.resource_type == resource_type))
+        for i in range(0, len(rows), self.insert_batch_size):
+            self._session.execute(popular_resource_rank_table.insert(), rows[i:i + self.insert_batch_size])
+        self._session.commit()
+        LOGGER.info('Materialized %i popular %s ranking rows', len(rows), resource_type)
@@ -0,0 +1,238 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import textwrap
+import time
+from typing import (
+    Any, Dict, Iterable, List,
+)
+
+import neo4j
+from neo4j import GraphDatabase
+from neo4j.api import (
+    SECURITY_TYPE_SECURE, SECURITY_TYPE_SELF_SIGNED_CERTIFICATE, parse_neo4j_uri,
+)
+from pyhocon import ConfigFactory, ConfigTree
+
+from databuilder import Scoped
+from databuilder.task.base_task import Task
+
+# A end point for Neo4j e.g: bolt://localhost:9999
+NEO4J_END_POINT_KEY = 'neo4j_endpoint'
+NEO4J_MAX_CONN_LIFE_TIME_SEC = 'neo4j_max_conn_life_time_sec'
+NEO4J_USER = 'neo4j_user'
+NEO4J_PASSWORD = 'neo4j_password'
+NEO4J_DATABASE_NAME = 'neo4j_database'
+NEO4J_ENCRYPTED = 'neo4j_encrypted'
+"""NEO4J_ENCRYPTED is a boolean indicating whether to use SSL/TLS when connecting."""
+NEO4J_VALIDATE_SSL = 'neo4j_validate_ssl'
+"""NEO4J_VALIDATE_SSL is a boolean indicating whether to validate the server's SSL/TLS cert against system CAs."""
+
+# Node labels to materialize popularity for, e.g. ['Table', 'Dashboard']
+RESOURCE_TYPES = 'resource_types'
+# Number of ranked resources stored, globally and per user. Should be at least the number of popular
+# resources requested by the frontend.
+NUM_ENTRIES = 'num_entries'
+# Should match POPULAR_RESOURCES_MINIMUM_READER_COUNT of the metadata service
+MINIMUM_READER_COUNT = 'minimum_reader_count'
+# Whether to also materialize personalized popular resources on User nodes
+MATERIALIZE_PERSONAL = 'materialize_personal'
+# Number of users whose personalized ranking is computed and written per Cypher statement
+USER_BATCH_SIZE = 'user_batch_size'
+
+DEFAULT_CONFIG = ConfigFactory.from_dict({NEO4J_MAX_CONN_LIFE_TIME_SEC: 50,
+                                          NEO4J_DATABASE_NAME: neo4j.DEFAULT_DATABASE,
+                                          RESOURCE_TYPES: ['Table', 'Dashboard'],
+                                          NUM_ENTRIES: 500,
+                                          MINIMUM_READER_COUNT: 10,
+                                          MATERIALIZE_PERSONAL: True,
+                                          USER_BATCH_SIZE: 100})
+
+# Property set on resource nodes holding their global popularity rank, 1 being the most popular
+POPULAR_RANK_PROPERTY = 'popular_rank'
+# Property set on User nodes holding the ranked personalized popular resource keys,
+# e.g. popular_table_keys
+POPULAR_KEYS_PROPERTY_FORMAT = 'popular_{resource_type}_keys'
+# Epoch ms of the run that materialized the property, used to clear rankings left over from previous runs
+POPULAR_UPDATED_PROPERTY_FORMAT = '{property}_updated_epoch_ms'
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Neo4jPopularResourcesTask(Task):
+    """
+    A task that precomputes popular resources in Neo4j and stores the ranking on the graph, so that the metadata
+    service does not need to scan every READ_BY relation on each cold cache.
+
+    The popularity score is the same one the metadata service Neo4jProxy uses:
+    number of distinct readers * log(total number of reads).
+     - The global ranking is stored on each resource node as "popular_rank".
+     - The personalized ranking, based on co-readers of the user, is stored on each User node as a list of
+       resource keys, e.g. "popular_table_keys".
+
+    Rankings left over from previous runs are removed once the new ranking is written.
+    Enable POPULAR_RESOURCES_MATERIALIZED in the metadata service config to serve popular resources from it.
+    """
+
+    global_ranking_statement = textwrap.dedent("""
+        MATCH (resource:{resource_type})-[r:READ_BY]->(u:User)
+        WITH resource.key AS resource_key, count(distinct u) AS readers, sum(r.read_count) AS total_reads
+        WHERE readers >= $num_readers
+        RETURN resource_key, (readers * log(total_reads)) AS score
+        ORDER BY score DESC LIMIT $num_entries
+        """)
+    set_global_ranking_statement = textwrap.dedent("""
+        UNWIND $rows AS row
+        MATCH (resource:{resource_type} {{key: row.resource_key}})
+        SET resource.{rank_property} = row.rank, resource.{updated_property} = $marker
+        """)
+    remove_stale_global_ranking_statement = textwrap.dedent("""
+        MATCH (resource:{resource_type})
+        WHERE resource.{updated_property} < $marker
+        REMOVE resource.{rank_property}, resource.{updated_property}
+        """)
+    users_statement = textwrap.dedent("""
+        MATCH (u:User)<-[:READ_BY]-(:{resource_type})
+        RETURN DISTINCT u.key AS user_key
+        """)
+    set_personal_ranking_statement = textwrap.dedent("""
+        UNWIND $user_keys AS user_key
+        MATCH (:User {{key: user_key}})<-[:READ_BY]-(:{resource_type})-[:READ_BY]->
+              (coUser:User)<-[coRead:READ_BY]-(resource:{resource_type})
+        WITH user_key, resource.key AS resource_key, count(DISTINCT coUser) AS co_readers,
+             sum(coRead.read_count) AS total_co_reads
+        WHERE co_readers >= $num_readers
+        WITH user_key, resource_key, (co_readers * log(total_co_reads)) AS score
+        ORDER BY score DESC
+        WITH user_key, collect(resource_key)[0..$num_entries] AS resource_keys
+        MATCH (u:User {{key: user_key}})
+        SET u.{keys_property} = resource_keys, u.{updated_property} = $marker
+        """)
+    remove_stale_personal_ranking_statement = textwrap.dedent("""
+        MATCH (u:User)
+        WHERE u.{updated_property} < $marker
+        REMOVE u.{keys_property}, u.{updated_property}
+        """)
+    create_rank_index_statement = textwrap.dedent("""
+        CREATE INDEX IF NOT EXISTS FOR (resource:{resource_type}) ON (resource.{rank_property})
+        """)
+
+    def get_scope(self) -> str:
+        return 'task.popular_resources'
+
+    def init(self, conf: ConfigTree) -> None:
+        conf = Scoped.get_scoped_conf(conf, self.get_scope()) \
+            .with_fallback(conf) \
+            .with_fallback(DEFAULT_CONFIG)
+        self.resource_types = conf.get_list(RESOURCE_TYPES)
+        self.num_entries = conf.get_int(NUM_ENTRIES)
+        self.num_readers = conf.get_int(MINIMUM_READER_COUNT)
+        self.materialize_personal = conf.get_bool(MATERIALIZE_PERSONAL)
+        self.user_batch_size = conf.get_int(USER_BATCH_SIZE)
+
+        uri = conf.get_string(NEO4J_END_POINT_KEY)
+        driver_args = {
+            'uri': uri,
+            'max_connection_lifetime': conf.get_int(NEO4J_MAX_CONN_LIFE_TIME_SEC),
+            'auth': (conf.get_string(NEO4J_USER), conf.get_string(NEO4J_PASSWORD)),
+        }
+
+        # if URI scheme not secure set `trust`` and `encrypted` to default values
+        # https://neo4j.com/docs/api/python-driver/current/api.html#uri
+        _, security_type, _ = parse_neo4j_uri(uri=uri)
+        if security_type not in [SECURITY_TYPE_SELF_SIGNED_CERTIFICATE, SECURITY_TYPE_SECURE]:
+            default_security_conf = {'trust': neo4j.TRUST_ALL_CERTIFICATES, 'encrypted': True}
+            driver_args.update(default_security_conf)
+
+        # if NEO4J_VALIDATE_SSL or NEO4J_ENCRYPTED are set in config pass them to the driver
+        validate_ssl_conf = conf.get(NEO4J_VALIDATE_SSL, None)
+        encrypted_conf = conf.get(NEO4J_ENCRYPTED, None)
+        if validate_ssl_conf is not None:
+            driver_args['trust'] = neo4j.TRUST_SYSTEM_CA_SIGNED_CERTIFICATES if validate_ssl_conf \
+                else neo4j.TRUST_ALL_CERTIFICATES
+        if encrypted_conf is not None:
+            driver_args['encrypted'] = encrypted_conf
+
+        self._driver = GraphDatabase.driver(**driver_args)
+
+        self.db_name = conf.get(NEO4J_DATABASE_NAME)
+
+    def run(self) -> None:
+        """
+        For each resource type, materializes the global ranking first and then the personalized ranking.
+        All rankings written by this run share the same marker, which is then used to clear older rankings.
+        :return:
+        """
+        marker = int(time.time() * 1000)
+        for resource_type in self.resource_types:
+            self._materialize_global_ranking(resource_type=resource_type, marker=marker)
+            if self.materialize_personal:
+                self._materialize_personal_ranking(resource_type=resource_type, marker=marker)
+
+    def _materialize_global_ranking(self, resource_type: str, marker: int) -> None:
+        updated_property = POPULAR_UPDATED_PROPERTY_FORMAT.format(property=POPULAR_RANK_PROPERTY)
+
+        LOGGER.info('Computing global popular %s ranking', resource_type)
+        records = self._execute_cypher_query(
+            statement=self.global_ranking_statement.format(resource_type=resource_type),
+            param_dict={'num_readers': self.num_readers, 'num_entries': self.num_entries})
+        rows = [{'resource_key': record['resource_key'], 'rank': rank}
+                for rank, record in enumerate(records, start=1)]
+
+        self._execute_cypher_query(
+            statement=self.create_rank_index_statement.format(resource_type=resource_type,
+                                                              rank_property=POPULAR_RANK_PROPERTY))
+        self._execute_cypher_query(
+            statement=self.set_global_ranking_statement.format(resource_type=resource_type,
+                                                               rank_property=POPULAR_RANK_PROPERTY,
+                                                               updated_property=updated_property),
+            param_dict={'rows': rows, 'marker': marker})
+        self._execute_cypher_query(
+            statement=self.remove_stale_global_ranking_statement.format(resource_type=resource_type,
+                                                                        rank_property=POPULAR_RANK_PROPERTY,
+                                                                        updated_property=updated_property),
+            param_dict={'marker': marker})
+        LOGGER.info('Materialized %i global popular %s', len(rows), resource_type)
+
+    def _materialize_personal_ranking(self, resource_type: str, marker: int) -> None:
+        keys_property = POPULAR_KEYS_PROPERTY_FORMAT.format(resource_type=resource_type.lower())
+        updated_property = POPULAR_UPDATED_PROPERTY_FORMAT.format(property=keys_property)
+
+        records = self._execute_cypher_query(statement=self.users_statement.format(resource_type=resource_type))
+        user_keys = [record['user_key'] for record in records]
+        LOGGER.info('Computing personal popular %s ranking for %i users', resource_type, len(user_keys))
+
+        statement = self.set_personal_ranking_statement.format(resource_type=resource_type,
+                                                               keys_property=keys_property,
+                                                               updated_property=updated_property)
+        for batch in self._batches(user_keys):
+            self._execute_cypher_query(statement=statement,
+                                       param_dict={'user_keys': batch,
+                                                   'num_readers': self.num_readers,
+                                                   'num_entries': self.num_entries,
+                                                   'marker': marker})
+
+        self._execute_cypher_query(
+            statement=self.remove_stale_personal_ranking_statement.format(keys_property=keys_property,
+                                                                          updated_property=updated_property),
+            param_dict={'marker': marker})
+
+    def _batches(self, items: List[str]) -> Iterable[List[str]]:
+        for i in range(0, len(items), self.user_batch_size):
+            yield items[i:i + self.user_batch_size]
+
+    def _execute_cypher_query(self,
+                              statement: str,
+                              param_dict: Dict[str, Any] = {}
+                              ) -> List[Dict[str, Any]]:
+        LOGGER.debug('Executing Cypher query: %s', statement)
+
+        start = time.time()
+        try:
+            with self._driver.session(database=self.db_name) as session:
+                result = session.run(statement, **param_dict)
+                return [record for record in result]
+
+        finally:
+            LOGGER.debug('Cypher query execution elapsed for %i seconds', time.time() - start)
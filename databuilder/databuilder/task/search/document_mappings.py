@@ -4,7 +4,7 @@
 from typing import Dict
 
 from elasticsearch_dsl import (
-    Date, Document, Keyword, MetaField, RankFeatures, Text, analysis, token_filter, tokenizer,
+    Completion, Date, Document, Keyword, MetaField, RankFeatures, Text, analysis, token_filter, tokenizer,
 )
 
 POSITIONS_OFFSETS = "with_positions_offsets"
@@ -144,6 +144,10 @@ class SearchableResource(Document):
     usage = RankFeatures()
     last_updated_timestamp = Date()
     resource_type = Keyword(required=True)
+    # prefix completions of the name and key for typeahead, weighted by usage
+    suggest = Completion(analyzer=Analyzer.general_analyzer)
+    # hash of the rest of the document, to only reindex changed documents
+    content_hash = Keyword(index=False)
 
     class Meta:
         meta = MetaField({'version': 2})
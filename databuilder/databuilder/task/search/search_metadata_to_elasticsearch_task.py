@@ -1,15 +1,20 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
+import json
 import logging
+import re
+from collections import Counter
 from datetime import date
+from itertools import islice
 from typing import (
-    Any, Generator, List,
+    Any, Dict, Generator, Iterable, List, Optional, Set, Tuple,
 )
 from uuid import uuid4
 
 from elasticsearch.exceptions import NotFoundError
-from elasticsearch.helpers import parallel_bulk
+from elasticsearch.helpers import scan
 from elasticsearch_dsl.connections import Connections, connections
 from elasticsearch_dsl.document import Document
 from elasticsearch_dsl.index import Index
@@ -21,9 +26,20 @@ from databuilder.task.base_task import Task
 from databuilder.task.search.document_mappings import RESOURCE_TO_MAPPING, SearchableResource
 from databuilder.transformer.base_transformer import NoopTransformer, Transformer
 from databuilder.utils.closer import Closer
+from databuilder.utils.elasticsearch_bulk import BulkIndexer
 
 LOGGER = logging.getLogger(__name__)
 
+# start of the words of a name, after the first one, same as the alphanum_tokenizer of the document mappings
+_WORD_START_PATTERN = re.compile(r'(?<=[^a-zA-Z0-9])[a-zA-Z0-9]')
+
+# completion weights are 32 bit integers
+_MAX_SUGGEST_WEIGHT = 2 ** 31 - 1
+
+CONTENT_HASH_FIELD = 'content_hash'
+# key of the index mapping _meta holding the hash of the mappings and settings the index was created with
+MAPPING_HASH_META_KEY = 'mapping_hash'
+
 
 class SearchMetadatatoElasticasearchTask(Task):
 
@@ -34,8 +50,21 @@ class SearchMetadatatoElasticasearchTask(Task):
     ELASTICSEARCH_NEW_INDEX = 'new_index'
     ELASTICSEARCH_PUBLISHER_BATCH_SIZE = 'batch_size'
     ELASTICSEARCH_TIMEOUT_SEC = 'es_timeout_sec'
+    ELASTICSEARCH_SCROLL_SIZE = 'scroll_size'
+    ELASTICSEARCH_MAX_CHUNK_BYTES = 'max_chunk_bytes'
+    ELASTICSEARCH_THREAD_COUNT = 'thread_count'
+    ELASTICSEARCH_QUEUE_SIZE = 'queue_size'
+    ELASTICSEARCH_MAX_RETRIES = 'max_retries'
+    ELASTICSEARCH_INITIAL_BACKOFF_SEC = 'initial_backoff_sec'
+    ELASTICSEARCH_NUMBER_OF_REPLICAS = 'number_of_replicas'
+    ELASTICSEARCH_REFRESH_INTERVAL = 'refresh_interval'
+    INCREMENTAL = 'incremental'
     DATE = 'date'
 
+    # usage metric weighting the completions of the suggest field, per entity
+    SUGGEST_WEIGHT_METRIC = {'user': 'total_read'}
+    DEFAULT_SUGGEST_WEIGHT_METRIC = 'total_usage'
+
     today = date.today().strftime("%Y%m%d")
 
     def __init__(self,
@@ -82,6 +111,29 @@ class SearchMetadatatoElasticasearchTask(Task):
         self.elasticsearch_timeout_sec = conf.get(
             SearchMetadatatoElasticasearchTask.ELASTICSEARCH_TIMEOUT_SEC, 120
         )
+        self.elasticsearch_scroll_size = conf.get_int(
+            SearchMetadatatoElasticasearchTask.ELASTICSEARCH_SCROLL_SIZE, 5000
+        )
+        self.elasticsearch_max_chunk_bytes = conf.get_int(
+            SearchMetadatatoElasticasearchTask.ELASTICSEARCH_MAX_CHUNK_BYTES, 10 * 1024 * 1024
+        )
+        self.elasticsearch_thread_count = conf.get_int(SearchMetadatatoElasticasearchTask.ELASTICSEARCH_THREAD_COUNT, 4)
+        self.elasticsearch_queue_size = conf.get_int(SearchMetadatatoElasticasearchTask.ELASTICSEARCH_QUEUE_SIZE, 4)
+        self.elasticsearch_max_retries = conf.get_int(SearchMetadatatoElasticasearchTask.ELASTICSEARCH_MAX_RETRIES, 3)
+        self.elasticsearch_initial_backoff_sec = conf.get_float(
+            SearchMetadatatoElasticasearchTask.ELASTICSEARCH_INITIAL_BACKOFF_SEC, 2
+        )
+        # settings of the new index once built, it is built without replicas and refreshes
+        self.elasticsearch_number_of_replicas = conf.get_int(
+            SearchMetadatatoElasticasearchTask.ELASTICSEARCH_NUMBER_OF_REPLICAS, 1
+        )
+        self.elasticsearch_refresh_interval = conf.get_string(
+            SearchMetadatatoElasticasearchTask.ELASTICSEARCH_REFRESH_INTERVAL, '1s'
+        )
+        # update the documents of the index behind the alias in place instead of building a new index.
+        # The extracted documents are compared to the index scroll_size at a time, only their keys are kept
+        # in memory until the end of the extraction, to delete the documents of the keys no longer extracted.
+        self.incremental = conf.get_bool(SearchMetadatatoElasticasearchTask.INCREMENTAL, False)
 
     def create_new_index_name(self) -> str:
         hex_string = uuid4().hex
@@ -91,6 +143,31 @@ class SearchMetadatatoElasticasearchTask(Task):
         return self.document_mapping(_index=self.elasticsearch_new_index,
                                      **metadata)
 
+    def get_suggest(self, source: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Builds the completions of the suggest field: the name, the name from each of its following words so that
+        e.g. 'order_items' is also suggested for 'items', and the key. The completions of the most used resources
+        get the highest weight so they are suggested first.
+        """
+        name = source.get('name') or ''
+        inputs = [name] + [name[match.start():] for match in _WORD_START_PATTERN.finditer(name)]
+        if source.get('key'):
+            inputs.append(source['key'])
+
+        metric = self.SUGGEST_WEIGHT_METRIC.get(self.entity, self.DEFAULT_SUGGEST_WEIGHT_METRIC)
+        usage = source.get('usage') or {}
+        weight = usage.get(metric) if isinstance(usage, dict) else None
+
+        return {
+            'input': [completion for completion in dict.fromkeys(inputs) if completion],
+            'weight': min(int(weight or 0), _MAX_SUGGEST_WEIGHT),
+        }
+
+    @staticmethod
+    def get_content_hash(source: Dict[str, Any]) -> str:
+        content = {field: value for field, value in source.items() if field != CONTENT_HASH_FIELD}
+        return hashlib.sha1(json.dumps(content, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
     def generate_documents(self, record: Any) -> Generator:
         # iterate through records
         while record:
@@ -101,6 +178,8 @@ class SearchMetadatatoElasticasearchTask(Task):
                 continue
             document = self.to_document(metadata=record).to_dict(True)
             document['_source']['resource_type'] = self.entity
+            document['_source']['suggest'] = self.get_suggest(document['_source'])
+            document['_source'][CONTENT_HASH_FIELD] = self.get_content_hash(document['_source'])
 
             yield document
             record = self.extractor.extract()
@@ -131,6 +210,170 @@ class SearchMetadatatoElasticasearchTask(Task):
             "alias": self.elasticsearch_alias}})
         connection.indices.update_aliases({"actions": alias_updates})
 
+    def _get_index(self, index_name: str) -> Index:
+        index = Index(name=index_name, using=self.elasticsearch_client)
+        index.document(self.document_mapping)
+
+        # allow for longer ngram length
+        index.settings(max_shingle_diff=10)
+        return index
+
+    def get_mapping_hash(self) -> str:
+        """
+        Hash of the mappings and settings of the index, an index created with others cannot be updated in place
+        """
+        index_body = self._get_index(index_name=self.elasticsearch_alias).to_dict()
+        return hashlib.sha1(json.dumps(index_body, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _create_index(self, connection: Connections) -> Index:
+        LOGGER.info(f"Creating ES index {self.elasticsearch_new_index}")
+        index = self._get_index(index_name=self.elasticsearch_new_index)
+
+        index_body = index.to_dict()
+        mappings = index_body.setdefault('mappings', {})
+        mappings['_meta'] = {**mappings.get('_meta', {}), MAPPING_HASH_META_KEY: self.get_mapping_hash()}
+        # the index is not searched until the alias swap, skip refreshes and replication while it is built
+        index_body.setdefault('settings', {}).update({'refresh_interval': '-1', 'number_of_replicas': 0})
+        connection.indices.create(index=self.elasticsearch_new_index, body=index_body)
+        return index
+
+    def _bulk(self, connection: Connections, actions: Iterable[Dict[str, Any]]) -> int:
+        """
+        Sends the actions to ES in bulk requests
+        :return: number of successful actions
+        """
+        indexer = BulkIndexer(connection,
+                              chunk_size=self.elasticsearch_batch_size,
+                              max_chunk_bytes=self.elasticsearch_max_chunk_bytes,
+                              thread_count=self.elasticsearch_thread_count,
+                              queue_size=self.elasticsearch_queue_size,
+                              max_retries=self.elasticsearch_max_retries,
+                              initial_backoff_sec=self.elasticsearch_initial_backoff_sec,
+                              request_timeout=self.elasticsearch_timeout_sec)
+        stats = indexer.index(actions)
+        LOGGER.info(f"Bulk indexing to ES completed: {stats}")
+        return stats.succeeded
+
+    def _restore_index_settings(self, connection: Connections) -> None:
+        LOGGER.info(f"Enabling replicas and refreshes on ES index {self.elasticsearch_new_index}")
+        connection.indices.put_settings(index=self.elasticsearch_new_index, body={'index': {
+            'number_of_replicas': self.elasticsearch_number_of_replicas,
+            'refresh_interval': self.elasticsearch_refresh_interval,
+        }})
+        connection.indices.refresh(index=self.elasticsearch_new_index)
+
+    def _get_incremental_index(self, connection: Connections) -> Optional[str]:
+        """
+        Returns the index behind the alias if it can be updated in place, None if it has to be rebuilt
+        """
+        indices = list(self._get_old_index(connection=connection))
+        if len(indices) != 1:
+            LOGGER.info(f"Rebuilding the index since {len(indices)} indices have alias {self.elasticsearch_alias}")
+            return None
+
+        index_name = indices[0]
+        mapping = connection.indices.get_mapping(index=index_name)[index_name]['mappings']
+        if mapping.get('_meta', {}).get(MAPPING_HASH_META_KEY) != self.get_mapping_hash():
+            LOGGER.info(f"Rebuilding the index since the mappings of {index_name} changed")
+            return None
+
+        return index_name
+
+    def _get_indexed_hashes(self,
+                            connection: Connections,
+                            index_name: str,
+                            keys: List[str]) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        Scrolls through the content hashes of the documents of the index with the given keys
+        :return: key -> (content hash, ids of the documents with the key)
+        """
+        indexed: Dict[str, Tuple[str, List[str]]] = {}
+        for hit in scan(connection,
+                        index=index_name,
+                        query={'query': {'terms': {'key.keyword': keys}}, '_source': ['key', CONTENT_HASH_FIELD]},
+                        size=self.elasticsearch_scroll_size,
+                        request_timeout=self.elasticsearch_timeout_sec):
+            source = hit.get('_source', {})
+            content_hash, doc_ids = indexed.setdefault(source.get('key'), (source.get(CONTENT_HASH_FIELD), []))
+            doc_ids.append(hit['_id'])
+        return indexed
+
+    def generate_incremental_actions(self,
+                                     record: Any,
+                                     connection: Connections,
+                                     index_name: str,
+                                     counts: Counter) -> Generator:
+        """
+        Yields the bulk actions bringing the index up to date with the extracted records: changed documents are
+        overwritten, new ones are added, and the documents of keys that were not extracted are deleted.
+        Unchanged documents are left as is. The documents are compared to the index in chunks of scroll_size
+        documents, and then the keys of the index are scrolled through to find the ones that were not extracted.
+        """
+        extracted_keys: Set[str] = set()
+        documents = self.generate_documents(record=record)
+        while True:
+            chunk = list(islice(documents, self.elasticsearch_scroll_size))
+            if not chunk:
+                break
+
+            # keys compared in a previous chunk are not looked up again, a key extracted twice is indexed anew
+            chunk_keys = {document['_source'].get('key') for document in chunk} - extracted_keys
+            indexed = self._get_indexed_hashes(connection=connection, index_name=index_name, keys=list(chunk_keys))
+            extracted_keys.update(chunk_keys)
+
+            for document in chunk:
+                document['_index'] = index_name
+                source = document['_source']
+                content_hash, doc_ids = indexed.pop(source.get('key'), (None, []))
+                if not doc_ids:
+                    counts['created'] += 1
+                    yield document
+                    continue
+
+                if content_hash == source[CONTENT_HASH_FIELD]:
+                    counts['unchanged'] += 1
+                else:
+                    counts['updated'] += 1
+                    yield {**document, '_id': doc_ids[0]}
+                # documents indexed twice for the same key
+                for doc_id in doc_ids[1:]:
+                    counts['deleted'] += 1
+                    yield {'_op_type': 'delete', '_index': index_name, '_id': doc_id}
+
+        for hit in scan(connection,
+                        index=index_name,
+                        query={'_source': ['key']},
+                        size=self.elasticsearch_scroll_size,
+                        request_timeout=self.elasticsearch_timeout_sec):
+            if hit.get('_source', {}).get('key') not in extracted_keys:
+                counts['deleted'] += 1
+                yield {'_op_type': 'delete', '_index': index_name, '_id': hit['_id']}
+
+    def _update_index(self, connection: Connections, index_name: str, record: Any) -> None:
+        LOGGER.info(f"Updating ES index {index_name} in place")
+
+        counts: Counter = Counter()
+        self._bulk(connection=connection,
+                   actions=self.generate_incremental_actions(record=record,
+                                                             connection=connection,
+                                                             index_name=index_name,
+                                                             counts=counts))
+        connection.indices.refresh(index=index_name)
+        LOGGER.info(f"Updated ES index {index_name}: {counts['created']} documents created, "
+                    f"{counts['updated']} updated, {counts['deleted']} deleted and {counts['unchanged']} unchanged")
+
+    def _rebuild_index(self, connection: Connections, record: Any) -> None:
+        # create index
+        index = self._create_index(connection=connection)
+
+        # publish search metadata to ES
+        self._bulk(connection=connection, actions=self.generate_documents(record=record))
+        self._restore_index_settings(connection=connection)
+
+        # delete old index
+        self._delete_old_index(connection=connection,
+                               document_index=index)
+
     def run(self) -> None:
         LOGGER.info('Running search metadata to Elasticsearch task')
         try:
@@ -149,33 +392,11 @@ class SearchMetadatatoElasticasearchTask(Task):
                 LOGGER.error(msg)
                 raise Exception(msg)
 
-            # create index
-            LOGGER.info(f"Creating ES index {self.elasticsearch_new_index}")
-            index = Index(name=self.elasticsearch_new_index, using=self.elasticsearch_client)
-            index.document(self.document_mapping)
-
-            # allow for longer ngram length
-            index.settings(max_shingle_diff=10)
-
-            index.create()
-
-            # publish search metadata to ES
-            cnt = 0
-            for success, info in parallel_bulk(connection,
-                                               self.generate_documents(record=record),
-                                               raise_on_error=False,
-                                               chunk_size=self.elasticsearch_batch_size,
-                                               request_timeout=self.elasticsearch_timeout_sec):
-                if not success:
-                    LOGGER.warn(f"There was an error while indexing a document to ES: {info}")
-                else:
-                    cnt += 1
-                if cnt == self.elasticsearch_batch_size:
-                    LOGGER.info(f'Published {str(cnt*self.elasticsearch_batch_size)} records to ES')
-
-            # delete old index
-            self._delete_old_index(connection=connection,
-                                   document_index=index)
+            incremental_index = self._get_incremental_index(connection=connection) if self.incremental else None
+            if incremental_index:
+                self._update_index(connection=connection, index_name=incremental_index, record=record)
+            else:
+                self._rebuild_index(connection=connection, record=record)
 
             LOGGER.info("Elasticsearch Indexing completed")
         finally:
@@ -0,0 +1,249 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+from functools import lru_cache
+from typing import (
+    List, NamedTuple, NoReturn, Optional, Tuple, Type, Union,
+)
+
+from pyparsing import ParseException
+
+from databuilder.models.table_metadata import ColumnMetadata
+from databuilder.models.type_metadata import (
+    ArrayTypeMetadata, MapTypeMetadata, ScalarTypeMetadata, StructTypeMetadata, TypeMetadata,
+)
+
+# Number of distinct type strings whose parse trees are kept, since the same types come back across columns and tables
+TYPE_CACHE_SIZE = 10000
+
+# a word or a single punctuation character, after the whitespace pyparsing skips
+_TOKEN_PATTERN = re.compile(r'[ \t\n\r]*(?:([0-9A-Za-z_]+)|([^ \t\n\r]))')
+
+
+class TypeDialect(NamedTuple):
+    """
+    Syntax of the complex types of a data store
+    """
+    opener: str
+    closer: str
+    struct_keyword: str
+    # separator between the name and the type of struct fields, whitespace if None
+    field_separator: Optional[str] = None
+    # keyword of the union types, which are kept as scalar types
+    union_keyword: Optional[str] = None
+
+
+class ParsedType(NamedTuple):
+    """
+    Parse tree of a type string, independent of the column it belongs to so that it can be cached
+    """
+    type_class: Type[TypeMetadata]
+    type_str: str
+    # named sub types: the inner type of arrays, key and value of maps, and fields of structs
+    children: Tuple[Tuple[str, 'ParsedType'], ...] = ()
+
+
+class _Token(NamedTuple):
+    text: str
+    is_word: bool
+    start: int
+    end: int
+
+
+def _tokenize(text: str) -> List[_Token]:
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(text):
+        group = 1 if match.group(1) is not None else 2
+        tokens.append(_Token(match.group(group), group == 1, match.start(group), match.end()))
+    return tokens
+
+
+class _TypeStringParser(object):
+    """
+    Recursive descent parser of a type string, which is tokenized in a single pass beforehand.
+    It accepts the types of the pyparsing grammars of the dialects, and rejects the malformed nestings
+    that their nestedExpr tolerate, such as empty or unseparated contents and unclosed quantifiers. It does parse the
+    unions starting with a union, that nestedExpr mistakes for a nesting of the enclosing union, and the scalar types
+    with words after their precision, such as timestamp(3) with time zone, that the grammars cut after the precision.
+    """
+
+    def __init__(self, dialect: TypeDialect, type_str: str) -> None:
+        self.dialect = dialect
+        self.type_str = type_str
+        # pyparsing expands the tabs of the string it parses, and so of the type strings of the sub types
+        self.text = type_str.expandtabs() if '\t' in type_str else type_str
+        self.tokens = _tokenize(self.text)
+        self.index = 0
+
+    def parse(self) -> ParsedType:
+        if not self.tokens:
+            self._error('Expected type')
+        parsed_type = self._parse_type()
+        if self.index < len(self.tokens):
+            self._error('Expected end of text')
+        return parsed_type._replace(type_str=self.type_str)
+
+    def _peek(self, offset: int = 0) -> Optional[_Token]:
+        index = self.index + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def _peek_text(self, offset: int = 0) -> Optional[str]:
+        token = self._peek(offset)
+        return token.text if token else None
+
+    def _peek_word(self, digits_only: bool = False) -> bool:
+        token = self._peek()
+        return token is not None and token.is_word and (not digits_only or token.text.isdigit())
+
+    def _error(self, message: str) -> NoReturn:
+        token = self._peek()
+        raise ParseException(self.text, token.start if token else len(self.text), message)
+
+    def _next(self) -> _Token:
+        token = self._peek()
+        if token is None:
+            self._error('Unexpected end of text')
+        self.index += 1
+        return token
+
+    def _expect(self, text: str) -> _Token:
+        if self._peek_text() != text:
+            self._error(f'Expected {text!r}')
+        return self._next()
+
+    def _expect_word(self, digits_only: bool = False) -> _Token:
+        if not self._peek_word(digits_only):
+            self._error('Expected number' if digits_only else 'Expected name')
+        return self._next()
+
+    def _text_from(self, token: _Token) -> str:
+        return self.text[token.start:self.tokens[self.index - 1].end]
+
+    def _text_until_next(self, token: _Token) -> str:
+        next_token = self._peek()
+        return self.text[token.start:next_token.start if next_token else len(self.text)]
+
+    def _parse_type(self) -> ParsedType:
+        text, following = self._peek_text(), self._peek_text(1)
+        if following == self.dialect.opener:
+            if text == 'array':
+                return self._parse_array()
+            if text == 'map':
+                return self._parse_map()
+            if text == self.dialect.struct_keyword:
+                return self._parse_struct()
+        elif text == 'array' and following == self.dialect.closer:
+            # nestedExpr takes the closer of the enclosing type as the end of an empty array
+            self._next()
+            self._error(f'Expected {self.dialect.opener!r}')
+        return self._parse_scalar()
+
+    def _parse_array(self) -> ParsedType:
+        keyword = self._next()
+        self._expect(self.dialect.opener)
+        inner_type = self._parse_type()
+        self._expect(self.dialect.closer)
+        return ParsedType(ArrayTypeMetadata, self._text_from(keyword), (('_inner_', inner_type),))
+
+    def _parse_map(self) -> ParsedType:
+        keyword = self._next()
+        self._expect(self.dialect.opener)
+        key_type = self._parse_scalar()
+        self._expect(',')
+        value_type = self._parse_type()
+        self._expect(self.dialect.closer)
+        return ParsedType(MapTypeMetadata, self._text_from(keyword),
+                          (('_map_key', key_type), ('_map_value', value_type)))
+
+    def _parse_struct(self) -> ParsedType:
+        keyword = self._next()
+        self._expect(self.dialect.opener)
+        fields = []
+        while True:
+            name = self._expect_word().text
+            if self.dialect.field_separator:
+                self._expect(self.dialect.field_separator)
+            fields.append((name, self._parse_type()))
+            if self._peek_text() != ',':
+                break
+            self._next()
+        self._expect(self.dialect.closer)
+        return ParsedType(StructTypeMetadata, self._text_from(keyword), tuple(fields))
+
+    def _parse_scalar(self) -> ParsedType:
+        if self._peek_text() == self.dialect.union_keyword and self._peek_text(1) == self.dialect.opener:
+            return self._parse_union()
+
+        # types of several words, such as double precision
+        first = self._expect_word()
+        while self._peek_word():
+            self._next()
+
+        # precision and scale, such as decimal(10,2)
+        if self._peek_text() == '(':
+            self._next()
+            self._expect_word(digits_only=True)
+            if self._peek_text() == ',':
+                self._next()
+                self._expect_word(digits_only=True)
+            self._expect(')')
+            if not self._peek_word():
+                return ParsedType(ScalarTypeMetadata, self._text_from(first))
+            # words after the precision, such as timestamp(3) with time zone
+            while self._peek_word():
+                self._next()
+
+        # the grammar skips the whitespace after the words when it looks for a quantifier
+        return ParsedType(ScalarTypeMetadata, self._text_until_next(first))
+
+    def _parse_union(self) -> ParsedType:
+        keyword = self._next()
+        self._expect(self.dialect.opener)
+        self._parse_type()
+        while self._peek_text() == ',':
+            self._next()
+            self._parse_type()
+        self._expect(self.dialect.closer)
+        return ParsedType(ScalarTypeMetadata, self._text_from(keyword))
+
+
+@lru_cache(maxsize=TYPE_CACHE_SIZE)
+def parse_type_str(type_str: str, dialect: TypeDialect) -> ParsedType:
+    """
+    Parses a type string normalized by the parsing function of the dialect, caching the parse trees
+    :raises ParseException: if the type string is not a valid type of the dialect
+    """
+    return _TypeStringParser(dialect, type_str).parse()
+
+
+def to_type_metadata(parsed_type: ParsedType,
+                     name: str,
+                     parent: Union[ColumnMetadata, TypeMetadata]) -> TypeMetadata:
+    """
+    Creates the TypeMetadata objects of a parse tree for the given column or parent type
+    """
+    type_metadata = parsed_type.type_class(name=name, parent=parent, type_str=parsed_type.type_str)
+    if isinstance(type_metadata, ArrayTypeMetadata):
+        inner_name, inner_type = parsed_type.children[0]
+        array_inner_type = to_type_metadata(inner_type, inner_name, type_metadata)
+        if not isinstance(array_inner_type, ScalarTypeMetadata):
+            type_metadata.array_inner_type = array_inner_type
+    elif isinstance(type_metadata, MapTypeMetadata):
+        (key_name, key_type), (value_name, value_type) = parsed_type.children
+        type_metadata.map_key_type = to_type_metadata(key_type, key_name, type_metadata)
+        type_metadata.map_value_type = to_type_metadata(value_type, value_name, type_metadata)
+    elif isinstance(type_metadata, StructTypeMetadata):
+        struct_items = {}
+        for index, (item_name, item_type) in enumerate(parsed_type.children):
+            struct_items[item_name] = to_type_metadata(item_type, item_name, type_metadata)
+            struct_items[item_name].sort_order = index
+        type_metadata.struct_items = struct_items
+    return type_metadata
+
+
+def parse_complex_type(type_str: str,
+                       name: str,
+                       parent: Union[ColumnMetadata, TypeMetadata],
+                       dialect: TypeDialect) -> TypeMetadata:
+    return to_type_metadata(parse_type_str(type_str, dialect), name, parent)
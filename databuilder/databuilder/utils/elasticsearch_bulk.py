@@ -0,0 +1,205 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ThreadPoolExecutor, wait,
+)
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union,
+)
+
+from elasticsearch import Elasticsearch
+from elasticsearch.exceptions import TransportError
+from elasticsearch.helpers import expand_action
+from elasticsearch.serializer import JSONSerializer
+
+LOGGER = logging.getLogger(__name__)
+
+# a bulk action serialized as its action line and its source line, None for deletes
+BulkLines = Tuple[str, Optional[str]]
+
+TOO_MANY_REQUESTS = 429
+
+_SERIALIZER = JSONSerializer()
+
+
+def to_bulk_lines(action: Dict[str, Any]) -> BulkLines:
+    """
+    Serializes an action in the format of the elasticsearch.helpers into the lines of the bulk request body
+    """
+    action_line, source = expand_action(action)
+    return _SERIALIZER.dumps(action_line), None if source is None else _SERIALIZER.dumps(source)
+
+
+def _size_of(lines: BulkLines) -> int:
+    action_line, source_line = lines
+    size = len(action_line.encode('utf-8')) + 1
+    if source_line is not None:
+        size += len(source_line.encode('utf-8')) + 1
+    return size
+
+
+class BulkStats(object):
+    """
+    Counts of a bulk indexing run, shared by the worker threads
+    """
+
+    def __init__(self) -> None:
+        self.succeeded = 0
+        self.failed = 0
+        self.retried = 0
+        self.bytes = 0
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, succeeded: int = 0, failed: int = 0, retried: int = 0, size: int = 0) -> None:
+        with self._lock:
+            self.succeeded += succeeded
+            self.failed += failed
+            self.retried += retried
+            self.bytes += size
+
+    @property
+    def elapsed_sec(self) -> float:
+        return time.monotonic() - self._start
+
+    @property
+    def docs_per_sec(self) -> float:
+        return self.succeeded / max(self.elapsed_sec, 1e-6)
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.bytes / max(self.elapsed_sec, 1e-6)
+
+    def __repr__(self) -> str:
+        return (f'{self.succeeded} documents indexed, {self.failed} failed and {self.retried} retried, '
+                f'{self.bytes / 1024 / 1024:.1f} MB sent in {self.elapsed_sec:.1f}s: '
+                f'{self.docs_per_sec:.0f} docs/sec, {self.bytes_per_sec / 1024 / 1024:.2f} MB/sec')
+
+
+class BulkIndexer(object):
+    """
+    Sends actions to Elasticsearch in bulk requests from a pool of worker threads.
+
+    Requests are cut at chunk_size actions or max_chunk_bytes bytes, whichever comes first, so that large documents
+    don't add up to requests the cluster rejects. At most queue_size requests wait for a free worker, which bounds
+    the memory used when the actions are produced faster than they are indexed. Actions rejected with a 429 because
+    the cluster is overloaded are sent again after an exponential backoff, up to max_retries times.
+    """
+
+    def __init__(self,
+                 client: Elasticsearch,
+                 chunk_size: int = 500,
+                 max_chunk_bytes: int = 10 * 1024 * 1024,
+                 thread_count: int = 4,
+                 queue_size: int = 4,
+                 max_retries: int = 3,
+                 initial_backoff_sec: float = 2,
+                 max_backoff_sec: float = 600,
+                 request_timeout: Optional[float] = None) -> None:
+        self.client = client
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.thread_count = thread_count
+        self.queue_size = queue_size
+        self.max_retries = max_retries
+        self.initial_backoff_sec = initial_backoff_sec
+        self.max_backoff_sec = max_backoff_sec
+        self.request_timeout = request_timeout
+
+    def chunk(self, actions: Iterable[Union[Dict[str, Any], BulkLines]]) -> Iterator[List[BulkLines]]:
+        """
+        Groups the actions, either dicts or already serialized lines, into the lines of each bulk request
+        """
+        chunk: List[BulkLines] = []
+        chunk_bytes = 0
+        for action in actions:
+            lines = action if isinstance(action, tuple) else to_bulk_lines(action)
+            size = _size_of(lines)
+            if chunk and (len(chunk) == self.chunk_size or chunk_bytes + size > self.max_chunk_bytes):
+                yield chunk
+                chunk, chunk_bytes = [], 0
+            chunk.append(lines)
+            chunk_bytes += size
+        if chunk:
+            yield chunk
+
+    def _send(self, chunk: List[BulkLines]) -> Tuple[int, List[BulkLines]]:
+        """
+        Sends one bulk request
+        :return: number of failed actions, and the actions rejected because the cluster is overloaded
+        """
+        body = ''.join(action_line + '\n' + (source_line + '\n' if source_line is not None else '')
+                       for action_line, source_line in chunk)
+        try:
+            response = self.client.bulk(body=body, request_timeout=self.request_timeout)
+        except TransportError as e:
+            if e.status_code == TOO_MANY_REQUESTS:
+                return 0, chunk
+            raise
+
+        if not response.get('errors'):
+            return 0, []
+
+        failed = 0
+        rejected = []
+        for lines, item in zip(chunk, response['items']):
+            op_type, result = item.popitem()
+            status = result.get('status', 500)
+            if status == TOO_MANY_REQUESTS:
+                rejected.append(lines)
+            elif not 200 <= status < 300:
+                failed += 1
+                LOGGER.warning(f'There was an error while indexing a document to ES: {op_type} {result}')
+        return failed, rejected
+
+    def _process(self, chunk: List[BulkLines], stats: BulkStats) -> None:
+        size = sum(_size_of(lines) for lines in chunk)
+        pending = chunk
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                backoff = min(self.max_backoff_sec, self.initial_backoff_sec * 2 ** (attempt - 1))
+                LOGGER.info(f'Retrying {len(pending)} actions rejected by ES in {backoff}s')
+                time.sleep(backoff)
+                stats.add(retried=len(pending))
+            failed, rejected = self._send(pending)
+            stats.add(succeeded=len(pending) - failed - len(rejected), failed=failed)
+            pending = rejected
+            if not pending:
+                break
+
+        if pending:
+            LOGGER.warning(f'{len(pending)} actions were still rejected by ES after {self.max_retries} retries')
+            stats.add(failed=len(pending))
+        stats.add(size=size)
+
+    def index(self, actions: Iterable[Union[Dict[str, Any], BulkLines]]) -> BulkStats:
+        """
+        Sends all the actions and waits for them to be indexed
+        :return: counts and throughput of the run
+        """
+        stats = BulkStats()
+        in_flight: Set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self.thread_count) as executor:
+            try:
+                for chunk in self.chunk(actions):
+                    if len(in_flight) >= self.thread_count + self.queue_size:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        self._check(done, stats)
+                    in_flight.add(executor.submit(self._process, chunk, stats))
+                done, in_flight = wait(in_flight)
+                self._check(done, stats)
+            finally:
+                for future in in_flight:
+                    future.cancel()
+        return stats
+
+    @staticmethod
+    def _check(done: Set[Future], stats: BulkStats) -> None:
+        for future in done:
+            # propagates the errors of the worker threads
+            future.result()
+        LOGGER.info(f'Published {stats.succeeded} records to ES ({stats.bytes / 1024 / 1024:.1f} MB)')
@@ -11,6 +11,7 @@ from databuilder.models.table_metadata import ColumnMetadata
 from databuilder.models.type_metadata import (
     ArrayTypeMetadata, MapTypeMetadata, ScalarTypeMetadata, StructTypeMetadata, TypeMetadata,
 )
+from databuilder.utils.complex_type_parser import TypeDialect, parse_complex_type
 
 array_keyword = Keyword("array")
 map_keyword = Keyword("map")
@@ -49,7 +50,25 @@ complex_type = (array_type("array_type") | map_type("map_type") | struct_type("s
                 scalar_type("scalar_type"))
 
 
+HIVE_DIALECT = TypeDialect(opener='<', closer='>', struct_keyword='struct', field_separator=':',
+                           union_keyword='uniontype')
+
+
 def parse_hive_type(type_str: str, name: str, parent: Union[ColumnMetadata, TypeMetadata]) -> TypeMetadata:
+    """
+    Parses the type string with a recursive descent parser, which gives the same TypeMetadata objects as the
+    pyparsing grammar above many times faster, and caches the parse tree of each type string
+    """
+    type_str = type_str.lower()
+    return parse_complex_type(type_str, name, parent, HIVE_DIALECT)
+
+
+def parse_hive_type_with_pyparsing(type_str: str,
+                                   name: str,
+                                   parent: Union[ColumnMetadata, TypeMetadata]) -> TypeMetadata:
+    """
+    Parses the type string with the pyparsing grammar, kept as the reference of parse_hive_type
+    """
     type_str = type_str.lower()
     parsed_type = complex_type.parseString(type_str, parseAll=True)
 
@@ -63,7 +82,7 @@ def parse_hive_type(type_str: str, name: str, parent: Union[ColumnMetadata, Type
         array_type_metadata = ArrayTypeMetadata(name=name,
                                                 parent=parent,
                                                 type_str=type_str)
-        array_inner_type = parse_hive_type(results.type, '_inner_', array_type_metadata)
+        array_inner_type = parse_hive_type_with_pyparsing(results.type, '_inner_', array_type_metadata)
         if not isinstance(array_inner_type, ScalarTypeMetadata):
             array_type_metadata.array_inner_type = array_inner_type
         return array_type_metadata
@@ -71,8 +90,9 @@ def parse_hive_type(type_str: str, name: str, parent: Union[ColumnMetadata, Type
         map_type_metadata = MapTypeMetadata(name=name,
                                             parent=parent,
                                             type_str=type_str)
-        map_type_metadata.map_key_type = parse_hive_type(results.key, '_map_key', map_type_metadata)
-        map_type_metadata.map_value_type = parse_hive_type(results.type, '_map_value', map_type_metadata)
+        map_type_metadata.map_key_type = parse_hive_type_with_pyparsing(results.key, '_map_key', map_type_metadata)
+        map_type_metadata.map_value_type = parse_hive_type_with_pyparsing(results.type, '_map_value',
+                                                                          map_type_metadata)
         return map_type_metadata
     elif parsed_type.struct_type:
         struct_type_metadata = StructTypeMetadata(name=name,
@@ -80,7 +100,8 @@ def parse_hive_type(type_str: str, name: str, parent: Union[ColumnMetadata, Type
                                                   type_str=type_str)
         struct_items = {}
         for index, result in enumerate(results):
-            struct_items[result.name] = parse_hive_type(result.type, result.name, struct_type_metadata)
+            struct_items[result.name] = parse_hive_type_with_pyparsing(result.type, result.name,
+                                                                       struct_type_metadata)
             struct_items[result.name].sort_order = index
 
         struct_type_metadata.struct_items = struct_items
@@ -5,7 +5,7 @@ import logging
 from os import listdir
 from os.path import isfile, join
 from typing import (
-    Iterator, List, Optional, Set,
+    Iterable, Iterator, List, Optional, Set,
 )
 
 import pandas
@@ -42,32 +42,44 @@ def create_neo4j_node_key_constraint(node_file: str,
     """
     LOGGER.info('Creating indices using Node file: %s. (Existing indices will be ignored)', node_file)
 
-    labels = set(current_labels)
     with open(node_file, 'r', encoding='utf8') as node_csv:
-        for node_record in pandas.read_csv(node_csv,
-                                           na_filter=False).to_dict(orient='records'):
-            label = node_record[NODE_LABEL]
-            if label not in labels:
-                with driver.session(database=db_name) as session:
-                    try:
-                        create_stmt = Template("""
-                            CREATE CONSTRAINT ON (node:{{ LABEL }}) ASSERT node.key IS UNIQUE
-                        """).render(LABEL=label)
-
-                        LOGGER.info(f'Trying to create index for label {label} if not exist: {create_stmt}')
-
-                        session.write_transaction(execute_neo4j_statement, create_stmt)
-                    except Neo4jError as e:
-                        if e.code != NEO4J_EQUIVALENT_SCHEMA_RULE_ALREADY_EXISTS_ERROR_CODE\
-                                and e.code != NEO4J_INDEX_ALREADY_EXISTS_ERROR_CODE:
-                            raise
-                        # Else, swallow the exception, to make this function idempotent.
-                labels.add(label)
+        node_records = pandas.read_csv(node_csv, na_filter=False).to_dict(orient='records')
+    labels = create_neo4j_label_key_constraints((node_record[NODE_LABEL] for node_record in node_records),
+                                                current_labels, driver, db_name)
 
     LOGGER.info('Indices have been created.')
     return labels
 
 
+def create_neo4j_label_key_constraints(node_labels: Iterable[str],
+                                       current_labels: Set,
+                                       driver: Neo4jDriver,
+                                       db_name: str) -> Set:
+    """
+    Try creating a unique index on the key of the nodes of each label not in current_labels.
+    :return: current_labels and the labels whose index was created or already existed
+    """
+    labels = set(current_labels)
+    for label in node_labels:
+        if label not in labels:
+            with driver.session(database=db_name) as session:
+                try:
+                    create_stmt = Template("""
+                        CREATE CONSTRAINT ON (node:{{ LABEL }}) ASSERT node.key IS UNIQUE
+                    """).render(LABEL=label)
+
+                    LOGGER.info(f'Trying to create index for label {label} if not exist: {create_stmt}')
+
+                    session.write_transaction(execute_neo4j_statement, create_stmt)
+                except Neo4jError as e:
+                    if e.code != NEO4J_EQUIVALENT_SCHEMA_RULE_ALREADY_EXISTS_ERROR_CODE\
+                            and e.code != NEO4J_INDEX_ALREADY_EXISTS_ERROR_CODE:
+                        raise
+                    # Else, swallow the exception, to make this function idempotent.
+            labels.add(label)
+    return labels
+
+
 def create_props_param(record_dict: dict, additional_publisher_metadata_fields: dict) -> dict:
     """
     Create a dict of all the params for a given record
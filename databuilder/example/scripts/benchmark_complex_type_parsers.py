@@ -0,0 +1,64 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares the time the pyparsing grammars and the recursive descent parser take to parse the corpus of
+real world column types in example/sample_data/complex_types, e.g.
+`python example/scripts/benchmark_complex_type_parsers.py`
+"""
+import logging
+import os
+import time
+from typing import Callable, List
+
+from databuilder.models.table_metadata import ColumnMetadata
+from databuilder.models.type_metadata import TypeMetadata
+from databuilder.utils.complex_type_parser import parse_type_str
+from databuilder.utils.hive_complex_type_parser import parse_hive_type, parse_hive_type_with_pyparsing
+from databuilder.utils.trino_complex_type_parser import parse_trino_type, parse_trino_type_with_pyparsing
+
+corpus_dir = os.path.join(os.path.dirname(__file__), '..', 'sample_data', 'complex_types')
+rounds = int(os.getenv('BENCHMARK_ROUNDS', 20))
+
+
+def load_types(dialect: str) -> List[str]:
+    with open(os.path.join(corpus_dir, f'{dialect}_types.txt')) as types_file:
+        return [line for line in types_file.read().splitlines() if line]
+
+
+def time_parsing(parse: Callable[[str, str, ColumnMetadata], TypeMetadata],
+                 types: List[str],
+                 clear_cache: bool = False) -> float:
+    column = ColumnMetadata('col', None, 'int', 0)
+    column.set_column_key('hive://gold.test_schema/test_table/col')
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if clear_cache:
+            parse_type_str.cache_clear()
+        for type_str in types:
+            try:
+                parse(type_str, column.name, column)
+            except Exception:
+                # ComplexTypeTransformer falls back to a scalar type
+                pass
+    return time.perf_counter() - start
+
+
+def run_benchmark():
+    logging.basicConfig(level=logging.INFO)
+
+    for dialect, parse, parse_with_pyparsing in (('hive', parse_hive_type, parse_hive_type_with_pyparsing),
+                                                 ('trino', parse_trino_type, parse_trino_type_with_pyparsing)):
+        types = load_types(dialect)
+        pyparsing_sec = time_parsing(parse_with_pyparsing, types)
+
+        uncached_sec = time_parsing(parse, types, clear_cache=True)
+        cached_sec = time_parsing(parse, types)
+
+        logging.info(f'{dialect}: {len(types) * rounds} types parsed in {pyparsing_sec:.3f}s with pyparsing, '
+                     f'{uncached_sec:.3f}s with the recursive descent parser and {cached_sec:.3f}s once its '
+                     f'cache is filled')
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -58,6 +58,8 @@ neptune_iam_role_name = os.getenv('NEPTUNE_IAM_ROLE')
 S3_BUCKET_NAME = os.getenv('S3_BUCKET_NAME')
 assert S3_BUCKET_NAME, "A S3 bucket is needed to load the data from"
 S3_DATA_PATH = os.getenv("S3_DATA_PATH", "amundsen_data")
+# S3 compatible endpoint to upload the files to instead of AWS, e.g. a local stand-in
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL")
 AWS_REGION = os.environ.get("AWS_REGION", 'us-east-1')
 
 es = Elasticsearch(
@@ -111,7 +113,8 @@ def run_csv_job(file_loc, job_name, model):
             NeptuneCSVPublisher.AWS_REGION: AWS_REGION,
             NeptuneCSVPublisher.AWS_ACCESS_KEY: aws_access_key,
             NeptuneCSVPublisher.AWS_SECRET_ACCESS_KEY: aws_access_secret,
-            NeptuneCSVPublisher.AWS_SESSION_TOKEN: aws_token
+            NeptuneCSVPublisher.AWS_SESSION_TOKEN: aws_token,
+            NeptuneCSVPublisher.AWS_S3_ENDPOINT_URL: S3_ENDPOINT_URL
         },
     })
 
@@ -153,7 +156,8 @@ def run_table_column_job(table_path, column_path):
             NeptuneCSVPublisher.AWS_REGION: AWS_REGION,
             NeptuneCSVPublisher.AWS_ACCESS_KEY: aws_access_key,
             NeptuneCSVPublisher.AWS_SECRET_ACCESS_KEY: aws_access_secret,
-            NeptuneCSVPublisher.AWS_SESSION_TOKEN: aws_token
+            NeptuneCSVPublisher.AWS_SESSION_TOKEN: aws_token,
+            NeptuneCSVPublisher.AWS_S3_ENDPOINT_URL: S3_ENDPOINT_URL
         }
     })
     job = DefaultJob(
@@ -197,6 +201,7 @@ def create_last_updated_job():
             NeptuneCSVPublisher.AWS_ACCESS_KEY: aws_access_key,
             NeptuneCSVPublisher.AWS_SECRET_ACCESS_KEY: aws_access_secret,
             NeptuneCSVPublisher.AWS_SESSION_TOKEN: aws_token,
+            NeptuneCSVPublisher.AWS_S3_ENDPOINT_URL: S3_ENDPOINT_URL,
             'job_publish_tag': 'unique_lastupdated_tag'
         }
     })
@@ -264,7 +269,8 @@ def create_dashboard_tables_job():
             NeptuneCSVPublisher.AWS_REGION: AWS_REGION,
             NeptuneCSVPublisher.AWS_ACCESS_KEY: aws_access_key,
             NeptuneCSVPublisher.AWS_SECRET_ACCESS_KEY: aws_access_secret,
-            NeptuneCSVPublisher.AWS_SESSION_TOKEN: aws_token
+            NeptuneCSVPublisher.AWS_SESSION_TOKEN: aws_token,
+            NeptuneCSVPublisher.AWS_S3_ENDPOINT_URL: S3_ENDPOINT_URL
         }
     })
 
@@ -0,0 +1,56 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares the throughput of the single and batched upserts of NeptuneSessionClient against a local Gremlin Server
+standing in for Neptune, e.g. the TinkerGraph of `docker run -p 8182:8182 tinkerpop/gremlin-server`.
+The graph is emptied before each pass, so that both of them create the same vertices and edges.
+"""
+import logging
+import os
+import time
+
+from gremlin_python.driver.driver_remote_connection import DriverRemoteConnection
+from gremlin_python.process.anonymous_traversal import traversal
+
+from databuilder.clients.neptune_client import NeptuneSessionClient
+
+gremlin_url = os.getenv('GREMLIN_URL', 'ws://localhost:8182/gremlin')
+count = int(os.getenv('UPSERT_COUNT', 1000))
+
+
+def drop_tables(client: NeptuneSessionClient) -> None:
+    client.get_graph().V().hasLabel('Table').drop().iterate()
+
+
+def run_upserts():
+    logging.basicConfig(level=logging.INFO)
+
+    remote_connection = DriverRemoteConnection(gremlin_url, 'g')
+    client = NeptuneSessionClient(graph=traversal().withRemote(remote_connection))
+    nodes = [(f'table_{i}', 'Table', {'name:String': f'table_{i}', 'published_tag:String': 'unique_tag'})
+             for i in range(count)]
+    edges = [(f'table_{i}', f'table_{i + 1}', f'table_{i}_table_{i + 1}', 'LINEAGE', {'published_tag:String': 'tag'})
+             for i in range(count - 1)]
+
+    try:
+        drop_tables(client)
+        start = time.monotonic()
+        for node in nodes:
+            client.upsert_node(*node)
+        for edge in edges:
+            client.upsert_edge(*edge)
+        logging.info(f'Single upserts: {time.monotonic() - start:.2f}s')
+
+        drop_tables(client)
+        start = time.monotonic()
+        client.upsert_nodes(nodes)
+        client.upsert_edges(edges)
+        logging.info(f'Batched upserts of {client.upsert_batch_size}: {time.monotonic() - start:.2f}s')
+    finally:
+        drop_tables(client)
+        remote_connection.close()
+
+
+if __name__ == '__main__':
+    run_upserts()
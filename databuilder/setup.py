@@ -75,7 +75,7 @@ feast = [
 
 atlas = [
     'pyatlasclient>=1.1.2',
-    'apache-atlas>=0.0.11'
+    'apache-atlas>=0.0.12'
 ]
 
 oracle = [
@@ -0,0 +1,106 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import unittest
+from typing import Any, List
+
+from gremlin_python.driver.protocol import GremlinServerError
+from gremlin_python.process.graph_traversal import GraphTraversal
+from gremlin_python.process.traversal import T
+from mock import MagicMock
+
+from databuilder.clients.neptune_client import EdgeUpsert, NeptuneSessionClient
+
+
+def _server_error(code: str) -> GremlinServerError:
+    return GremlinServerError(dict(code=500, attributes={}, message=json.dumps(dict(code=code))))
+
+
+class TestNeptuneSessionClient(unittest.TestCase):
+    def setUp(self) -> None:
+        self.graph = MagicMock()
+        self.client = NeptuneSessionClient(graph=self.graph)
+        self.client.upsert_batch_size = 2
+        self.client.retry_backoff_sec = 0
+        self.union = self.graph.inject.return_value.union
+
+    def _upserts(self, call_index: int) -> List[List[Any]]:
+        """
+        :return: the steps of the upserts of each element in the traversal of the call_index batch
+        """
+        upserts = self.union.call_args_list[call_index][0]
+        self.assertTrue(all(isinstance(upsert, GraphTraversal) for upsert in upserts))
+        return [upsert.bytecode.step_instructions for upsert in upserts]
+
+    def test_upsert_nodes(self) -> None:
+        self.union.return_value.toList.side_effect = [['table_0', 'table_1'], ['table_2']]
+        nodes = [(f'table_{i}', 'Table', {'name:String': f'table_{i}', 'row_count:Long': '3'}) for i in range(3)]
+
+        self.assertEqual(self.client.upsert_nodes(nodes), 3)
+
+        self.assertEqual(self.union.call_count, 2)
+        first_batch = self._upserts(0)
+        self.assertEqual(len(first_batch), 2)
+        self.assertEqual(first_batch[0][:2], [['V'], ['has', T.id, 'table_0']])
+        self.assertIn(['property', 'name', 'table_0'], first_batch[0])
+        self.assertIn(['property', 'row_count', 3], first_batch[0])
+        # each upsert gives back the id of its node
+        self.assertEqual(first_batch[0][-1], ['constant', 'table_0'])
+        self.assertEqual(first_batch[1][-1], ['constant', 'table_1'])
+        self.assertEqual([steps[-1] for steps in self._upserts(1)], [['constant', 'table_2']])
+
+    def test_upsert_edges(self) -> None:
+        self.union.return_value.toList.side_effect = [['table_0_table_1', 'table_1_table_2']]
+        edges: List[EdgeUpsert] = [(f'table_{i}', f'table_{i + 1}', f'table_{i}_table_{i + 1}', 'LINEAGE',
+                                    {'published_tag:String': 'tag'}) for i in range(2)]
+
+        self.assertEqual(self.client.upsert_edges(edges), 2)
+
+        upserts = self._upserts(0)
+        self.assertEqual(upserts[0][:4], [['V'], ['has', T.id, 'table_0'], ['outE', 'LINEAGE'],
+                                          ['has', T.id, 'table_0_table_1']])
+        self.assertIn(['property', 'published_tag', 'tag'], upserts[0])
+        self.assertEqual([steps[-1] for steps in upserts],
+                         [['constant', 'table_0_table_1'], ['constant', 'table_1_table_2']])
+
+    def test_upsert_edges_with_missing_start_node(self) -> None:
+        self.client.upsert_batch_size = 3
+        # the edge from the missing table_1 was not upserted, but the one after it in the batch was
+        self.union.return_value.toList.side_effect = [['table_0_table_1', 'table_2_table_3']]
+        edges: List[EdgeUpsert] = [(f'table_{i}', f'table_{i + 1}', f'table_{i}_table_{i + 1}', 'LINEAGE', {})
+                                   for i in range(4)]
+
+        with self.assertRaisesRegex(RuntimeError, r"\['table_1_table_2'\] \(2 edges were upserted\)"):
+            self.client.upsert_edges(edges)
+        self.assertEqual(len(self._upserts(0)), 3)
+        # the later batches are not upserted
+        self.assertEqual(self.union.call_count, 1)
+
+    def test_upsert_retries_concurrent_modification(self) -> None:
+        self.union.return_value.toList.side_effect = [_server_error('ConcurrentModificationException'),
+                                                      _server_error('ConcurrentModificationException'),
+                                                      ['table_0']]
+
+        self.assertEqual(self.client.upsert_nodes([('table_0', 'Table', {})]), 1)
+        # the traversal is built again for each attempt
+        self.assertEqual(self.union.call_count, 3)
+
+    def test_upsert_gives_up_after_max_retries(self) -> None:
+        self.client.max_retries = 2
+        self.union.return_value.toList.side_effect = _server_error('ConcurrentModificationException')
+
+        with self.assertRaises(GremlinServerError):
+            self.client.upsert_nodes([('table_0', 'Table', {})])
+        self.assertEqual(self.union.call_count, 3)
+
+    def test_upsert_does_not_retry_other_errors(self) -> None:
+        self.union.return_value.toList.side_effect = _server_error('ConstraintViolationException')
+
+        with self.assertRaises(GremlinServerError):
+            self.client.upsert_nodes([('table_0', 'Table', {})])
+        self.assertEqual(self.union.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+import unittest
+from typing import (
+    Any, Dict, List, Optional,
+)
+
+from gremlin_python.process.graph_traversal import __
+from gremlin_python.process.traversal import P, T
+from mock import patch
+from pyhocon import ConfigFactory
+
+from databuilder.clients.neptune_client import NeptuneSessionClient
+from databuilder.extractor.neptune_search_data_extractor import NeptuneSearchDataExtractor, _page
+
+
+class _Vertices:
+    """
+    Stands in for the traversal of the vertices that the ids of the pages are listed from
+    """
+
+    def __init__(self, ids: List[str], listings: List[Optional[str]]) -> None:
+        self.ids = ids
+        self.listings = listings
+        self.after_id: Optional[str] = None
+        self.page_size: Optional[int] = None
+
+    def has(self, key: Any, predicate: P) -> '_Vertices':
+        assert key == T.id and predicate.operator == 'gt'
+        self.after_id = predicate.value
+        return self
+
+    def id(self) -> '_Vertices':
+        return self
+
+    def order(self) -> '_Vertices':
+        return self
+
+    def limit(self, page_size: int) -> '_Vertices':
+        self.page_size = page_size
+        return self
+
+    def toList(self) -> List[str]:
+        self.listings.append(self.after_id)
+        ids = sorted(vertex_id for vertex_id in self.ids if self.after_id is None or vertex_id > self.after_id)
+        return ids[:self.page_size]
+
+
+class TestNeptuneSearchDataExtractor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pages: List[List[str]] = []
+        self.listings: List[Optional[str]] = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _extractor(self, ids: List[str], page_delay_sec: float = 0, **conf: Any) -> NeptuneSearchDataExtractor:
+        def vertices(graph: Any, tag_filter: str) -> _Vertices:
+            self.assertEqual(tag_filter, 'unique_tag')
+            return _Vertices(ids, self.listings)
+
+        def query(graph: Any, tag_filter: str, page: Optional[List[str]] = None) -> List[Dict]:
+            if page is None:
+                return [{'key': vertex_id} for vertex_id in ids]
+            with self.lock:
+                self.pages.append(page)
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            # the first pages are the last to be fetched
+            time.sleep(page_delay_sec * (len(ids) - ids.index(page[0])))
+            with self.lock:
+                self.in_flight -= 1
+            return [{'key': vertex_id} for vertex_id in reversed(page)]
+
+        extractor = NeptuneSearchDataExtractor()
+        with patch.object(NeptuneSessionClient, 'init'):
+            extractor.init(ConfigFactory.from_dict({
+                NeptuneSearchDataExtractor.ENTITY_TYPE_CONFIG_KEY: 'table',
+                NeptuneSearchDataExtractor.JOB_PUBLISH_TAG_CONFIG_KEY: 'unique_tag',
+                NeptuneSearchDataExtractor.QUERY_FUNCTION_CONFIG_KEY: query,
+                NeptuneSearchDataExtractor.VERTICES_FUNCTION_CONFIG_KEY: vertices,
+                NeptuneSearchDataExtractor.PAGE_SIZE_CONFIG_KEY: 2,
+                NeptuneSearchDataExtractor.PAGE_CONCURRENCY_CONFIG_KEY: 2,
+                **conf
+            }))
+        return extractor
+
+    def _extract_all(self, extractor: NeptuneSearchDataExtractor) -> List[str]:
+        keys = []
+        result = extractor.extract()
+        while result:
+            keys.append(result['key'])
+            result = extractor.extract()
+        return keys
+
+    def test_page_looks_up_the_vertices_by_id(self) -> None:
+        self.assertEqual(_page(__.V(), ['table_0', 'table_1']).bytecode.step_instructions,
+                         [['V'], ['hasId', 'table_0', 'table_1']])
+        self.assertEqual(_page(__.V(), None).bytecode.step_instructions, [['V']])
+
+    def test_full_pages(self) -> None:
+        ids = [f'table_{i}' for i in range(6)]
+        extractor = self._extractor(ids)
+
+        self.assertEqual(self._extract_all(extractor), ['table_1', 'table_0', 'table_3', 'table_2',
+                                                        'table_5', 'table_4'])
+        self.assertEqual(self.pages, [['table_0', 'table_1'], ['table_2', 'table_3'], ['table_4', 'table_5']])
+        # each listing starts after the last id of the previous page, until one isn't full
+        self.assertEqual(self.listings, [None, 'table_1', 'table_3', 'table_5'])
+
+    def test_final_short_page(self) -> None:
+        ids = [f'table_{i}' for i in range(5)]
+        extractor = self._extractor(ids)
+
+        self.assertEqual(sorted(self._extract_all(extractor)), ids)
+        self.assertEqual(self.pages, [['table_0', 'table_1'], ['table_2', 'table_3'], ['table_4']])
+        self.assertEqual(self.listings, [None, 'table_1', 'table_3'])
+
+    def test_pages_are_yielded_in_order(self) -> None:
+        ids = [f'table_{i}' for i in range(8)]
+        extractor = self._extractor(ids, page_delay_sec=0.01)
+
+        self.assertEqual(self._extract_all(extractor),
+                         ['table_1', 'table_0', 'table_3', 'table_2', 'table_5', 'table_4', 'table_7', 'table_6'])
+        self.assertEqual(self.max_in_flight, 2)
+
+    def test_empty_graph(self) -> None:
+        extractor = self._extractor([])
+
+        self.assertIsNone(extractor.extract())
+        self.assertEqual(self.pages, [])
+        self.assertEqual(self.listings, [None])
+
+    def test_not_paged(self) -> None:
+        ids = [f'table_{i}' for i in range(3)]
+        extractor = self._extractor(ids, **{NeptuneSearchDataExtractor.PAGE_SIZE_CONFIG_KEY: 0})
+
+        self.assertEqual(self._extract_all(extractor), ids)
+        self.assertEqual(self.pages, [])
+        self.assertEqual(self.listings, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
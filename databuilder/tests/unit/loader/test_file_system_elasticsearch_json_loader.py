@@ -1,6 +1,7 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import gzip
 import json
 import shutil
 import tempfile
@@ -159,3 +160,33 @@ class TestFSElasticsearchJSONLoader(unittest.TestCase):
         ] * 5
 
         self._check_results_helper(expected=expected)
+
+    def test_loading_gzip_file(self) -> None:
+        """
+        Test Loading functionality to a gzip compressed file
+        """
+        self.conf.put('loader.filesystem.elasticsearch.file_path', f'{self.temp_dir_path}/test_file.json.gz')
+        loader = FSElasticsearchJSONLoader()
+        loader.init(conf=Scoped.get_scoped_conf(conf=self.conf,
+                                                scope=loader.get_scope()))
+
+        data = [TableESDocument(database='test_database',
+                                cluster='test_cluster',
+                                schema='test_schema',
+                                name=f'test_table_{i}',
+                                key=f'test_table_key_{i}',
+                                last_updated_timestamp=123456789,
+                                description='test_description',
+                                column_names=['test_col1'],
+                                column_descriptions=['test_comment1'],
+                                total_usage=10,
+                                unique_usage=5,
+                                tags=['test_tag1'])
+                for i in range(3)]
+        for d in data:
+            loader.load(d)
+        loader.close()
+
+        with gzip.open(f'{self.temp_dir_path}/test_file.json.gz', 'rt', encoding='utf-8') as file:
+            self.assertEqual([json.loads(line)['name'] for line in file],
+                             ['test_table_0', 'test_table_1', 'test_table_2'])
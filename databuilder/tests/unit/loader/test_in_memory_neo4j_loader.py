@@ -0,0 +1,72 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from typing import Union
+
+from pyhocon import ConfigFactory
+
+from databuilder.loader.in_memory_neo4j_loader import InMemoryNeo4jLoader
+from databuilder.models.graph_serializable import (
+    GraphNode, GraphRelationship, GraphSerializable,
+)
+from tests.unit.models.test_graph_serializable import (
+    Actor, City, Movie,
+)
+
+
+class Review(GraphSerializable):
+    def __init__(self, description: Union[str, None], stars: int) -> None:
+        self._node: Union[GraphNode, None] = GraphNode(key='review://top_gun', label='Review',
+                                                       attributes={'description': description, 'stars': stars})
+
+    def create_next_node(self) -> Union[GraphNode, None]:
+        node, self._node = self._node, None
+        return node
+
+    def create_next_relation(self) -> Union[GraphRelationship, None]:
+        return None
+
+
+class TestInMemoryNeo4jLoader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loader = InMemoryNeo4jLoader()
+        self.loader.init(ConfigFactory.from_dict({}))
+
+    def test_load(self) -> None:
+        self.loader.load(Movie('Top Gun', [Actor('Tom Cruise'), Actor('Meg Ryan')], [City('San Diego')]))
+        self.loader.load(Movie('Heat', [Actor('Al Pacino')], [City('Los Angeles')]))
+
+        node_keys = frozenset({'KEY', 'LABEL', 'name'})
+        self.assertEqual(list(self.loader.node_groups.keys()),
+                         [('Movie', node_keys), ('Actor', node_keys), ('City', node_keys)])
+        self.assertEqual([record['KEY'] for record in self.loader.node_groups[('Actor', node_keys)]],
+                         ['actor://Tom Cruise', 'actor://Meg Ryan', 'actor://Al Pacino'])
+
+        relation_keys = frozenset({'START_KEY', 'START_LABEL', 'END_KEY', 'END_LABEL', 'TYPE', 'REVERSE_TYPE'})
+        self.assertEqual(list(self.loader.relation_groups.keys()),
+                         [('Movie', 'Actor', 'ACTOR', relation_keys), ('Movie', 'City', 'FILMED_AT', relation_keys)])
+        self.assertEqual(self.loader.relation_groups[('Movie', 'City', 'FILMED_AT', relation_keys)],
+                         [{'START_KEY': 'movie://Top Gun', 'START_LABEL': 'Movie', 'END_KEY': 'city://San Diego',
+                           'END_LABEL': 'City', 'TYPE': 'FILMED_AT', 'REVERSE_TYPE': 'APPEARS_IN'},
+                          {'START_KEY': 'movie://Heat', 'START_LABEL': 'Movie', 'END_KEY': 'city://Los Angeles',
+                           'END_LABEL': 'City', 'TYPE': 'FILMED_AT', 'REVERSE_TYPE': 'APPEARS_IN'}])
+
+    def test_load_serializes_as_csv_rows(self) -> None:
+        self.loader.load(Review(None, 5))
+
+        node_keys = frozenset({'KEY', 'LABEL', 'description', 'stars:UNQUOTED'})
+        self.assertEqual(self.loader.node_groups,
+                         {('Review', node_keys): [{'KEY': 'review://top_gun', 'LABEL': 'Review',
+                                                   'description': '', 'stars:UNQUOTED': 5}]})
+        self.assertEqual(self.loader.relation_groups, {})
+
+    def test_init_clears_records(self) -> None:
+        self.loader.load(Review('Classic', 4))
+        self.loader.init(ConfigFactory.from_dict({}))
+
+        self.assertEqual(self.loader.node_groups, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,11 +3,15 @@
 import logging
 import os
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from apache_atlas.exceptions import AtlasServiceException
+from apache_atlas.model.instance import AtlasEntitiesWithExtInfo, AtlasEntity
 from pyhocon import ConfigFactory
+from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from databuilder import Scoped
+from databuilder.publisher import atlas_csv_publisher
 from databuilder.publisher.atlas_csv_publisher import AtlasCSVPublisher
 
 
@@ -18,16 +22,22 @@ class TestAtlasCsvPublisher(unittest.TestCase):
         self._resource_path = os.path.join(os.path.dirname(__file__), '../resources/atlas_csv_publisher')
         self.mock_atlas_client = MagicMock()
 
-        config_dict = {
+        self._config_dict = {
             'publisher.atlas_csv_publisher.entity_files_directory': f'{self._resource_path}/entities',
             'publisher.atlas_csv_publisher.relationship_files_directory': f'{self._resource_path}/relationships',
             'publisher.atlas_csv_publisher.batch_size': 1,
             'publisher.atlas_csv_publisher.atlas_client': self.mock_atlas_client,
         }
 
-        self._conf = ConfigFactory.from_dict(config_dict)
+        self._conf = ConfigFactory.from_dict(self._config_dict)
 
-    def test_publisher(self) -> None:
+        existing_entity = AtlasEntity({'typeName': 'City', 'guid': '42'})
+        existing_entity.attributes = {'name': 'Oakland', 'qualifiedName': 'city://Oakland'}
+        self.mock_atlas_client.entity.get_entities_by_attribute.return_value = AtlasEntitiesWithExtInfo(
+            {'entities': [existing_entity]}
+        )
+
+    def _publish(self) -> None:
         publisher = AtlasCSVPublisher()
         publisher.init(
             conf=Scoped.get_scoped_conf(
@@ -37,11 +47,61 @@ class TestAtlasCsvPublisher(unittest.TestCase):
         )
         publisher.publish()
 
-        # 4 entities to create
-        self.assertEqual(self.mock_atlas_client.entity.create_entities.call_count, 4)
+    def test_publisher(self) -> None:
+        self._publish()
+
+        # 4 entities to create, and 1 entity to update in bulk
+        self.assertEqual(self.mock_atlas_client.entity.create_entities.call_count, 5)
+        self.mock_atlas_client.entity.update_entity.assert_not_called()
 
-        # 1 entity to update
-        self.assertEqual(self.mock_atlas_client.entity.update_entity.call_count, 1)
+        # the entity to update is fetched in bulk by its unique attributes
+        self.mock_atlas_client.entity.get_entities_by_attribute.assert_called_once_with(
+            'City', [{'qualifiedName': 'city://Oakland'}]
+        )
+        updated_entities = [call[0][0].entities for call in self.mock_atlas_client.entity.create_entities.call_args_list
+                            if call[0][0].entities[0].guid == '42']
+        self.assertEqual(len(updated_entities), 1)
+        self.assertEqual(updated_entities[0][0].attributes['operation'], 'UPDATE')
 
         # 2 relationships to create
         self.assertEqual(self.mock_atlas_client.relationship.create_relationship.call_count, 2)
+
+    def test_retry_failed_calls(self) -> None:
+        server_error = MagicMock(status_code=503, content=b'')
+        client_error = MagicMock(status_code=409, content=b'')
+        api = MagicMock(method='POST', path='relationship')
+        # the first relationship conflicts with an existing one, the second one is created once the server is back
+        self.mock_atlas_client.relationship.create_relationship.side_effect = [
+            AtlasServiceException(api, client_error),
+            AtlasServiceException(api, server_error),
+            None,
+        ]
+        self._conf = ConfigFactory.from_dict({**self._config_dict, 'publisher.atlas_csv_publisher.worker_count': 1})
+
+        with patch.object(atlas_csv_publisher.time, 'sleep') as sleep:
+            self._publish()
+
+        self.assertEqual(self.mock_atlas_client.relationship.create_relationship.call_count, 3)
+        sleep.assert_called_once_with(1)
+
+    def test_retries_exhausted_fail_the_publish(self) -> None:
+        self.mock_atlas_client.relationship.create_relationship.side_effect = RequestsConnectionError()
+        self._conf = ConfigFactory.from_dict({**self._config_dict, 'publisher.atlas_csv_publisher.worker_count': 1,
+                                              'publisher.atlas_csv_publisher.max_retries': 2})
+
+        with patch.object(atlas_csv_publisher.time, 'sleep') as sleep, self.assertRaises(RequestsConnectionError):
+            self._publish()
+
+        # each of the 2 relationships is retried twice before the publish fails
+        self.assertEqual(self.mock_atlas_client.relationship.create_relationship.call_count, 6)
+        self.assertEqual([call[0][0] for call in sleep.call_args_list], [1, 2, 1, 2])
+
+    def test_other_errors_fail_the_publish(self) -> None:
+        self.mock_atlas_client.entity.create_entities.side_effect = KeyError('qualifiedName')
+
+        with patch.object(atlas_csv_publisher.time, 'sleep') as sleep, self.assertRaises(KeyError):
+            self._publish()
+
+        # the error is not retried, and the relationships are not created
+        sleep.assert_not_called()
+        self.mock_atlas_client.relationship.create_relationship.assert_not_called()
@@ -1,8 +1,13 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import gzip
 import json
+import os
+import shutil
+import tempfile
 import unittest
+from typing import List
 
 from mock import (
     MagicMock, mock_open, patch,
@@ -33,6 +38,10 @@ class TestElasticsearchPublisher(unittest.TestCase):
 
         self.conf = ConfigFactory.from_dict(config_dict)
 
+    def _bulk_body_documents(self) -> List[dict]:
+        body = self.mock_es_client.bulk.call_args[1]['body']
+        return [json.loads(line) for line in body.splitlines()]
+
     def test_publish_with_no_data(self) -> None:
         """
         Test Publish functionality with no data
@@ -72,12 +81,12 @@ class TestElasticsearchPublisher(unittest.TestCase):
                                                                        body=default_mapping)
 
             # bulk endpoint called once
-            self.mock_es_client.bulk.assert_called_once_with(
-                [{'index': {'_index': self.test_es_new_index}},
-                 {'KEY_DOESNOT_MATTER': 'NO_VALUE',
-                  'KEY_DOESNOT_MATTER2': 'NO_VALUE2',
-                  'resource_type': 'test_doc_type'}]
-            )
+            self.mock_es_client.bulk.assert_called_once()
+            self.assertEqual(self._bulk_body_documents(),
+                             [{'index': {'_index': self.test_es_new_index}},
+                              {'KEY_DOESNOT_MATTER': 'NO_VALUE',
+                               'KEY_DOESNOT_MATTER2': 'NO_VALUE2',
+                               'resource_type': 'test_doc_type'}])
 
             # update alias endpoint called once
             self.mock_es_client.indices.update_aliases.assert_called_once_with(
@@ -107,15 +116,41 @@ class TestElasticsearchPublisher(unittest.TestCase):
                                                                        body=default_mapping)
 
             # bulk endpoint called once
-            self.mock_es_client.bulk.assert_called_once_with(
-                [{'index': {'_index': self.test_es_new_index}},
-                 {'KEY_DOESNOT_MATTER': 'NO_VALUE',
-                  'KEY_DOESNOT_MATTER2': 'NO_VALUE2',
-                  'resource_type': 'test_doc_type'}]
-            )
+            self.mock_es_client.bulk.assert_called_once()
+            self.assertEqual(self._bulk_body_documents(),
+                             [{'index': {'_index': self.test_es_new_index}},
+                              {'KEY_DOESNOT_MATTER': 'NO_VALUE',
+                               'KEY_DOESNOT_MATTER2': 'NO_VALUE2',
+                               'resource_type': 'test_doc_type'}])
 
             # update alias endpoint called once
             self.mock_es_client.indices.update_aliases.assert_called_once_with(
                 {'actions': [{"add": {"index": self.test_es_new_index, "alias": self.test_es_alias}},
                              {"remove_index": {"index": 'test_old_index'}}]}
             )
+
+    def test_publish_streams_gzip_file(self) -> None:
+        """
+        Test Publish functionality with a gzip compressed file and documents split into several bulk requests
+        """
+        temp_dir_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir_path)
+        file_path = os.path.join(temp_dir_path, 'test_publisher_file.json.gz')
+        with gzip.open(file_path, 'wt', encoding='utf-8') as file:
+            file.write(json.dumps({'name': 'orders'}) + '\n\n')
+            file.write(json.dumps({'name': 'customers', 'resource_type': 'table'}) + '\n')
+            file.write(json.dumps({'name': 'items'}) + '\n')
+        self.conf.put('publisher.elasticsearch.file_path', file_path)
+        self.conf.put('publisher.elasticsearch.batch_size', 2)
+
+        publisher = ElasticsearchPublisher()
+        publisher.init(conf=Scoped.get_scoped_conf(conf=self.conf, scope=publisher.get_scope()))
+        publisher.publish()
+
+        self.assertEqual(self.mock_es_client.bulk.call_count, 2)
+        documents = [json.loads(line)
+                     for call in self.mock_es_client.bulk.call_args_list
+                     for line in call[1]['body'].splitlines()]
+        self.assertEqual(documents[1::2], [{'name': 'orders', 'resource_type': 'test_doc_type'},
+                                           {'name': 'customers', 'resource_type': 'test_doc_type'},
+                                           {'name': 'items', 'resource_type': 'test_doc_type'}])
@@ -0,0 +1,91 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import unittest
+import uuid
+
+from mock import MagicMock, patch
+from neo4j import GraphDatabase
+from pyhocon import ConfigFactory
+
+from databuilder.loader.in_memory_neo4j_loader import InMemoryNeo4jLoader
+from databuilder.publisher.neo4j_unwind_publisher import Neo4jUnwindPublisher
+from databuilder.publisher.publisher_config_constants import Neo4jCsvPublisherConfigs, PublisherConfigs
+from tests.unit.models.test_graph_serializable import (
+    Actor, City, Movie,
+)
+
+
+class TestNeo4jUnwindPublisher(unittest.TestCase):
+
+    def setUp(self) -> None:
+        logging.basicConfig(level=logging.INFO)
+        self.loader = InMemoryNeo4jLoader()
+        self.loader.init(ConfigFactory.from_dict({}))
+        self.loader.load(Movie('Top Gun', [Actor('Tom Cruise'), Actor('Meg Ryan')], [City('San Diego')]))
+
+        self.publish_tag = str(uuid.uuid4())
+        self.conf = ConfigFactory.from_dict(
+            {Neo4jCsvPublisherConfigs.NEO4J_END_POINT_KEY: 'bolt://999.999.999.999:7687/',
+             Neo4jCsvPublisherConfigs.NEO4J_USER: 'neo4j_user',
+             Neo4jCsvPublisherConfigs.NEO4J_PASSWORD: 'neo4j_password',
+             Neo4jCsvPublisherConfigs.NEO4J_CREATE_ONLY_NODES: ['City'],
+             PublisherConfigs.JOB_PUBLISH_TAG: self.publish_tag}
+        )
+
+    def test_publisher(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver:
+            mock_session = MagicMock()
+            mock_driver.return_value.session.return_value = mock_session
+
+            mock_write_transaction = MagicMock()
+            mock_session.__enter__.return_value.write_transaction = mock_write_transaction
+
+            publisher = Neo4jUnwindPublisher(self.loader)
+            publisher.init(self.conf)
+            publisher.publish()
+
+            # Create 3 indices, write 3 groups of nodes, write 2 groups of relations
+            self.assertEqual(8, mock_write_transaction.call_count)
+            statements = [call_args[0][1] for call_args in mock_write_transaction.call_args_list]
+            self.assertTrue(all('CREATE CONSTRAINT' in stmt for stmt in statements[:3]))
+            self.assertTrue(all('MERGE (node:' in stmt for stmt in statements[3:6]))
+            self.assertTrue(all('MERGE (n1)-[r1:' in stmt for stmt in statements[6:]))
+
+            self.assertIn('MERGE (node:Actor', statements[4])
+            self.assertIn('ON MATCH SET', statements[4])
+            self.assertIn('MERGE (node:City', statements[5])
+            self.assertNotIn('ON MATCH SET', statements[5])
+            self.assertIn(f"node.published_tag = '{self.publish_tag}'", statements[4])
+
+            actor_batch = mock_write_transaction.call_args_list[4][0][2]['batch']
+            self.assertEqual(actor_batch, [{'KEY': 'actor://Tom Cruise', 'LABEL': 'Actor', 'name': 'Top Gun'},
+                                           {'KEY': 'actor://Meg Ryan', 'LABEL': 'Actor', 'name': 'Top Gun'}])
+            self.assertEqual(self.loader.node_groups, {})
+            self.assertEqual(self.loader.relation_groups, {})
+
+    def test_publisher_write_exception(self) -> None:
+        with patch.object(GraphDatabase, 'driver') as mock_driver:
+            mock_session = MagicMock()
+            mock_driver.return_value.session.return_value = mock_session
+
+            mock_write_transaction = MagicMock(side_effect=Exception('Could not write'))
+            mock_session.__enter__.return_value.write_transaction = mock_write_transaction
+
+            publisher = Neo4jUnwindPublisher(self.loader)
+            publisher.init(self.conf)
+
+            with self.assertRaises(Exception):
+                publisher.publish()
+
+    def test_publish_tag_required(self) -> None:
+        with patch.object(GraphDatabase, 'driver'):
+            publisher = Neo4jUnwindPublisher(self.loader)
+
+            with self.assertRaises(Exception):
+                publisher.init(ConfigFactory.from_dict({PublisherConfigs.JOB_PUBLISH_TAG: ''}).with_fallback(self.conf))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import csv
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from typing import (
+    IO, Any, Dict, List,
+)
+
+from mock import (
+    MagicMock, call, patch,
+)
+from pyhocon import ConfigFactory
+
+from databuilder.publisher.neptune_csv_publisher import NeptuneCSVPublisher, split_csv
+
+HEADER = b'~id,~label,name:String\n'
+
+
+def _read_parts(file_csv: IO[bytes], max_part_bytes: int) -> List[bytes]:
+    return [part.read() for part in split_csv(file_csv, max_part_bytes)]
+
+
+def _records(part: bytes) -> List[List[str]]:
+    return list(csv.reader(io.StringIO(part.decode('utf-8'), newline='')))[1:]
+
+
+class TestSplitCsv(unittest.TestCase):
+    def test_small_file_is_not_split(self) -> None:
+        file_csv = io.BytesIO(HEADER + b'table_0,Table,t0\n')
+        parts = list(split_csv(file_csv, 1024))
+
+        self.assertEqual(len(parts), 1)
+        self.assertIs(parts[0], file_csv)
+        self.assertEqual(parts[0].read(), HEADER + b'table_0,Table,t0\n')
+
+    def test_header_is_repeated_in_every_part(self) -> None:
+        records = [f'table_{i},Table,t{i}\n'.encode() for i in range(10)]
+        max_part_bytes = len(HEADER) + 3 * len(records[0])
+
+        parts = _read_parts(io.BytesIO(HEADER + b''.join(records)), max_part_bytes)
+
+        self.assertEqual(len(parts), 4)
+        self.assertTrue(all(part.startswith(HEADER) for part in parts))
+        self.assertTrue(all(len(part) <= max_part_bytes for part in parts))
+        self.assertEqual(b''.join(part[len(HEADER):] for part in parts), b''.join(records))
+
+    def test_quoted_line_breaks_are_not_cut(self) -> None:
+        records = [b'table_0,Table,t0\n',
+                   b'table_1,Table,"a name\nover ""three""\nlines"\n',
+                   b'table_2,Table,t2\n']
+        # the part would be full in the middle of the second record
+        max_part_bytes = len(HEADER) + len(records[0]) + 10
+
+        parts = _read_parts(io.BytesIO(HEADER + b''.join(records)), max_part_bytes)
+
+        self.assertEqual([_records(part) for part in parts],
+                         [[['table_0', 'Table', 't0']],
+                          [['table_1', 'Table', 'a name\nover "three"\nlines']],
+                          [['table_2', 'Table', 't2']]])
+
+    def test_record_larger_than_part_is_a_part_of_its_own(self) -> None:
+        large_record = b'table_1,Table,' + b'x' * 100 + b'\n'
+        records = [b'table_0,Table,t0\n', large_record, b'table_2,Table,t2\n']
+
+        parts = _read_parts(io.BytesIO(HEADER + b''.join(records)), len(HEADER) + 20)
+
+        self.assertEqual(parts, [HEADER + records[0], HEADER + large_record, HEADER + records[2]])
+
+
+class TestNeptuneCSVPublisher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.node_dir = os.path.join(self.temp_dir, 'nodes')
+        self.relation_dir = os.path.join(self.temp_dir, 'relations')
+        os.mkdir(self.node_dir)
+        os.mkdir(self.relation_dir)
+
+        self.conf = ConfigFactory.from_dict({
+            NeptuneCSVPublisher.NODE_FILES_DIR: self.node_dir,
+            NeptuneCSVPublisher.RELATION_FILES_DIR: self.relation_dir,
+            NeptuneCSVPublisher.AWS_S3_BUCKET_NAME: 'bucket',
+            NeptuneCSVPublisher.AWS_BASE_S3_DATA_PATH: 'amundsen',
+            NeptuneCSVPublisher.NEPTUNE_HOST: 'neptune:8182',
+            NeptuneCSVPublisher.AWS_REGION: 'us-east-1',
+        })
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def _publisher(self, **conf: Any) -> NeptuneCSVPublisher:
+        publisher = NeptuneCSVPublisher()
+        with patch('databuilder.publisher.neptune_csv_publisher.Session'), \
+                patch('databuilder.publisher.neptune_csv_publisher.NeptuneBulkLoaderApi'):
+            publisher.init(ConfigFactory.from_dict(conf).with_fallback(self.conf))
+        return publisher
+
+    def _uploads(self, publisher: NeptuneCSVPublisher) -> Dict[str, bytes]:
+        """
+        :return: the content uploaded to each S3 key
+        """
+        uploads: Dict[str, bytes] = {}
+
+        def upload_fileobj(fileobj: IO[bytes], bucket: str, key: str, Config: Any) -> None:
+            self.assertEqual(bucket, 'bucket')
+            self.assertIs(Config, publisher._s3_transfer_config)
+            uploads[key] = fileobj.read()
+
+        publisher._s3_client.upload_fileobj.side_effect = upload_fileobj
+        return uploads
+
+    def _write(self, directory: str, file_name: str, content: bytes) -> None:
+        with open(os.path.join(directory, file_name), 'wb') as f:
+            f.write(content)
+
+    def test_upload_compressed_files(self) -> None:
+        self._write(self.node_dir, 'Table.csv', HEADER + b'table_0,Table,t0\n')
+        publisher = self._publisher()
+        uploads = self._uploads(publisher)
+
+        publisher.upload_files('amundsen/2021')
+
+        self.assertEqual(list(uploads), ['amundsen/2021/Table.csv.gz'])
+        self.assertEqual(gzip.decompress(uploads['amundsen/2021/Table.csv.gz']), HEADER + b'table_0,Table,t0\n')
+
+    def test_upload_uncompressed_files(self) -> None:
+        self._write(self.node_dir, 'Table.csv', HEADER + b'table_0,Table,t0\n')
+        self._write(self.relation_dir, 'Table_Column.csv', b'~id,~from,~to,~label\nedge_0,table_0,column_0,COLUMN\n')
+        publisher = self._publisher(**{NeptuneCSVPublisher.COMPRESS_FILES: False})
+        uploads = self._uploads(publisher)
+
+        publisher.upload_files('amundsen/2021')
+
+        self.assertEqual(uploads, {
+            'amundsen/2021/Table.csv': HEADER + b'table_0,Table,t0\n',
+            'amundsen/2021/Table_Column.csv': b'~id,~from,~to,~label\nedge_0,table_0,column_0,COLUMN\n',
+        })
+
+    def test_upload_split_files(self) -> None:
+        records = [f'table_{i},Table,t{i}\n'.encode() for i in range(4)]
+        self._write(self.node_dir, 'Table.csv', HEADER + b''.join(records))
+        publisher = self._publisher(**{NeptuneCSVPublisher.MAX_FILE_PART_BYTES: len(HEADER) + 2 * len(records[0])})
+        uploads = self._uploads(publisher)
+
+        publisher.upload_files('amundsen/2021')
+
+        self.assertEqual({key: gzip.decompress(content) for key, content in uploads.items()}, {
+            'amundsen/2021/Table_part00000.csv.gz': HEADER + records[0] + records[1],
+            'amundsen/2021/Table_part00001.csv.gz': HEADER + records[2] + records[3],
+        })
+
+    def test_transfer_config(self) -> None:
+        publisher = self._publisher(**{NeptuneCSVPublisher.MULTIPART_CHUNK_BYTES: 8 * 1024 * 1024,
+                                       NeptuneCSVPublisher.MULTIPART_CONCURRENCY: 2})
+
+        self.assertEqual(publisher._s3_transfer_config.multipart_threshold, 8 * 1024 * 1024)
+        self.assertEqual(publisher._s3_transfer_config.multipart_chunksize, 8 * 1024 * 1024)
+        self.assertEqual(publisher._s3_transfer_config.max_concurrency, 2)
+
+    def test_status_polling_period_grows_up_to_its_max(self) -> None:
+        self._write(self.node_dir, 'Table.csv', HEADER + b'table_0,Table,t0\n')
+        publisher = self._publisher(**{NeptuneCSVPublisher.STATUS_POLLING_PERIOD: 1,
+                                       NeptuneCSVPublisher.STATUS_POLLING_BACKOFF_FACTOR: 2,
+                                       NeptuneCSVPublisher.MAX_STATUS_POLLING_PERIOD: 5})
+        self._uploads(publisher)
+        neptune_api_client = MagicMock()
+        publisher.neptune_api_client = neptune_api_client
+        neptune_api_client.load.return_value = {'payload': {'loadId': 'load_0'}}
+        neptune_api_client.load_status.side_effect = \
+            [{'payload': {'overallStatus': {'status': status}}}
+             for status in ['LOAD_IN_QUEUE', 'LOAD_NOT_STARTED'] + ['LOAD_IN_PROGRESS'] * 3 + ['LOAD_COMPLETED']]
+
+        with patch('databuilder.publisher.neptune_csv_publisher.time.sleep') as mock_sleep:
+            publisher.publish()
+
+        self.assertEqual(mock_sleep.call_args_list, [call(1), call(2), call(4), call(5), call(5), call(5)])
+        neptune_api_client.load_status.assert_called_with(load_id='load_0', errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
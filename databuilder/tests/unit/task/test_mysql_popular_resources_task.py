@@ -0,0 +1,87 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import unittest
+from collections import namedtuple
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from pyhocon import ConfigFactory
+
+from databuilder.task import mysql_popular_resources_task
+from databuilder.task.mysql_popular_resources_task import MySQLPopularResourcesTask
+
+Usage = namedtuple('Usage', ['user_rk', 'res_key', 'readers', 'total_reads'])
+
+
+class TestMySQLPopularResourcesTask(unittest.TestCase):
+
+    def setUp(self) -> None:
+        logging.basicConfig(level=logging.INFO)
+
+    @patch.object(mysql_popular_resources_task, 'sessionmaker')
+    @patch.object(mysql_popular_resources_task, 'create_engine')
+    def _init_task(self, mock_create_engine: Any, mock_session_maker: Any, **kwargs: Any) -> MySQLPopularResourcesTask:
+        task = MySQLPopularResourcesTask()
+        conf = {
+            'job.identifier': 'mysql_popular_resources_job',
+            f'{task.get_scope()}.{MySQLPopularResourcesTask.CONN_STRING}': 'foobar',
+        }
+        conf.update({f'{task.get_scope()}.{k}': v for k, v in kwargs.items()})
+        task.init(ConfigFactory.from_dict(conf))
+        self.session = MagicMock()
+        task._session = self.session
+        return task
+
+    def test_unsupported_resource_type(self) -> None:
+        with self.assertRaises(Exception):
+            self._init_task(**{MySQLPopularResourcesTask.RESOURCE_TYPES: ['feature']})
+
+    def test_global_ranking_rows(self) -> None:
+        task = self._init_task(**{MySQLPopularResourcesTask.NUM_ENTRIES: 2})
+        self.session.query.return_value.group_by.return_value.having.return_value.all.return_value = [
+            Usage(None, 'foo', 10, 10),
+            Usage(None, 'bar', 20, 100),
+            Usage(None, 'baz', 15, 1000),
+        ]
+
+        rows = task._get_global_ranking_rows(resource_type='table')
+
+        self.assertEqual(rows, [
+            {'resource_type': 'table', 'user_rk': '', 'popularity_rank': 1, 'resource_rk': 'baz'},
+            {'resource_type': 'table', 'user_rk': '', 'popularity_rank': 2, 'resource_rk': 'bar'},
+        ])
+
+    def test_personal_ranking_rows(self) -> None:
+        task = self._init_task(**{MySQLPopularResourcesTask.MINIMUM_READER_COUNT: 1})
+        self.session.query.return_value.group_by.return_value.having.return_value.all.return_value = [
+            Usage('alice', 'foo', 1, 10),
+            Usage('bob', 'foo', 1, 5),
+            Usage('alice', 'bar', 1, 100),
+        ]
+
+        rows = task._get_personal_ranking_rows(resource_type='dashboard')
+
+        self.assertEqual(rows, [
+            {'resource_type': 'dashboard', 'user_rk': 'alice', 'popularity_rank': 1, 'resource_rk': 'bar'},
+            {'resource_type': 'dashboard', 'user_rk': 'alice', 'popularity_rank': 2, 'resource_rk': 'foo'},
+            {'resource_type': 'dashboard', 'user_rk': 'bob', 'popularity_rank': 1, 'resource_rk': 'foo'},
+        ])
+
+    def test_replace_ranking(self) -> None:
+        task = self._init_task(**{MySQLPopularResourcesTask.INSERT_BATCH_SIZE: 2})
+        rows = [{'resource_type': 'table', 'user_rk': '', 'popularity_rank': i, 'resource_rk': f'key_{i}'}
+                for i in range(1, 4)]
+
+        task._replace_ranking(resource_type='table', rows=rows)
+
+        # one delete followed by two insert batches, committed together
+        self.assertEqual(self.session.execute.call_count, 3)
+        self.assertEqual(self.session.execute.call_args_list[1][0][1], rows[:2])
+        self.assertEqual(self.session.execute.call_args_list[2][0][1], rows[2:])
+        self.session.commit.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import unittest
+from typing import Any, Dict
+
+from mock import patch
+from neo4j import GraphDatabase
+from pyhocon import ConfigFactory
+
+from databuilder.task import neo4j_popular_resources_task
+from databuilder.task.neo4j_popular_resources_task import Neo4jPopularResourcesTask
+
+
+class TestNeo4jPopularResourcesTask(unittest.TestCase):
+
+    def setUp(self) -> None:
+        logging.basicConfig(level=logging.INFO)
+
+    def _init_task(self, **kwargs: Any) -> Neo4jPopularResourcesTask:
+        task = Neo4jPopularResourcesTask()
+        conf: Dict[str, Any] = {
+            'job.identifier': 'popular_resources_job',
+            f'{task.get_scope()}.{neo4j_popular_resources_task.NEO4J_END_POINT_KEY}': 'neo4j://example.com:7687',
+            f'{task.get_scope()}.{neo4j_popular_resources_task.NEO4J_USER}': 'foo',
+            f'{task.get_scope()}.{neo4j_popular_resources_task.NEO4J_PASSWORD}': 'bar',
+        }
+        conf.update({f'{task.get_scope()}.{k}': v for k, v in kwargs.items()})
+        task.init(ConfigFactory.from_dict(conf))
+        return task
+
+    def test_global_ranking(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), \
+                patch.object(Neo4jPopularResourcesTask, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = [[{'resource_key': 'foo'}, {'resource_key': 'bar'}], [], [], []]
+
+            task = self._init_task(**{neo4j_popular_resources_task.RESOURCE_TYPES: ['Table'],
+                                      neo4j_popular_resources_task.MATERIALIZE_PERSONAL: False,
+                                      neo4j_popular_resources_task.NUM_ENTRIES: 2})
+            task.run()
+
+            self.assertEqual(mock_execute.call_count, 4)
+            compute_call, _, set_call, remove_call = mock_execute.call_args_list
+
+            self.assertIn('MATCH (resource:Table)-[r:READ_BY]->(u:User)', compute_call[1]['statement'])
+            self.assertEqual(compute_call[1]['param_dict'], {'num_readers': 10, 'num_entries': 2})
+
+            self.assertIn('SET resource.popular_rank = row.rank', set_call[1]['statement'])
+            self.assertEqual(set_call[1]['param_dict']['rows'],
+                             [{'resource_key': 'foo', 'rank': 1}, {'resource_key': 'bar', 'rank': 2}])
+
+            marker = set_call[1]['param_dict']['marker']
+            self.assertIn('REMOVE resource.popular_rank, resource.popular_rank_updated_epoch_ms',
+                          remove_call[1]['statement'])
+            self.assertEqual(remove_call[1]['param_dict'], {'marker': marker})
+
+    def test_personal_ranking(self) -> None:
+        with patch.object(GraphDatabase, 'driver'), \
+                patch.object(Neo4jPopularResourcesTask, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = [[], [], [], [],
+                                        [{'user_key': 'a'}, {'user_key': 'b'}, {'user_key': 'c'}],
+                                        [], [], []]
+
+            task = self._init_task(**{neo4j_popular_resources_task.RESOURCE_TYPES: ['Dashboard'],
+                                      neo4j_popular_resources_task.USER_BATCH_SIZE: 2})
+            task.run()
+
+            self.assertEqual(mock_execute.call_count, 8)
+            first_batch, second_batch, remove_call = mock_execute.call_args_list[5:]
+
+            self.assertIn('SET u.popular_dashboard_keys = resource_keys', first_batch[1]['statement'])
+            self.assertEqual(first_batch[1]['param_dict']['user_keys'], ['a', 'b'])
+            self.assertEqual(second_batch[1]['param_dict']['user_keys'], ['c'])
+            self.assertIn('REMOVE u.popular_dashboard_keys, u.popular_dashboard_keys_updated_epoch_ms',
+                          remove_call[1]['statement'])
+
+
+if __name__ == '__main__':
+    unittest.main()
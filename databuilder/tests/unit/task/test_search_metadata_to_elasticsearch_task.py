@@ -0,0 +1,194 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import unittest
+from typing import (
+    Any, Iterator, List,
+)
+
+from mock import MagicMock, patch
+from pyhocon import ConfigFactory
+
+from databuilder.task.search import search_metadata_to_elasticsearch_task
+from databuilder.task.search.search_metadata_to_elasticsearch_task import SearchMetadatatoElasticasearchTask
+
+
+def _table_record(name: str, description: str = '') -> dict:
+    return {'key': f'hive://gold.core/{name}', 'name': name, 'schema': 'core', 'description': description}
+
+
+class TestSearchMetadataToElasticsearchTask(unittest.TestCase):
+
+    def _init_task(self, entity: str, *records: Any, **conf: Any) -> SearchMetadatatoElasticasearchTask:
+        extractor = MagicMock()
+        extractor.get_scope.return_value = 'extractor.search_data'
+        extractor.extract.side_effect = list(records) + [None]
+
+        task = SearchMetadatatoElasticasearchTask(extractor=extractor)
+        scope = task.get_scope()
+        task.init(ConfigFactory.from_dict({
+            f'{scope}.{SearchMetadatatoElasticasearchTask.ENTITY_TYPE}': entity,
+            f'{scope}.{SearchMetadatatoElasticasearchTask.ELASTICSEARCH_CLIENT_CONFIG_KEY}': MagicMock(),
+            f'{scope}.{SearchMetadatatoElasticasearchTask.ELASTICSEARCH_ALIAS_CONFIG_KEY}': f'{entity}_search_index',
+            f'{scope}.{SearchMetadatatoElasticasearchTask.ELASTICSEARCH_NEW_INDEX}': f'{entity}_search_index_new',
+            **{f'{scope}.{key}': value for key, value in conf.items()},
+        }))
+        return task
+
+    def test_generate_documents_with_suggest(self) -> None:
+        task = self._init_task('table', {
+            'key': 'hive://gold.core/order_items',
+            'name': 'order_items',
+            'schema': 'core',
+            'usage': {'total_usage': 42, 'unique_usage': 3},
+        })
+
+        documents = list(task.generate_documents(record=task.extractor.extract()))
+
+        self.assertEqual(len(documents), 1)
+        self.assertEqual(documents[0]['_index'], 'table_search_index_new')
+        self.assertEqual(documents[0]['_source']['resource_type'], 'table')
+        self.assertEqual(documents[0]['_source']['suggest'], {
+            'input': ['order_items', 'items', 'hive://gold.core/order_items'],
+            'weight': 42,
+        })
+        self.assertEqual(documents[0]['_source']['content_hash'],
+                         task.get_content_hash(documents[0]['_source']))
+
+    def test_suggest_weight(self) -> None:
+        task = self._init_task('user')
+        self.assertEqual(task.get_suggest({'key': 'jdoe@example.com',
+                                           'name': 'Jane Doe',
+                                           'usage': {'total_read': 7, 'total_own': 100}}),
+                         {'input': ['Jane Doe', 'Doe', 'jdoe@example.com'], 'weight': 7})
+
+        task = self._init_task('dashboard')
+        self.assertEqual(task.get_suggest({'key': 'mode_dashboard://gold.sales/daily', 'name': 'daily'}),
+                         {'input': ['daily', 'mode_dashboard://gold.sales/daily'], 'weight': 0})
+        self.assertEqual(task.get_suggest({'key': 'k', 'name': 'n', 'usage': {'total_usage': 2 ** 40}})['weight'],
+                         2 ** 31 - 1)
+
+    def _run(self, task: SearchMetadatatoElasticasearchTask, indexed_hits: List[dict]) -> MagicMock:
+        """
+        Runs the task against a mocked cluster
+        :return: the mocked connection, with the bulk actions sent in bulk_actions
+        """
+        connection = task.elasticsearch_client
+        connection.cluster.health.return_value = {'status': 'green'}
+        bulk_actions: List[dict] = []
+
+        def bulk(body: str, **kwargs: Any) -> dict:
+            lines = iter(body.splitlines())
+            for action_line in lines:
+                op_type, meta = json.loads(action_line).popitem()
+                action = {'_op_type': op_type, **meta}
+                if op_type != 'delete':
+                    action['_source'] = json.loads(next(lines))
+                bulk_actions.append(action)
+            return {'errors': False, 'items': []}
+
+        def scan(client: Any, query: dict, **kwargs: Any) -> Iterator[dict]:
+            keys = query.get('query', {}).get('terms', {}).get('key.keyword')
+            connection.scanned_keys.append(keys)
+            return iter([hit for hit in indexed_hits if keys is None or hit['_source']['key'] in keys])
+
+        connection.bulk.side_effect = bulk
+        connection.scanned_keys = []
+        with patch.object(search_metadata_to_elasticsearch_task, 'scan', side_effect=scan), \
+                patch.object(search_metadata_to_elasticsearch_task.connections, 'get_connection',
+                             return_value=connection):
+            task.run()
+        connection.bulk_actions = bulk_actions
+        return connection
+
+    def test_full_rebuild(self) -> None:
+        task = self._init_task('table', _table_record('orders'), _table_record('customers'))
+        task.elasticsearch_client.indices.get_alias.return_value = {'table_search_index_old': {}}
+
+        connection = self._run(task, indexed_hits=[])
+
+        create_kwargs = connection.indices.create.call_args[1]
+        self.assertEqual(create_kwargs['index'], 'table_search_index_new')
+        self.assertEqual(create_kwargs['body']['mappings']['_meta'],
+                         {'version': 2, 'mapping_hash': task.get_mapping_hash()})
+        self.assertEqual(create_kwargs['body']['settings']['refresh_interval'], '-1')
+        self.assertEqual(create_kwargs['body']['settings']['number_of_replicas'], 0)
+        self.assertEqual([action['_source']['name'] for action in connection.bulk_actions], ['orders', 'customers'])
+        connection.indices.put_settings.assert_called_once_with(index='table_search_index_new', body={'index': {
+            'number_of_replicas': 1,
+            'refresh_interval': '1s',
+        }})
+        connection.indices.update_aliases.assert_called_once_with({'actions': [
+            {'remove_index': {'index': 'table_search_index_old'}},
+            {'add': {'index': 'table_search_index_new', 'alias': 'table_search_index'}},
+        ]})
+
+    def _run_incremental_update(self, **conf: Any) -> MagicMock:
+        records = [_table_record('orders'), _table_record('customers', description='new'), _table_record('items')]
+        task = self._init_task('table', *records, incremental=True, **conf)
+        connection = task.elasticsearch_client
+        connection.indices.get_alias.return_value = {'table_search_index_live': {}}
+        connection.indices.get_mapping.return_value = {
+            'table_search_index_live': {'mappings': {'_meta': {'version': 2, 'mapping_hash': task.get_mapping_hash()}}}
+        }
+
+        # hash of the orders document as it is generated now
+        previous_task = self._init_task('table', _table_record('orders'))
+        orders_document = next(previous_task.generate_documents(previous_task.extractor.extract()))
+        orders_hash = orders_document['_source']['content_hash']
+        indexed_hits = [
+            {'_id': 'id_orders', '_source': {'key': 'hive://gold.core/orders', 'content_hash': orders_hash}},
+            {'_id': 'id_customers', '_source': {'key': 'hive://gold.core/customers', 'content_hash': 'old'}},
+            {'_id': 'id_customers_2', '_source': {'key': 'hive://gold.core/customers', 'content_hash': 'old'}},
+            {'_id': 'id_dropped', '_source': {'key': 'hive://gold.core/dropped', 'content_hash': 'old'}},
+        ]
+
+        self._run(task, indexed_hits=indexed_hits)
+
+        actions = [(action.get('_op_type', 'index'), action.get('_id'), action.get('_source', {}).get('name'))
+                   for action in connection.bulk_actions]
+        self.assertEqual(actions, [
+            ('index', 'id_customers', 'customers'),
+            ('delete', 'id_customers_2', None),
+            ('index', None, 'items'),
+            ('delete', 'id_dropped', None),
+        ])
+        self.assertEqual({action['_index'] for action in connection.bulk_actions}, {'table_search_index_live'})
+        connection.indices.create.assert_not_called()
+        connection.indices.update_aliases.assert_not_called()
+        connection.indices.refresh.assert_called_once_with(index='table_search_index_live')
+        return connection
+
+    def test_incremental_update(self) -> None:
+        connection = self._run_incremental_update()
+
+        # the hashes of the extracted keys are looked up at once, then all the keys of the index are scrolled
+        self.assertEqual([sorted(keys) if keys else keys for keys in connection.scanned_keys], [
+            ['hive://gold.core/customers', 'hive://gold.core/items', 'hive://gold.core/orders'],
+            None,
+        ])
+
+    def test_incremental_update_in_chunks(self) -> None:
+        connection = self._run_incremental_update(scroll_size=2)
+
+        self.assertEqual([sorted(keys) if keys else keys for keys in connection.scanned_keys], [
+            ['hive://gold.core/customers', 'hive://gold.core/orders'],
+            ['hive://gold.core/items'],
+            None,
+        ])
+
+    def test_incremental_update_falls_back_to_rebuild(self) -> None:
+        task = self._init_task('table', _table_record('orders'), incremental=True)
+        connection = task.elasticsearch_client
+        connection.indices.get_alias.return_value = {'table_search_index_live': {}}
+        # the live index was created with other mappings
+        connection.indices.get_mapping.return_value = {
+            'table_search_index_live': {'mappings': {'_meta': {'version': 2}}}
+        }
+
+        self._run(task, indexed_hits=[])
+
+        connection.indices.create.assert_called_once()
+        self.assertEqual([action['_index'] for action in connection.bulk_actions], ['table_search_index_new'])
+        connection.indices.update_aliases.assert_called_once()
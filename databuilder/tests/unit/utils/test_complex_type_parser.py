@@ -0,0 +1,130 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from typing import Callable, List
+
+from pyparsing import ParseException
+
+from databuilder.models.table_metadata import ColumnMetadata
+from databuilder.models.type_metadata import (
+    ArrayTypeMetadata, ScalarTypeMetadata, StructTypeMetadata, TypeMetadata,
+)
+from databuilder.utils.complex_type_parser import parse_type_str
+from databuilder.utils.hive_complex_type_parser import (
+    HIVE_DIALECT, parse_hive_type, parse_hive_type_with_pyparsing,
+)
+from databuilder.utils.trino_complex_type_parser import (
+    TRINO_DIALECT, parse_trino_type, parse_trino_type_with_pyparsing,
+)
+
+ParsingFunction = Callable[[str, str, ColumnMetadata], TypeMetadata]
+
+# types whose contents are not separated by commas, which the nestedExpr of the pyparsing grammars accept
+UNSEPARATED_TYPES = {
+    'hive': ['array<int<string>', 'struct<a:array<int> b:int>'],
+    'trino': ['array(int(string)'],
+}
+
+# the grammars cut the scalar types with words after their precision, such as timestamp(3) with time zone
+WORDS_AFTER_PRECISION = 'with time zone'
+
+
+def _load_types(dialect: str) -> List[str]:
+    with open(f'example/sample_data/complex_types/{dialect}_types.txt') as types_file:
+        return [line for line in types_file.read().splitlines() if line]
+
+
+def _grammar_parses_nested_types() -> bool:
+    # the rewritten nestedExpr of pyparsing 3.3.3 no longer parses the nested types of the grammars
+    try:
+        return isinstance(parse_hive_type_with_pyparsing('array<int>', 'col1', None), ArrayTypeMetadata)  # type: ignore
+    except ParseException:
+        return False
+
+
+class TestComplexTypeParser(unittest.TestCase):
+    def setUp(self) -> None:
+        self.column = ColumnMetadata('col1', None, 'int', 0)
+        self.column.set_column_key('hive://gold.test_schema/test_table/col1')
+
+    def _assert_same_types(self, dialect: str, parse: ParsingFunction, parse_with_pyparsing: ParsingFunction) -> None:
+        for type_str in _load_types(dialect) + UNSEPARATED_TYPES[dialect]:
+            if WORDS_AFTER_PRECISION in type_str:
+                continue
+            with self.subTest(type_str=type_str):
+                try:
+                    expected = parse_with_pyparsing(type_str, 'col1', self.column)
+                except Exception:
+                    with self.assertRaises(ParseException):
+                        parse(type_str, 'col1', self.column)
+                    continue
+
+                if type_str in UNSEPARATED_TYPES[dialect]:
+                    with self.assertRaises(ParseException):
+                        parse(type_str, 'col1', self.column)
+                else:
+                    self.assertEqual(parse(type_str, 'col1', self.column), expected)
+
+    @unittest.skipUnless(_grammar_parses_nested_types(), 'pyparsing version does not parse the grammar')
+    def test_same_hive_types_as_pyparsing_grammar(self) -> None:
+        self._assert_same_types('hive', parse_hive_type, parse_hive_type_with_pyparsing)
+
+    @unittest.skipUnless(_grammar_parses_nested_types(), 'pyparsing version does not parse the grammar')
+    def test_same_trino_types_as_pyparsing_grammar(self) -> None:
+        self._assert_same_types('trino', parse_trino_type, parse_trino_type_with_pyparsing)
+
+    def test_whitespace_in_type_strings(self) -> None:
+        actual = parse_hive_type('STRUCT< a : INT ,\tb : decimal ( 10 , 2 ) >', 'col1', self.column)
+
+        self.assertIsInstance(actual, StructTypeMetadata)
+        self.assertEqual(actual.type_str, 'struct< a : int ,\tb : decimal ( 10 , 2 ) >')
+        # as the pyparsing grammar, keeps the whitespace after scalar types and expands the tabs of sub types
+        self.assertEqual({name: item.type_str for name, item in actual.struct_items.items()},  # type: ignore
+                         {'a': 'int ', 'b': 'decimal ( 10 , 2 )'})
+
+    def test_words_after_precision(self) -> None:
+        actual = parse_trino_type('row(id bigint, created timestamp(3) with time zone, '
+                                  'opened time(6) with time zone, tags array(varchar))', 'col1', self.column)
+
+        self.assertIsInstance(actual, StructTypeMetadata)
+        self.assertEqual({name: item.type_str for name, item in actual.struct_items.items()},  # type: ignore
+                         {'id': 'bigint', 'created': 'timestamp(3) with time zone',
+                          'opened': 'time(6) with time zone', 'tags': 'array(varchar)'})
+        self.assertIsInstance(parse_trino_type('array(timestamp(6) with time zone)', 'col1', self.column),
+                              ArrayTypeMetadata)
+        self.assertIsInstance(parse_trino_type('timestamp(6) with time zone', 'col1', self.column),
+                              ScalarTypeMetadata)
+        with self.assertRaises(ParseException):
+            parse_type_str('row(created timestamp(3) with time zone(3))', TRINO_DIALECT)
+
+    def test_cache_parse_trees(self) -> None:
+        parse_type_str.cache_clear()
+        other_column = ColumnMetadata('col2', None, 'int', 1)
+        other_column.set_column_key('hive://gold.test_schema/test_table/col2')
+
+        actual = parse_hive_type('array<struct<a:int>>', 'col1', self.column)
+        other = parse_hive_type('ARRAY<STRUCT<A:INT>>', 'col2', other_column)
+
+        self.assertEqual(parse_type_str.cache_info().hits, 1)
+        self.assertEqual(parse_type_str.cache_info().currsize, 1)
+        self.assertIs(actual.parent, self.column)
+        self.assertIs(other.parent, other_column)
+        self.assertIsNot(actual.array_inner_type, other.array_inner_type)  # type: ignore
+        self.assertEqual(other.array_inner_type.key(),  # type: ignore
+                         'hive://gold.test_schema/test_table/col2/type/col2/_inner_')
+
+    def test_invalid_types(self) -> None:
+        for type_str in ['', 'array<>', 'map<string>', 'map<array<int>,int>', 'struct<>', 'struct<a int>',
+                         'decimal(10', 'decimal(a)', 'array<int>>', 'struct<a:int,>', 'uniontype<int,>']:
+            with self.subTest(type_str=type_str), self.assertRaises(ParseException):
+                parse_type_str(type_str, HIVE_DIALECT)
+
+        self.assertIsInstance(parse_hive_type('array', 'col1', self.column), ScalarTypeMetadata)
+        with self.assertRaises(ParseException) as context:
+            parse_hive_type('struct<a:array<int*>>', 'col1', self.column)
+        self.assertEqual(context.exception.loc, 18)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import unittest
+from typing import Any, List
+
+from elasticsearch.exceptions import TransportError
+from mock import MagicMock, patch
+
+from databuilder.utils import elasticsearch_bulk
+from databuilder.utils.elasticsearch_bulk import BulkIndexer, to_bulk_lines
+
+
+def _action(doc_id: str, size: int = 10) -> dict:
+    return {'_index': 'table_search_index', '_id': doc_id, '_source': {'name': 'x' * size}}
+
+
+def _action_bytes(action: dict) -> int:
+    # a newline ends each line of the action in the bulk request
+    action_line, source_line = to_bulk_lines(action)
+    return len(action_line) + len(source_line or '') + 2
+
+
+class TestBulkIndexer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.requests: List[List[str]] = []
+
+    def _bulk(self, *responses: Any) -> None:
+        """
+        Records the ids of the documents of each bulk request, and answers with the given responses in order,
+        an int being the status of every item and an exception being raised
+        """
+        responses_iter = iter(responses)
+
+        def bulk(body: str, **kwargs: Any) -> dict:
+            lines = body.splitlines()
+            ids = [json.loads(line)['index']['_id'] for line in lines[::2]]
+            self.requests.append(ids)
+            response = next(responses_iter, 200)
+            if isinstance(response, Exception):
+                raise response
+            statuses = response if isinstance(response, list) else [response] * len(ids)
+            return {'errors': any(status != 200 for status in statuses),
+                    'items': [{'index': {'_id': doc_id, 'status': status}} for doc_id, status in zip(ids, statuses)]}
+
+        self.client.bulk.side_effect = bulk
+
+    def test_to_bulk_lines(self) -> None:
+        self.assertEqual(to_bulk_lines(_action('1', size=1)),
+                         ('{"index":{"_id":"1","_index":"table_search_index"}}', '{"name":"x"}'))
+        self.assertEqual(to_bulk_lines({'_op_type': 'delete', '_index': 'table_search_index', '_id': '1'}),
+                         ('{"delete":{"_id":"1","_index":"table_search_index"}}', None))
+
+    def test_chunk_by_count_and_bytes(self) -> None:
+        action_bytes = _action_bytes(_action('1', size=100))
+        indexer = BulkIndexer(self.client, chunk_size=3, max_chunk_bytes=2 * action_bytes)
+
+        chunks = list(indexer.chunk([_action('1'), _action('2'), _action('3'), _action('4'),
+                                     _action('5', size=100), _action('6', size=100), _action('7', size=100)]))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 2, 2])
+
+    def test_index(self) -> None:
+        self._bulk()
+        indexer = BulkIndexer(self.client, chunk_size=2, thread_count=1, queue_size=1)
+
+        stats = indexer.index(_action(str(i)) for i in range(5))
+
+        self.assertEqual(self.requests, [['0', '1'], ['2', '3'], ['4']])
+        self.assertEqual((stats.succeeded, stats.failed, stats.retried), (5, 0, 0))
+        self.assertEqual(stats.bytes, sum(_action_bytes(_action(str(i))) for i in range(5)))
+
+    def test_retry_rejected_actions(self) -> None:
+        self._bulk([200, 429, 400], TransportError(429, 'es_rejected_execution_exception'), 429)
+        indexer = BulkIndexer(self.client, chunk_size=3, max_retries=2, initial_backoff_sec=1)
+
+        with patch.object(elasticsearch_bulk.time, 'sleep') as sleep:
+            stats = indexer.index(_action(str(i)) for i in range(3))
+
+        self.assertEqual(self.requests, [['0', '1', '2'], ['1'], ['1']])
+        self.assertEqual([call[0][0] for call in sleep.call_args_list], [1, 2])
+        self.assertEqual((stats.succeeded, stats.failed, stats.retried), (1, 2, 2))
+
+    def test_raise_other_errors(self) -> None:
+        self._bulk(TransportError(400, 'illegal_argument_exception'))
+        indexer = BulkIndexer(self.client)
+
+        with self.assertRaises(TransportError):
+            indexer.index([_action('1')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,7 +21,10 @@ from amundsen_application.models.user import load_user, dump_user
 from amundsen_application.api.utils.metadata_utils import is_table_editable, marshall_table_partial, \
     marshall_table_full, marshall_dashboard_partial, marshall_dashboard_full, marshall_feature_full, \
     marshall_lineage_table, TableUri
-from amundsen_application.api.utils.request_utils import get_query_param, request_metadata
+from amundsen_application.api.utils.request_utils import dispatch_views_concurrently, get_query_param, \
+    request_metadata
+from amundsen_application.api.notice.v0 import get_table_notices_summary
+from amundsen_application.api.quality.v0 import get_table_quality_checks_summary
 
 from amundsen_application.api.utils.search_utils import execute_search_document_request
 
@@ -893,6 +896,57 @@ def get_table_lineage() -> Response:
         return make_response(jsonify(payload), HTTPStatus.INTERNAL_SERVER_ERROR)
 
 
+@metadata_blueprint.route('/table_page', methods=['GET'])
+def get_table_page() -> Response:
+    """
+    Fetches everything displayed on the table page with concurrent requests, so that loading the page takes as long
+    as the slowest upstream request instead of the sum of all of them.
+    Each entry of 'results' holds the payload and 'status_code' of the matching endpoint. A failing entry does not
+    fail the others, the response status code is the one of the table metadata.
+    Args:
+        key: the table key
+        index, source: (optional) logged with the table metadata request
+        depth, direction: (optional) table lineage is included when both are given
+    :return:
+    """
+    try:
+        table_key = get_query_param(request.args, 'key')
+        table_args = {k: v for k, v in request.args.items() if k in ('key', 'index', 'source')}
+        views = {
+            'table': (get_table_metadata, table_args, {}),
+            'dashboards': (get_related_dashboard_metadata, {}, {'table_key': table_key}),
+        }
+
+        depth = request.args.get('depth')
+        direction = request.args.get('direction')
+        if depth and direction:
+            views['lineage'] = (get_table_lineage, {'key': table_key, 'depth': depth, 'direction': direction}, {})
+
+        if app.config['AUTH_USER_METHOD']:
+            user_id = app.config['AUTH_USER_METHOD'](app).user_id
+            views['bookmarks'] = (get_bookmark, {}, {})
+            views['read'] = (get_user_read, {'user_id': user_id}, {})
+            views['own'] = (get_user_own, {'user_id': user_id}, {})
+
+        if app.config['QUALITY_CLIENT']:
+            views['quality'] = (get_table_quality_checks_summary, {'key': table_key}, {})
+
+        if app.config['NOTICE_CLIENT']:
+            views['notices'] = (get_table_notices_summary, {'key': table_key}, {})
+
+        results = {name: dict(payload or {}, status_code=status_code)
+                   for name, (payload, status_code) in dispatch_views_concurrently(views).items()}
+
+        failed = [name for name, result in results.items() if result['status_code'] != HTTPStatus.OK]
+        message = 'Success' if not failed else 'Encountered error: failed to fetch ' + ', '.join(failed)
+        return make_response(jsonify({'msg': message, 'results': results}), results['table']['status_code'])
+    except Exception as e:
+        message = 'Encountered exception: ' + str(e)
+        logging.exception(message)
+        payload = jsonify({'msg': message, 'results': {}})
+        return make_response(payload, HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
 @metadata_blueprint.route('/get_column_lineage', methods=['GET'])
 def get_column_lineage() -> Response:
     """
@@ -4,7 +4,8 @@
 import json
 import logging
 from http import HTTPStatus
-from typing import Any, Dict, List  # noqa: F401
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple  # noqa: F401
 
 from amundsen_common.models.search import (Filter, SearchRequestSchema,
                                            SearchResponseSchema)
@@ -136,14 +137,13 @@ def _search_resources(*, search_term: str,
         status_code = response.status_code
 
         if status_code == HTTPStatus.OK:
-            search_response = SearchResponseSchema().loads(json.dumps(response.json()))
-            results_dict['msg'] = search_response.msg
-            results = search_response.results
-            for resource in results.keys():
+            results_dict['msg'], results = _get_search_results(response.json())
+            for resource, resource_results in results.items():
+                map_result = RESOURCE_TO_MAPPING[resource]
                 results_dict[resource] = {
                     'page_index': int(page_index),
-                    'results': [RESOURCE_TO_MAPPING[resource](result) for result in results[resource]['results']],
-                    'total_results': results[resource]['total_results'],
+                    'results': [map_result(result) for result in resource_results['results']],
+                    'total_results': resource_results['total_results'],
                 }
         else:
             message = 'Encountered error: Search request failed'
@@ -157,3 +157,20 @@ def _search_resources(*, search_term: str,
         results_dict['msg'] = message
         LOGGER.exception(message)
         return results_dict
+
+
+@lru_cache(maxsize=None)
+def _get_search_response_schema() -> SearchResponseSchema:
+    return SearchResponseSchema()
+
+
+def _get_search_results(response_json: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Returns the message and the results by resource of a search service response. The response is validated
+    against SearchResponseSchema unless SEARCHSERVICE_VALIDATE_RESPONSE is disabled, in which case it is passed
+    through and only the fields read from it need to be present.
+    """
+    if app.config['SEARCHSERVICE_VALIDATE_RESPONSE']:
+        search_response = _get_search_response_schema().load(response_json)
+        return search_response.msg, search_response.results
+    return response_json.get('msg', ''), response_json['results']
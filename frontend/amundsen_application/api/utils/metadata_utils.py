@@ -4,13 +4,15 @@
 import logging
 
 from dataclasses import dataclass
-from marshmallow import EXCLUDE
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from marshmallow import EXCLUDE, RAISE, Schema, ValidationError, fields, missing
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Pattern, Type, cast
 
+import attr
 from amundsen_common.models.dashboard import DashboardSummary, DashboardSummarySchema
 from amundsen_common.models.feature import Feature, FeatureSchema
 from amundsen_common.models.popular_table import PopularTable, PopularTableSchema
-from amundsen_common.models.table import Table, TableSchema, TypeMetadata
+from amundsen_common.models.table import TableSchema, TypeMetadata
 from amundsen_application.models.user import load_user, dump_user
 from amundsen_application.config import MatchRuleObject
 from flask import current_app as app
@@ -72,19 +74,24 @@ def _parse_editable_rule(rule: MatchRuleObject,
     :return: boolean which determines if table desc is editable or not for given table as per input matching rule
     """
     if rule.schema_regex and rule.table_name_regex:
-        match_schema = re.match(rule.schema_regex, schema)
-        match_table = re.match(rule.table_name_regex, table)
+        match_schema = _compile_match_rule_regex(rule.schema_regex).match(schema)
+        match_table = _compile_match_rule_regex(rule.table_name_regex).match(table)
         return not (match_schema and match_table)
 
     if rule.schema_regex:
-        return not re.match(rule.schema_regex, schema)
+        return not _compile_match_rule_regex(rule.schema_regex).match(schema)
 
     if rule.table_name_regex:
-        return not re.match(rule.table_name_regex, table)
+        return not _compile_match_rule_regex(rule.table_name_regex).match(table)
 
     return True
 
 
+@lru_cache(maxsize=None)
+def _compile_match_rule_regex(regex: str) -> Pattern:
+    return re.compile(regex)
+
+
 def is_table_editable(schema_name: str, table_name: str, cfg: Any = None) -> bool:
     if cfg is None:
         cfg = app.config
@@ -109,16 +116,143 @@ def _recursive_set_type_metadata_is_editable(type_metadata: Optional[TypeMetadat
             _recursive_set_type_metadata_is_editable(tm, is_editable)
 
 
+class _NotNormalizable(Exception):
+    pass
+
+
+class _NormalizedField(NamedTuple):
+    name: str
+    required: bool
+    default: Any
+    scalar_type: Optional[type]
+    nested: Optional['_SchemaNormalizer']
+    many: bool
+    allow_none: bool
+    converter: Optional[Callable[[Any], Any]]
+
+
+class _SchemaNormalizer:
+    """
+    Turns a dict, in place, into what schema.dump(schema.load(data)) returns without building the attrs objects.
+    Fields are checked one by one for schemas that only have string, integer, boolean and nested fields, and no
+    hooks or validators besides building the attrs object. Other schemas are loaded and dumped as usual.
+    Raises _NotNormalizable for values that would need to be converted or are invalid, leaving the values
+    normalized so far in place: the caller then falls back to loading and dumping the whole dict.
+    """
+    _SCALAR_TYPES: Dict[Type[fields.Field], type] = {fields.String: str, fields.Integer: int, fields.Boolean: bool}
+    _PLAIN_HOOKS = {('post_load', False): ['make_object']}
+
+    def __init__(self, schema_class: Type[Schema], normalizers: Dict[Type[Schema], '_SchemaNormalizer']) -> None:
+        # registered first so that recursive schemas, e.g. TypeMetadataSchema, reuse this normalizer
+        normalizers[schema_class] = self
+        self._schema = schema_class()
+        self._names = frozenset(self._schema.fields)
+        self._fields: List[_NormalizedField] = []
+        self._plain = self._compile_fields(normalizers)
+
+    def _compile_fields(self, normalizers: Dict[Type[Schema], '_SchemaNormalizer']) -> bool:
+        # _hooks is a defaultdict, which gains empty entries once the schema is used
+        hooks = {tag: names for tag, names in self._schema._hooks.items() if names}
+        if self._schema.unknown != RAISE or hooks != self._PLAIN_HOOKS:
+            return False
+        attributes = attr.fields_dict(self._schema.opts.target)
+
+        for name, field in self._schema.fields.items():
+            attribute = attributes.get(name)
+            if attribute is None or attribute.validator is not None or field.validators \
+                    or field.data_key is not None or field.attribute is not None:
+                return False
+
+            converter = cast(Optional[Callable[[Any], Any]], attribute.converter)
+            default = None if field.required else field.missing
+            if default is missing:
+                return False
+            if converter is not None:
+                default = converter(default)
+            if default not in (None, []) and type(default) not in (str, int, bool):
+                return False
+
+            scalar_type = self._SCALAR_TYPES.get(type(field))
+            nested = None
+            if isinstance(field, fields.Nested):
+                nested_class = type(field.schema)
+                nested = normalizers.get(nested_class) or _SchemaNormalizer(nested_class, normalizers)
+            elif scalar_type is None:
+                return False
+
+            self._fields.append(_NormalizedField(name=name,
+                                                 required=field.required,
+                                                 default=default,
+                                                 scalar_type=scalar_type,
+                                                 nested=nested,
+                                                 many=nested is not None and field.many,
+                                                 allow_none=field.allow_none,
+                                                 converter=converter))
+        return True
+
+    def normalize(self, data: Any) -> Dict[str, Any]:
+        if type(data) is not dict:
+            raise _NotNormalizable()
+        if not self._plain:
+            return self._schema.dump(self._schema.load(data))
+        if not self._names.issuperset(data):
+            raise _NotNormalizable()
+
+        for field in self._fields:
+            if field.name in data:
+                data[field.name] = self._normalize_value(field, data[field.name])
+            elif field.required:
+                raise _NotNormalizable()
+            else:
+                data[field.name] = [] if field.default == [] else field.default
+        return data
+
+    def _normalize_value(self, field: _NormalizedField, value: Any) -> Any:
+        if value is None:
+            if not field.allow_none:
+                raise _NotNormalizable()
+        elif field.nested is None:
+            if type(value) is not field.scalar_type:
+                raise _NotNormalizable()
+        elif not field.many:
+            value = field.nested.normalize(value)
+        elif type(value) is list:
+            for i, item in enumerate(value):
+                value[i] = field.nested.normalize(item)
+        else:
+            raise _NotNormalizable()
+
+        return value if field.converter is None else field.converter(value)
+
+
+@lru_cache(maxsize=None)
+def _get_table_schema() -> TableSchema:
+    return TableSchema()
+
+
+@lru_cache(maxsize=None)
+def _get_table_normalizer() -> _SchemaNormalizer:
+    return _SchemaNormalizer(TableSchema, {})
+
+
+def _load_and_dump_table(table_dict: Dict) -> Dict[str, Any]:
+    """
+    Validates the table Dict and returns it as TableSchema dumps it, normalizing it in place when possible
+    """
+    try:
+        return _get_table_normalizer().normalize(table_dict)
+    except (_NotNormalizable, ValidationError):
+        schema = _get_table_schema()
+        return schema.dump(schema.load(table_dict))
+
+
 def marshall_table_full(table_dict: Dict) -> Dict:
     """
     Forms the full version of a table Dict, with additional and sanitized fields
-    :param table_dict: Table Dict from metadata service
+    :param table_dict: Table Dict from metadata service, updated in place
     :return: Table Dict with sanitized fields
     """
-
-    schema = TableSchema()
-    table: Table = schema.load(table_dict)
-    results: Dict[str, Any] = schema.dump(table)
+    results = _load_and_dump_table(table_dict)
 
     is_editable = is_table_editable(results['schema'], results['name'])
     results['is_editable'] = is_editable
@@ -132,7 +266,7 @@ def marshall_table_full(table_dict: Dict) -> Dict:
         reader_object['user'] = _map_user_object_to_schema(reader_object['user'])
 
     # TODO: Add the 'key' or 'id' to the base TableSchema
-    results['key'] = f'{table.database}://{table.cluster}.{table.schema}/{table.name}'
+    results['key'] = f"{results['database']}://{results['cluster']}.{results['schema']}/{results['name']}"
     # Temp code to make 'partition_key' and 'partition_value' part of the table
     results['partition'] = _get_partition_data(results['watermarks'])
 
@@ -140,19 +274,20 @@ def marshall_table_full(table_dict: Dict) -> Dict:
     prog_descriptions = results['programmatic_descriptions']
     results['programmatic_descriptions'] = _convert_prog_descriptions(prog_descriptions)
 
+    column_stat_order = app.config['COLUMN_STAT_ORDER']
+    column_key_prefix = results['key'] + '/'
     columns = results['columns']
     for col in columns:
         # Set column key to guarantee it is available on the frontend
         # since it is currently an optional field in the model
-        col['key'] = results['key'] + '/' + col['name']
+        col['key'] = column_key_prefix + col['name']
         # Set editable state
         col['is_editable'] = is_editable
         _recursive_set_type_metadata_is_editable(col['type_metadata'], is_editable)
         # If order is provided, we sort the column based on the pre-defined order
-        if app.config['COLUMN_STAT_ORDER']:
+        if column_stat_order:
             # the stat_type isn't defined in COLUMN_STAT_ORDER, we just use the max index for sorting
-            col['stats'].sort(key=lambda x: app.config['COLUMN_STAT_ORDER'].
-                              get(x['stat_type'], len(app.config['COLUMN_STAT_ORDER'])))
+            col['stats'].sort(key=lambda x: column_stat_order.get(x['stat_type'], len(column_stat_order)))
 
     return results
 
@@ -1,10 +1,29 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Dict, Optional
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from http import HTTPStatus
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
 
 import requests
+from flask import Flask, Response, request
 from flask import current_app as app
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+LOGGER = logging.getLogger(__name__)
+
+# Key of the pooled session in Flask's app.extensions
+REQUEST_SESSION_EXTENSION = 'amundsen_request_session'
+# Key of the executor running concurrent requests in Flask's app.extensions
+AGGREGATE_EXECUTOR_EXTENSION = 'amundsen_aggregate_executor'
+
+_session_lock = threading.Lock()
+_executor_lock = threading.Lock()
 
 
 def get_query_param(args: Dict, param: str, error_msg: Optional[str] = None) -> str:
@@ -109,17 +128,19 @@ def request_wrapper(method: str, url: str, client, headers, timeout_sec: int, da
         else:
             raise Exception('Method not allowed: {}'.format(method))
     else:
-        with build_session() as s:
-            if method == 'DELETE':
-                return s.delete(url, headers=headers, timeout=timeout_sec, data=data, json=json)
-            elif method == 'GET':
-                return s.get(url, headers=headers, timeout=timeout_sec)
-            elif method == 'POST':
-                return s.post(url, headers=headers, timeout=timeout_sec, data=data, json=json)
-            elif method == 'PUT':
-                return s.put(url, headers=headers, timeout=timeout_sec, data=data, json=json)
-            else:
-                raise Exception('Method not allowed: {}'.format(method))
+        connect_timeout_sec = app.config.get('REQUEST_SESSION_CONNECT_TIMEOUT_SEC')
+        timeout = (connect_timeout_sec, timeout_sec) if connect_timeout_sec else timeout_sec
+        s = get_session()
+        if method == 'DELETE':
+            return s.delete(url, headers=headers, timeout=timeout, data=data, json=json)
+        elif method == 'GET':
+            return s.get(url, headers=headers, timeout=timeout)
+        elif method == 'POST':
+            return s.post(url, headers=headers, timeout=timeout, data=data, json=json)
+        elif method == 'PUT':
+            return s.put(url, headers=headers, timeout=timeout, data=data, json=json)
+        else:
+            raise Exception('Method not allowed: {}'.format(method))
 
 
 def build_session() -> requests.Session:
@@ -131,3 +152,131 @@ def build_session() -> requests.Session:
         session.cert = (cert, key)
 
     return session
+
+
+def build_pooled_session() -> requests.Session:
+    """
+    Builds a session that keeps connections to each upstream host alive and reuses them across requests.
+    Pool sizes and retries are set from the REQUEST_SESSION_* configurations.
+    """
+    session = build_session()
+
+    retries = Retry(total=app.config['REQUEST_SESSION_MAX_RETRIES'],
+                    backoff_factor=app.config['REQUEST_SESSION_RETRY_BACKOFF_FACTOR'],
+                    status_forcelist=app.config['REQUEST_SESSION_RETRY_STATUS_CODES'],
+                    raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=app.config['REQUEST_SESSION_POOL_CONNECTIONS'],
+                          pool_maxsize=app.config['REQUEST_SESSION_POOL_MAXSIZE'],
+                          pool_block=app.config['REQUEST_SESSION_POOL_BLOCK'],
+                          max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    # The session is shared by all users, cookies set by upstream services must not be sent on behalf of others
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the session shared by all requests to metadata and search services, building it on first use.
+    """
+    session = app.extensions.get(REQUEST_SESSION_EXTENSION)
+    if session is None:
+        with _session_lock:
+            session = app.extensions.get(REQUEST_SESSION_EXTENSION)
+            if session is None:
+                session = build_pooled_session()
+                app.extensions[REQUEST_SESSION_EXTENSION] = session
+    return session
+
+
+def get_session_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns connection reuse statistics of the shared session, per upstream host.
+    requests: number of requests sent
+    connections: number of connections opened
+    reused: number of requests sent over an already opened connection
+    idle: number of connections currently kept alive in the pool
+    """
+    session = app.extensions.get(REQUEST_SESSION_EXTENSION)
+    if session is None:
+        return {}
+
+    stats = {}
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats[f'{pool.scheme}://{pool.host}:{pool.port}'] = {
+                'requests': pool.num_requests,
+                'connections': pool.num_connections,
+                'reused': max(pool.num_requests - pool.num_connections, 0),
+                'idle': len([conn for conn in list(pool.pool.queue) if conn is not None]) if pool.pool else 0,
+            }
+    return stats
+
+
+def get_aggregate_executor() -> ThreadPoolExecutor:
+    """
+    Returns the executor shared by all aggregate requests, which bounds the number of concurrent upstream calls
+    to AGGREGATE_REQUEST_MAX_WORKERS.
+    """
+    executor = app.extensions.get(AGGREGATE_EXECUTOR_EXTENSION)
+    if executor is None:
+        with _executor_lock:
+            executor = app.extensions.get(AGGREGATE_EXECUTOR_EXTENSION)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=app.config['AGGREGATE_REQUEST_MAX_WORKERS'],
+                                              thread_name_prefix='aggregate_request')
+                app.extensions[AGGREGATE_EXECUTOR_EXTENSION] = executor
+    return executor
+
+
+def dispatch_views_concurrently(views: Dict[str, Tuple[Callable[..., Response], Dict[str, str], Dict[str, Any]]]
+                                ) -> Dict[str, Tuple[Any, int]]:
+    """
+    Runs views of this application concurrently on behalf of the current request and waits for them up to
+    AGGREGATE_REQUEST_TIMEOUT_SEC. A view that raises or does not complete in time is reported with an error
+    payload and status code, without failing the others.
+    :param views: name -> (view function, query parameters of the view, keyword arguments of the view)
+    :return: name -> (JSON payload, status code)
+    """
+    flask_app = app._get_current_object()  # type: ignore
+    executor = get_aggregate_executor()
+    futures = {name: executor.submit(_dispatch_view, flask_app, request.environ, view, query_args, view_args)
+               for name, (view, query_args, view_args) in views.items()}
+
+    done, _ = wait(futures.values(), timeout=app.config['AGGREGATE_REQUEST_TIMEOUT_SEC'])
+
+    results: Dict[str, Tuple[Any, int]] = {}
+    for name, future in futures.items():
+        if future not in done:
+            future.cancel()
+            message = f'Encountered error: {name} request timed out'
+            LOGGER.error(message)
+            results[name] = ({'msg': message}, HTTPStatus.GATEWAY_TIMEOUT)
+            continue
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            message = 'Encountered exception: ' + str(e)
+            LOGGER.exception(message)
+            results[name] = ({'msg': message}, HTTPStatus.INTERNAL_SERVER_ERROR)
+    return results
+
+
+def _dispatch_view(flask_app: Flask,
+                   environ: Dict[str, Any],
+                   view: Callable[..., Response],
+                   query_args: Dict[str, str],
+                   view_args: Dict[str, Any]) -> Tuple[Any, int]:
+    # The view runs in a request context of its own, sharing the headers and session of the original request
+    view_environ = dict(environ, QUERY_STRING=urlencode(query_args))
+    with flask_app.request_context(view_environ):
+        response = view(**view_args)
+        return response.get_json(), response.status_code
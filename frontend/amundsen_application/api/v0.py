@@ -10,7 +10,7 @@ from flask import current_app as app
 from flask.blueprints import Blueprint
 
 from amundsen_application.api.metadata.v0 import USER_ENDPOINT
-from amundsen_application.api.utils.request_utils import request_metadata
+from amundsen_application.api.utils.request_utils import get_session_stats, request_metadata
 from amundsen_application.models.user import load_user, dump_user
 
 
@@ -47,3 +47,15 @@ def current_user() -> Response:
         logging.exception(message)
         payload = {'msg': message}
         return make_response(jsonify(payload), HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
+@blueprint.route('/request_session_stats', methods=['GET'])
+def request_session_stats() -> Response:
+    """
+    Returns connection reuse statistics of the session used to call metadata and search services
+    """
+    payload = {
+        'msg': 'Success',
+        'stats': get_session_stats()
+    }
+    return make_response(jsonify(payload), HTTPStatus.OK)
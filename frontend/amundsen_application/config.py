@@ -54,6 +54,27 @@ class Config:
 
     # Request Timeout Configurations in Seconds
     REQUEST_SESSION_TIMEOUT_SEC = 3
+    # Optional timeout to establish a connection, REQUEST_SESSION_TIMEOUT_SEC then only applies to reading the response
+    REQUEST_SESSION_CONNECT_TIMEOUT_SEC = None  # type: Optional[float]
+
+    # Connection pool of the session used to call metadata and search services when no request client is configured.
+    # Connections are kept alive and reused across requests.
+    # Number of upstream hosts whose connections are pooled
+    REQUEST_SESSION_POOL_CONNECTIONS = 10  # type: int
+    # Maximum number of connections kept alive per upstream host
+    REQUEST_SESSION_POOL_MAXSIZE = 32  # type: int
+    # Whether to wait for a free connection instead of opening a new one when the pool of a host is exhausted
+    REQUEST_SESSION_POOL_BLOCK = False  # type: bool
+    # Retries on connection errors, and on the status codes below for idempotent methods
+    REQUEST_SESSION_MAX_RETRIES = 0  # type: int
+    REQUEST_SESSION_RETRY_BACKOFF_FACTOR = 0.1  # type: float
+    REQUEST_SESSION_RETRY_STATUS_CODES = [502, 503, 504]  # type: List[int]
+
+    # Upstream requests of aggregate endpoints, e.g. /api/metadata/v0/table_page, are sent concurrently.
+    # Maximum number of concurrent upstream requests in the process
+    AGGREGATE_REQUEST_MAX_WORKERS = 16  # type: int
+    # Time to wait for all upstream requests, the ones that did not complete are reported as timed out
+    AGGREGATE_REQUEST_TIMEOUT_SEC = 5  # type: float
 
     # Frontend Application
     FRONTEND_BASE = ''
@@ -65,6 +86,9 @@ class Config:
     SEARCHSERVICE_REQUEST_CLIENT = None
     SEARCHSERVICE_REQUEST_HEADERS = None
     SEARCHSERVICE_BASE = ''
+    # Validates search service responses against SearchResponseSchema. When disabled, responses are parsed once
+    # and passed through to the result mappers.
+    SEARCHSERVICE_VALIDATE_RESPONSE = True  # type: bool
 
     # Metadata Service
     METADATASERVICE_REQUEST_CLIENT = None
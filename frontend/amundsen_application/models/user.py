@@ -1,6 +1,7 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+from functools import lru_cache
 from typing import Dict, Optional
 
 from amundsen_common.models.user import UserSchema, User
@@ -19,7 +20,7 @@ def _str_no_value(s: Optional[str]) -> bool:
 
 def load_user(user_data: Dict) -> User:
     try:
-        schema = UserSchema()
+        schema = _get_user_schema()
         # In order to call 'GET_PROFILE_URL' we make sure the user id exists
         if _str_no_value(user_data.get('user_id')):
             user_data['user_id'] = user_data.get('email')
@@ -34,5 +35,10 @@ def load_user(user_data: Dict) -> User:
 
 
 def dump_user(user: User) -> Dict:
-    schema = UserSchema()
+    schema = _get_user_schema()
     return schema.dump(user)
+
+
+@lru_cache(maxsize=None)
+def _get_user_schema() -> UserSchema:
+    return UserSchema()
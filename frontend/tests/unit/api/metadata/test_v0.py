@@ -2,8 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
+import time
 import responses
 import unittest
+from typing import Any
 from unittest.mock import patch
 
 from http import HTTPStatus
@@ -1259,6 +1261,86 @@ class MetadataTest(unittest.TestCase):
             }
             self.assertEqual(response.json, expected)
 
+    def _add_table_page_responses(self, dashboards_status: int = HTTPStatus.OK) -> None:
+        base = local_app.config['METADATASERVICE_BASE']
+        test_table = 'db://cluster.schema/table'
+        responses.add(responses.GET, f'{base}{TABLE_ENDPOINT}/{test_table}', json=self.mock_metadata,
+                      status=HTTPStatus.OK)
+        responses.add(responses.GET, f'{base}{TABLE_ENDPOINT}/{test_table}/dashboard/',
+                      json=self.expected_related_dashboard_response, status=dashboards_status)
+        for resource in ['follow', 'read', 'own']:
+            responses.add(responses.GET, f'{base}{USER_ENDPOINT}/{TEST_USER_ID}/{resource}/',
+                          json=self.get_user_resource_response, status=HTTPStatus.OK)
+
+    @responses.activate
+    def test_get_table_page_success(self) -> None:
+        """
+        Test get_table_page returns the payload of each endpoint displayed on the table page
+        :return:
+        """
+        self._add_table_page_responses()
+
+        with local_app.test_client() as test:
+            response = test.get('/api/metadata/v0/table_page',
+                                query_string=dict(key='db://cluster.schema/table', index='0', source='test_source'))
+            data = json.loads(response.data)
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            self.assertEqual(data.get('msg'), 'Success')
+
+            results = data.get('results')
+            self.assertCountEqual(results.keys(), ['table', 'dashboards', 'bookmarks', 'read', 'own'])
+            self.assertCountEqual(results['table'].get('tableData'), self.expected_parsed_metadata)
+            self.assertEqual(len(results['dashboards'].get('dashboards')),
+                             len(self.expected_related_dashboard_response['dashboards']))
+            self.assertCountEqual(results['bookmarks'].get('bookmarks'), self.expected_parsed_user_resources)
+            self.assertCountEqual(results['read'].get('read'),
+                                  self.expected_parsed_user_resources.get('table'))  # type: ignore
+            self.assertCountEqual(results['own'].get('own'), self.expected_parsed_user_resources)
+            for result in results.values():
+                self.assertEqual(result.get('status_code'), HTTPStatus.OK)
+
+    @responses.activate
+    def test_get_table_page_partial_failure(self) -> None:
+        """
+        Test get_table_page still returns the other payloads when one of the endpoints fails
+        :return:
+        """
+        self._add_table_page_responses(dashboards_status=HTTPStatus.BAD_REQUEST)
+
+        with local_app.test_client() as test:
+            response = test.get('/api/metadata/v0/table_page', query_string=dict(key='db://cluster.schema/table'))
+            data = json.loads(response.data)
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            self.assertEqual(data.get('msg'), 'Encountered error: failed to fetch dashboards')
+
+            results = data.get('results')
+            self.assertEqual(results['dashboards'].get('status_code'), HTTPStatus.BAD_REQUEST)
+            self.assertEqual(results['dashboards'].get('dashboards'), [])
+            self.assertCountEqual(results['table'].get('tableData'), self.expected_parsed_metadata)
+
+    @responses.activate
+    def test_get_table_page_timeout(self) -> None:
+        """
+        Test get_table_page reports the endpoints that did not complete in time
+        :return:
+        """
+        self._add_table_page_responses()
+        slow_url = '{0}{1}/{2}/own/'.format(local_app.config['METADATASERVICE_BASE'], USER_ENDPOINT, TEST_USER_ID)
+        responses.remove(responses.GET, slow_url)
+
+        def slow_callback(request: Any) -> Any:
+            time.sleep(0.5)
+            return HTTPStatus.OK, {}, json.dumps(self.get_user_resource_response)
+        responses.add_callback(responses.GET, slow_url, callback=slow_callback)
+
+        with patch.dict(local_app.config, {'AGGREGATE_REQUEST_TIMEOUT_SEC': 0.1}), \
+                local_app.test_client() as test:
+            response = test.get('/api/metadata/v0/table_page', query_string=dict(key='db://cluster.schema/table'))
+            data = json.loads(response.data)
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            self.assertEqual(data['results']['own'], {'msg': 'Encountered error: own request timed out',
+                                                      'status_code': HTTPStatus.GATEWAY_TIMEOUT})
+
     @responses.activate
     def test_get_feature_metadata_failure(self) -> None:
         """
@@ -2,8 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
+import logging
+import time
 import unittest
 from http import HTTPStatus
+from typing import Any, Dict, List, cast
 from unittest.mock import Mock, patch
 
 import responses
@@ -298,3 +301,57 @@ class Search(unittest.TestCase):
 
             self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
             self.assertEqual(data['msg'], 'Invalid search response')
+
+    @responses.activate
+    def test_search_pass_through_benchmark(self) -> None:
+        """
+        Test that passing search responses through gives the same results as validating them, logging the
+        search proxy overhead per 100 results of each mode
+        :return:
+        """
+        table_result = cast(List[Dict[str, Any]], self.mock_table_results['results'])[0]
+        search_response = {
+            'msg': 'Success',
+            'page_index': 0,
+            'results_per_page': 100,
+            'results': {
+                'table': {'results': [dict(table_result, key=f'key_{i}') for i in range(100)], 'total_results': 100},
+            },
+            'status_code': HTTPStatus.OK,
+        }
+        responses.add(responses.POST, self.search_service_url, json=search_response, status=HTTPStatus.OK)
+        request_json = {'searchTerm': 'test', 'pageIndex': 0, 'resultsPerPage': 100, 'resources': ['table']}
+
+        iterations = 20
+        results = {}
+        with local_app.test_client() as test:
+            for validate in (True, False):
+                with patch.dict(local_app.config, {'SEARCHSERVICE_VALIDATE_RESPONSE': validate}):
+                    start = time.perf_counter()
+                    for _ in range(iterations):
+                        response = test.post(self.fe_flask_endpoint, json=request_json)
+                    elapsed_ms = (time.perf_counter() - start) * 1000 / iterations
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+                results[validate] = json.loads(response.data)
+                logging.info('Search proxy with SEARCHSERVICE_VALIDATE_RESPONSE=%s: %.2fms per 100 results',
+                             validate, elapsed_ms)
+
+        self.assertEqual(results[True], results[False])
+        self.assertEqual(len(results[False]['table']['results']), 100)
+        self.assertEqual(results[False]['table']['results'][99]['key'], 'key_99')
+
+    @responses.activate
+    def test_search_pass_through_invalid_response(self) -> None:
+        """
+        Test that a response missing results fails the search when it is passed through
+        :return:
+        """
+        responses.add(responses.POST, self.search_service_url, json={'msg': 'Success'}, status=HTTPStatus.OK)
+
+        with patch.dict(local_app.config, {'SEARCHSERVICE_VALIDATE_RESPONSE': False}), \
+                local_app.test_client() as test:
+            response = test.post(self.fe_flask_endpoint, json={'searchTerm': 'test', 'pageIndex': 0,
+                                                               'resultsPerPage': 10, 'resources': ['table']})
+            data = json.loads(response.data)
+            self.assertEqual(data['msg'], "Encountered exception: 'results'")
+            self.assertEqual(data['table']['results'], [])
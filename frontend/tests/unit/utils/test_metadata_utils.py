@@ -1,12 +1,20 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
+import logging
+import time
 import unittest
-from typing import Dict
+from typing import Any, Dict
+from unittest.mock import patch
+
+from amundsen_common.models.table import TableSchema
+from marshmallow import ValidationError
 
 from amundsen_application import create_app
+from amundsen_application.api.utils import metadata_utils
 from amundsen_application.api.utils.metadata_utils import _convert_prog_descriptions, _sort_prog_descriptions, \
-    _parse_editable_rule, is_table_editable, TableUri
+    _parse_editable_rule, is_table_editable, marshall_table_full, TableUri, _load_and_dump_table, _NotNormalizable
 from amundsen_application.config import MatchRuleObject
 
 local_app = create_app('amundsen_application.config.TestConfig', 'tests/templates')
@@ -209,6 +217,115 @@ class TableEditabilityWrapper(unittest.TestCase):
         self.assertTrue(is_table_editable('second', 'bad', mockConfig))
 
 
+def _build_table(num_columns: int) -> Dict[str, Any]:
+    columns = []
+    for i in range(num_columns):
+        column: Dict[str, Any] = {
+            'name': f'column_{i}',
+            'col_type': 'struct<a:int,b:array<string>>' if i % 3 == 0 else 'string',
+            'sort_order': i,
+            'description': f'description {i}' if i % 2 else None,
+            'stats': [{'stat_type': 'max', 'stat_val': '10', 'start_epoch': 1, 'end_epoch': 2},
+                      {'stat_type': 'min', 'stat_val': '1'}],
+        }
+        if i % 3 == 0:
+            column['badges'] = [{'badge_name': 'primary_key', 'category': 'column'}]
+            column['type_metadata'] = {
+                'kind': 'struct', 'name': f'column_{i}', 'key': f'key/column_{i}/type/column_{i}',
+                'data_type': 'struct<a:int,b:array<string>>', 'sort_order': 0,
+                'children': [
+                    {'kind': 'scalar', 'name': 'a', 'key': f'key/column_{i}/type/column_{i}/a',
+                     'data_type': 'int', 'sort_order': 0},
+                    {'kind': 'array', 'name': 'b', 'key': f'key/column_{i}/type/column_{i}/b',
+                     'data_type': 'array<string>', 'sort_order': 1, 'description': 'b', 'children': []},
+                ],
+            }
+        columns.append(column)
+
+    return {
+        'database': 'hive',
+        'cluster': 'gold',
+        'schema': 'core',
+        'name': 'wide_table',
+        'description': 'a wide table',
+        'tags': [{'tag_type': 'default', 'tag_name': 'wide'}],
+        'table_readers': [{'user': {'email': 'reader@example.com', 'user_id': 'reader', 'extra_field': 'x'},
+                           'read_count': 10}],
+        'owners': [{'email': 'owner@example.com', 'user_id': 'owner', 'other_key_values': {'team': 'data'}}],
+        'watermarks': [{'watermark_type': 'high_watermark', 'partition_key': 'ds', 'partition_value': '2020-01-01',
+                        'create_time': '2020-01-01'}],
+        'table_writer': {'application_url': 'https://airflow', 'id': 'dag/task', 'name': 'Airflow'},
+        'source': {'source_type': 'github', 'source': 'https://github.com'},
+        'is_view': None,
+        'programmatic_descriptions': [{'source': 'quality', 'text': 'checked'}],
+        'columns': columns,
+    }
+
+
+class TableMarshallingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = TableSchema()
+
+    def _round_trip(self, table_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return self.schema.dump(self.schema.load(copy.deepcopy(table_dict)))
+
+    def test_load_and_dump_table_equivalence_benchmark(self) -> None:
+        """
+        Verify that normalizing a 5,000 column table in place gives the same result as TableSchema load and dump
+        """
+        table_dict = _build_table(5000)
+        round_trip_input = copy.deepcopy(table_dict)
+
+        start = time.perf_counter()
+        expected = self.schema.dump(self.schema.load(round_trip_input))
+        round_trip_sec = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = _load_and_dump_table(table_dict)
+        fast_path_sec = time.perf_counter() - start
+
+        logging.info('Marshalling 5,000 columns: load and dump %.3fs, in place %.3fs', round_trip_sec, fast_path_sec)
+        self.assertIs(result, table_dict)
+        self.assertEqual(result, expected)
+        self.assertIs(result['is_view'], False)
+
+    def test_load_and_dump_table_fallback(self) -> None:
+        """
+        Verify that values needing conversion fall back to TableSchema load and dump
+        """
+        table_dict = _build_table(3)
+        table_dict['columns'][1]['sort_order'] = '1'
+        table_dict['last_updated_timestamp'] = 1.0
+
+        result = _load_and_dump_table(copy.deepcopy(table_dict))
+
+        self.assertEqual(result, self._round_trip(table_dict))
+        self.assertEqual(result['columns'][1]['sort_order'], 1)
+
+    def test_load_and_dump_table_invalid(self) -> None:
+        table_dict = _build_table(3)
+        table_dict['unknown_field'] = 'foo'
+        with self.assertRaises(ValidationError):
+            _load_and_dump_table(table_dict)
+
+        table_dict = _build_table(3)
+        del table_dict['columns'][0]['col_type']
+        with self.assertRaises(ValidationError):
+            _load_and_dump_table(table_dict)
+
+    def test_marshall_table_full_equivalence(self) -> None:
+        table_dict = _build_table(10)
+        with local_app.app_context(), patch.dict(local_app.config, {'COLUMN_STAT_ORDER': {'min': 0, 'max': 1}}):
+            with patch.object(metadata_utils, '_get_table_normalizer', side_effect=_NotNormalizable):
+                expected = marshall_table_full(copy.deepcopy(table_dict))
+
+            result = marshall_table_full(copy.deepcopy(table_dict))
+
+        self.assertEqual(result, expected)
+        self.assertEqual(result['columns'][0]['key'], 'hive://gold.core/wide_table/column_0')
+        self.assertEqual([stat['stat_type'] for stat in result['columns'][0]['stats']], ['min', 'max'])
+
+
 class TableUriObject(unittest.TestCase):
     def test_simple_constructor(self) -> None:
         uri = TableUri("db", "clstr", "schm", "tbl")
@@ -0,0 +1,91 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import cast
+
+import responses
+from requests.adapters import HTTPAdapter
+
+from amundsen_application import create_app
+from amundsen_application.api.utils.request_utils import get_session, get_session_stats, request_metadata
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        body = b'{}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class RequestUtilsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app('amundsen_application.config.TestConfig', 'tests/templates')
+        self.app.config['REQUEST_SESSION_POOL_MAXSIZE'] = 4
+        self.app.config['REQUEST_SESSION_MAX_RETRIES'] = 2
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def test_get_session(self) -> None:
+        """
+        Verify that the same pooled session is used across requests, configured from the app config
+        :return:
+        """
+        session = get_session()
+        self.assertIs(session, get_session())
+
+        adapter = cast(HTTPAdapter, session.get_adapter('http://metadata'))
+        self.assertIs(adapter, session.get_adapter('https://metadata'))
+        self.assertEqual(adapter.poolmanager.connection_pool_kw['maxsize'], 4)
+        self.assertEqual(adapter.max_retries.total, 2)
+
+    @responses.activate
+    def test_cookies_are_not_shared(self) -> None:
+        """
+        Verify that cookies set by an upstream service are not kept by the shared session
+        :return:
+        """
+        url = 'http://metadata/user'
+        responses.add(responses.GET, url, json={}, status=200, headers={'Set-Cookie': 'session=foo'})
+
+        request_metadata(url=url)
+        request_metadata(url=url)
+
+        self.assertEqual(len(get_session().cookies), 0)
+        self.assertNotIn('Cookie', responses.calls[1].request.headers)
+
+    def test_connections_are_reused(self) -> None:
+        """
+        Verify that consecutive requests to the same host go over a single connection
+        :return:
+        """
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f'http://127.0.0.1:{server.server_port}/user'
+            for _ in range(3):
+                self.assertEqual(request_metadata(url=url).status_code, 200)
+
+            stats = get_session_stats()[f'http://127.0.0.1:{server.server_port}']
+            self.assertEqual(stats['requests'], 3)
+            self.assertEqual(stats['connections'], 1)
+            self.assertEqual(stats['reused'], 2)
+            self.assertEqual(stats['idle'], 1)
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -83,6 +83,11 @@ class Config:
     POPULAR_TABLE_MINIMUM_READER_COUNT = None
     POPULAR_RESOURCES_MINIMUM_READER_COUNT = 10  # type: int
 
+    # Serve popular resources from the ranking precomputed by the databuilder popular resources task
+    # (Neo4jPopularResourcesTask or MySQLPopularResourcesTask). The per-process cached computation is only used
+    # as fallback when no ranking has been materialized.
+    POPULAR_RESOURCES_MATERIALIZED = False  # type: bool
+
     # List of regexes which will exclude certain parameters from appearing as Programmatic Descriptions
     PROGRAMMATIC_DESCRIPTIONS_EXCLUDE_FILTERS = []  # type: list
 
@@ -4,11 +4,13 @@
 import datetime
 import logging
 import re
-from collections import defaultdict
+import threading
+import time
+from collections import OrderedDict, defaultdict
 from operator import attrgetter
 from random import randint
-from typing import (Any, Dict, Generator, List, Optional, Set, Tuple, Type,
-                    Union, no_type_check)
+from typing import (Any, Dict, Generator, Iterable, List, Optional, Set, Tuple,
+                    Type, Union, no_type_check)
 
 from amundsen_common.entity.resource_type import ResourceType
 from amundsen_common.models.dashboard import DashboardSummary
@@ -54,6 +56,87 @@ LOGGER = logging.getLogger(__name__)
 _ATLAS_PROXY_CACHE_EXPIRY_SEC = 11 * 60 * 60 + randint(0, 3600)
 
 
+class EntityCache:
+    """
+    Entities fetched by guid, shared by the requests. It holds at most max_size entities, evicting the least recently
+    used ones, and each one for ttl_sec so that the changes made in Atlas show up.
+    """
+
+    def __init__(self, *, max_size: int = 10000, ttl_sec: float = 300) -> None:
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self._entities: 'OrderedDict[str, Tuple[float, AtlasEntity]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, guids: Iterable[str]) -> Dict[str, AtlasEntity]:
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for guid in guids:
+                cached = self._entities.get(guid)
+                if cached is None:
+                    continue
+                expiry, entity = cached
+                if expiry < now:
+                    del self._entities[guid]
+                    continue
+                self._entities.move_to_end(guid)
+                found[guid] = entity
+        return found
+
+    def put_many(self, entities: Dict[str, AtlasEntity]) -> None:
+        expiry = time.monotonic() + self.ttl_sec
+        with self._lock:
+            for guid, entity in entities.items():
+                self._entities[guid] = (expiry, entity)
+                self._entities.move_to_end(guid)
+            while len(self._entities) > self.max_size:
+                self._entities.popitem(last=False)
+
+
+class EntityBatchLoader:
+    """
+    Loads the entities needed by a request by guid. The guids are queued with load(), and the ones that aren't cached
+    are all fetched with a single get_entities_by_guids call the first time an entity is needed.
+    """
+
+    def __init__(self, client: AtlasClient, cache: EntityCache) -> None:
+        self._client = client
+        self._cache = cache
+        # guids to fetch, in order
+        self._queued: Dict[str, None] = dict()
+        self._resolved: Set[str] = set()
+        self._entities: Dict[str, AtlasEntity] = dict()
+
+    def load(self, guids: Iterable[Optional[str]]) -> None:
+        for guid in guids:
+            if guid and guid not in self._resolved:
+                self._queued[guid] = None
+
+    def get_many(self, guids: Iterable[str]) -> List[AtlasEntity]:
+        """
+        :return: the entities of the guids that exist, in the order of the guids
+        """
+        guids = list(dict.fromkeys(guids))
+        self.load(guids)
+        if self._queued:
+            self._fetch()
+        return [self._entities[guid] for guid in guids if guid in self._entities]
+
+    def _fetch(self) -> None:
+        queued = list(self._queued)
+        self._queued.clear()
+        self._resolved.update(queued)
+
+        self._entities.update(self._cache.get_many(queued))
+        missing = [guid for guid in queued if guid not in self._entities]
+        if missing:
+            response = self._client.entity.get_entities_by_guids(guids=missing, ignore_relationships=False)
+            fetched = {entity.guid: entity for entity in response.entities or list()}
+            self._cache.put_many(fetched)
+            self._entities.update(fetched)
+
+
 # noinspection PyMethodMayBeStatic
 class AtlasProxy(BaseProxy):
     """
@@ -84,6 +167,10 @@ class AtlasProxy(BaseProxy):
         protocol = 'https' if encrypted else 'http'
         self.client = AtlasClient(f'{protocol}://{host}:{port}', (user, password))
         self.client.session.verify = validate_ssl
+        self.entity_cache = EntityCache(**client_kwargs.get('atlas_entity_cache', dict()))
+
+    def _create_entity_loader(self) -> EntityBatchLoader:
+        return EntityBatchLoader(self.client, self.entity_cache)
 
     def _parse_dashboard_bookmark_qn(self, bookmark_qn: str) -> Dict:
         """
@@ -352,11 +439,12 @@ class AtlasProxy(BaseProxy):
             )
         return sorted(columns, key=lambda item: item.sort_order)
 
-    def _get_reports(self, guids: List[str]) -> List[ResourceReport]:
+    def _get_reports(self, guids: List[str], entity_loader: Optional[EntityBatchLoader] = None) \
+            -> List[ResourceReport]:
         reports = []
         if guids:
-            report_entities = self.client.entity.get_entities_by_guids(guids=guids)
-            for report_entity in report_entities.entities:
+            report_entities = (entity_loader or self._create_entity_loader()).get_many(guids)
+            for report_entity in report_entities:
                 try:
                     if report_entity.status == AtlasStatus.ACTIVE:
                         report_attrs = report_entity.attributes
@@ -461,8 +549,13 @@ class AtlasProxy(BaseProxy):
             table_type = attrs.get('tableType') or 'table'
             is_view = 'view' in table_type.lower()
 
-            readers = self._get_readers(table_details, Reader)
-            application = self._get_application(table_details)
+            # the readers, application and reports are fetched together
+            entity_loader = self._create_entity_loader()
+            entity_loader.load(self._get_reader_guids(table_details) + self._get_application_guids(table_details)
+                               + reports_guids)
+
+            readers = self._get_readers(table_details, Reader, entity_loader=entity_loader)
+            application = self._get_application(table_details, entity_loader=entity_loader)
 
             table = Table(
                 table_writer=application,
@@ -475,7 +568,7 @@ class AtlasProxy(BaseProxy):
                 description=attrs.get('description') or attrs.get('comment'),
                 owners=self._get_owners(
                     table_details[AtlasCommonParams.relationships].get('ownedBy', []), attrs.get('owner')),
-                resource_reports=self._get_reports(guids=reports_guids),
+                resource_reports=self._get_reports(guids=reports_guids, entity_loader=entity_loader),
                 columns=columns,
                 is_view=is_view,
                 table_readers=readers,
@@ -1115,20 +1208,24 @@ class AtlasProxy(BaseProxy):
         except Exception:
             return None
 
-    def _get_readers(self, entity: AtlasEntityWithExtInfo, model: Any = Reader, top: Optional[int] = 15) \
-            -> List[Union[Reader, User]]:
+    def _get_reader_guids(self, entity: AtlasEntityWithExtInfo) -> List[str]:
         _readers = entity.get(AtlasCommonParams.relationships, dict()).get('readers', list())
 
-        guids = [_reader.get(AtlasCommonParams.guid) for _reader in self._filter_active(_readers)]
+        return [_reader[AtlasCommonParams.guid] for _reader in self._filter_active(_readers)
+                if _reader.get(AtlasCommonParams.guid)]
+
+    def _get_readers(self, entity: AtlasEntityWithExtInfo, model: Any = Reader, top: Optional[int] = 15,
+                     entity_loader: Optional[EntityBatchLoader] = None) -> List[Union[Reader, User]]:
+        guids = self._get_reader_guids(entity)
 
         if not guids:
             return []
 
-        readers = self.client.entity.get_entities_by_guids(guids=list(guids), ignore_relationships=False)
+        readers = (entity_loader or self._create_entity_loader()).get_many(guids)
 
         _result = []
 
-        for _reader in readers.entities or list():
+        for _reader in readers:
             read_count = _reader.attributes['count']
 
             if read_count >= int(app.config['POPULAR_RESOURCES_MINIMUM_READER_COUNT']):
@@ -1153,17 +1250,21 @@ class AtlasProxy(BaseProxy):
 
         return result
 
-    def _get_application(self, entity: AtlasEntityWithExtInfo) -> Optional[Application]:
+    def _get_application_guids(self, entity: AtlasEntityWithExtInfo) -> List[str]:
         _applications = entity.get(AtlasCommonParams.relationships, dict()).get('applications', list())
 
-        guids = [a.get(AtlasCommonParams.guid) for a in self._filter_active(_applications)]
+        return [a[AtlasCommonParams.guid] for a in self._filter_active(_applications) if a.get(AtlasCommonParams.guid)]
+
+    def _get_application(self, entity: AtlasEntityWithExtInfo,
+                         entity_loader: Optional[EntityBatchLoader] = None) -> Optional[Application]:
+        guids = self._get_application_guids(entity)
 
         if not guids:
             return None
 
-        applications = self.client.entity.get_entities_by_guids(guids=list(guids), ignore_relationships=False)
+        applications = (entity_loader or self._create_entity_loader()).get_many(guids)
 
-        for _app in applications.entities or list():
+        for _app in applications:
             url = _app.attributes.get('application_url', '')
             description = _app.attributes.get('description', '')
             id = _app.attributes.get('id', '')
@@ -1217,23 +1318,26 @@ class AtlasProxy(BaseProxy):
 
         return result
 
-    def _get_dashboard_group(self, group_guid: str) -> AtlasEntityWithExtInfo:
+    def _get_dashboard_group(self, group_guid: str,
+                             entity_loader: Optional[EntityBatchLoader] = None) -> AtlasEntityWithExtInfo:
         """
         Return raw DashboardGroup entity.
 
         :param group_guid: guid of dashboard group entity.
+        :param entity_loader: loader of the entities of the request, a new one if not given
         :return : Atlas DashboardGroup entity.
         """
-        entity = self.client.entity.get_entities_by_guids(guids=[group_guid]).entities[0]
+        entity = (entity_loader or self._create_entity_loader()).get_many([group_guid])[0]
 
         return entity
 
-    def _get_dashboard_summary(self, entity: AtlasEntityWithExtInfo, executions: List[AtlasEntity]) -> Dict:
+    def _get_dashboard_summary(self, entity: AtlasEntityWithExtInfo, executions: List[AtlasEntity],
+                               entity_loader: Optional[EntityBatchLoader] = None) -> Dict:
         attributes = entity.entity[AtlasCommonParams.attributes]
         relationships = entity.entity[AtlasCommonParams.relationships]
 
-        group = self._get_dashboard_group(relationships.get('group').get(AtlasCommonParams.guid))[
-            AtlasCommonParams.attributes]
+        group = self._get_dashboard_group(relationships.get('group').get(AtlasCommonParams.guid),
+                                          entity_loader=entity_loader)[AtlasCommonParams.attributes]
 
         successful_executions = [e for e in executions if e.get('state') == 'succeeded']
 
@@ -1285,10 +1389,16 @@ class AtlasProxy(BaseProxy):
             queries = self._serialize_dashboard_queries(_queries)
             query_names = [q.name for q in queries]
 
-            table_guids = [t.get(AtlasCommonParams.guid) for t in self._filter_active(relationships.get('tables', []))]
+            table_guids = [t[AtlasCommonParams.guid] for t in self._filter_active(relationships.get('tables', []))]
+
+            # the tables, readers and group are fetched together
+            entity_loader = self._create_entity_loader()
+            entity_loader.load(table_guids + self._get_reader_guids(entity.entity)
+                               + [relationships.get('group', dict()).get(AtlasCommonParams.guid)])
 
             if table_guids:
-                _tables = self.client.entity.get_entities_by_guids(guids=table_guids)
+                _tables = AtlasEntitiesWithExtInfo()
+                _tables.entities = entity_loader.get_many(table_guids)
                 tables = self._serialize_popular_tables(_tables)
             else:
                 tables = []
@@ -1301,9 +1411,9 @@ class AtlasProxy(BaseProxy):
                 last_execution = dict(timestamp=0, state='Unknown')
 
             owners = self._get_owners(relationships.get('ownedBy', []))
-            readers = self._get_readers(entity.entity, User)
+            readers = self._get_readers(entity.entity, User, entity_loader=entity_loader)
 
-            result = self._get_dashboard_summary(entity, executions_attributes)
+            result = self._get_dashboard_summary(entity, executions_attributes, entity_loader=entity_loader)
 
             extra_spec = dict(
                 created_timestamp=attributes.get('createdTimestamp', 0),
@@ -1381,6 +1491,13 @@ class AtlasProxy(BaseProxy):
         """
         result = []
 
+        # the groups of the dashboards are fetched together
+        entity_loader = self._create_entity_loader()
+        entity_loader.load(
+            _dashboard.get(AtlasCommonParams.relationships, dict()).get('group', dict()).get(AtlasCommonParams.guid)
+            for _dashboard in entities.entities or list() if _dashboard.status == AtlasStatus.ACTIVE
+        )
+
         for _dashboard in entities.entities:
             try:
                 if _dashboard.status == AtlasStatus.ACTIVE:
@@ -1392,7 +1509,8 @@ class AtlasProxy(BaseProxy):
 
                     dashboard = AtlasEntityWithExtInfo(attrs=dict(entity=_dashboard, referredEntities={}))
 
-                    summary = DashboardSummary(**self._get_dashboard_summary(dashboard, executions))
+                    summary = DashboardSummary(**self._get_dashboard_summary(dashboard, executions,
+                                                                             entity_loader=entity_loader))
 
                     result.append(summary)
             except (KeyError, AttributeError):
@@ -4,12 +4,17 @@
 import collections
 import json
 import logging
+import queue
+import threading
+import time
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 from operator import attrgetter
-from typing import (Any, Callable, Dict, Iterable, List, Mapping, Optional,
-                    Sequence, Set, Tuple, Type, TypeVar, Union, no_type_check,
-                    overload)
+from typing import (Any, Callable, Dict, Hashable, Iterable, Iterator, List,
+                    Mapping, Optional, Sequence, Set, Tuple, Type, TypeVar,
+                    Union, cast, no_type_check, overload)
 from urllib.parse import unquote
 
 import gremlin_python
@@ -47,11 +52,11 @@ from gremlin_python.process.graph_traversal import (GraphTraversal,
                                                     constant, has, inE, inV,
                                                     outE, outV, select, unfold,
                                                     valueMap, values)
-from gremlin_python.process.traversal import Cardinality
+from gremlin_python.process.traversal import Binding, Bytecode, Cardinality
 from gremlin_python.process.traversal import Column as MapColumn
 from gremlin_python.process.traversal import (Direction, Order, P, T, TextP,
-                                              Traversal, gte, not_, within,
-                                              without)
+                                              Traversal, Traverser, gte, not_,
+                                              within, without)
 from gremlin_python.structure.graph import Path
 from neptune_python_utils.gremlin_utils import ExtendedGraphSONSerializersV3d0
 from overrides import overrides
@@ -66,7 +71,8 @@ from metadata_service.entity.dashboard_query import \
 from metadata_service.entity.description import Description
 from metadata_service.entity.tag_detail import TagDetail
 from metadata_service.exception import NotFoundException
-from metadata_service.proxy.statsd_utilities import timer_with_counter
+from metadata_service.proxy.statsd_utilities import (_get_statsd_client,
+                                                     timer_with_counter)
 from metadata_service.util import UserResourceRel
 
 from .base_proxy import BaseProxy
@@ -175,8 +181,119 @@ class FromResultSet:
         raise RuntimeError('Expected one item, but there was more!')
 
 
+class TraverserResultSet:
+    """
+    The results of a traversal submitted as bytecode are traversers, this iterates over their objects like the results
+    of a script so that FromResultSet works the same for both
+    """
+    def __init__(self, result_set: ResultSet) -> None:
+        self.result_set = result_set
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        for part in self.result_set:
+            yield [item.object for item in part for _ in range(item.bulk)] \
+                if part and isinstance(part[0], Traverser) else part
+
+
+class _BindingAsVariable(ScriptTranslator):
+    @classmethod
+    def _convert_to_string(cls, thing: Any) -> str:
+        if isinstance(thing, Binding):
+            return thing.key
+        return super()._convert_to_string(thing)
+
+
+class ParameterizingScriptTranslator:
+    """
+    Translates traversals into scripts with their strings and integers extracted into bindings, e.g.
+    g.V().has('key','a') into g.V().has(_p0,_p1) with {'_p0': 'key', '_p1': 'a'}.  Traversals of the same shape (like
+    getting any table by key) are then the same script, which the server compiles once and finds in its script cache
+    afterwards.  The scripts are also cached here by shape, so a known shape is not translated again.
+
+    Floats, dates and booleans stay in the script, so that the types the server sees don't change.
+    """
+
+    BINDING_PREFIX = '_p'
+
+    def __init__(self, script_translator: Type[ScriptTranslator], *, cache_size: int = 1024) -> None:
+        self.script_translator: Type[ScriptTranslator] = type(
+            f'Parameterizing{script_translator.__name__}', (_BindingAsVariable, script_translator), {})
+        self.cache_size = cache_size
+        self._scripts: 'collections.OrderedDict[Hashable, str]' = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _parameterize(self, thing: Any, bindings: Dict[str, Any], rebuild: bool) -> Tuple[Hashable, Any]:
+        """
+        :return: the shape of thing, with its strings and integers replaced by placeholders that are added to
+        bindings, and if rebuild is set, thing with these replaced by Bindings
+        """
+        if isinstance(thing, (str, int)) and not isinstance(thing, bool):
+            binding = Binding(f'{self.BINDING_PREFIX}{len(bindings)}', thing)
+            bindings[binding.key] = thing
+            return Binding, binding
+        if isinstance(thing, Bytecode):
+            shapes = []
+            steps = []
+            for step_name, *args in thing.step_instructions:
+                parameterized = [self._parameterize(arg, bindings, rebuild) for arg in args]
+                shapes.append((step_name, tuple(shape for shape, _ in parameterized)))
+                steps.append([step_name] + [arg for _, arg in parameterized])
+            bytecode = None
+            if rebuild:
+                bytecode = Bytecode()
+                bytecode.step_instructions = steps
+            return (Bytecode, tuple(shapes)), bytecode
+        if isinstance(thing, P):
+            value_shape, value = self._parameterize(thing.value, bindings, rebuild)
+            return (type(thing), thing.operator, value_shape), type(thing)(thing.operator, value) if rebuild else None
+        if isinstance(thing, (list, tuple)):
+            parameterized = [self._parameterize(item, bindings, rebuild) for item in thing]
+            return (list, tuple(shape for shape, _ in parameterized)), [item for _, item in parameterized]
+        if isinstance(thing, dict):
+            parameterized_values = {key: self._parameterize(value, bindings, rebuild) for key, value in thing.items()}
+            return ((dict, tuple((key, shape) for key, (shape, _) in parameterized_values.items())),
+                    {key: value for key, (_, value) in parameterized_values.items()})
+        try:
+            hash(thing)
+            return (type(thing), thing), thing
+        except TypeError:
+            return (type(thing), repr(thing)), thing
+
+    def translate(self, traversal: Traversal) -> Tuple[str, Dict[str, Any]]:
+        bindings: Dict[str, Any] = {}
+        traversal_source = self.script_translator.get_traversal_source_name(traversal)
+        shape = (traversal_source, self._parameterize(traversal.bytecode, bindings, False)[0])
+        with self._lock:
+            script = self._scripts.get(shape)
+            if script is not None:
+                self._scripts.move_to_end(shape)
+                self.hits += 1
+                return script, bindings
+
+        bindings = {}
+        _, bytecode = self._parameterize(traversal.bytecode, bindings, True)
+        script = self.script_translator.translateB(traversal_source, bytecode)
+        with self._lock:
+            self.misses += 1
+            self._scripts[shape] = script
+            if len(self._scripts) > self.cache_size:
+                self._scripts.popitem(last=False)
+        return script, bindings
+
+
 TYPE = TypeVar('TYPE')
 
+# how traversals are submitted: translated to scripts with all their values in the script, to scripts with their
+# values in bindings (see ParameterizingScriptTranslator), or as bytecode
+QUERY_SUBMISSION_SCRIPT = 'script'
+QUERY_SUBMISSION_BINDINGS = 'bindings'
+QUERY_SUBMISSION_BYTECODE = 'bytecode'
+
+# translates a traversal to a script, a script and its bindings, or bytecode
+TraversalTranslator = Callable[[Traversal], Union[str, Tuple[str, Dict[str, Any]], Bytecode]]
+
 
 class ExecuteQuery(Protocol):
     @overload  # noqa: F811
@@ -193,28 +310,214 @@ class ExecuteQuery(Protocol):
         ...
 
 
+class _PooledClient:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+        self.created_at = self.last_used_at = time.monotonic()
+
+
+class GremlinClientPool:
+    """
+    Long lived Clients that the query executors borrow, so that each query does not open (and for Neptune, sign) new
+    websocket connections.  A Client is borrowed for one query and given back once its results are read.
+
+    :param client_factory creates a Client, connecting with a freshly signed request for Neptune
+    :param size the maximum number of Clients, each with the pool_size connections of the gremlin client options
+    :param max_age_sec Clients older than this are closed and replaced when given back, so that the connections are
+    made again with refreshed credentials.  None to keep them until they fail
+    :param health_check_interval_sec Clients idle for longer than this are checked with a trivial query before being
+    borrowed, None to never check them
+    :param health_check_timeout_sec how long to wait for the health check, a Client that does not answer within it is
+    closed
+    :param borrow_timeout_sec how long to wait for a Client when all of them are borrowed
+
+    A Client is closed when a query fails with something other than an error returned by the server (e.g. the
+    connection was closed), so the next borrow connects again.  The wait for a Client, the reuse of a connected one and
+    the (re)connections are counted in metrics() and sent to statsd.
+    """
+
+    HEALTH_CHECK_QUERY = 'g.inject(0)'
+
+    def __init__(self, client_factory: Callable[[], Client], *, size: int = 4, max_age_sec: Optional[float] = 600,
+                 health_check_interval_sec: Optional[float] = 60, health_check_timeout_sec: float = 5,
+                 borrow_timeout_sec: float = 30) -> None:
+        if size < 1:
+            raise AssertionError(f'size ({size}) must be >= 1')
+        self.client_factory = client_factory
+        self.size = size
+        self.max_age_sec = max_age_sec
+        self.health_check_interval_sec = health_check_interval_sec
+        self.health_check_timeout_sec = health_check_timeout_sec
+        self.borrow_timeout_sec = borrow_timeout_sec
+
+        # most recently used first, so that the Clients beyond the load are the ones left to expire
+        self._idle: 'queue.LifoQueue[_PooledClient]' = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._metrics: Dict[str, float] = collections.defaultdict(float)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._metrics[name] += 1
+        statsd_client = _get_statsd_client(prefix=__name__)
+        if statsd_client:
+            statsd_client.incr(f'gremlin_client_pool.{name}')
+
+    def _record_wait(self, start: float) -> None:
+        wait_sec = time.monotonic() - start
+        with self._lock:
+            self._metrics['wait_sec'] += wait_sec
+        statsd_client = _get_statsd_client(prefix=__name__)
+        if statsd_client:
+            statsd_client.timing('gremlin_client_pool.wait', wait_sec * 1000)
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        :return: the number of borrows, of borrows that reused a connected Client or had to connect one, of Clients
+        closed (because they failed, expired or were unhealthy), the total seconds spent waiting for a Client, and the
+        current number of open and idle Clients
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics.update(open=self._opened, idle=self._idle.qsize())
+        return metrics
+
+    def _connect(self) -> Optional[_PooledClient]:
+        """
+        :return: a new Client, or None if there are already size of them
+        """
+        with self._lock:
+            if self._opened >= self.size:
+                return None
+            self._opened += 1
+        try:
+            pooled = _PooledClient(self.client_factory())
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+        self._count('connected')
+        return pooled
+
+    def _discard(self, pooled: _PooledClient, *, reason: str) -> None:
+        LOGGER.info(f'closing gremlin client: {reason}')
+        with self._lock:
+            self._opened -= 1
+        self._count('closed')
+        try:
+            pooled.client.close()
+        except Exception as e:
+            LOGGER.warning('got exception closing gremlin client', exc_info=e)
+
+    def _is_healthy(self, pooled: _PooledClient) -> bool:
+        if self.health_check_interval_sec is None \
+                or time.monotonic() - pooled.last_used_at < self.health_check_interval_sec:
+            return True
+        deadline = time.monotonic() + self.health_check_timeout_sec
+        try:
+            # like the wait for a Client, so that a connection that stopped answering can't hang the borrow
+            result_set = pooled.client.submitAsync(self.HEALTH_CHECK_QUERY).result(
+                timeout=self.health_check_timeout_sec)
+            result_set.all().result(timeout=max(deadline - time.monotonic(), 0))
+            return True
+        except Exception as e:
+            LOGGER.warning('gremlin client failed its health check', exc_info=e)
+            return False
+
+    def _acquire(self) -> _PooledClient:
+        start = time.monotonic()
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                connected = self._connect()
+                if connected is not None:
+                    self._record_wait(start)
+                    return connected
+                remaining = self.borrow_timeout_sec - (time.monotonic() - start)
+                try:
+                    pooled = self._idle.get(timeout=max(remaining, 0))
+                except queue.Empty:
+                    raise RuntimeError(f'no gremlin client was given back within {self.borrow_timeout_sec}s')
+
+            if self._is_healthy(pooled):
+                self._record_wait(start)
+                self._count('reused')
+                return pooled
+            self._discard(pooled, reason='unhealthy')
+
+    def _give_back(self, pooled: _PooledClient) -> None:
+        now = time.monotonic()
+        if self.max_age_sec is not None and now - pooled.created_at >= self.max_age_sec:
+            self._discard(pooled, reason='expired')
+            return
+        pooled.last_used_at = now
+        self._idle.put(pooled)
+
+    @contextmanager
+    def borrow(self) -> Iterator[Client]:
+        pooled = self._acquire()
+        self._count('borrowed')
+        try:
+            yield pooled.client
+        except gremlin_python.driver.protocol.GremlinServerError:
+            # the server answered, the connection is fine
+            self._give_back(pooled)
+            raise
+        except BaseException:
+            self._discard(pooled, reason='query failed')
+            raise
+        self._give_back(pooled)
+
+    def close(self) -> None:
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(pooled, reason='pool closed')
+
+
 class ClientQueryExecutor(ExecuteQuery):
-    def __init__(self, *, client: Client, traversal_translator: Callable[[Traversal], str]) -> None:
+    """
+    :param client a Client, or a GremlinClientPool to borrow one from for each query
+    """
+    def __init__(self, *, client: Union[Client, GremlinClientPool],
+                 traversal_translator: TraversalTranslator) -> None:
         self.client = client
         self.traversal_translator = traversal_translator
 
     def __call__(self, query: Union[str, Traversal], get: Callable[[ResultSet], V], *,  # noqa: F811
                  bindings: Optional[Mapping[str, Any]] = None) -> V:
+        message: Union[str, Bytecode]
         if isinstance(query, Traversal):
             if bindings is not None:
                 raise AssertionError(f'expected bindings to be none')
-            query_text = self.traversal_translator(query)
+            translated = self.traversal_translator(query)
+            if isinstance(translated, tuple):
+                message, bindings = translated
+            else:
+                message = translated
         else:
-            query_text = query
+            message = query
+
+        if not isinstance(message, (str, Bytecode)):
+            raise AssertionError(f'expected str or Bytecode')
+        if isinstance(self.client, GremlinClientPool):
+            # keep the client until the results are read
+            with self.client.borrow() as client:
+                return self._get(client.submit(message, bindings), message, get)
+        return self._get(self.client.submit(message, bindings), message, get)
 
-        if not isinstance(query_text, str):
-            raise AssertionError(f'expected str')
-        result_set = self.client.submit(query_text, bindings)
+    @staticmethod
+    def _get(result_set: ResultSet, message: Union[str, Bytecode], get: Callable[[ResultSet], V]) -> V:
+        if isinstance(message, Bytecode):
+            return get(cast(ResultSet, TraverserResultSet(result_set)))
         return get(result_set)
 
 
 class RetryingClientQueryExecutor(ClientQueryExecutor):
-    def __init__(self, client: Client, traversal_translator: Callable[[Traversal], str],
+    def __init__(self, client: Union[Client, GremlinClientPool], traversal_translator: TraversalTranslator,
                  is_retryable: Callable[[Exception], bool]) -> None:
         ClientQueryExecutor.__init__(self, client=client, traversal_translator=traversal_translator)
         self.is_retryable = is_retryable
@@ -223,6 +526,9 @@ class RetryingClientQueryExecutor(ClientQueryExecutor):
         return self
 
     def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        # the pool outlives the executors
+        if isinstance(self.client, GremlinClientPool):
+            return None
         return self.client.close()
 
     # TODO: ideally this would be __call__(*args: Any, **kwargs: Any) -> Any (and then this could be mixinable) but I
@@ -843,6 +1149,12 @@ class AbstractGremlinProxy(BaseProxy):
 
     :param key_property_name defaults to 'key', but some some servers don't allow key so their proxies will pick a different key property name (e.g. _key)
     :param remote_connection a RemoteConnection e.g. `DriverRemoteConnection(url='wss://host:8182/gremlin')`
+    :param client_pool_options passed to the GremlinClientPool the query executors borrow their Client from, e.g.
+    `dict(size=8, max_age_sec=600)`
+    :param query_submission how traversals are sent to the server, one of QUERY_SUBMISSION_BINDINGS (default),
+    QUERY_SUBMISSION_BYTECODE or QUERY_SUBMISSION_SCRIPT
+    :param max_concurrent_traversals how many of the independent traversals of get_table and get_dashboard run at the
+    same time, across all requests.  1 to run them one after the other
 
     If you see:
     gremlin_python.driver.protocol.GremlinServerError: 498: {"requestId":"80a1d05e-bcde-4f43-95c7-d48db3966c0a","code":"UnsupportedOperationException","detailedMessage:"com.amazon.neptune.storage.volcano.ast.CutoffNode cannot be cast to com.amazon.neptune.storage.volcano.ast.AbstractGroupNode"}
@@ -858,7 +1170,10 @@ class AbstractGremlinProxy(BaseProxy):
     """  # noqa: E501
 
     def __init__(self, *, key_property_name: str, driver_remote_connection_options: Mapping[str, Any] = {},
-                 gremlin_client_options: Mapping[str, Any] = {}) -> None:
+                 gremlin_client_options: Mapping[str, Any] = {},
+                 client_pool_options: Mapping[str, Any] = {},
+                 query_submission: str = QUERY_SUBMISSION_BINDINGS,
+                 max_concurrent_traversals: int = 4) -> None:
         # these might vary from datastore type to another, but if you change these while talking to the same instance
         # without migration, it will go poorly
         self.key_property_name: str = key_property_name
@@ -880,6 +1195,23 @@ class AbstractGremlinProxy(BaseProxy):
 
         self._g: GraphTraversalSource = traversal().withRemote(self.remote_connection)
 
+        # connects lazily, on the first query
+        self.client_pool = GremlinClientPool(self.client, **(client_pool_options or {}))
+
+        self.traversal_translator: TraversalTranslator
+        if query_submission == QUERY_SUBMISSION_BINDINGS:
+            self.traversal_translator = ParameterizingScriptTranslator(self.script_translator()).translate
+        elif query_submission == QUERY_SUBMISSION_BYTECODE:
+            self.traversal_translator = attrgetter('bytecode')
+        elif query_submission == QUERY_SUBMISSION_SCRIPT:
+            self.traversal_translator = self.script_translator().translateT
+        else:
+            raise ValueError(f'unknown query_submission: {query_submission}, expected one of '
+                             f'{QUERY_SUBMISSION_BINDINGS}, {QUERY_SUBMISSION_BYTECODE} or {QUERY_SUBMISSION_SCRIPT}')
+
+        self._traversal_executor = ThreadPoolExecutor(max_workers=max_concurrent_traversals,
+                                                      thread_name_prefix='gremlin-traversal')
+
     def drop(self) -> None:
         LOGGER.warning('DROPPING ALL NODES')
         with self.query_executor() as executor:
@@ -919,8 +1251,39 @@ class AbstractGremlinProxy(BaseProxy):
     def query_executor(self, *, method_name: str = "nope") -> \
             RetryingClientQueryExecutor:
         return RetryingClientQueryExecutor(
-            client=self.client(), is_retryable=self.get_is_retryable(method_name),
-            traversal_translator=self.script_translator().translateT)
+            client=self.client_pool, is_retryable=self.get_is_retryable(method_name),
+            traversal_translator=self.traversal_translator)
+
+    @staticmethod
+    def _timed(method_name: str, name: str, traversal: Callable[[], TYPE]) -> TYPE:
+        start = time.monotonic()
+        try:
+            return traversal()
+        finally:
+            elapsed_ms = (time.monotonic() - start) * 1000
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(f'{method_name} traversal {name} took {elapsed_ms:.1f}ms')
+            statsd_client = _get_statsd_client(prefix=__name__)
+            if statsd_client:
+                statsd_client.timing(f'{method_name}.{name}', elapsed_ms)
+
+    def _run_concurrently(self, method_name: str, **traversals: Callable[[], Any]) -> Dict[str, Any]:
+        """
+        Runs independent read traversals at the same time on the traversal executor, timing each of them
+        :return: the result of each traversal by name.  If any of them raised, the first one (in order) is raised
+        """
+        app = current_app._get_current_object() if has_app_context() else None  # type: ignore
+
+        def run(name: str, traversal: Callable[[], Any]) -> Any:
+            if app is None:
+                return self._timed(method_name, name, traversal)
+            # for the statsd and user config lookups
+            with app.app_context():
+                return self._timed(method_name, name, traversal)
+
+        futures = {name: self._traversal_executor.submit(run, name, traversal)
+                   for name, traversal in traversals.items()}
+        return {name: future.result() for name, future in futures.items()}
 
     @classmethod
     def _is_retryable_exception(cls, *, method_name: str, exception: Exception) -> bool:
@@ -1048,12 +1411,17 @@ class AbstractGremlinProxy(BaseProxy):
         :return:  A Table object
         """
 
-        result = self._get_table_itself(table_uri=table_uri)
+        results = self._run_concurrently(
+            'get_table',
+            table=lambda: self._get_table_itself(table_uri=table_uri),
+            columns=lambda: self._get_table_columns(table_uri=table_uri),
+            readers=lambda: self._get_table_readers(table_uri=table_uri))
+        result = results['table']
         if not result:
             raise NotFoundException(f'Table URI( {table_uri} ) does not exist')
 
-        cols = self._get_table_columns(table_uri=table_uri)
-        readers = self._get_table_readers(table_uri=table_uri)
+        cols = results['columns']
+        readers = results['readers']
 
         users_by_type: Dict[str, List[User]] = {}
         users_by_type['owner'] = _safe_get_list(result, f'all_owners', transform=self._convert_to_user) or []
@@ -1686,6 +2054,19 @@ class AbstractGremlinProxy(BaseProxy):
             product_name = ""
         return dashboard_group_name, dashboard_group_url, cluster_name, product_name
 
+    def _get_dashboard_out_vertices(self, dashboard_uri: str, *edge_labels: str) -> List[Dict[str, Any]]:
+        """
+        Helper function to get the properties of the vertices the dashboard has edges to
+        :param dashboard_uri: dashboard URI that is sent from frontend
+        :param edge_labels: labels of the edges, the vertices are deduplicated when there are several
+        :return: List of the properties of each vertex
+        """
+        query = self.g.V().has("key", dashboard_uri).out(*edge_labels)
+        if len(edge_labels) > 1:
+            query = query.dedup()
+        query = query.valueMap().by(__.unfold())
+        return self.query_executor()(query=query, get=FromResultSet.toList)
+
     def _get_dashboard_tables(self,
                               dashboard_uri: str,
                               ) -> List[PopularTable]:
@@ -1728,57 +2109,60 @@ class AbstractGremlinProxy(BaseProxy):
         :param dashboard_uri: dashboard URI that is sent from frontend
         :return: The DashboardDetailEntity object
         '''
-        dashboard_uri, dashboard_url, dashboard_name, dashboard_created_timestamp = \
-            self._get_dashboard_vertex(dashboard_uri)
-
-        dashboard_group_name, dashboard_group_url, cluster_name, product_name = \
-            self._get_dashboard_group_and_cluster(dashboard_uri)
-
-        dashboard_desc_query = self.g.V().has("key", dashboard_uri).out("DESCRIPTION")
-        dashboard_desc_query = dashboard_desc_query.valueMap().by(__.unfold())
-        dashboard_desc = self.query_executor()(query=dashboard_desc_query, get=FromResultSet.toList)
+        def get_out_vertices(*edge_labels: str) -> Callable[[], List[Dict[str, Any]]]:
+            return lambda: self._get_dashboard_out_vertices(dashboard_uri, *edge_labels)
+
+        dashboard_view_count_query = self.g.V().has("key", dashboard_uri).outE("READ_BY").valueMap().by(__.unfold())
+
+        # these are independent, run them at the same time
+        results = self._run_concurrently(
+            'get_dashboard',
+            vertex=lambda: self._get_dashboard_vertex(dashboard_uri),
+            group_and_cluster=lambda: self._get_dashboard_group_and_cluster(dashboard_uri),
+            description=get_out_vertices("DESCRIPTION"),
+            owners=get_out_vertices("READ_BY", "OWNER"),
+            tags=get_out_vertices("TAGGED_BY"),
+            badges=get_out_vertices("HAS_BADGE"),
+            charts=get_out_vertices("HAS_CHART"),
+            queries=get_out_vertices("HAS_QUERY"),
+            tables=lambda: self._get_dashboard_tables(dashboard_uri),
+            executions=get_out_vertices("EXECUTED"),
+            last_updates=get_out_vertices("LAST_UPDATED_AT"),
+            views=lambda: self.query_executor()(query=dashboard_view_count_query, get=FromResultSet.toList))
+
+        dashboard_uri, dashboard_url, dashboard_name, dashboard_created_timestamp = results['vertex']
+
+        dashboard_group_name, dashboard_group_url, cluster_name, product_name = results['group_and_cluster']
+
+        dashboard_desc = results['description']
         if dashboard_desc:
             dashboard_description = dashboard_desc[0].get("description", "")
         else:
             dashboard_description = ""
 
         owners = []
-        dashboard_owners_query = self.g.V().has("key", dashboard_uri).out("READ_BY", "OWNER")
-        dashboard_owners_query = dashboard_owners_query.dedup().valueMap().by(__.unfold())
-        dashboard_owners = self.query_executor()(query=dashboard_owners_query, get=FromResultSet.toList)
-        for owner in dashboard_owners:
+        for owner in results['owners']:
             owner_data = self._get_user_details(user_id=owner["email"], user_data=owner)
             owners.append(self._build_user_from_record(record=owner_data))
 
-        dashboard_tags_query = self.g.V().has("key", dashboard_uri).out("TAGGED_BY").valueMap().by(__.unfold())
-        dashboard_tags = self.query_executor()(query=dashboard_tags_query, get=FromResultSet.toList)
-        tags = [Tag(tag_type=tag['tag_type'], tag_name=tag['key']) for tag in dashboard_tags]
+        tags = [Tag(tag_type=tag['tag_type'], tag_name=tag['key']) for tag in results['tags']]
 
-        dashboard_badges_query = self.g.V().has("key", dashboard_uri).out("HAS_BADGE").valueMap().by(__.unfold())
-        dashboard_badges = self.query_executor()(query=dashboard_badges_query, get=FromResultSet.toList)
-        badges = self._make_badges(dashboard_badges)
+        badges = self._make_badges(results['badges'])
 
-        dashboard_charts_query = self.g.V().has("key", dashboard_uri).out("HAS_CHART").valueMap().by(__.unfold())
-        dashboard_charts = self.query_executor()(query=dashboard_charts_query, get=FromResultSet.toList)
-        chart = [chart['name'] for chart in dashboard_charts if 'name' in chart and chart['name']]
+        chart = [chart['name'] for chart in results['charts'] if 'name' in chart and chart['name']]
 
-        dashboard_query_query = self.g.V().has("key", dashboard_uri).out("HAS_QUERY").valueMap().by(__.unfold())
-        dashboard_query = self.query_executor()(query=dashboard_query_query, get=FromResultSet.toList)
+        dashboard_query = results['queries']
         query_names = [query['name'] for query in dashboard_query if 'name' in query and query['name']]
-        queries = []
-        for query in dashboard_query:
-            if query.get('name') or query.get('url') or query.get('query_text'):
-                query_dict = {'name': query.get('name'), 'url': query.get('url'), 'query_text': query.get('query_text')}
-                queries.append(DashboardQueryEntity(**query_dict))
+        queries = [DashboardQueryEntity(name=query.get('name'), url=query.get('url'),
+                                        query_text=query.get('query_text'))
+                   for query in dashboard_query if query.get('name') or query.get('url') or query.get('query_text')]
 
-        tables = self._get_dashboard_tables(dashboard_uri)
+        tables = results['tables']
 
         last_successful_run_timestamp = None
         last_run_timestamp = None
         last_run_state = None
-        dashboard_execution_query = self.g.V().has("key", dashboard_uri).out("EXECUTED").valueMap().by(__.unfold())
-        dashboard_execution = self.query_executor()(query=dashboard_execution_query, get=FromResultSet.toList)
-        for execution in dashboard_execution:
+        for execution in results['executions']:
             if "last_successful_execution" in execution.get("key"):
                 last_successful_run_timestamp = int(execution.get("timestamp"))
             if "last_execution" in execution.get("key"):
@@ -1786,16 +2170,11 @@ class AbstractGremlinProxy(BaseProxy):
                 last_run_state = execution.get("state")
 
         updated_timestamp = None
-        dashboard_last_update_query = self.g.V().has("key", dashboard_uri).out("LAST_UPDATED_AT")
-        dashboard_last_update_query = dashboard_last_update_query.valueMap().by(__.unfold())
-        dashboard_last_update = self.query_executor()(query=dashboard_last_update_query, get=FromResultSet.toList)
-        for last_update in dashboard_last_update:
+        for last_update in results['last_updates']:
             updated_timestamp = int(last_update.get("timestamp"))
 
         view_count = 0
-        dashboard_view_count = self.g.V().has("key", dashboard_uri).outE("READ_BY").valueMap().by(__.unfold())
-        dashboard_view_count = self.query_executor()(query=dashboard_view_count, get=FromResultSet.toList)
-        for view in dashboard_view_count:
+        for view in results['views']:
             view_count += view.get("read_count")
 
         return DashboardDetailEntity(uri=dashboard_uri,
@@ -2138,11 +2517,14 @@ class GenericGremlinProxy(AbstractGremlinProxy):
     :param user: (as optional as your server allows) username
     :param password: (as optional as your server allows) password
     :param driver_remote_connection_options: passed to DriverRemoteConnection's constructor.
+    :param client_kwargs: gremlin_client_pool is passed to the GremlinClientPool, and gremlin_query_submission is how
+    traversals are sent (see AbstractGremlinProxy)
     """
 
     def __init__(self, *, host: str, port: Optional[int] = None, user: Optional[str] = None,
                  password: Optional[str] = None, traversal_source: 'str' = 'g', key_property_name: str = 'key',
                  driver_remote_connection_options: Mapping[str, Any] = {},
+                 client_kwargs: Dict = dict(),
                  **kwargs: dict) -> None:
         driver_remote_connection_options = dict(driver_remote_connection_options)
 
@@ -2163,7 +2545,10 @@ class GenericGremlinProxy(AbstractGremlinProxy):
         driver_remote_connection_options.update(traversal_source=traversal_source)
 
         super().__init__(key_property_name=key_property_name,
-                         driver_remote_connection_options=driver_remote_connection_options)
+                         driver_remote_connection_options=driver_remote_connection_options,
+                         client_pool_options=client_kwargs.get('gremlin_client_pool', {}),
+                         query_submission=client_kwargs.get('gremlin_query_submission', QUERY_SUBMISSION_BINDINGS),
+                         max_concurrent_traversals=client_kwargs.get('gremlin_max_concurrent_traversals', 4))
 
     @classmethod
     @overrides
@@ -1,12 +1,12 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, Mapping, Optional, Type
+from typing import Any, Dict, Mapping, Optional, Type
 
 from amundsen_gremlin.script_translator import ScriptTranslatorTargetJanusgraph
 from overrides import overrides
 
-from .gremlin_proxy import AbstractGremlinProxy
+from .gremlin_proxy import QUERY_SUBMISSION_BINDINGS, AbstractGremlinProxy
 
 
 class JanusGraphGremlinProxy(AbstractGremlinProxy):
@@ -21,6 +21,7 @@ class JanusGraphGremlinProxy(AbstractGremlinProxy):
     def __init__(self, *, host: str, port: Optional[int] = None, user: Optional[str] = None,
                  password: Optional[str] = None, traversal_source: 'str' = 'g',
                  driver_remote_connection_options: Mapping[str, Any] = {},
+                 client_kwargs: Dict = dict(),
                  **kwargs: dict) -> None:
         driver_remote_connection_options = dict(driver_remote_connection_options)
 
@@ -40,7 +41,12 @@ class JanusGraphGremlinProxy(AbstractGremlinProxy):
 
         # use _key
         AbstractGremlinProxy.__init__(self, key_property_name='_key',
-                                      driver_remote_connection_options=driver_remote_connection_options)
+                                      driver_remote_connection_options=driver_remote_connection_options,
+                                      client_pool_options=client_kwargs.get('gremlin_client_pool', {}),
+                                      query_submission=client_kwargs.get('gremlin_query_submission',
+                                                                         QUERY_SUBMISSION_BINDINGS),
+                                      max_concurrent_traversals=client_kwargs.get(
+                                          'gremlin_max_concurrent_traversals', 4))
 
     @classmethod
     @overrides
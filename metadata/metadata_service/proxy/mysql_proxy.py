@@ -60,7 +60,8 @@ from amundsen_rds.models.user import User as RDSUser
 from beaker.cache import CacheManager
 from beaker.util import parse_cache_config_options
 from flask import current_app as app
-from sqlalchemy import func, literal
+from sqlalchemy import func, literal, sql
+from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.orm import Session, load_only, subqueryload
 
 from metadata_service.client.rds_client import RDSClient
@@ -80,6 +81,13 @@ _CACHE = CacheManager(**parse_cache_config_options({'cache.type': 'memory'}))
 # Expire cache every 11 hours + jitter
 _GET_POPULAR_RESOURCES_CACHE_EXPIRY_SEC = 11 * 60 * 60 + randint(0, 3600)
 
+# Ranking materialized by the databuilder MySQLPopularResourcesTask, rows with an empty user_rk hold the global ranking
+_POPULAR_RESOURCE_RANK = sql.table('popular_resource_rank',
+                                   sql.column('resource_type'),
+                                   sql.column('user_rk'),
+                                   sql.column('popularity_rank'),
+                                   sql.column('resource_rk'))
+
 resource_relation_model = {
     ResourceType.Table: {
         UserResourceRel.read: RDSTableUsage,
@@ -745,11 +753,31 @@ class MySQLProxy(BaseProxy):
 
         return popular_resources
 
-    @_CACHE.cache('_get_global_popular_resources_uris', expire=_GET_POPULAR_RESOURCES_CACHE_EXPIRY_SEC)
     def _get_global_popular_resources_uris(self,
                                            num_entries: int,
                                            resource_type: ResourceType = ResourceType.Table) -> List[str]:
         """
+        Retrieve popular resources uris. When POPULAR_RESOURCES_MATERIALIZED is enabled, the ranking precomputed by
+        the databuilder MySQLPopularResourcesTask is used, falling back to the cached computation if there is none.
+        :param num_entries:
+        :param resource_type:
+        :return:
+        """
+        if app.config['POPULAR_RESOURCES_MATERIALIZED']:
+            resource_uris = self._get_materialized_popular_resources_uris(num_entries=num_entries,
+                                                                          user_id='',
+                                                                          resource_type=resource_type)
+            if resource_uris:
+                return resource_uris
+            LOGGER.warning(f'No materialized popular {resource_type.name} found, computing them')
+
+        return self._compute_global_popular_resources_uris(num_entries=num_entries, resource_type=resource_type)
+
+    @_CACHE.cache('_get_global_popular_resources_uris', expire=_GET_POPULAR_RESOURCES_CACHE_EXPIRY_SEC)
+    def _compute_global_popular_resources_uris(self,
+                                               num_entries: int,
+                                               resource_type: ResourceType = ResourceType.Table) -> List[str]:
+        """
         Retrieve popular resources uris. Will provide resources with top x popularity score.
         Popularity score = number of distinct readers * log(total number of reads)
         The result of this method will be cached based on the key (num_entries),
@@ -783,12 +811,59 @@ class MySQLProxy(BaseProxy):
         return [usage.res_key for usage in popular_usage]
 
     @timer_with_counter
-    @_CACHE.cache('_get_personal_popular_resources_uris', _GET_POPULAR_RESOURCES_CACHE_EXPIRY_SEC)
     def _get_personal_popular_resources_uris(self,
                                              num_entries: int,
                                              user_id: str,
                                              resource_type: ResourceType = ResourceType.Table) -> List[str]:
         """
+        Retrieve personalized popular resources uris. When POPULAR_RESOURCES_MATERIALIZED is enabled, the ranking
+        precomputed by the databuilder MySQLPopularResourcesTask is used, falling back to the cached computation
+        if there is none.
+        :param num_entries:
+        :param user_id:
+        :param resource_type:
+        :return:
+        """
+        if app.config['POPULAR_RESOURCES_MATERIALIZED']:
+            resource_uris = self._get_materialized_popular_resources_uris(num_entries=num_entries,
+                                                                          user_id=user_id,
+                                                                          resource_type=resource_type)
+            if resource_uris:
+                return resource_uris
+
+        return self._compute_personal_popular_resources_uris(num_entries=num_entries,
+                                                             user_id=user_id,
+                                                             resource_type=resource_type)
+
+    def _get_materialized_popular_resources_uris(self, *,
+                                                 num_entries: int,
+                                                 user_id: str,
+                                                 resource_type: ResourceType) -> List[str]:
+        """
+        Retrieve the top resources uris of the materialized ranking, an empty user_id being the global ranking.
+        :param num_entries:
+        :param user_id:
+        :param resource_type:
+        :return:
+        """
+        try:
+            with self.client.create_session() as session:
+                ranks = session.query(_POPULAR_RESOURCE_RANK.c.resource_rk).filter(
+                    _POPULAR_RESOURCE_RANK.c.resource_type == resource_type.name.lower(),
+                    _POPULAR_RESOURCE_RANK.c.user_rk == user_id
+                ).order_by(_POPULAR_RESOURCE_RANK.c.popularity_rank).limit(num_entries).all()
+        except (OperationalError, ProgrammingError):
+            LOGGER.exception('Failed to query materialized popular resources')
+            return []
+
+        return [rank.resource_rk for rank in ranks]
+
+    @_CACHE.cache('_get_personal_popular_resources_uris', _GET_POPULAR_RESOURCES_CACHE_EXPIRY_SEC)
+    def _compute_personal_popular_resources_uris(self,
+                                                 num_entries: int,
+                                                 user_id: str,
+                                                 resource_type: ResourceType = ResourceType.Table) -> List[str]:
+        """
         Retrieve personalized popular resources uris. Will provide resources with top
         popularity score that have been read by a peer of the user_id provided.
         The popularity score is defined in the same way as `_get_global_popular_resources_uris`
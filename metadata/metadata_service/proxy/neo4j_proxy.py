@@ -1198,10 +1198,32 @@ class Neo4jProxy(BaseProxy):
             return neo4j_statistics
         return {}
 
-    @_CACHE.cache('_get_global_popular_resources_uris', expire=_GET_POPULAR_RESOURCES_CACHE_EXPIRY_SEC)
     def _get_global_popular_resources_uris(self, num_entries: int,
                                            resource_type: ResourceType = ResourceType.Table) -> List[str]:
         """
+        Retrieve popular resource uris. When POPULAR_RESOURCES_MATERIALIZED is enabled, the ranking precomputed by
+        the databuilder Neo4jPopularResourcesTask is used, falling back to the cached computation if there is none.
+        :return: Iterable of resource uri
+        """
+        if current_app.config['POPULAR_RESOURCES_MATERIALIZED']:
+            query = textwrap.dedent("""
+            MATCH (resource:{resource_type})
+            WHERE resource.popular_rank IS NOT NULL
+            RETURN resource.key as resource_key
+            ORDER BY resource.popular_rank LIMIT $num_entries;
+            """).format(resource_type=resource_type.name)
+            records = self._execute_cypher_query(statement=query,
+                                                 param_dict={'num_entries': num_entries})
+            if records:
+                return [record['resource_key'] for record in records]
+            LOGGER.warning('No materialized popular %s found, computing them', resource_type.name)
+
+        return self._compute_global_popular_resources_uris(num_entries, resource_type)
+
+    @_CACHE.cache('_get_global_popular_resources_uris', expire=_GET_POPULAR_RESOURCES_CACHE_EXPIRY_SEC)
+    def _compute_global_popular_resources_uris(self, num_entries: int,
+                                               resource_type: ResourceType = ResourceType.Table) -> List[str]:
+        """
         Retrieve popular table uris. Will provide tables with top x popularity score.
         Popularity score = number of distinct readers * log(total number of reads)
         The result of this method will be cached based on the key (num_entries), and the cache will be expired based on
@@ -1227,11 +1249,33 @@ class Neo4jProxy(BaseProxy):
         return [record['resource_key'] for record in records]
 
     @timer_with_counter
-    @_CACHE.cache('_get_personal_popular_tables_uris', _GET_POPULAR_RESOURCES_CACHE_EXPIRY_SEC)
     def _get_personal_popular_resources_uris(self, num_entries: int,
                                              user_id: str,
                                              resource_type: ResourceType = ResourceType.Table) -> List[str]:
         """
+        Retrieve personalized popular resource uris. When POPULAR_RESOURCES_MATERIALIZED is enabled, the ranking
+        precomputed on the User node by the databuilder Neo4jPopularResourcesTask is used, falling back to the cached
+        computation if there is none.
+        :return: Iterable of resource uri
+        """
+        if current_app.config['POPULAR_RESOURCES_MATERIALIZED']:
+            query = textwrap.dedent("""
+            MATCH (user:User {{key: $user_id}})
+            RETURN user.popular_{resource_type}_keys[0..$num_entries] as resource_keys;
+            """).format(resource_type=resource_type.name.lower())
+            record = get_single_record(self._execute_cypher_query(statement=query,
+                                                                  param_dict={'user_id': user_id,
+                                                                              'num_entries': num_entries}))
+            if record and record['resource_keys'] is not None:
+                return list(record['resource_keys'])
+
+        return self._compute_personal_popular_resources_uris(num_entries, user_id, resource_type)
+
+    @_CACHE.cache('_get_personal_popular_tables_uris', _GET_POPULAR_RESOURCES_CACHE_EXPIRY_SEC)
+    def _compute_personal_popular_resources_uris(self, num_entries: int,
+                                                 user_id: str,
+                                                 resource_type: ResourceType = ResourceType.Table) -> List[str]:
+        """
         Retrieve personalized popular resources uris. Will provide resources with top
         popularity score that have been read by a peer of the user_id provided.
         The popularity score is defined in the same way as `_get_global_popular_resources_uris`
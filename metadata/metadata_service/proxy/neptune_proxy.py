@@ -25,8 +25,8 @@ from ssl_override_server_hostname.ssl_context import \
     OverrideServerHostnameSSLContext
 from tornado import httpclient
 
-from .gremlin_proxy import (AbstractGremlinProxy, FromResultSet,
-                            _parse_gremlin_server_error)
+from .gremlin_proxy import (QUERY_SUBMISSION_BYTECODE, AbstractGremlinProxy,
+                            FromResultSet, _parse_gremlin_server_error)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -118,7 +118,13 @@ class NeptuneGremlinProxy(AbstractGremlinProxy):
                                                                                                  neptune_url=host)
 
         AbstractGremlinProxy.__init__(self, key_property_name='key',
-                                      driver_remote_connection_options=driver_remote_connection_options)
+                                      driver_remote_connection_options=driver_remote_connection_options,
+                                      client_pool_options=client_kwargs.get('gremlin_client_pool', {}),
+                                      # Neptune runs bytecode without compiling a script
+                                      query_submission=client_kwargs.get('gremlin_query_submission',
+                                                                         QUERY_SUBMISSION_BYTECODE),
+                                      max_concurrent_traversals=client_kwargs.get(
+                                          'gremlin_max_concurrent_traversals', 4))
 
     @classmethod
     @overrides
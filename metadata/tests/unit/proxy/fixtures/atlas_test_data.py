@@ -636,6 +636,7 @@ class Data:
     })
 
     dashboard_group_data = DottedDict({
+        'guid': 'group_1',
         'attributes': {
             'name': 'prod superset',
             'url': 'https://superset.prod'
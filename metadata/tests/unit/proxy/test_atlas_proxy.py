@@ -3,7 +3,7 @@
 
 import copy
 import unittest
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, List, Optional, cast
 from unittest.mock import MagicMock, patch
 
 from amundsen_common.entity.resource_type import ResourceType
@@ -65,6 +65,16 @@ class TestAtlasProxy(unittest.TestCase, Data):
         self.proxy._get_table_entity = MagicMock(return_value=mocked_entity)  # type: ignore
         return mocked_entity
 
+    def _mock_get_entities_by_guids(self, *entities: Any, **response: Any) -> None:
+        """
+        Answers get_entities_by_guids with the given entities that have the guids asked for
+        """
+        def get_entities_by_guids(guids: List[str], **kwargs: Any) -> DottedDict:
+            return DottedDict({'entities': [DottedDict(entity) for entity in entities if entity['guid'] in guids],
+                               **response})
+
+        self.proxy.client.entity.get_entities_by_guids = MagicMock(side_effect=get_entities_by_guids)
+
     def _mock_get_create_glossary_term(self, tag: str, assigned_ent: Optional[Any] = None,
                                        guid: Optional[str] = None) -> Any:
         term = MagicMock()
@@ -93,8 +103,10 @@ class TestAtlasProxy(unittest.TestCase, Data):
     def _create_mocked_report_entities_collection(self) -> None:
         mocked_report_entities_collection = MagicMock()
         mocked_report_entities_collection.entities = []
-        for entity in self.report_entities:
+        report_guids = [report['guid'] for report in cast(dict, self.entity1)['attributes']['reports']]
+        for entity, guid in zip(self.report_entities, report_guids):
             mocked_report_entity = MagicMock()
+            mocked_report_entity.guid = guid
             mocked_report_entity.status = entity['status']
             mocked_report_entity.attributes = entity['attributes']
             mocked_report_entities_collection.entities.append(mocked_report_entity)
@@ -105,7 +117,7 @@ class TestAtlasProxy(unittest.TestCase, Data):
         self._create_mocked_report_entities_collection()
         self.report_entity_collection.entities.sort(key=lambda x: x.attributes['name'], reverse=True)
         self.proxy.client.entity.get_entities_by_guids = MagicMock(return_value=self.report_entity_collection)
-        reports_guid = cast(dict, self.entity1)['attributes']['reports']
+        reports_guid = [report['guid'] for report in cast(dict, self.entity1)['attributes']['reports']]
         sorted_reports = self.proxy._get_reports(reports_guid)
         expected = [ResourceReport(name="test_report", url="http://test"),
                     ResourceReport(name="test_report3", url="http://test3")]
@@ -493,16 +505,15 @@ class TestAtlasProxy(unittest.TestCase, Data):
         unique_attr_response.entity = self.user_entity_1
         self.proxy.client.entity.get_entity_by_attribute = MagicMock(return_value=unique_attr_response)
 
-        entity_bulk_result = MagicMock()
-        entity_bulk_result.entities = [DottedDict(self.dashboard_data['entity'])]
-        self.proxy.client.entity.get_entities_by_guids = MagicMock(return_value=entity_bulk_result)
+        self._mock_get_entities_by_guids(self.dashboard_data['entity'], self.dashboard_group_data,
+                                         referredEntities=MagicMock())
 
         res_dashboard = self.proxy._get_resources_owned_by_user(user_id='test_user_1',
                                                                 resource_type=ResourceType.Dashboard.name)
         self.assertEqual(len(res_dashboard), 1)
         expected_dashboard = [
             DashboardSummary(uri='superset_dashboard://datalab.prod/1', cluster='datalab', group_name='prod superset',
-                             group_url='https://prod.superset/dashboards/1', product='superset', name='Prod Usage',
+                             group_url='https://superset.prod', product='superset', name='Prod Usage',
                              url='https://prod.superset/dashboards/1', description='Robs famous dashboard',
                              last_successful_run_timestamp=0, chart_names=[])]
         self.assertEqual(expected_dashboard, res_dashboard)
@@ -520,14 +531,13 @@ class TestAtlasProxy(unittest.TestCase, Data):
         expected_resources_count = 1
         expected_resource_detail = [DashboardSummary(uri='superset_dashboard://datalab.prod/1', cluster='datalab',
                                                      group_name='prod superset',
-                                                     group_url='https://prod.superset/dashboards/1', product='superset',
+                                                     group_url='https://superset.prod', product='superset',
                                                      name='Prod Usage', url='https://prod.superset/dashboards/1',
                                                      description='Robs famous dashboard',
                                                      last_successful_run_timestamp=1619517099, chart_names=[])]
 
-        self.proxy.client.entity.get_entities_by_guids = MagicMock(return_value=DottedDict({
-            'entities': [DottedDict(self.dashboard_data['entity'])],
-            'referredEntities': self.dashboard_data['referredEntities']}))
+        self._mock_get_entities_by_guids(self.dashboard_data['entity'], self.dashboard_group_data,
+                                         referredEntities=self.dashboard_data['referredEntities'])
 
         result = self.proxy.get_resources_using_table(id='DOESNT_MATTER', resource_type=ResourceType.Dashboard)
 
@@ -582,26 +592,62 @@ class TestAtlasProxy(unittest.TestCase, Data):
                                                         relation_type=UserResourceRel.follow,
                                                         resource_type=resource_type)  # type: ignore
 
+    def test_get_table_fetches_related_entities_together(self) -> None:
+        table: Dict = copy.deepcopy(self.entity1)
+        table['relationshipAttributes']['readers'] = [
+            dict(guid='1', entityStatus='ACTIVE', relationshipStatus='ACTIVE'),
+            dict(guid='2', entityStatus='ACTIVE', relationshipStatus='ACTIVE'),
+        ]
+        mocked_entity = self._mock_get_table_entity(table)
+        mocked_entity.referredEntities = {self.test_column['guid']: self.test_column}
+        self.proxy._get_owners = MagicMock(return_value=[])  # type: ignore
+        report_guids = [report['guid'] for report in table['attributes']['reports']]
+        self._mock_get_entities_by_guids(*self.reader_entities,
+                                         *[dict(report, guid=guid) for report, guid in
+                                           zip(self.report_entities, report_guids)])
+
+        for _ in range(2):
+            response = self.proxy.get_table(table_uri=self.table_uri)
+
+        # a single call for the readers and reports of the first request, the second one is served from the cache
+        self.proxy.client.entity.get_entities_by_guids.assert_called_once_with(guids=['1', '2'] + report_guids,
+                                                                               ignore_relationships=False)
+        self.assertEqual([reader.read_count for reader in response.table_readers], [150, 5])
+        self.assertEqual([report.name for report in response.resource_reports], ['test_report', 'test_report3'])
+
+    def test_entity_cache(self) -> None:
+        from metadata_service.proxy import atlas_proxy
+        cache = atlas_proxy.EntityCache(max_size=2, ttl_sec=10)
+
+        with patch.object(atlas_proxy.time, 'monotonic', return_value=100):
+            cache.put_many({'a': 'entity_a', 'b': 'entity_b'})
+            self.assertEqual(cache.get_many(['a', 'c']), {'a': 'entity_a'})
+            # b is the least recently used
+            cache.put_many({'c': 'entity_c'})
+            self.assertEqual(cache.get_many(['a', 'b', 'c']), {'a': 'entity_a', 'c': 'entity_c'})
+
+        with patch.object(atlas_proxy.time, 'monotonic', return_value=111):
+            self.assertEqual(cache.get_many(['a', 'c']), {})
+
     def test_get_readers(self) -> None:
         entity_bulk_result = MagicMock()
         entity_bulk_result.entities = self.reader_entities
         self.proxy.client.entity.get_entities_by_guids = MagicMock(return_value=entity_bulk_result)
 
-        res = self.proxy._get_readers(dict(relationshipAttributes=dict(readers=[dict(guid=1, entityStatus='ACTIVE',
-                                                                                     relationshipStatus='ACTIVE')])),
-                                      Reader, 1)
+        entity = dict(relationshipAttributes=dict(readers=[
+            dict(guid='1', entityStatus='ACTIVE', relationshipStatus='ACTIVE'),
+            dict(guid='2', entityStatus='ACTIVE', relationshipStatus='ACTIVE'),
+        ]))
+
+        res = self.proxy._get_readers(entity, Reader, 1)
         expected_readers = [Reader(user=User(email='test_user_2', user_id='test_user_2'), read_count=150)]
         self.assertEqual(expected_readers, res)
 
-        res = self.proxy._get_readers(dict(relationshipAttributes=dict(readers=[dict(guid=1, entityStatus='ACTIVE',
-                                                                                     relationshipStatus='ACTIVE')])),
-                                      User, 1)
+        res = self.proxy._get_readers(entity, User, 1)
         expected_users = [User(email='test_user_1', user_id='test_user_1')]
         self.assertEqual(expected_users, res)
 
-        res = self.proxy._get_readers(dict(relationshipAttributes=dict(readers=[dict(guid=1, entityStatus='ACTIVE',
-                                                                                     relationshipStatus='ACTIVE')])),
-                                      'WRONG_MODEL', 1)
+        res = self.proxy._get_readers(entity, 'WRONG_MODEL', 1)
         expected = []  # type: ignore
         self.assertEqual(expected, res)
 
@@ -724,9 +770,7 @@ class TestAtlasProxy(unittest.TestCase, Data):
 
     def test_get_dashboard(self) -> None:
         self.proxy.client.entity.get_entity_by_attribute = MagicMock(return_value=self.dashboard_data)  # type: ignore
-        self.proxy._get_dashboard_group = MagicMock(return_value=self.dashboard_group_data)  # type: ignore
-        self.proxy.client.entity.get_entities_by_guids = MagicMock(return_value=DottedDict({
-            'entities': [DottedDict(self.entity1)]}))
+        self._mock_get_entities_by_guids(dict(self.entity1, guid='table_1'), self.dashboard_group_data)
 
         expected = DashboardDetail(uri='superset_dashboard://datalab.prod/1',
                                    cluster='datalab',
@@ -764,6 +808,9 @@ class TestAtlasProxy(unittest.TestCase, Data):
         result = self.proxy.get_dashboard(id='superset_dashboard://datalab.prod/1')
 
         self.assertEqual(expected, result)
+        # the table and the group are fetched together
+        self.proxy.client.entity.get_entities_by_guids.assert_called_once_with(guids=['table_1', 'group_1'],
+                                                                               ignore_relationships=False)
 
     def test_get_dashboard_description(self) -> None:
         self.proxy.client.entity.get_entity_by_attribute = MagicMock(return_value=self.dashboard_data)  # type: ignore
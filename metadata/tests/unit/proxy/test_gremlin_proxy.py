@@ -0,0 +1,386 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+from operator import attrgetter
+from typing import Any, Callable, Dict, List
+from unittest.mock import ANY, MagicMock, call, patch
+
+import gremlin_python.driver.protocol
+from amundsen_common.models.table import Column, Reader, Table
+from amundsen_common.models.user import User
+from amundsen_gremlin.script_translator import ScriptTranslator
+from flask import current_app, has_app_context
+from gremlin_python.process.anonymous_traversal import traversal
+from gremlin_python.process.traversal import Bytecode, P, Traverser, within
+
+from metadata_service import create_app
+from metadata_service.entity.dashboard_detail import DashboardDetail
+from metadata_service.proxy.gremlin_proxy import (
+    ClientQueryExecutor, FromResultSet, GenericGremlinProxy, GremlinClientPool,
+    ParameterizingScriptTranslator)
+
+
+def _completed(result: object) -> Future:
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
+
+class TestGremlinClientPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clients: List[MagicMock] = []
+
+    def _client(self) -> MagicMock:
+        client = MagicMock(name=f'client{len(self.clients)}')
+        client.submitAsync.return_value = _completed(MagicMock(**{'all.return_value': _completed([0])}))
+        self.clients.append(client)
+        return client
+
+    def test_borrow_reuses_the_given_back_client(self) -> None:
+        pool = GremlinClientPool(self._client, size=2)
+        with pool.borrow() as client1:
+            pass
+        with pool.borrow() as client2:
+            pass
+
+        self.assertIs(client1, client2)
+        self.assertEqual(self.clients, [client1])
+        self.assertEqual(pool.metrics(), dict(borrowed=2, connected=1, reused=1, wait_sec=ANY,
+                                              open=1, idle=1))
+
+    def test_borrow_connects_up_to_size(self) -> None:
+        pool = GremlinClientPool(self._client, size=2)
+        with pool.borrow() as client1, pool.borrow() as client2:
+            self.assertIsNot(client1, client2)
+        self.assertEqual(pool.metrics()['open'], 2)
+        self.assertEqual(pool.metrics()['idle'], 2)
+
+        pool.close()
+        client1.close.assert_called_once_with()
+        client2.close.assert_called_once_with()
+        self.assertEqual(pool.metrics()['open'], 0)
+
+    def test_client_is_closed_after_an_error(self) -> None:
+        pool = GremlinClientPool(self._client)
+        with self.assertRaises(RuntimeError):
+            with pool.borrow() as client1:
+                raise RuntimeError('connection closed')
+        client1.close.assert_called_once_with()
+        self.assertEqual(pool.metrics()['open'], 0)
+
+        with pool.borrow() as client2:
+            pass
+        self.assertIsNot(client1, client2)
+        self.assertEqual(pool.metrics()['connected'], 2)
+        self.assertEqual(pool.metrics()['closed'], 1)
+
+    def test_client_is_kept_after_a_server_error(self) -> None:
+        pool = GremlinClientPool(self._client)
+        with self.assertRaises(gremlin_python.driver.protocol.GremlinServerError):
+            with pool.borrow() as client1:
+                raise gremlin_python.driver.protocol.GremlinServerError(
+                    dict(code=500, attributes=(), message='{"code": "InternalFailureException"}'))
+        client1.close.assert_not_called()
+
+        with pool.borrow() as client2:
+            pass
+        self.assertIs(client1, client2)
+
+    def test_expired_client_is_closed_when_given_back(self) -> None:
+        pool = GremlinClientPool(self._client, max_age_sec=0)
+        with pool.borrow() as client1:
+            pass
+        client1.close.assert_called_once_with()
+        self.assertEqual(pool.metrics()['open'], 0)
+
+        with pool.borrow() as client2:
+            pass
+        self.assertIsNot(client1, client2)
+
+    def test_idle_client_is_health_checked(self) -> None:
+        pool = GremlinClientPool(self._client, health_check_interval_sec=0)
+        with pool.borrow() as client1:
+            pass
+        with pool.borrow() as client2:
+            pass
+
+        self.assertIs(client1, client2)
+        client1.submitAsync.assert_called_once_with(GremlinClientPool.HEALTH_CHECK_QUERY)
+
+    def test_client_failing_its_health_check_is_replaced(self) -> None:
+        pool = GremlinClientPool(self._client, health_check_interval_sec=0)
+        with pool.borrow() as client1:
+            pass
+        client1.submitAsync.side_effect = RuntimeError('connection closed')
+
+        with pool.borrow() as client2:
+            pass
+        self.assertIsNot(client1, client2)
+        client1.close.assert_called_once_with()
+        self.assertEqual(pool.metrics()['open'], 1)
+
+    def test_health_check_times_out(self) -> None:
+        pool = GremlinClientPool(self._client, health_check_interval_sec=0, health_check_timeout_sec=0.01)
+        with pool.borrow() as client1:
+            pass
+        # the server never answers
+        client1.submitAsync.return_value = _completed(MagicMock(**{'all.return_value': Future()}))
+
+        with pool.borrow() as client2:
+            pass
+        self.assertIsNot(client1, client2)
+        client1.close.assert_called_once_with()
+
+    def test_borrow_times_out(self) -> None:
+        pool = GremlinClientPool(self._client, size=1, borrow_timeout_sec=0.01)
+        with pool.borrow():
+            with self.assertRaisesRegex(RuntimeError, 'no gremlin client was given back'):
+                with pool.borrow():
+                    pass
+        self.clients[0].close.assert_not_called()
+
+    def test_failed_connect_does_not_count_as_open(self) -> None:
+        pool = GremlinClientPool(MagicMock(side_effect=RuntimeError('could not connect')), size=1)
+        with self.assertRaises(RuntimeError):
+            with pool.borrow():
+                pass
+        self.assertEqual(pool.metrics()['open'], 0)
+
+
+class TestParameterizingScriptTranslator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = traversal().withRemote(MagicMock(traversal_source='g'))
+        self.translator = ParameterizingScriptTranslator(ScriptTranslator)
+
+    def test_strings_and_integers_are_bindings(self) -> None:
+        script, bindings = self.translator.translate(self.g.V().has('Table', 'key', 'a').out('COLUMN').limit(2))
+        self.assertEqual(script, 'g.V().has(_p0,_p1,_p2).out(_p3).limit(_p4)')
+        self.assertEqual(bindings, {'_p0': 'Table', '_p1': 'key', '_p2': 'a', '_p3': 'COLUMN', '_p4': 2})
+
+    def test_predicates_and_other_values_stay_in_the_script(self) -> None:
+        script, bindings = self.translator.translate(
+            self.g.V().has('key', within('a', 'b')).has('rating', P.gt(1.5)).has('deleted', False))
+        self.assertEqual(script, 'g.V().has(_p0,within([_p1,_p2])).has(_p3,gt(1.5)).has(_p4,false)')
+        self.assertEqual(bindings, {'_p0': 'key', '_p1': 'a', '_p2': 'b', '_p3': 'rating', '_p4': 'deleted'})
+
+    def test_same_shape_reuses_the_script_with_its_own_bindings(self) -> None:
+        script1, bindings1 = self.translator.translate(self.g.V().has('Table', 'key', 'a').limit(2))
+        script2, bindings2 = self.translator.translate(self.g.V().has('Table', 'key', 'b').limit(3))
+
+        self.assertEqual(script1, script2)
+        self.assertEqual(bindings1, {'_p0': 'Table', '_p1': 'key', '_p2': 'a', '_p3': 2})
+        self.assertEqual(bindings2, {'_p0': 'Table', '_p1': 'key', '_p2': 'b', '_p3': 3})
+        self.assertEqual((self.translator.hits, self.translator.misses), (1, 1))
+
+    def test_different_shapes_are_different_scripts(self) -> None:
+        script1, bindings1 = self.translator.translate(self.g.V().has('key', within('a', 'b')))
+        script2, bindings2 = self.translator.translate(self.g.V().has('key', within('a', 'b', 'c')))
+        script3, bindings3 = self.translator.translate(self.g.V().has('rating', P.gt(1.5)))
+        script4, bindings4 = self.translator.translate(self.g.V().has('rating', P.gt(2.5)))
+
+        self.assertEqual(len({script1, script2, script3, script4}), 4)
+        self.assertEqual(bindings2, {'_p0': 'key', '_p1': 'a', '_p2': 'b', '_p3': 'c'})
+        self.assertEqual(script4, 'g.V().has(_p0,gt(2.5))')
+        self.assertEqual((self.translator.hits, self.translator.misses), (0, 4))
+
+    def test_least_recently_used_script_is_evicted(self) -> None:
+        translator = ParameterizingScriptTranslator(ScriptTranslator, cache_size=2)
+        translator.translate(self.g.V().has('key', 'a'))
+        translator.translate(self.g.V().out('COLUMN'))
+        translator.translate(self.g.V().has('key', 'b'))
+        translator.translate(self.g.V().in_('COLUMN'))
+        self.assertEqual((translator.hits, translator.misses), (1, 3))
+
+        # out was evicted, has was used more recently
+        translator.translate(self.g.V().has('key', 'c'))
+        script, bindings = translator.translate(self.g.V().out('TAG'))
+        self.assertEqual((translator.hits, translator.misses), (2, 4))
+        self.assertEqual(script, 'g.V().out(_p0)')
+        self.assertEqual(bindings, {'_p0': 'TAG'})
+
+
+class TestClientQueryExecutor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.g = traversal().withRemote(MagicMock(traversal_source='g'))
+        self.client = MagicMock()
+
+    def test_bytecode_and_script_submission_get_the_same_results(self) -> None:
+        query = self.g.V().has('Table', 'key', 'a').out('COLUMN').values('name')
+
+        self.client.submit.return_value = [[Traverser('id', 2), Traverser('name')], [Traverser('type')]]
+        executor = ClientQueryExecutor(client=self.client, traversal_translator=attrgetter('bytecode'))
+        bytecode_results = executor(query=query, get=FromResultSet.toList)
+        message, bindings = self.client.submit.call_args[0]
+        self.assertIsInstance(message, Bytecode)
+        self.assertIsNone(bindings)
+
+        self.client.submit.return_value = [['id', 'id', 'name'], ['type']]
+        executor = ClientQueryExecutor(client=self.client,
+                                       traversal_translator=ParameterizingScriptTranslator(ScriptTranslator).translate)
+        script_results = executor(query=query, get=FromResultSet.toList)
+        self.client.submit.assert_called_with('g.V().has(_p0,_p1,_p2).out(_p3).values(_p4)',
+                                              {'_p0': 'Table', '_p1': 'key', '_p2': 'a', '_p3': 'COLUMN',
+                                               '_p4': 'name'})
+
+        self.assertEqual(bytecode_results, ['id', 'id', 'name', 'type'])
+        self.assertEqual(bytecode_results, script_results)
+
+    def test_bytecode_submission_of_empty_results(self) -> None:
+        self.client.submit.return_value = [[]]
+        executor = ClientQueryExecutor(client=self.client, traversal_translator=attrgetter('bytecode'))
+        self.assertIsNone(executor(query=self.g.V().has('key', 'a'), get=FromResultSet.getOptional))
+
+    def test_unknown_query_submission(self) -> None:
+        with patch('metadata_service.proxy.gremlin_proxy.DriverRemoteConnection'), \
+                self.assertRaisesRegex(ValueError, 'unknown query_submission: graphson, expected one of bindings, '
+                                                   'bytecode or script'):
+            GenericGremlinProxy(host='ws://localhost:8182/gremlin',
+                                client_kwargs=dict(gremlin_query_submission='graphson'))
+
+
+def _slow(result: Any, delay_sec: float) -> Callable[..., Any]:
+    def get(*args: Any, **kwargs: Any) -> Any:
+        time.sleep(delay_sec)
+        return result
+    return get
+
+
+class TestGremlinProxyConcurrentTraversals(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='metadata_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def _proxy(self, max_concurrent_traversals: int) -> GenericGremlinProxy:
+        with patch('metadata_service.proxy.gremlin_proxy.DriverRemoteConnection'):
+            return GenericGremlinProxy(
+                host='ws://localhost:8182/gremlin',
+                client_kwargs=dict(gremlin_max_concurrent_traversals=max_concurrent_traversals))
+
+    def _get_table(self, proxy: GenericGremlinProxy) -> Table:
+        table = {'table': [{'key': ['hive://gold.test_schema/test_table'], 'name': ['test_table']}],
+                 'schema': [{'name': ['test_schema']}], 'database': [{'name': ['hive']}],
+                 'cluster': [{'name': ['gold']}], 'description': [{'description': ['a table']}]}
+        columns = [Column(name='id', key='hive://gold.test_schema/test_table/id', description=None,
+                          col_type='int', sort_order=0)]
+        readers = [Reader(user=User(user_id='roald', email='roald@example.com'), read_count=5)]
+        # the first traversal is the last to finish
+        with patch.object(proxy, '_get_table_itself', side_effect=_slow(table, 0.05)), \
+                patch.object(proxy, '_get_table_columns', side_effect=_slow(columns, 0.02)), \
+                patch.object(proxy, '_get_table_readers', side_effect=_slow(readers, 0)):
+            return proxy.get_table(table_uri='hive://gold.test_schema/test_table')
+
+    def _get_dashboard(self, proxy: GenericGremlinProxy) -> DashboardDetail:
+        out_vertices: Dict[Any, List[Dict[str, Any]]] = {
+            ('DESCRIPTION',): [{'description': 'a dashboard'}],
+            ('READ_BY', 'OWNER'): [],
+            ('TAGGED_BY',): [{'tag_type': 'default', 'key': 'test_tag'}],
+            ('HAS_BADGE',): [],
+            ('HAS_CHART',): [{'name': 'chart1'}, {'name': 'chart2'}],
+            ('HAS_QUERY',): [{'name': 'query1', 'url': 'http://query1', 'query_text': 'SELECT 1'}],
+            ('EXECUTED',): [{'key': 'dashboard/_last_successful_execution', 'timestamp': 1},
+                            {'key': 'dashboard/_last_execution', 'timestamp': 2, 'state': 'succeeded'}],
+            ('LAST_UPDATED_AT',): [{'timestamp': 3}]}
+
+        def get_out_vertices(dashboard_uri: str, *edge_labels: str) -> List[Dict[str, Any]]:
+            # the later traversals finish first
+            time.sleep(0.01 * (len(out_vertices) - list(out_vertices).index(edge_labels)))
+            return out_vertices[edge_labels]
+
+        executor = MagicMock(return_value=[{'read_count': 4}, {'read_count': 6}])
+        with patch.object(proxy, '_get_dashboard_vertex',
+                          side_effect=_slow(['dashboard://uri', 'http://dashboard', 'dashboard', 100], 0.05)), \
+                patch.object(proxy, '_get_dashboard_group_and_cluster',
+                             side_effect=_slow(['group', 'http://group', 'gold', 'mode'], 0.03)), \
+                patch.object(proxy, '_get_dashboard_out_vertices', side_effect=get_out_vertices), \
+                patch.object(proxy, '_get_dashboard_tables', side_effect=_slow([], 0)), \
+                patch.object(proxy, 'query_executor', return_value=executor):
+            return proxy.get_dashboard('dashboard://uri')
+
+    def test_get_table_is_the_same_as_sequential(self) -> None:
+        concurrent = self._get_table(self._proxy(4))
+        sequential = self._get_table(self._proxy(1))
+
+        self.assertEqual(concurrent, sequential)
+        self.assertEqual(concurrent.name, 'test_table')
+        self.assertEqual(concurrent.description, 'a table')
+        self.assertEqual([column.name for column in concurrent.columns], ['id'])
+        self.assertEqual([reader.read_count for reader in concurrent.table_readers], [5])
+
+    def test_get_dashboard_is_the_same_as_sequential(self) -> None:
+        concurrent = self._get_dashboard(self._proxy(4))
+        sequential = self._get_dashboard(self._proxy(1))
+
+        self.assertEqual(vars(concurrent), vars(sequential))
+        self.assertEqual(concurrent.name, 'dashboard')
+        self.assertEqual(concurrent.group_name, 'group')
+        self.assertEqual(concurrent.description, 'a dashboard')
+        self.assertEqual(concurrent.chart_names, ['chart1', 'chart2'])
+        self.assertEqual(concurrent.last_run_state, 'succeeded')
+        self.assertEqual(concurrent.updated_timestamp, 3)
+        self.assertEqual(concurrent.recent_view_count, 10)
+
+    def test_exception_is_raised_to_the_caller(self) -> None:
+        proxy = self._proxy(4)
+        with patch.object(proxy, '_get_table_itself', side_effect=_slow({}, 0.02)), \
+                patch.object(proxy, '_get_table_columns', side_effect=RuntimeError('columns failed')), \
+                patch.object(proxy, '_get_table_readers', return_value=[]):
+            with self.assertRaisesRegex(RuntimeError, 'columns failed'):
+                proxy.get_table(table_uri='hive://gold.test_schema/test_table')
+
+    def test_first_exception_is_raised(self) -> None:
+        def fail(message: str, delay_sec: float) -> Callable[[], Any]:
+            def traversal() -> Any:
+                time.sleep(delay_sec)
+                raise RuntimeError(message)
+            return traversal
+
+        with self.assertRaisesRegex(RuntimeError, 'first'):
+            self._proxy(4)._run_concurrently('get_table', first=fail('first', 0.02), second=fail('second', 0))
+
+    def test_traversals_run_in_the_app_context(self) -> None:
+        def traversal() -> Any:
+            return has_app_context() and current_app._get_current_object(), threading.current_thread().name
+
+        results = self._proxy(4)._run_concurrently('get_table', traversal=traversal)
+        app, thread_name = results['traversal']
+        self.assertIs(app, self.app)
+        self.assertTrue(thread_name.startswith('gremlin-traversal'))
+
+    def test_traversals_run_without_an_app_context(self) -> None:
+        proxy = self._proxy(4)
+        results: Dict[str, Any] = {}
+
+        # a new thread is outside of any app context
+        def run() -> None:
+            results.update(proxy._run_concurrently('get_table', traversal=has_app_context))
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertEqual(results, {'traversal': False})
+
+    def test_traversals_are_timed(self) -> None:
+        proxy = self._proxy(4)
+        with patch('metadata_service.proxy.gremlin_proxy._get_statsd_client') as mock_statsd_client, \
+                patch.object(proxy, '_get_table_itself', return_value={'table': [{'name': ['test_table']}]}), \
+                patch.object(proxy, '_get_table_columns', return_value=[]), \
+                patch.object(proxy, '_get_table_readers', side_effect=RuntimeError('readers failed')):
+            with self.assertRaises(RuntimeError):
+                proxy.get_table(table_uri='hive://gold.test_schema/test_table')
+
+        # the failed traversal is timed as well
+        mock_statsd_client.return_value.timing.assert_has_calls(
+            [call('get_table.table', ANY), call('get_table.columns', ANY), call('get_table.readers', ANY)],
+            any_order=True)
+        self.assertEqual(mock_statsd_client.return_value.timing.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -570,6 +570,35 @@ class TestMySQLProxy(unittest.TestCase):
 
         self.assertEqual(1, mock_session_query_orderby_limit_all.call_count)
 
+    @patch.object(mysql_proxy, 'RDSClient')
+    def test_get_materialized_popular_resources_uris(self, mock_rds_client: Any) -> None:
+        self.app.config['POPULAR_RESOURCES_MATERIALIZED'] = True
+
+        mock_client = MagicMock()
+        mock_rds_client.return_value = mock_client
+
+        mock_create_session = MagicMock()
+        mock_client.create_session.return_value = mock_create_session
+
+        mock_session = MagicMock()
+        mock_create_session.__enter__.return_value = mock_session
+
+        mock_session_query_limit = mock_session.query.return_value.filter.return_value.order_by.return_value.limit
+        mock_session_query_limit.return_value.all.return_value = [
+            MagicMock(resource_rk='foo'), MagicMock(resource_rk='bar')
+        ]
+
+        proxy = MySQLProxy()
+        self.assertEqual(proxy._get_global_popular_resources_uris(num_entries=2), ['foo', 'bar'])
+        self.assertEqual(proxy._get_personal_popular_resources_uris(num_entries=2, user_id='test_id'), ['foo', 'bar'])
+        mock_session_query_limit.assert_called_with(2)
+
+        # Falls back to the computation when nothing is materialized
+        mock_session_query_limit.return_value.all.return_value = []
+        with patch.object(MySQLProxy, '_compute_global_popular_resources_uris') as mock_compute:
+            mock_compute.return_value = ['baz']
+            self.assertEqual(proxy._get_global_popular_resources_uris(num_entries=2), ['baz'])
+
     @patch.object(mysql_proxy, 'RDSClient')
     def test_get_user(self, mock_rds_client: Any) -> None:
         user = RDSUser(employee_type='teamMember',
@@ -21,6 +21,7 @@ from amundsen_common.models.table import (Application, Badge, Column,
                                           SqlWhere, Stat, Table, TableSummary,
                                           Tag, TypeMetadata, User, Watermark)
 from amundsen_common.models.user import User as UserModel
+from beaker.cache import cache_managers
 from neo4j import GraphDatabase
 from neo4j.exceptions import ClientError
 
@@ -40,6 +41,10 @@ class TestNeo4jProxy(unittest.TestCase):
         self.app_context = self.app.app_context()
         self.app_context.push()
 
+        # Popular resources are cached across proxy instances
+        for cache in cache_managers.values():
+            cache.clear()
+
         table_entry = {'db': {'name': 'hive'},
                        'clstr': {
                            'name': 'gold'},
@@ -966,6 +971,47 @@ class TestNeo4jProxy(unittest.TestCase):
 
             self.assertEqual(actual.__repr__(), expected.__repr__())
 
+    def test_get_materialized_popular_resources_uris(self) -> None:
+        self.app.config['POPULAR_RESOURCES_MATERIALIZED'] = True
+
+        # Materialized global popular resources are read directly
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.return_value = [{'resource_key': 'foo'}, {'resource_key': 'bar'}]
+
+            neo4j_proxy = Neo4jProxy(host='neo4j://example.com', port=0000)
+            self.assertEqual(neo4j_proxy._get_global_popular_resources_uris(2, ResourceType.Dashboard),
+                             ['foo', 'bar'])
+            self.assertEqual(neo4j_proxy._get_global_popular_resources_uris(2, ResourceType.Dashboard),
+                             ['foo', 'bar'])
+
+            self.assertEqual(mock_execute.call_count, 2)
+            self.assertIn('resource.popular_rank IS NOT NULL', mock_execute.call_args[1]['statement'])
+
+        # Falls back to the computation when nothing is materialized
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = [[], [{'resource_key': 'baz'}]]
+
+            neo4j_proxy = Neo4jProxy(host='neo4j://example.com', port=0000)
+            self.assertEqual(neo4j_proxy._get_global_popular_resources_uris(3, ResourceType.Dashboard), ['baz'])
+            self.assertIn('READ_BY', mock_execute.call_args[1]['statement'])
+
+        # Materialized personal popular resources are read from the user node
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.return_value = [{'resource_keys': ['foo', 'bar']}]
+
+            neo4j_proxy = Neo4jProxy(host='neo4j://example.com', port=0000)
+            self.assertEqual(neo4j_proxy._get_personal_popular_resources_uris(2, 'test_id'), ['foo', 'bar'])
+
+            self.assertEqual(mock_execute.call_count, 1)
+            self.assertIn('user.popular_table_keys[0..$num_entries]', mock_execute.call_args[1]['statement'])
+
+        # Falls back to the computation when the user has no materialized ranking
+        with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_execute_cypher_query') as mock_execute:
+            mock_execute.side_effect = [[{'resource_keys': None}], [{'resource_key': 'baz'}]]
+
+            neo4j_proxy = Neo4jProxy(host='neo4j://example.com', port=0000)
+            self.assertEqual(neo4j_proxy._get_personal_popular_resources_uris(2, 'materialized_test_id'), ['baz'])
+
     def test_get_popular_resources_table(self) -> None:
         with patch.object(GraphDatabase, 'driver'), patch.object(Neo4jProxy, '_get_popular_tables') as mock_execute:
             mock_execute.return_value = [
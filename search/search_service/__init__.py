@@ -18,10 +18,12 @@ from search_service.api.dashboard import SearchDashboardAPI, SearchDashboardFilt
 from search_service.api.document import (
     DocumentFeatureAPI, DocumentFeaturesAPI, DocumentTableAPI, DocumentTablesAPI, DocumentUserAPI, DocumentUsersAPI,
 )
-from search_service.api.document_update import DocumentAPI
+from search_service.api.document_update import DocumentAPI, DocumentsAPI
 from search_service.api.feature import SearchFeatureAPI, SearchFeatureFilterAPI
 from search_service.api.healthcheck import HealthcheckAPI
-from search_service.api.search import SearchAPI
+from search_service.api.search import (
+    SearchAPI, SearchExportAPI, SearchPageAPI, SearchResultCacheAPI, SuggestAPI,
+)
 from search_service.api.table import SearchTableAPI, SearchTableFilterAPI
 from search_service.api.user import SearchUserAPI
 
@@ -93,9 +95,14 @@ def create_app(*, config_module_class: str) -> Flask:
 
     # New search endpoint
     api.add_resource(SearchAPI, '/v2/search')
+    api.add_resource(SearchResultCacheAPI, '/v2/search/cache')
+    api.add_resource(SearchPageAPI, '/v2/search/page')
+    api.add_resource(SearchExportAPI, '/v2/search/export')
+    api.add_resource(SuggestAPI, '/v2/suggest')
 
     # New document update API
     api.add_resource(DocumentAPI, '/v2/document')
+    api.add_resource(DocumentsAPI, '/v2/documents')
 
     # Table Search API
     api.add_resource(SearchTableFilterAPI, '/search_table')
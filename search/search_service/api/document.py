@@ -18,6 +18,7 @@ from search_service.models.table import TableSchema
 from search_service.models.user import UserSchema
 from search_service.proxy import get_proxy_client
 from search_service.proxy.base import BaseProxy
+from search_service.proxy.search_result_cache import clear_search_result_cache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +41,7 @@ class BaseDocumentAPI(Resource):
 
         try:
             self.proxy.delete_document(data=[document_id], index=args.get('index'))
+            clear_search_result_cache()
             return {}, HTTPStatus.OK
         except RuntimeError as e:
             err_msg = 'Exception encountered while deleting document '
@@ -74,6 +76,7 @@ class BaseDocumentsAPI(Resource):
                 raise ValidationError("Invalid input")
 
             results = self.proxy.create_document(data=data, index=args.get('index'))
+            clear_search_result_cache()
             return results, HTTPStatus.OK
         except RuntimeError as e:
             err_msg = 'Exception encountered while updating documents '
@@ -101,6 +104,7 @@ class BaseDocumentsAPI(Resource):
                 raise ValidationError("Invalid input")
 
             results = self.proxy.update_document(data=data, index=args.get('index'))
+            clear_search_result_cache()
             return results, HTTPStatus.OK
         except RuntimeError as e:
             err_msg = 'Exception encountered while updating documents '
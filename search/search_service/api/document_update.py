@@ -11,6 +11,7 @@ from flask_restful import Resource, request
 
 from search_service.proxy import get_proxy_client
 from search_service.proxy.es_proxy_utils import RESOURCE_STR_MAPPING
+from search_service.proxy.search_result_cache import clear_search_result_cache
 
 
 class DocumentAPI(Resource):
@@ -27,6 +28,7 @@ class DocumentAPI(Resource):
                                                      field=self.request.field,
                                                      value=self.request.value,
                                                      operation=self.request.operation)
+            clear_search_result_cache()
             return {'msg': resp}, HTTPStatus.OK
         except Exception as e:
             err_msg = f'Failed to update the field value: {e}'
@@ -38,7 +40,28 @@ class DocumentAPI(Resource):
                                                      resource_type=RESOURCE_STR_MAPPING[self.request.resource_type],
                                                      field=self.request.field,
                                                      value=self.request.value)
+            clear_search_result_cache()
             return {'msg': resp}, HTTPStatus.OK
         except Exception as e:
             err_msg = f'Failed to delete the field value: {e}'
             return {'message': err_msg}, HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+class DocumentsAPI(Resource):
+    """
+    Applies many field edits at once, e.g. when tagging resources in bulk
+    """
+
+    def __init__(self) -> None:
+        self.proxy = get_proxy_client()
+
+    @swag_from('swagger_doc/search/documents_post.yml')
+    def post(self) -> Tuple[Any, int]:
+        try:
+            updates = UpdateDocumentRequestSchema(many=True).loads(json.dumps(request.get_json()))
+            resp = self.proxy.update_documents_by_key(updates=updates)
+            clear_search_result_cache()
+            return {'msg': resp}, HTTPStatus.OK
+        except Exception as e:
+            err_msg = f'Failed to update the field values: {e}'
+            return {'message': err_msg}, HTTPStatus.INTERNAL_SERVER_ERROR
@@ -1,19 +1,28 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 from http import HTTPStatus
 from typing import (  # noqa: F401
-    Any, Dict, Iterable, List,
+    Any, Dict, Hashable, Iterable, Iterator, List, Tuple,
 )
 
 from amundsen_common.models.search import (
     HighlightOptions, SearchRequestSchema, SearchResponseSchema,
 )
+from elasticsearch.exceptions import NotFoundError
 from flasgger import swag_from
-from flask_restful import Resource, request
+from flask import (
+    Response, current_app, stream_with_context,
+)
+from flask_restful import (
+    Resource, reqparse, request,
+)
 
+from search_service import config
 from search_service.proxy import get_proxy_client
 from search_service.proxy.es_proxy_utils import RESOURCE_STR_MAPPING, Resource as AmundsenResource
+from search_service.proxy.search_result_cache import get_search_cache_key, get_search_result_cache
 
 
 class SearchAPI(Resource):
@@ -45,15 +54,147 @@ class SearchAPI(Resource):
                 err_msg = f'Search for invalid resource "{r}" requested'
                 return {'message': err_msg}, HTTPStatus.BAD_REQUEST
 
+        search_args = dict(query_term=request_data.query_term,
+                           page_index=request_data.page_index,
+                           results_per_page=request_data.results_per_page,
+                           resource_types=resources,
+                           filters=request_data.filters,
+                           highlight_options=highlight_options)
         try:
-            search_results = self.search_proxy.search(query_term=request_data.query_term,
-                                                      page_index=request_data.page_index,
-                                                      results_per_page=request_data.results_per_page,
-                                                      resource_types=resources,
-                                                      filters=request_data.filters,
-                                                      highlight_options=highlight_options)
-            return SearchResponseSchema().dump(search_results), HTTPStatus.OK
+            search_result_cache = get_search_result_cache()
+            if search_result_cache is None:
+                return SearchResponseSchema().dump(self.search_proxy.search(**search_args)), HTTPStatus.OK
+
+            cache_key = get_search_cache_key(**search_args)
+            index_version = self._get_index_version()
+            cached_results = search_result_cache.get(cache_key, version=index_version)
+            if cached_results is not None:
+                return cached_results, HTTPStatus.OK
+
+            search_results = self.search_proxy.search(**search_args)
+            dumped_results = SearchResponseSchema().dump(search_results)
+            if search_results.status_code == HTTPStatus.OK:
+                search_result_cache.put(cache_key, version=index_version, value=dumped_results)
+            return dumped_results, HTTPStatus.OK
 
         except RuntimeError as e:
             err_msg = f'Exception encountered while processing search request {e}'
             return {'message': err_msg}, HTTPStatus.INTERNAL_SERVER_ERROR
+
+    def _get_index_version(self) -> Hashable:
+        # cached results are only valid for the indices they were computed from, which the proxies keeping
+        # track of their aliases can tell
+        alias_registry = getattr(self.search_proxy, 'alias_registry', None)
+        return alias_registry.version if alias_registry is not None else None
+
+
+class SearchResultCacheAPI(Resource):
+    """
+    Reports the hit rate of the search result cache
+    """
+
+    @swag_from('swagger_doc/search/search_cache.yml')
+    def get(self) -> Tuple[Dict[str, Any], int]:
+        search_result_cache = get_search_result_cache()
+        if search_result_cache is None:
+            return {'enabled': False}, HTTPStatus.OK
+        return {'enabled': True, **search_result_cache.stats()}, HTTPStatus.OK
+
+
+def _get_requested_resources(resource_types: List[str]) -> List[AmundsenResource]:
+    resources = []
+    for r in resource_types:
+        resource = RESOURCE_STR_MAPPING.get(r)
+        if resource is None:
+            raise ValueError(f'Search for invalid resource "{r}" requested')
+        resources.append(resource)
+    return resources
+
+
+class SearchPageAPI(Resource):
+    """
+    Paginates through the search results of a single resource with a cursor, which unlike page_index is not
+    limited in depth
+    """
+
+    def __init__(self) -> None:
+        self.search_proxy = get_proxy_client()
+
+    @swag_from('swagger_doc/search/search_page.yml')
+    def post(self) -> Iterable[Any]:
+        request_json = dict(request.json)
+        cursor = request_json.pop('cursor', None)
+        request_data = SearchRequestSchema().load(request_json, partial=False)
+
+        try:
+            resources = _get_requested_resources(request_data.resource_types)
+            if len(resources) != 1:
+                raise ValueError('Paginated search requires a single resource type')
+            page = self.search_proxy.search_page(query_term=request_data.query_term,
+                                                 resource_type=resources[0],
+                                                 filters=request_data.filters,
+                                                 results_per_page=request_data.results_per_page,
+                                                 cursor=cursor)
+            return page, HTTPStatus.OK
+        except ValueError as e:
+            return {'message': str(e)}, HTTPStatus.BAD_REQUEST
+        except NotFoundError as e:
+            err_msg = f'Search cursor expired, search again from the first page: {e}'
+            return {'message': err_msg}, HTTPStatus.NOT_FOUND
+
+
+class SearchExportAPI(Resource):
+    """
+    Streams every search result as newline delimited json, for bulk consumers
+    """
+
+    def __init__(self) -> None:
+        self.search_proxy = get_proxy_client()
+
+    @swag_from('swagger_doc/search/search_export.yml')
+    def post(self) -> Any:
+        request_data = SearchRequestSchema().load(request.json, partial=False)
+        try:
+            resources = _get_requested_resources(request_data.resource_types)
+        except ValueError as e:
+            return {'message': str(e)}, HTTPStatus.BAD_REQUEST
+
+        def generate() -> Iterator[str]:
+            for resource in resources:
+                for result in self.search_proxy.export_search_results(query_term=request_data.query_term,
+                                                                      resource_type=resource,
+                                                                      filters=request_data.filters):
+                    yield json.dumps(result) + '\n'
+
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+class SuggestAPI(Resource):
+    """
+    Typeahead suggestions: completes a prefix into the names of the most used resources of each type, far cheaper
+    than a search on every keystroke
+    """
+
+    def __init__(self) -> None:
+        self.search_proxy = get_proxy_client()
+
+        self.parser = reqparse.RequestParser(bundle_errors=True)
+        self.parser.add_argument('prefix', required=True, type=str, location='args')
+        self.parser.add_argument('resource_types', required=False, action='append', default=[], location='args')
+        self.parser.add_argument('size', required=False, default=5, type=int, location='args')
+
+    @swag_from('swagger_doc/search/suggest.yml')
+    def get(self) -> Iterable[Any]:
+        args = self.parser.parse_args()
+
+        max_size = current_app.config.get(config.SUGGEST_MAX_SIZE)
+        if args['size'] < 1 or (max_size and args['size'] > max_size):
+            return {'message': f'size must be between 1 and {max_size}'}, HTTPStatus.BAD_REQUEST
+
+        try:
+            resources = _get_requested_resources(args['resource_types'])
+        except ValueError as e:
+            return {'message': str(e)}, HTTPStatus.BAD_REQUEST
+
+        suggestions = self.search_proxy.suggest(prefix=args['prefix'], resource_types=resources, size=args['size'])
+        return suggestions, HTTPStatus.OK
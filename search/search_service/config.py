@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
-from typing import Any, Optional
+from typing import (
+    Any, Dict, Optional,
+)
 
 STATS_FEATURE_KEY = 'STATS'
 
@@ -15,10 +17,22 @@ ELASTICSEARCH_CLIENT = 'ELASTICSEARCH_CLIENT'
 # Elasticsearch proxy class configuration
 ES_PROXY_CLIENT = 'ES_PROXY_CLIENT'
 ES_INDEX_ALIAS_TEMPLATE = 'ES_INDEX_ALIAS_TEMPLATE'
+# Elasticsearch aliases are cached by the proxy, see ElasticsearchAliasRegistry
+ES_ALIAS_CACHE_TTL_SEC = 'ES_ALIAS_CACHE_TTL_SEC'
+ES_ALIAS_CACHE_MAX_STALE_SEC = 'ES_ALIAS_CACHE_MAX_STALE_SEC'
+# Search results of /v2/search are cached when SEARCH_RESULT_CACHE_MAX_ENTRIES is set, see SearchResultCache
+SEARCH_RESULT_CACHE_MAX_ENTRIES = 'SEARCH_RESULT_CACHE_MAX_ENTRIES'
+SEARCH_RESULT_CACHE_TTL_SEC = 'SEARCH_RESULT_CACHE_TTL_SEC'
+# Typeahead suggestions of /v2/suggest, see ElasticsearchProxyV2.suggest
+SUGGEST_REQUEST_TIMEOUT_SEC = 'SUGGEST_REQUEST_TIMEOUT_SEC'
+SUGGEST_MAX_SIZE = 'SUGGEST_MAX_SIZE'
+# Newline delimited json files indexed by InMemorySearchProxy on start, per resource type
+IN_MEMORY_SEARCH_DATA_FILES = 'IN_MEMORY_SEARCH_DATA_FILES'
 PROXY_CLIENTS = {
     'ELASTICSEARCH': 'search_service.proxy.elasticsearch.ElasticsearchProxy',
     'ELASTICSEARCH_V2': 'search_service.proxy.es_proxy_v2.ElasticsearchProxyV2',
-    'ELASTICSEARCH_V2_1': 'search_service.proxy.es_proxy_v2_1.ElasticsearchProxyV2_1'
+    'ELASTICSEARCH_V2_1': 'search_service.proxy.es_proxy_v2_1.ElasticsearchProxyV2_1',
+    'IN_MEMORY': 'search_service.proxy.in_memory.InMemorySearchProxy',
 }
 
 
@@ -26,6 +40,20 @@ class Config:
 
     # specify the alias string template under which the ES index exists for each resource
     ES_INDEX_ALIAS_TEMPLATE = '{resource}_search_index_v2_1'
+    # how long the cached aliases are used before being refreshed in the background
+    ES_ALIAS_CACHE_TTL_SEC = 60
+    # how long the cached aliases can be used at most, older ones are refreshed before searching
+    ES_ALIAS_CACHE_MAX_STALE_SEC = 600
+    # maximum number of cached search results, 0 disables the cache. Entries are dropped when documents are
+    # updated through this service or when a new index is swapped in, but every instance has its own cache.
+    SEARCH_RESULT_CACHE_MAX_ENTRIES = 0
+    SEARCH_RESULT_CACHE_TTL_SEC = 60
+    # typeahead suggestions are given up on past this timeout, rather than slowing down the next keystrokes
+    SUGGEST_REQUEST_TIMEOUT_SEC = 1.0
+    # maximum number of suggestions per resource type
+    SUGGEST_MAX_SIZE = 20
+    # resource type -> file written by FSElasticsearchJSONLoader, used when ES_PROXY_CLIENT is IN_MEMORY
+    IN_MEMORY_SEARCH_DATA_FILES: Dict[str, str] = {}
     ES_PROXY_CLIENT = PROXY_CLIENTS[os.environ.get('ES_PROXY_CLIENT', 'ELASTICSEARCH_V2_1')]
 
     LOG_FORMAT = '%(asctime)s.%(msecs)03d [%(levelname)s] %(module)s.%(funcName)s:%(lineno)d (%(process)d:'\
@@ -3,12 +3,12 @@
 
 from abc import ABCMeta, abstractmethod
 from typing import (
-    Any, Dict, List, Optional, Union,
+    Any, Dict, Iterator, List, Optional, Union,
 )
 
 from amundsen_common.models.api.health_check import HealthCheck
 from amundsen_common.models.search import (
-    Filter, HighlightOptions, SearchResponse,
+    Filter, HighlightOptions, SearchResponse, UpdateDocumentRequest,
 )
 
 from search_service.models.dashboard import SearchDashboardResult
@@ -42,6 +42,29 @@ class BaseProxy(metaclass=ABCMeta):
                highlight_options: Dict[Resource, HighlightOptions]) -> SearchResponse:
         pass
 
+    @abstractmethod
+    def search_page(self, *,
+                    query_term: str,
+                    resource_type: Resource,
+                    filters: List[Filter],
+                    results_per_page: int,
+                    cursor: Optional[str] = None) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def export_search_results(self, *,
+                              query_term: str,
+                              resource_type: Resource,
+                              filters: List[Filter]) -> Iterator[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def suggest(self, *,
+                prefix: str,
+                resource_types: List[Resource],
+                size: int) -> Dict[str, List[Dict[str, Any]]]:
+        pass
+
     @abstractmethod
     def fetch_table_search_results(self, *,
                                    query_term: str,
@@ -103,6 +126,10 @@ class BaseProxy(metaclass=ABCMeta):
                                value: Optional[str] = None) -> str:
         pass
 
+    @abstractmethod
+    def update_documents_by_key(self, *, updates: List[UpdateDocumentRequest]) -> str:
+        pass
+
     @abstractmethod
     def create_document(self, *,
                         data: List[Dict[str, Any]],
@@ -4,7 +4,7 @@
 import logging
 import uuid
 from typing import (
-    Any, Dict, List, Optional, Union,
+    Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union,
 )
 
 from amundsen_common.models.api import health_check
@@ -12,11 +12,12 @@ from amundsen_common.models.index_map import (
     FEATURE_INDEX_MAP, TABLE_INDEX_MAP, USER_INDEX_MAP,
 )
 from amundsen_common.models.search import (
-    Filter, HighlightOptions, SearchResponse,
+    Filter, HighlightOptions, SearchResponse, UpdateDocumentRequest,
 )
 from elasticsearch import Elasticsearch
 from elasticsearch.exceptions import ConnectionError as ElasticConnectionError, NotFoundError
 from elasticsearch_dsl import Search, query
+from elasticsearch_dsl.response import Response
 from elasticsearch_dsl.utils import AttrDict
 
 from search_service.api.dashboard import DASHBOARD_INDEX
@@ -252,6 +253,22 @@ class ElasticsearchProxy(BaseProxy):
             }
         }
 
+    def _get_search_hits(self, page_index: int, client: Search) -> Tuple[Optional[Response], Iterable[Any]]:
+        """
+        Fetches the hits of the requested page, or every hit if page index is -1
+        :return: the search response, None when every hit is requested, and the hits
+        """
+        # Use {page_index} to calculate index of results to fetch from
+        if page_index != -1:
+            start_from = page_index * self.page_size
+            end_at = start_from + self.page_size
+            response = client[start_from:end_at].execute()
+            return response, response
+
+        # scroll through every result instead of counting them first and fetching them in a single response,
+        # which is capped by max_result_window
+        return None, client.params(preserve_order=True).scan()
+
     def _get_search_result(self, page_index: int,
                            client: Search,
                            model: Any,
@@ -268,18 +285,11 @@ class ElasticsearchProxy(BaseProxy):
             raise Exception('ES Doc model must be provided!')
 
         results = []
-        # Use {page_index} to calculate index of results to fetch from
-        if page_index != -1:
-            start_from = page_index * self.page_size
-            end_at = start_from + self.page_size
-            client = client[start_from:end_at]
-        else:
-            # if page index is -1, return everything
-            client = client[0:client.count()]
-
-        response = client.execute()
+        response, hits = self._get_search_hits(page_index=page_index, client=client)
 
-        for hit in response:
+        total_hits = 0
+        for hit in hits:
+            total_hits += 1
             try:
                 es_metadata = hit.__dict__.get('meta', {})
                 """
@@ -323,7 +333,9 @@ class ElasticsearchProxy(BaseProxy):
                 LOGGING.exception('The record doesnt contain specified field.')
 
         # This is to support ESv7.x, and newer version of elasticsearch_dsl
-        if isinstance(response.hits.total, AttrDict):
+        if response is None:
+            _total = total_hits
+        elif isinstance(response.hits.total, AttrDict):
             _total = response.hits.total.value
         else:
             _total = response.hits.total
@@ -823,6 +835,29 @@ class ElasticsearchProxy(BaseProxy):
                               results={},
                               status_code=501)
 
+    def search_page(self, *,
+                    query_term: str,
+                    resource_type: Resource,
+                    filters: List[Filter],
+                    results_per_page: int,
+                    cursor: Optional[str] = None) -> Dict[str, Any]:
+        LOGGING.warn(DEPRECATION_MSG)
+        return {'results': [], 'total_results': 0, 'cursor': None}
+
+    def export_search_results(self, *,
+                              query_term: str,
+                              resource_type: Resource,
+                              filters: List[Filter]) -> Iterator[Dict[str, Any]]:
+        LOGGING.warn(DEPRECATION_MSG)
+        return iter([])
+
+    def suggest(self, *,
+                prefix: str,
+                resource_types: List[Resource],
+                size: int) -> Dict[str, List[Dict[str, Any]]]:
+        LOGGING.warn(DEPRECATION_MSG)
+        return {}
+
     def update_document_by_key(self, *,
                                resource_key: str,
                                resource_type: Resource,
@@ -839,3 +874,7 @@ class ElasticsearchProxy(BaseProxy):
                                value: Optional[str] = None) -> str:
         LOGGING.warn(DEPRECATION_MSG)
         return ''
+
+    def update_documents_by_key(self, *, updates: List[UpdateDocumentRequest]) -> str:
+        LOGGING.warn(DEPRECATION_MSG)
+        return ''
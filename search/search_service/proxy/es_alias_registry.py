@@ -0,0 +1,113 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import threading
+import time
+from typing import (
+    Dict, FrozenSet, Optional,
+)
+
+from elasticsearch import Elasticsearch
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TTL_SEC = 60.0
+DEFAULT_MAX_STALE_SEC = 600.0
+
+
+class ElasticsearchAliasRegistry:
+    """
+    Caches the aliases and indices of the cluster, so that checking whether the index of a resource exists does
+    not cost a round trip on every search.
+
+    Cached entries are fresh for ttl_sec. Once they are older, they are still used while a background thread
+    refreshes them, unless they are older than max_stale_sec, in which case they are refreshed before being used.
+    Swapping a new index in behind an alias is picked up by the next refresh, and invalidate() forces the next
+    lookup to refresh, e.g. after a search failed. version changes whenever a refresh finds aliases pointing to
+    other indices, so that results cached for the previous indices can be told apart.
+    """
+
+    def __init__(self,
+                 client: Elasticsearch,
+                 ttl_sec: float = DEFAULT_TTL_SEC,
+                 max_stale_sec: float = DEFAULT_MAX_STALE_SEC) -> None:
+        self._client = client
+        self._ttl_sec = ttl_sec
+        self._max_stale_sec = max(max_stale_sec, ttl_sec)
+
+        self._lock = threading.Lock()
+        self._alias_to_indices: Dict[str, FrozenSet[str]] = {}
+        self._indices: FrozenSet[str] = frozenset()
+        # monotonic time of the last refresh, None until the first refresh or after an invalidation
+        self._refreshed_at: Optional[float] = None
+        self._refreshing = False
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        self._ensure_fresh()
+        return self._version
+
+    def exists(self, name: str) -> bool:
+        """
+        Returns whether an alias or an index of the given name exists
+        """
+        self._ensure_fresh()
+        return name in self._alias_to_indices or name in self._indices
+
+    def get_indices(self, alias: str) -> FrozenSet[str]:
+        """
+        Returns the indices behind the given alias, empty if the alias does not exist
+        """
+        self._ensure_fresh()
+        return self._alias_to_indices.get(alias, frozenset())
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._refreshed_at = None
+
+    def _ensure_fresh(self) -> None:
+        refreshed_at = self._refreshed_at
+        age = None if refreshed_at is None else time.monotonic() - refreshed_at
+        if age is not None and age <= self._ttl_sec:
+            return
+
+        if age is not None and age <= self._max_stale_sec:
+            # serve the cached entries and revalidate them in the background
+            with self._lock:
+                if self._refreshing:
+                    return
+                self._refreshing = True
+            threading.Thread(target=self._background_refresh, name='es_alias_registry', daemon=True).start()
+            return
+
+        with self._lock:
+            if self._refreshed_at is None or time.monotonic() - self._refreshed_at > self._max_stale_sec:
+                self._refresh()
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._lock:
+                self._refresh()
+        except Exception as e:
+            LOGGER.warning(f'Failed to refresh Elasticsearch aliases, keeping the cached ones. {e}')
+        finally:
+            self._refreshing = False
+
+    def _refresh(self) -> None:
+        # a single call returns every index along with its aliases
+        response = self._client.indices.get_alias(index='*')
+
+        alias_to_indices: Dict[str, set] = {}
+        for index, index_info in response.items():
+            for alias in (index_info or {}).get('aliases', {}):
+                alias_to_indices.setdefault(alias, set()).add(index)
+
+        new_alias_to_indices = {alias: frozenset(indices) for alias, indices in alias_to_indices.items()}
+        if new_alias_to_indices != self._alias_to_indices:
+            self._version += 1
+        self._alias_to_indices = new_alias_to_indices
+        self._indices = frozenset(response.keys())
+        self._refreshed_at = time.monotonic()
+        LOGGER.debug(f'Refreshed Elasticsearch aliases: {self._alias_to_indices}')
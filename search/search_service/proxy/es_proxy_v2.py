@@ -1,15 +1,16 @@
 # Copyright Contributors to the Amundsen project.
 # SPDX-License-Identifier: Apache-2.0
 
+import base64
 import json
 import logging
 from typing import (
-    Any, Dict, List, Optional, Union,
+    Any, Dict, Iterator, List, Optional, Tuple, Union,
 )
 
 from amundsen_common.models.api import health_check
 from amundsen_common.models.search import (
-    Filter, HighlightOptions, SearchResponse,
+    Filter, HighlightOptions, SearchResponse, UpdateDocumentRequest,
 )
 from elasticsearch import Elasticsearch
 from elasticsearch.exceptions import ConnectionError as ElasticConnectionError, ElasticsearchException
@@ -18,10 +19,13 @@ from elasticsearch_dsl import (
 )
 from elasticsearch_dsl.query import MultiMatch
 from elasticsearch_dsl.response import Response
-from elasticsearch_dsl.utils import AttrList
+from flask import current_app
 from werkzeug.exceptions import InternalServerError
 
-from search_service.proxy.es_proxy_utils import Resource, create_search_response
+from search_service import config
+from search_service.proxy.es_proxy_utils import (
+    RESOURCE_STR_MAPPING, Resource, SearchHit, create_search_response, format_resource_response,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -30,10 +34,91 @@ WILDCARD_QUERY = 'wildcard'
 TERM_QUERY = 'term'
 TERMS_QUERY = 'terms'
 
+# stands for the query term in query templates, see ElasticsearchProxyV2._get_query_template
+QUERY_TERM_SLOT = '\x00query_term\x00'
+
+SUGGESTION_NAME = 'completions'
+DEFAULT_SUGGEST_REQUEST_TIMEOUT_SEC = 1.0
+
+# edits a field of a document in place: lists get the value added, overwritten as the only element or removed, other
+# fields get the value set or cleared. Removing a value missing from a list leaves the document as is.
+FIELD_UPDATE_SCRIPT = """
+def current = ctx._source[params.field];
+if (params.operation == 'add') {
+    if (current instanceof List) {
+        current.add(params.value);
+    } else {
+        ctx._source[params.field] = current == null ? [params.value] : [current, params.value];
+    }
+} else if (params.operation == 'overwrite') {
+    ctx._source[params.field] = current instanceof List ? [params.value] : params.value;
+} else if (current instanceof List) {
+    if (params.value == null) {
+        current.clear();
+    } else if (current.contains(params.value)) {
+        current.remove(current.indexOf(params.value));
+    } else {
+        ctx.op = 'noop';
+    }
+} else {
+    ctx._source[params.field] = '';
+}
+"""
+
+
+def fill_query_term(template: Any, query_term: str) -> Any:
+    """
+    Copies a query template, replacing the query term slot wherever it appears
+    """
+    if isinstance(template, str):
+        return template.replace(QUERY_TERM_SLOT, query_term) if QUERY_TERM_SLOT in template else template
+    if isinstance(template, dict):
+        return {key: fill_query_term(value, query_term) for key, value in template.items()}
+    if isinstance(template, list):
+        return [fill_query_term(value, query_term) for value in template]
+    return template
+
+
+class PrebuiltSearch(Search):
+    """
+    Search sent with a body built beforehand, e.g. from query templates, instead of one serialized from DSL objects
+    """
+
+    def __init__(self, *, body: Dict[str, Any], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._body = body
+
+    def to_dict(self, count: bool = False, **kwargs: Any) -> Dict[str, Any]:
+        return self._body
+
 
 class ElasticsearchProxyV2():
     PRIMARY_ENTITIES = [Resource.TABLE, Resource.DASHBOARD, Resource.FEATURE, Resource.USER]
 
+    # whether searches fill in query templates rather than building their queries from DSL objects, see
+    # _get_query_template. Subclasses whose _build_must_query or _build_should_query use the query term in other
+    # ways than including it as is, e.g. by branching on its length, must disable them.
+    USE_QUERY_TEMPLATES = True
+
+    # number of times a field edit is retried when the document is modified concurrently
+    UPDATE_RETRY_ON_CONFLICT = 3
+
+    # how long the point in time of a paginated search is kept between two pages
+    POINT_IN_TIME_KEEP_ALIVE = '1m'
+    # number of documents fetched per request when exporting search results
+    EXPORT_BATCH_SIZE = 1000
+
+    # (completion field, name field, key field, usage field) of the suggestions of each resource. The suggest
+    # subfields of the index_map mappings carry no weight, so SUGGEST_OVERFETCH times more completions than requested
+    # are fetched and ordered by usage.
+    RESOURCE_TO_SUGGEST_FIELDS: Dict[Resource, Tuple[str, str, str, Optional[str]]] = {
+        Resource.TABLE: ('name.suggest', 'name', 'key', 'total_usage'),
+        Resource.DASHBOARD: ('name.suggest', 'name', 'uri', 'total_usage'),
+        Resource.FEATURE: ('feature_name.suggest', 'feature_name', 'key', 'total_usage'),
+        Resource.USER: ('full_name.suggest', 'full_name', 'email', 'total_read'),
+    }
+    SUGGEST_OVERFETCH = 4
+
     # mapping to translate request for table resources
     TABLE_MAPPING = {
         'key': 'key',
@@ -138,6 +223,7 @@ class ElasticsearchProxyV2():
             http_auth = (user, password) if user else None
             self.elasticsearch = Elasticsearch(host, http_auth=http_auth)
         self.page_size = page_size
+        self._query_templates: Dict[Resource, Dict[str, List[Dict[str, Any]]]] = {}
 
     def health(self) -> health_check.HealthCheck:
         """
@@ -192,27 +278,26 @@ class ElasticsearchProxyV2():
         # Can define on custom es_search_proxy class, no default implementation
         return []
 
-    def _build_filters(self, resource: Resource, filters: List[Filter]) -> List:
+    def _build_filter_clauses(self, resource: Resource, filters: List[Filter]) -> List[Dict[str, Any]]:
         """
-        Builds the query object for all of the filters given in the search request
+        Builds the serialized queries for all of the filters given in the search request
         """
         mapping = type(self).RESOURCE_TO_MAPPING.get(resource)
 
-        filter_queries: List = []
+        filter_queries: List[Dict[str, Any]] = []
 
         for filter in filters:
             if mapping is not None and mapping.get(filter.name) is not None:
                 # only apply filter to query if field exists for the given resource
                 filter_name = mapping.get(filter.name)
 
-                queries_per_term = [Q(WILDCARD_QUERY, **{filter_name: term}) for term in filter.values]
+                queries_per_term = [{WILDCARD_QUERY: {filter_name: term}} for term in filter.values]
 
                 if filter.operation == 'OR':
-                    filter_queries.append(Q(BOOL_QUERY, should=queries_per_term, minimum_should_match=1))
+                    filter_queries.append({BOOL_QUERY: {'should': queries_per_term, 'minimum_should_match': 1}})
 
                 elif filter.operation == 'AND':
-                    for q in queries_per_term:
-                        filter_queries.append(q)
+                    filter_queries.extend(queries_per_term)
 
                 else:
                     msg = f'Invalid operation {filter.operation} for filter {filter_name} with values {filter.values}'
@@ -222,6 +307,12 @@ class ElasticsearchProxyV2():
 
         return filter_queries
 
+    def _build_filters(self, resource: Resource, filters: List[Filter]) -> List:
+        """
+        Builds the query object for all of the filters given in the search request
+        """
+        return [Q(clause) for clause in self._build_filter_clauses(resource=resource, filters=filters)]
+
     def _build_elasticsearch_query(self, *,
                                    resource: Resource,
                                    query_term: str,
@@ -239,6 +330,46 @@ class ElasticsearchProxyV2():
 
         return es_query
 
+    def _get_query_template(self, resource: Resource) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Serializes the must and should clauses of the resource once, with a slot standing for the query term, so
+        that searches only have to fill in the term instead of building and serializing the clauses every time
+        """
+        template = self._query_templates.get(resource)
+        if template is None:
+            must_query = self._build_must_query(resource=resource, query_term=QUERY_TERM_SLOT)
+            should_query = self._build_should_query(resource=resource, query_term=QUERY_TERM_SLOT)
+            template = {
+                'must': [query.to_dict() for query in must_query],
+                'should': [query.to_dict() for query in should_query],
+            }
+            self._query_templates[resource] = template
+        return template
+
+    def _build_query_dict(self, *,
+                          resource: Resource,
+                          query_term: str,
+                          filters: List[Filter]) -> Dict[str, Any]:
+        """
+        Builds the same query as _build_elasticsearch_query, already serialized
+        """
+        if not self.USE_QUERY_TEMPLATES:
+            return self._build_elasticsearch_query(resource=resource, query_term=query_term, filters=filters).to_dict()
+
+        if query_term:
+            template = self._get_query_template(resource)
+            clauses = {occurrence: fill_query_term(template[occurrence], query_term)
+                       for occurrence in ('must', 'should')}
+        else:
+            clauses = {
+                'must': [query.to_dict() for query in self._build_must_query(resource=resource, query_term='')],
+                'should': [query.to_dict() for query in self._build_should_query(resource=resource, query_term='')],
+            }
+        clauses['filter'] = self._build_filter_clauses(resource=resource, filters=filters)
+
+        # same as the DSL, which leaves out empty clauses
+        return {BOOL_QUERY: {occurrence: queries for occurrence, queries in clauses.items() if queries}}
+
     def execute_queries(self, queries: Dict[Resource, Q],
                         page_index: int,
                         results_per_page: int) -> List[Response]:
@@ -247,7 +378,8 @@ class ElasticsearchProxyV2():
         for resource in queries.keys():
             query_for_resource = queries.get(resource)
             search = Search(index=self.get_index_alias_for_resource(resource_type=resource)).query(query_for_resource)
-            LOGGER.info(json.dumps(search.to_dict()))
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(json.dumps(search.to_dict()))
 
             # pagination
             start_from = page_index * results_per_page
@@ -274,16 +406,20 @@ class ElasticsearchProxyV2():
             # if resource types are not defined then search all resources
             resource_types = self.PRIMARY_ENTITIES
 
-        queries: Dict[Resource, Q] = {}
+        multisearch = MultiSearch(using=self.elasticsearch)
         for resource in resource_types:
             # build a query for each resource to search
-            queries[resource] = self._build_elasticsearch_query(resource=resource,
-                                                                query_term=query_term,
-                                                                filters=filters)
+            body = {
+                'query': self._build_query_dict(resource=resource, query_term=query_term, filters=filters),
+                'from': page_index * results_per_page,
+                'size': results_per_page,
+            }
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(json.dumps(body))
+            multisearch = multisearch.add(
+                PrebuiltSearch(body=body, index=self.get_index_alias_for_resource(resource_type=resource)))
 
-        responses = self.execute_queries(queries=queries,
-                                         page_index=page_index,
-                                         results_per_page=results_per_page)
+        responses = self.execute_multisearch_query(multisearch=multisearch)
 
         formatted_response = create_search_response(page_index=page_index,
                                                     results_per_page=results_per_page,
@@ -293,6 +429,192 @@ class ElasticsearchProxyV2():
 
         return formatted_response
 
+    def execute_multisearch_query(self, multisearch: MultiSearch) -> List[Response]:
+        try:
+            return multisearch.execute()
+        except Exception as e:
+            LOGGER.error(f'Failed to execute ES search queries. {e}')
+            return []
+
+    def _build_suggest_search(self, resource: Resource, prefix: str, size: int) -> Optional[Search]:
+        """
+        Builds a search running the completion suggester of the resource only, without any query
+        :return: None if the resource cannot be suggested
+        """
+        completion_field, name_field, key_field, usage_field = self.RESOURCE_TO_SUGGEST_FIELDS[resource]
+        source_fields = [name_field, key_field] + ([usage_field] if usage_field else [])
+        search = Search(index=self.get_index_alias_for_resource(resource_type=resource)) \
+            .source(source_fields) \
+            .suggest(SUGGESTION_NAME, prefix, completion={'field': completion_field,
+                                                          'size': size * self.SUGGEST_OVERFETCH})
+        return search[0:0]
+
+    def _format_suggestions(self, resource: Resource, response: Response, size: int) -> List[Dict[str, Any]]:
+        _, name_field, key_field, usage_field = self.RESOURCE_TO_SUGGEST_FIELDS[resource]
+
+        suggestions = []
+        for suggestion in response.to_dict().get('suggest', {}).get(SUGGESTION_NAME, []):
+            for option in suggestion.get('options', []):
+                source = option.get('_source', {})
+                # the score of a completion is its weight
+                score = source.get(usage_field) if usage_field else option.get('_score')
+                suggestions.append({
+                    'key': source.get(key_field),
+                    'name': source.get(name_field),
+                    'score': score or 0,
+                })
+
+        # sorting is stable, so completions with the same usage keep the order of the suggester
+        suggestions.sort(key=lambda s: -s['score'])
+        return suggestions[:size]
+
+    def suggest(self, *,
+                prefix: str,
+                resource_types: List[Resource],
+                size: int) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Completes the prefix into the names of the most used resources of each type, for typeahead. Completion
+        suggesters are served from in memory structures and skip scoring, so they are much cheaper than a search.
+        Suggestions are given up on past SUGGEST_REQUEST_TIMEOUT_SEC.
+
+        :return: resource type -> suggestions with their key, name and score, from the best to the worst
+        """
+        if not resource_types:
+            resource_types = self.PRIMARY_ENTITIES
+
+        suggestions: Dict[str, List[Dict[str, Any]]] = {resource.name.lower(): [] for resource in resource_types}
+        if not prefix:
+            return suggestions
+
+        request_timeout = current_app.config.get(config.SUGGEST_REQUEST_TIMEOUT_SEC,
+                                                 DEFAULT_SUGGEST_REQUEST_TIMEOUT_SEC)
+        multisearch = MultiSearch(using=self.elasticsearch).params(request_timeout=request_timeout)
+        suggested_resources = []
+        for resource in resource_types:
+            search = self._build_suggest_search(resource=resource, prefix=prefix, size=size)
+            if search is not None:
+                suggested_resources.append(resource)
+                multisearch = multisearch.add(search)
+
+        if not suggested_resources:
+            return suggestions
+
+        responses = self.execute_multisearch_query(multisearch=multisearch)
+        for resource, response in zip(suggested_resources, responses):
+            suggestions[resource.name.lower()] = self._format_suggestions(resource=resource,
+                                                                          response=response,
+                                                                          size=size)
+        return suggestions
+
+    @staticmethod
+    def _encode_cursor(point_in_time_id: str, search_after: List[Any]) -> str:
+        cursor = json.dumps({'pit': point_in_time_id, 'after': search_after})
+        return base64.urlsafe_b64encode(cursor.encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, List[Any]]:
+        try:
+            decoded = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            return decoded['pit'], decoded['after']
+        except Exception:
+            raise ValueError(f'Invalid search cursor {cursor}')
+
+    def _execute_search_after(self, *,
+                              query: Q,
+                              point_in_time_id: str,
+                              search_after: Optional[List[Any]],
+                              size: int) -> Response:
+        """
+        Fetches the hits following search_after in the given point in time. Hits are sorted by score, then by their
+        position in the shards so that the order is total and stable across pages.
+        """
+        search = Search(using=self.elasticsearch) \
+            .query(query) \
+            .sort('_score', {'_shard_doc': 'asc'}) \
+            .extra(pit={'id': point_in_time_id, 'keep_alive': self.POINT_IN_TIME_KEEP_ALIVE})
+        if search_after:
+            search = search.extra(search_after=search_after)
+        return search[0:size].execute()
+
+    def _open_point_in_time(self, resource_type: Resource) -> str:
+        response = self.elasticsearch.open_point_in_time(
+            index=self.get_index_alias_for_resource(resource_type=resource_type),
+            keep_alive=self.POINT_IN_TIME_KEEP_ALIVE)
+        return response['id']
+
+    def _close_point_in_time(self, point_in_time_id: str) -> None:
+        try:
+            self.elasticsearch.close_point_in_time(body={'id': point_in_time_id})
+        except Exception as e:
+            # the point in time expires on its own anyway
+            LOGGER.warning(f'Failed to close point in time. {e}')
+
+    def search_page(self, *,
+                    query_term: str,
+                    resource_type: Resource,
+                    filters: List[Filter],
+                    results_per_page: int,
+                    cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fetches a page of search results for a single resource, paginating with search_after on a point in time
+        so that deep pages cost as much as the first one and are not capped by max_result_window.
+
+        :param cursor: cursor returned along with the previous page, None to fetch the first page
+        :return: the results of the page, and the cursor of the next page which is None after the last page
+        """
+        if cursor:
+            point_in_time_id, search_after = self._decode_cursor(cursor)
+        else:
+            point_in_time_id, search_after = self._open_point_in_time(resource_type), None
+
+        query = self._build_elasticsearch_query(resource=resource_type, query_term=query_term, filters=filters)
+        response = self._execute_search_after(query=query,
+                                              point_in_time_id=point_in_time_id,
+                                              search_after=search_after,
+                                              size=results_per_page)
+        # the point in time id may change from one response to the next
+        point_in_time_id = response.to_dict().get('pit_id', point_in_time_id)
+
+        next_cursor = None
+        if len(response.hits) < results_per_page:
+            self._close_point_in_time(point_in_time_id)
+        else:
+            next_cursor = self._encode_cursor(point_in_time_id, list(response.hits[-1].meta.sort))
+
+        return {
+            **format_resource_response(response=response, fields_mapping=self.RESOURCE_TO_MAPPING[resource_type]),
+            'cursor': next_cursor,
+        }
+
+    def export_search_results(self, *,
+                              query_term: str,
+                              resource_type: Resource,
+                              filters: List[Filter]) -> Iterator[Dict[str, Any]]:
+        """
+        Yields every search result for a single resource, fetching them in batches of EXPORT_BATCH_SIZE so that
+        memory stays flat however many results there are.
+        """
+        query = self._build_elasticsearch_query(resource=resource_type, query_term=query_term, filters=filters)
+        fields_mapping = self.RESOURCE_TO_MAPPING[resource_type]
+
+        point_in_time_id = self._open_point_in_time(resource_type)
+        try:
+            search_after = None
+            while True:
+                response = self._execute_search_after(query=query,
+                                                      point_in_time_id=point_in_time_id,
+                                                      search_after=search_after,
+                                                      size=self.EXPORT_BATCH_SIZE)
+                point_in_time_id = response.to_dict().get('pit_id', point_in_time_id)
+                for hit in response.hits:
+                    yield SearchHit(hit=hit, fields_mapping=fields_mapping).to_search_result()
+
+                if len(response.hits) < self.EXPORT_BATCH_SIZE:
+                    return
+                search_after = list(response.hits[-1].meta.sort)
+        finally:
+            self._close_point_in_time(point_in_time_id)
+
     def get_document_json_by_key(self,
                                  resource_key: str,
                                  resource_type: Resource) -> Any:
@@ -344,51 +666,64 @@ class ElasticsearchProxyV2():
                                   id=document_id,
                                   body=partial_document)
 
+    def _get_field_update_script(self, *, field: str, value: Optional[str], operation: str) -> Dict[str, Any]:
+        if operation not in ('add', 'overwrite', 'delete'):
+            raise ValueError(f'Invalid operation {operation} for field {field}')
+        if operation == 'delete' and not value:
+            # deleting without a value, or with an empty one, clears the whole list
+            value = None
+        return {
+            'source': FIELD_UPDATE_SCRIPT,
+            'lang': 'painless',
+            'params': {
+                'field': field,
+                'value': value,
+                'operation': operation,
+            },
+        }
+
+    def _update_field_by_key(self, *,
+                             resource_key: str,
+                             resource_type: Resource,
+                             field: str,
+                             value: Optional[str],
+                             operation: str) -> None:
+        """
+        Edits the field of the document with the given key server side, in a single request. Documents modified
+        concurrently are skipped by Elasticsearch, and the edit is applied again to them.
+        """
+        mapped_field = self.RESOURCE_TO_MAPPING[resource_type].get(field) or field
+        body = {
+            'query': {TERM_QUERY: {'key': resource_key}},
+            'script': self._get_field_update_script(field=mapped_field, value=value, operation=operation),
+        }
+        index = self.get_index_alias_for_resource(resource_type=resource_type)
+
+        for _ in range(self.UPDATE_RETRY_ON_CONFLICT + 1):
+            response = self.elasticsearch.update_by_query(index=index, body=body, conflicts='proceed')
+            if response['total'] == 0:
+                raise ValueError(f'Requested key {resource_key} query returned no results in ES')
+            if response['failures']:
+                raise ElasticsearchException(f'Request to Elasticsearch failed: {response["failures"]}')
+            if not response['version_conflicts']:
+                return
+
+        raise ElasticsearchException(f'Document for key {resource_key} kept being modified concurrently')
+
     def update_document_by_key(self, *,
                                resource_key: str,
                                resource_type: Resource,
                                field: str,
                                value: Optional[str] = None,
                                operation: str = 'add') -> str:
-
-        mapped_field = self.RESOURCE_TO_MAPPING[resource_type].get(field)
-        if not mapped_field:
-            mapped_field = field
-
-        try:
-            es_hit = self.get_document_json_by_key(resource_key=resource_key,
-                                                   resource_type=resource_type)
-            document_id = es_hit._id
-            current_value = getattr(es_hit._source, mapped_field)
-
-        except Exception as e:
-            msg = f'Failed to get ES document id and current value for key {resource_key}. {e}'
-            LOGGER.error(msg)
-            return msg
-
-        new_value = current_value
-
-        if operation == 'overwrite':
-            if type(current_value) is AttrList:
-                new_value = [value]
-            else:
-                new_value = value
-        else:
-            # operation is add
-            if type(current_value) is AttrList:
-                curr_list = list(current_value)
-                curr_list.append(value)
-                new_value = curr_list
-            else:
-                new_value = [current_value, value]
-
         try:
-            self.update_document_by_id(resource_type=resource_type,
-                                       field=mapped_field,
-                                       new_value=new_value,
-                                       document_id=document_id)
+            self._update_field_by_key(resource_key=resource_key,
+                                      resource_type=resource_type,
+                                      field=field,
+                                      value=value,
+                                      operation=operation)
         except Exception as e:
-            msg = f'Failed to update field {field} with value {new_value} for {resource_key}. {e}'
+            msg = f'Failed to update field {field} with value {value} for {resource_key}. {e}'
             LOGGER.error(msg)
             return msg
 
@@ -399,42 +734,97 @@ class ElasticsearchProxyV2():
                                resource_type: Resource,
                                field: str,
                                value: Optional[str] = None) -> str:
-        mapped_field = self.RESOURCE_TO_MAPPING[resource_type].get(field)
-        if not mapped_field:
-            mapped_field = field
-
         try:
-            es_hit = self.get_document_json_by_key(resource_key=resource_key,
-                                                   resource_type=resource_type)
-            document_id = es_hit._id
-            current_value = getattr(es_hit._source, mapped_field)
-
+            self._update_field_by_key(resource_key=resource_key,
+                                      resource_type=resource_type,
+                                      field=field,
+                                      value=value,
+                                      operation='delete')
         except Exception as e:
-            msg = f'Failed to get ES document id and current value for key {resource_key}. {e}'
+            msg = f'Failed to delete field {field} with value {value} for {resource_key}. {e}'
             LOGGER.error(msg)
             return msg
 
-        new_value = current_value
+        return f'ES document field {field} for {resource_key} with value {value} was deleted successfully'
+
+    def _get_document_ids_by_key(self,
+                                 keys_by_resource: Dict[Resource, List[str]]) -> Dict[Tuple[Resource, str],
+                                                                                      Tuple[str, str]]:
+        """
+        Looks up the index and id of the documents with the given keys, in a single request
+        :return: (resource, key) -> (index, id) of each document found
+        """
+        multisearch = MultiSearch(using=self.elasticsearch)
+        resources = list(keys_by_resource.keys())
+        for resource in resources:
+            keys = keys_by_resource[resource]
+            search = Search(index=self.get_index_alias_for_resource(resource_type=resource)) \
+                .filter(TERMS_QUERY, key=keys) \
+                .source(['key'])
+            multisearch = multisearch.add(search[0:len(keys)])
+
+        document_ids = {}
+        for resource, response in zip(resources, multisearch.execute()):
+            for hit in response.hits:
+                document_ids[(resource, hit.key)] = (hit.meta.index, hit.meta.id)
+        return document_ids
+
+    def _build_bulk_update_actions(self,
+                                   updates: List[UpdateDocumentRequest],
+                                   document_ids: Dict[Tuple[Resource, str], Tuple[str, str]]) -> Tuple[List, List]:
+        """
+        :return: the bulk update actions, and the keys of the documents which could not be found
+        """
+        actions: List[Dict[str, Any]] = []
+        missing_keys = []
+        for update in updates:
+            resource_type = RESOURCE_STR_MAPPING[update.resource_type]
+            if (resource_type, update.resource_key) not in document_ids:
+                missing_keys.append(update.resource_key)
+                continue
+
+            index, document_id = document_ids[(resource_type, update.resource_key)]
+            mapped_field = self.RESOURCE_TO_MAPPING[resource_type].get(update.field) or update.field
+            actions.append({'update': {'_index': index,
+                                       '_id': document_id,
+                                       'retry_on_conflict': self.UPDATE_RETRY_ON_CONFLICT}})
+            actions.append({'script': self._get_field_update_script(field=mapped_field,
+                                                                    value=update.value,
+                                                                    operation=update.operation)})
+        return actions, missing_keys
+
+    def update_documents_by_key(self, *, updates: List[UpdateDocumentRequest]) -> str:
+        """
+        Applies edits to the fields of many documents, identified by their keys, in a single bulk request.
+        Edits to the same document are applied in order, and the operation of an edit can be add, overwrite or
+        delete.
+        """
+        if not updates:
+            return 'No ES document field to update'
 
-        if type(current_value) is AttrList:
-            if value:
-                curr_list = list(current_value)
-                curr_list.remove(value)
-                new_value = curr_list
-            else:
-                new_value = []
-        else:
-            # no value given when deleting implies
-            # delete is happening on a single value field
-            new_value = ''
         try:
-            self.update_document_by_id(resource_type=resource_type,
-                                       field=mapped_field,
-                                       new_value=new_value,
-                                       document_id=document_id)
+            keys_by_resource: Dict[Resource, List[str]] = {}
+            for update in updates:
+                keys = keys_by_resource.setdefault(RESOURCE_STR_MAPPING[update.resource_type], [])
+                if update.resource_key not in keys:
+                    keys.append(update.resource_key)
+            document_ids = self._get_document_ids_by_key(keys_by_resource)
+
+            actions, missing_keys = self._build_bulk_update_actions(updates, document_ids)
+            failures = [f'Requested key {key} query returned no results in ES' for key in missing_keys]
+            if actions:
+                response = self.elasticsearch.bulk(body=actions)
+                if response['errors']:
+                    failures.extend(str(item['update']['error']) for item in response['items']
+                                    if 'error' in item['update'])
         except Exception as e:
-            msg = f'Failed to delete field {field} with value {new_value} for {resource_key}. {e}'
+            msg = f'Failed to update ES document fields. {e}'
             LOGGER.error(msg)
             return msg
 
-        return f'ES document field {field} for {resource_key} with value {value} was deleted successfully'
+        if failures:
+            msg = f'Failed to update {len(failures)} of {len(updates)} ES document fields. {failures}'
+            LOGGER.error(msg)
+            return msg
+
+        return f'{len(updates)} ES document fields were updated successfully'
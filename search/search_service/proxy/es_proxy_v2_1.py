@@ -4,7 +4,7 @@
 import json
 import logging
 from typing import (
-    Any, Dict, List,
+    Any, Dict, List, Optional, Tuple,
 )
 
 from amundsen_common.models.search import (
@@ -19,8 +19,13 @@ from elasticsearch_dsl.response import Response
 from flask import current_app
 
 from search_service import config
+from search_service.proxy.es_alias_registry import (
+    DEFAULT_MAX_STALE_SEC, DEFAULT_TTL_SEC, ElasticsearchAliasRegistry,
+)
 from search_service.proxy.es_proxy_utils import Resource, create_search_response
-from search_service.proxy.es_proxy_v2 import BOOL_QUERY, ElasticsearchProxyV2
+from search_service.proxy.es_proxy_v2 import (
+    BOOL_QUERY, ElasticsearchProxyV2, PrebuiltSearch,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +98,12 @@ class ElasticsearchProxyV2_1(ElasticsearchProxyV2):
         Resource.USER: USER_MAPPING,
     }
 
+    # the suggest field of the document mappings is weighted by usage, completions come already ordered
+    RESOURCE_TO_SUGGEST_FIELDS: Dict[Resource, Tuple[str, str, str, Optional[str]]] = {
+        resource: ('suggest', 'name', 'key', None) for resource in RESOURCE_TO_MAPPING
+    }
+    SUGGEST_OVERFETCH = 1
+
     # The overriding of __new__ here is a temporary solution to provide backwards compatiblity
     # until most of the community has moved to using the new Elasticsearch mappings and it will
     # be removed once ElasticsearchProxyV2 id deprecated
@@ -133,6 +144,19 @@ class ElasticsearchProxyV2_1(ElasticsearchProxyV2):
                      page_size=page_size)
         return obj
 
+    def __init__(self, *,
+                 host: Optional[str] = None,
+                 user: str = '',
+                 password: str = '',
+                 client: Optional[Elasticsearch] = None,
+                 page_size: int = 10) -> None:
+        super().__init__(host=host, user=user, password=password, client=client, page_size=page_size)
+        self.alias_registry = ElasticsearchAliasRegistry(
+            client=self.elasticsearch,
+            ttl_sec=current_app.config.get(config.ES_ALIAS_CACHE_TTL_SEC, DEFAULT_TTL_SEC),
+            max_stale_sec=current_app.config.get(config.ES_ALIAS_CACHE_MAX_STALE_SEC, DEFAULT_MAX_STALE_SEC))
+        self._highlight_templates: Dict[Resource, Dict[str, Any]] = {}
+
     def get_index_alias_for_resource(self, resource_type: Resource) -> str:
         resource_str = resource_type.name.lower()
         alias_config = current_app.config.get(
@@ -341,12 +365,33 @@ class ElasticsearchProxyV2_1(ElasticsearchProxyV2):
 
         return search
 
+    def _build_suggest_search(self, resource: Resource, prefix: str, size: int) -> Optional[Search]:
+        # same guard as search, against missing indices or aliases
+        if not self.alias_registry.exists(self.get_index_alias_for_resource(resource_type=resource)):
+            return None
+        return super()._build_suggest_search(resource=resource, prefix=prefix, size=size)
+
+    def _get_highlight_template(self, resource: Resource) -> Dict[str, Any]:
+        """
+        Serializes the highlighting of the resource once, it does not depend on the search request
+        """
+        template = self._highlight_templates.get(resource)
+        if template is None:
+            search = self._search_highlight(resource=resource,
+                                            search=Search(),
+                                            highlight_options={resource: HighlightOptions(enable_highlight=True)})
+            template = search.to_dict().get('highlight', {})
+            self._highlight_templates[resource] = template
+        return template
+
     def execute_multisearch_query(self, multisearch: MultiSearch) -> List[Response]:
         try:
             response = multisearch.execute()
             return response
         except Exception as e:
             LOGGER.error(f'Failed to execute ES search queries. {e}')
+            # the failure may come from an index that was swapped out
+            self.alias_registry.invalidate()
             return []
 
     def search(self, *,
@@ -364,33 +409,27 @@ class ElasticsearchProxyV2_1(ElasticsearchProxyV2):
 
         for resource in resource_types:
             # guard clause to prevent search in missing indices or aliases
-            aliases_in_es = {alias['alias'] for alias in self.elasticsearch.cat.aliases(format="json")}
             resource_alias = self.get_index_alias_for_resource(resource_type=resource)
-            if resource_alias not in aliases_in_es:
+            if not self.alias_registry.exists(resource_alias):
                 LOGGER.info(f"There are no indices in elasticsearch against resource_type: {resource}")
                 continue
 
             # build a query for each resource to search
-            query_for_resource = self._build_elasticsearch_query(resource=resource,
-                                                                 query_term=query_term,
-                                                                 filters=filters)
-            # wrap the query in a search object
-            search = Search(index=resource_alias).query(query_for_resource)
+            body = {
+                'query': self._build_query_dict(resource=resource, query_term=query_term, filters=filters),
+                'from': page_index * results_per_page,
+                'size': results_per_page,
+            }
 
             # highlighting
-            if highlight_options:
-                search = self._search_highlight(resource=resource,
-                                                search=search,
-                                                highlight_options=highlight_options)
-
-            # pagination
-            start_from = page_index * results_per_page
-            end = results_per_page * (page_index + 1)
-            search = search[start_from:end]
+            resource_options = highlight_options.get(resource)
+            if resource_options and resource_options.enable_highlight:
+                body['highlight'] = self._get_highlight_template(resource)
 
             # add search object to multisearch
-            LOGGER.info(json.dumps(search.to_dict()))
-            multisearch = multisearch.add(search)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(json.dumps(body))
+            multisearch = multisearch.add(PrebuiltSearch(body=body, index=resource_alias))
 
         responses = self.execute_multisearch_query(multisearch=multisearch)
 
@@ -0,0 +1,720 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+import math
+import re
+import sys
+import threading
+from array import array
+from collections import Counter
+from functools import lru_cache
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple, Union,
+)
+
+from amundsen_common.models.api import health_check
+from amundsen_common.models.search import (
+    Filter, HighlightOptions, SearchResponse, UpdateDocumentRequest,
+)
+from elasticsearch import Elasticsearch
+from flask import current_app, has_app_context
+
+from search_service import config
+from search_service.models.dashboard import SearchDashboardResult
+from search_service.models.feature import SearchFeatureResult
+from search_service.models.table import SearchTableResult
+from search_service.models.user import SearchUserResult
+from search_service.proxy.base import BaseProxy
+from search_service.proxy.es_proxy_utils import (
+    RESOURCE_STR_MAPPING, Resource, get_index_for_resource,
+)
+from search_service.proxy.es_proxy_v2_1 import ElasticsearchProxyV2_1
+
+LOGGER = logging.getLogger(__name__)
+
+# BM25 parameters, Elasticsearch defaults
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# postings are rebuilt once more than this share of the indexed documents has been deleted or replaced
+COMPACTION_THRESHOLD = 0.25
+
+_TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+# (field, boost, fuzzy) matched against the query term, mirroring ElasticsearchProxyV2_1._build_must_query.
+# Documents written by FSElasticsearchJSONLoader use the older field names, e.g. column_names and full_name.
+_GENERAL_FIELDS = [
+    ('name', 5.0, True),
+    ('description', 1.5, True),
+    ('badges', 1.0, True),
+    ('tags', 1.0, True),
+]
+
+SEARCH_FIELDS = {
+    Resource.TABLE: _GENERAL_FIELDS + [
+        ('schema', 3.0, True),
+        ('columns', 2.0, True),
+        ('column_descriptions', 1.0, True),
+    ],
+    Resource.DASHBOARD: _GENERAL_FIELDS + [
+        ('group_name', 3.0, True),
+        ('query_names', 2.0, True),
+        ('chart_names', 2.0, True),
+        ('uri', 4.0, True),
+    ],
+    Resource.FEATURE: _GENERAL_FIELDS + [
+        ('feature_group', 3.0, True),
+        ('version', 1.0, False),
+        ('entity', 2.0, True),
+        ('status', 1.0, False),
+    ],
+    Resource.USER: [
+        ('name', 5.0, True),
+        ('first_name', 3.0, True),
+        ('last_name', 3.0, True),
+        ('team_name', 1.0, True),
+        ('key', 4.0, True),
+    ],
+}
+
+# usage metrics boosting the score of matching documents, mirroring ElasticsearchProxyV2_1._build_should_query
+USAGE_BOOSTS = {
+    Resource.TABLE: {'total_usage': 10.0, 'unique_usage': 10.0},
+    Resource.DASHBOARD: {'total_usage': 10.0},
+    Resource.FEATURE: {'total_usage': 10.0},
+    Resource.USER: {'total_read': 10.0, 'total_own': 10.0, 'total_follow': 10.0},
+}
+
+# usage metric ordering the suggestions, same as the weights of the suggest field written by the databuilder
+SUGGEST_USAGE_METRICS = {
+    Resource.TABLE: 'total_usage',
+    Resource.DASHBOARD: 'total_usage',
+    Resource.FEATURE: 'total_usage',
+    Resource.USER: 'total_read',
+}
+
+# fields read from other fields when missing, for documents using the older field names
+FIELD_FALLBACKS = {
+    'columns': ['column_names'],
+    'name': ['full_name', 'feature_name'],
+}
+
+
+def tokenize(value: Any) -> List[str]:
+    """
+    Splits a field value into lowercase alphanumeric terms, so that e.g. snake_case names match their words
+    """
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [term for item in value for term in tokenize(item)]
+    return _TOKEN_PATTERN.findall(str(value).lower())
+
+
+def get_field_value(document: Dict[str, Any], field: str) -> Any:
+    if field in document:
+        return document[field]
+    for fallback in FIELD_FALLBACKS.get(field, []):
+        if fallback in document:
+            return document[fallback]
+    return None
+
+
+def _get_usage(document: Dict[str, Any], metric: str) -> float:
+    # the v2.1 documents nest usage metrics under usage, the older ones have them at the top level
+    usage = document.get('usage')
+    value = usage.get(metric) if isinstance(usage, dict) else document.get(metric)
+    return float(value) if isinstance(value, (int, float)) and value > 0 else 0.0
+
+
+def _get_completions(document: Dict[str, Any]) -> List[str]:
+    """
+    Terms of the name starting from each of its words, and of the key, joined by spaces. The name is matched from
+    any of its words like the suggest field written by the databuilder.
+    """
+    name_terms = tokenize(get_field_value(document, 'name'))
+    completions = [' '.join(name_terms[i:]) for i in range(len(name_terms))]
+    key_terms = tokenize(document.get('key'))
+    if key_terms:
+        completions.append(' '.join(key_terms))
+    return completions
+
+
+def _get_max_edits(term: str) -> int:
+    # same as fuzziness AUTO
+    if len(term) <= 2:
+        return 0
+    return 1 if len(term) <= 5 else 2
+
+
+def _edit_distance(source: str, target: str, max_edits: int) -> int:
+    """
+    Damerau-Levenshtein (optimal string alignment) distance, counting transpositions as one edit like
+    Elasticsearch fuzzy queries. Gives up with max_edits + 1 as soon as the distance exceeds max_edits.
+    """
+    if abs(len(source) - len(target)) > max_edits:
+        return max_edits + 1
+
+    previous_previous: List[int] = []
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and source[i - 1] == target[j - 2] and source[i - 2] == target[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_edits:
+            return max_edits + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+@lru_cache(maxsize=1024)
+def _compile_wildcard(pattern: str) -> Pattern:
+    # * and ? are the only special characters of wildcard queries
+    regex = '.*'.join('.'.join(re.escape(part) for part in chunk.split('?')) for chunk in pattern.split('*'))
+    return re.compile(regex + r'\Z', re.DOTALL)
+
+
+class _ResourceIndex:
+    """
+    Inverted index of the documents of a resource.
+
+    Postings are stored per field and term as arrays of increasing document ids along with the term frequencies.
+    Deleting a document only marks its id as deleted, and updating it indexes it again under a new id. Deleted ids
+    are skipped when reading the postings until enough of them have accumulated for the postings to be rebuilt.
+    """
+
+    def __init__(self, resource: Resource) -> None:
+        self.resource = resource
+        self.fields = SEARCH_FIELDS[resource]
+        self._reset()
+
+    def _reset(self) -> None:
+        # document id -> document, None once deleted
+        self._documents: List[Optional[Dict[str, Any]]] = []
+        # document id -> completions the document is suggested for
+        self._completions: List[List[str]] = []
+        self._key_to_doc_id: Dict[str, int] = {}
+        # field -> term -> (document ids, term frequencies)
+        self._postings: Dict[str, Dict[str, Tuple[array, array]]] = {field: {} for field, _, _ in self.fields}
+        # field -> term -> number of documents not deleted containing the term
+        self._document_frequencies: Dict[str, Dict[str, int]] = {field: {} for field, _, _ in self.fields}
+        # field -> term length -> terms, to look up fuzzy matches among terms of a similar length only
+        self._terms_by_length: Dict[str, Dict[int, List[str]]] = {field: {} for field, _, _ in self.fields}
+        # field -> document id -> number of terms
+        self._field_lengths: Dict[str, array] = {field: array('I') for field, _, _ in self.fields}
+        self._total_field_lengths: Dict[str, int] = {field: 0 for field, _, _ in self.fields}
+        self._deleted_count = 0
+        self._usage_pivots: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._key_to_doc_id)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        doc_id = self._key_to_doc_id.get(key)
+        return None if doc_id is None else self._documents[doc_id]
+
+    def documents(self) -> Iterator[Dict[str, Any]]:
+        return (document for document in self._documents if document is not None)
+
+    def add(self, document: Dict[str, Any]) -> None:
+        key = document.get('key')
+        if not key:
+            raise ValueError(f'Document without key cannot be indexed: {document}')
+        if 'resource_type' not in document:
+            document = {**document, 'resource_type': self.resource.name.lower()}
+
+        self._delete(key)
+        doc_id = len(self._documents)
+        self._documents.append(document)
+        self._completions.append(_get_completions(document))
+        self._key_to_doc_id[key] = doc_id
+
+        for field, _, _ in self.fields:
+            terms = tokenize(get_field_value(document, field))
+            self._field_lengths[field].append(len(terms))
+            self._total_field_lengths[field] += len(terms)
+            for term, frequency in Counter(terms).items():
+                postings = self._postings[field].get(term)
+                if postings is None:
+                    term = sys.intern(term)
+                    postings = self._postings[field][term] = (array('I'), array('H'))
+                    self._terms_by_length[field].setdefault(len(term), []).append(term)
+                postings[0].append(doc_id)
+                postings[1].append(min(frequency, 0xFFFF))
+                document_frequencies = self._document_frequencies[field]
+                document_frequencies[term] = document_frequencies.get(term, 0) + 1
+
+        self._usage_pivots.clear()
+        self._compact_if_needed()
+
+    def delete(self, key: str) -> bool:
+        deleted = self._delete(key)
+        self._compact_if_needed()
+        return deleted
+
+    def _delete(self, key: str) -> bool:
+        doc_id = self._key_to_doc_id.pop(key, None)
+        if doc_id is None:
+            return False
+
+        document = self._documents[doc_id]
+        self._documents[doc_id] = None
+        self._completions[doc_id] = []
+        for field, _, _ in self.fields:
+            self._total_field_lengths[field] -= self._field_lengths[field][doc_id]
+            for term in set(tokenize(get_field_value(document, field))):  # type: ignore
+                self._document_frequencies[field][term] -= 1
+        self._deleted_count += 1
+        self._usage_pivots.clear()
+        return True
+
+    def _compact_if_needed(self) -> None:
+        if self._deleted_count <= COMPACTION_THRESHOLD * len(self._documents):
+            return
+        documents = list(self.documents())
+        self._reset()
+        for document in documents:
+            self.add(document)
+
+    def _expand(self, field: str, token: str, fuzzy: bool) -> Iterator[Tuple[str, float]]:
+        """
+        Yields the indexed terms matching the token along with their weight, lower the more edits they are away
+        """
+        if token in self._postings[field]:
+            yield token, 1.0
+        max_edits = _get_max_edits(token) if fuzzy else 0
+        for length in range(len(token) - max_edits, len(token) + max_edits + 1):
+            for term in self._terms_by_length[field].get(length, []):
+                if term == token:
+                    continue
+                distance = _edit_distance(token, term, max_edits)
+                if distance <= max_edits:
+                    yield term, 1.0 - distance / len(token)
+
+    def _score_field(self, field: str, fuzzy: bool, tokens: List[str]) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        if not self._total_field_lengths[field]:
+            return scores
+
+        document_count = len(self)
+        average_length = self._total_field_lengths[field] / document_count
+        field_lengths = self._field_lengths[field]
+        for token in tokens:
+            # a document matching several expansions of the token is scored for the best one
+            token_scores: Dict[int, float] = {}
+            for term, weight in self._expand(field, token, fuzzy):
+                doc_ids, frequencies = self._postings[field][term]
+                document_frequency = self._document_frequencies[field][term]
+                if not document_frequency:
+                    continue
+                idf = math.log(1 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+                for doc_id, frequency in zip(doc_ids, frequencies):
+                    if self._documents[doc_id] is None:
+                        continue
+                    length_norm = 1 - BM25_B + BM25_B * field_lengths[doc_id] / average_length
+                    score = weight * idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+            for doc_id, score in token_scores.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+        return scores
+
+    def _get_usage_pivot(self, metric: str) -> float:
+        # rank_feature queries default to a saturation pivot close to the geometric mean of the values
+        if metric not in self._usage_pivots:
+            logs = [math.log(value) for value in (_get_usage(d, metric) for d in self.documents()) if value > 0]
+            self._usage_pivots[metric] = math.exp(sum(logs) / len(logs)) if logs else 1.0
+        return self._usage_pivots[metric]
+
+    def search(self, query_term: str, filters: List[Filter],
+               fields_mapping: Dict[str, str]) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        :return: (score, document) of the matching documents, from the best match to the worst
+        """
+        tokens = tokenize(query_term)
+        if tokens:
+            scores: Dict[int, float] = {}
+            for field, boost, fuzzy in self.fields:
+                for doc_id, score in self._score_field(field, fuzzy, tokens).items():
+                    scores[doc_id] = scores.get(doc_id, 0.0) + boost * score
+
+            for metric, boost in USAGE_BOOSTS[self.resource].items():
+                pivot = self._get_usage_pivot(metric)
+                for doc_id in scores:
+                    usage = _get_usage(self._documents[doc_id], metric)  # type: ignore
+                    scores[doc_id] += boost * usage / (usage + pivot)
+        else:
+            # no scoring happens if there is no search term
+            scores = {doc_id: 0.0 for doc_id in self._key_to_doc_id.values()}
+
+        matcher = _FilterMatcher(filters=filters, fields_mapping=fields_mapping)
+        ranked = [(score, doc_id) for doc_id, score in scores.items()
+                  if matcher.matches(self._documents[doc_id])]  # type: ignore
+        ranked.sort(key=lambda result: (-result[0], result[1]))
+        return [(score, self._documents[doc_id]) for score, doc_id in ranked]  # type: ignore
+
+    def suggest(self, prefix: str, size: int) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        :return: (usage, document) of the most used documents having a completion starting with the prefix
+        """
+        prefix = ' '.join(tokenize(prefix))
+        if not prefix:
+            return []
+
+        metric = SUGGEST_USAGE_METRICS[self.resource]
+        matches = []
+        for doc_id, completions in enumerate(self._completions):
+            if any(completion.startswith(prefix) for completion in completions):
+                document = self._documents[doc_id]
+                matches.append((_get_usage(document, metric), doc_id))  # type: ignore
+        matches.sort(key=lambda match: (-match[0], match[1]))
+        return [(usage, self._documents[doc_id]) for usage, doc_id in matches[:size]]  # type: ignore
+
+
+class _FilterMatcher:
+    """
+    Matches documents against the filters of a search request, like the wildcard queries of
+    ElasticsearchProxyV2._build_filters
+    """
+
+    def __init__(self, filters: List[Filter], fields_mapping: Dict[str, str]) -> None:
+        self.filters: List[Tuple[str, str, List[Pattern]]] = []
+        for search_filter in filters:
+            mapped_field = fields_mapping.get(search_filter.name)
+            if mapped_field is None:
+                LOGGER.info(f'Filter {search_filter.name} does not apply')
+                continue
+            if search_filter.operation not in ('AND', 'OR'):
+                raise ValueError(f'Invalid operation {search_filter.operation} for filter {mapped_field} '
+                                 f'with values {search_filter.values}')
+            self.filters.append((mapped_field.split('.')[0],
+                                 search_filter.operation,
+                                 [_compile_wildcard(value) for value in search_filter.values]))
+
+    def matches(self, document: Dict[str, Any]) -> bool:
+        for field, operation, patterns in self.filters:
+            value = get_field_value(document, field)
+            values = [str(v) for v in value] if isinstance(value, list) else [] if value is None else [str(value)]
+            pattern_matches = (any(pattern.match(v) for v in values) for pattern in patterns)
+            if not (any(pattern_matches) if operation == 'OR' else all(pattern_matches)):
+                return False
+        return True
+
+
+def _apply_field_update(current: Any, value: Optional[str], operation: str) -> Any:
+    """
+    Computes the new value of an edited field, with the same semantics as the update script of
+    ElasticsearchProxyV2
+    """
+    if operation == 'add':
+        if isinstance(current, list):
+            return current + [value]
+        return [value] if current is None else [current, value]
+    if operation == 'overwrite':
+        return [value] if isinstance(current, list) else value
+    if operation == 'delete':
+        if not isinstance(current, list):
+            return ''
+        if value is None:
+            return []
+        new_value = list(current)
+        if value in new_value:
+            new_value.remove(value)
+        return new_value
+    raise ValueError(f'Invalid operation {operation}')
+
+
+class InMemorySearchProxy(BaseProxy):
+    """
+    Search proxy backed by in-process inverted indices instead of Elasticsearch, for small deployments and
+    reproducible performance tests.
+
+    Documents are ranked with BM25 over the fields searched by ElasticsearchProxyV2_1, with fuzzy matching and
+    usage boosts. They can be loaded from the newline delimited json files written by FSElasticsearchJSONLoader,
+    configured per resource type with IN_MEMORY_SEARCH_DATA_FILES, and are then kept up to date by the document
+    APIs. Documents are identified by their key. Highlighting is not supported.
+    """
+    PRIMARY_ENTITIES = ElasticsearchProxyV2_1.PRIMARY_ENTITIES
+    RESOURCE_TO_MAPPING = ElasticsearchProxyV2_1.RESOURCE_TO_MAPPING
+
+    def __init__(self, *,
+                 host: Optional[str] = None,
+                 user: str = '',
+                 password: str = '',
+                 client: Optional[Elasticsearch] = None,
+                 page_size: int = 10,
+                 data_files: Optional[Dict[str, str]] = None) -> None:
+        self.page_size = page_size
+        self._lock = threading.RLock()
+        self._indices = {resource: _ResourceIndex(resource) for resource in Resource}
+
+        if data_files is None and has_app_context():
+            data_files = current_app.config.get(config.IN_MEMORY_SEARCH_DATA_FILES)
+        for resource_type, file_path in (data_files or {}).items():
+            self.load_ndjson(resource_type=RESOURCE_STR_MAPPING[resource_type], file_path=file_path)
+
+    def health(self) -> health_check.HealthCheck:
+        documents = {resource.name.lower(): len(index) for resource, index in self._indices.items()}
+        return health_check.HealthCheck(status=health_check.OK,
+                                        checks={f'{type(self).__name__}:documents': documents})
+
+    def load_ndjson(self, *, resource_type: Resource, file_path: str) -> int:
+        """
+        Indexes the documents of a newline delimited json file, one at a time
+        :return: number of documents indexed
+        """
+        with open(file_path, 'r') as f:
+            count = self.add_documents(resource_type=resource_type,
+                                       documents=(json.loads(line) for line in f if line.strip()))
+        LOGGER.info(f'Indexed {count} {resource_type.name.lower()} documents from {file_path}')
+        return count
+
+    def add_documents(self, *, resource_type: Resource, documents: Iterable[Dict[str, Any]]) -> int:
+        """
+        Indexes the documents, replacing the ones with the same key
+        :return: number of documents indexed
+        """
+        count = 0
+        index = self._indices[resource_type]
+        for document in documents:
+            with self._lock:
+                index.add(document)
+            count += 1
+        return count
+
+    def delete_documents(self, *, resource_type: Resource, keys: Iterable[str]) -> int:
+        """
+        :return: number of documents deleted
+        """
+        index = self._indices[resource_type]
+        with self._lock:
+            return sum(index.delete(key) for key in keys)
+
+    def _rank(self, *, resource: Resource, query_term: str,
+              filters: List[Filter]) -> List[Tuple[float, Dict[str, Any]]]:
+        with self._lock:
+            return self._indices[resource].search(query_term=query_term,
+                                                  filters=filters,
+                                                  fields_mapping=self.RESOURCE_TO_MAPPING[resource])
+
+    def _to_search_result(self, resource: Resource, score: float, document: Dict[str, Any]) -> Dict[str, Any]:
+        # same fields as es_proxy_utils.SearchHit.to_search_result
+        result = {}
+        for field, mapped_field in self.RESOURCE_TO_MAPPING[resource].items():
+            mapped_field = mapped_field.split('.')[0]
+            field_value = get_field_value(document, mapped_field)
+            if field_value is None or field == mapped_field:
+                field_value = document.get(field, field_value)
+            result[field] = field_value
+        result['search_score'] = score
+        return result
+
+    def _get_results(self, resource: Resource, ranked: List[Tuple[float, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        return [{**self._to_search_result(resource, score, document), 'highlight': {}} for score, document in ranked]
+
+    def search(self, *,
+               query_term: str,
+               page_index: int,
+               results_per_page: int,
+               resource_types: List[Resource],
+               filters: List[Filter],
+               highlight_options: Dict[Resource, HighlightOptions]) -> SearchResponse:
+        results = {}
+        for resource in resource_types or self.PRIMARY_ENTITIES:
+            ranked = self._rank(resource=resource, query_term=query_term, filters=filters)
+            start_from = page_index * results_per_page
+            results[resource.name.lower()] = {
+                'results': self._get_results(resource, ranked[start_from:start_from + results_per_page]),
+                'total_results': len(ranked),
+            }
+
+        return SearchResponse(msg='Success',
+                              page_index=page_index,
+                              results_per_page=results_per_page,
+                              results=results,
+                              status_code=200)
+
+    def search_page(self, *,
+                    query_term: str,
+                    resource_type: Resource,
+                    filters: List[Filter],
+                    results_per_page: int,
+                    cursor: Optional[str] = None) -> Dict[str, Any]:
+        # the cursor is the offset of the page, there is no point in time to keep
+        try:
+            start_from = int(cursor) if cursor else 0
+        except ValueError:
+            raise ValueError(f'Invalid search cursor {cursor}')
+
+        ranked = self._rank(resource=resource_type, query_term=query_term, filters=filters)
+        end = start_from + results_per_page
+        return {
+            'results': self._get_results(resource_type, ranked[start_from:end]),
+            'total_results': len(ranked),
+            'cursor': str(end) if end < len(ranked) else None,
+        }
+
+    def export_search_results(self, *,
+                              query_term: str,
+                              resource_type: Resource,
+                              filters: List[Filter]) -> Iterator[Dict[str, Any]]:
+        for score, document in self._rank(resource=resource_type, query_term=query_term, filters=filters):
+            yield self._to_search_result(resource_type, score, document)
+
+    def suggest(self, *,
+                prefix: str,
+                resource_types: List[Resource],
+                size: int) -> Dict[str, List[Dict[str, Any]]]:
+        suggestions = {}
+        for resource in resource_types or self.PRIMARY_ENTITIES:
+            with self._lock:
+                matches = self._indices[resource].suggest(prefix=prefix, size=size)
+            suggestions[resource.name.lower()] = [{
+                'key': document['key'],
+                'name': get_field_value(document, 'name'),
+                'score': usage,
+            } for usage, document in matches]
+        return suggestions
+
+    def _update_field(self, *,
+                      resource_key: str,
+                      resource_type: Resource,
+                      field: str,
+                      value: Optional[str],
+                      operation: str) -> None:
+        mapped_field = (self.RESOURCE_TO_MAPPING[resource_type].get(field) or field).split('.')[0]
+        index = self._indices[resource_type]
+        with self._lock:
+            document = index.get(resource_key)
+            if document is None:
+                raise ValueError(f'Requested key {resource_key} query returned no results')
+            new_value = _apply_field_update(document.get(mapped_field), value, operation)
+            index.add({**document, mapped_field: new_value})
+
+    def update_document_by_key(self, *,
+                               resource_key: str,
+                               resource_type: Resource,
+                               field: str,
+                               value: Optional[str] = None,
+                               operation: str = 'add') -> str:
+        try:
+            self._update_field(resource_key=resource_key,
+                               resource_type=resource_type,
+                               field=field,
+                               value=value,
+                               operation=operation)
+        except Exception as e:
+            msg = f'Failed to update field {field} with value {value} for {resource_key}. {e}'
+            LOGGER.error(msg)
+            return msg
+
+        return f'Document field {field} for {resource_key} with value {value} was updated successfully'
+
+    def delete_document_by_key(self, *,
+                               resource_key: str,
+                               resource_type: Resource,
+                               field: str,
+                               value: Optional[str] = None) -> str:
+        try:
+            self._update_field(resource_key=resource_key,
+                               resource_type=resource_type,
+                               field=field,
+                               value=value,
+                               operation='delete')
+        except Exception as e:
+            msg = f'Failed to delete field {field} with value {value} for {resource_key}. {e}'
+            LOGGER.error(msg)
+            return msg
+
+        return f'Document field {field} for {resource_key} with value {value} was deleted successfully'
+
+    def update_documents_by_key(self, *, updates: List[UpdateDocumentRequest]) -> str:
+        failures = []
+        for update in updates:
+            try:
+                self._update_field(resource_key=update.resource_key,
+                                   resource_type=RESOURCE_STR_MAPPING[update.resource_type],
+                                   field=update.field,
+                                   value=update.value,
+                                   operation=update.operation)
+            except Exception as e:
+                failures.append(str(e))
+
+        if failures:
+            msg = f'Failed to update {len(failures)} of {len(updates)} document fields. {failures}'
+            LOGGER.error(msg)
+            return msg
+
+        return f'{len(updates)} document fields were updated successfully'
+
+    @staticmethod
+    def _get_resource_for_index(index: str) -> Resource:
+        for resource in Resource:
+            if index.startswith(get_index_for_resource(resource)):
+                return resource
+        raise ValueError(f'No resource is searched in index {index}')
+
+    def create_document(self, *, data: List[Any], index: str = '') -> str:
+        # data are Table, User or Feature models, like for ElasticsearchProxy
+        resource = self._get_resource_for_index(index)
+        self.add_documents(resource_type=resource,
+                           documents=({'key': item.get_id(), **item.get_attrs_dict(), 'resource_type': item.get_type()}
+                                      for item in data))
+        return index
+
+    def update_document(self, *, data: List[Any], index: str = '') -> str:
+        resource = self._get_resource_for_index(index)
+        with self._lock:
+            for item in data:
+                document = {'key': item.get_id(), **item.get_attrs_dict(), 'resource_type': item.get_type()}
+                # like a partial update, fields missing from the new document are kept
+                self._indices[resource].add({**(self._indices[resource].get(document['key']) or {}), **document})
+        return index
+
+    def delete_document(self, *, data: List[str], index: str = '') -> str:
+        # documents are identified by their key, which is what the ids of the models are set to
+        self.delete_documents(resource_type=self._get_resource_for_index(index), keys=data)
+        return index
+
+    def fetch_table_search_results(self, *,
+                                   query_term: str,
+                                   page_index: int = 0,
+                                   index: str = '') -> SearchTableResult:
+        LOGGER.warning(f'{type(self).__name__} only supports the /v2/search API')
+        return SearchTableResult(total_results=0, results=[])
+
+    def fetch_dashboard_search_results(self, *,
+                                       query_term: str,
+                                       page_index: int = 0,
+                                       index: str = '') -> SearchDashboardResult:
+        LOGGER.warning(f'{type(self).__name__} only supports the /v2/search API')
+        return SearchDashboardResult(total_results=0, results=[])
+
+    def fetch_feature_search_results(self, *,
+                                     query_term: str,
+                                     page_index: int = 0,
+                                     index: str = '') -> SearchFeatureResult:
+        LOGGER.warning(f'{type(self).__name__} only supports the /v2/search API')
+        return SearchFeatureResult(total_results=0, results=[])
+
+    def fetch_user_search_results(self, *,
+                                  query_term: str,
+                                  page_index: int = 0,
+                                  index: str = '') -> SearchUserResult:
+        LOGGER.warning(f'{type(self).__name__} only supports the /v2/search API')
+        return SearchUserResult(total_results=0, results=[])
+
+    def fetch_search_results_with_filter(self, *,
+                                         query_term: str,
+                                         search_request: dict,
+                                         page_index: int = 0,
+                                         index: str = '') -> Union[SearchTableResult,
+                                                                   SearchDashboardResult,
+                                                                   SearchFeatureResult]:
+        LOGGER.warning(f'{type(self).__name__} only supports the /v2/search API')
+        return SearchTableResult(total_results=0, results=[])
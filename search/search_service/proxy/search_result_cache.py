@@ -0,0 +1,148 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any, Dict, Hashable, List, Optional, Tuple,
+)
+
+from amundsen_common.models.search import Filter, HighlightOptions
+from flask import current_app
+
+from search_service import config
+from search_service.proxy.es_proxy_utils import Resource
+from search_service.proxy.statsd_utilities import _get_statsd_client
+
+LOGGER = logging.getLogger(__name__)
+
+_search_result_cache = None
+_search_result_cache_lock = threading.Lock()
+
+
+class SearchResultCache:
+    """
+    LRU cache of search responses, whose entries expire after ttl_sec.
+
+    Each entry is stored along with a version of the indices it was computed from, e.g. the version of the
+    ElasticsearchAliasRegistry, and is dropped once looked up with another version. clear() drops every entry,
+    which is needed whenever documents are updated.
+    """
+
+    def __init__(self, max_entries: int, ttl_sec: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+
+        self._lock = threading.Lock()
+        # key -> (version, expiry monotonic time, value)
+        self._entries: 'OrderedDict[Hashable, Tuple[Hashable, float, Any]]' = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable, version: Hashable) -> Optional[Any]:
+        value = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_version, expires_at, entry_value = entry
+                if entry_version == version and expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    value = entry_value
+                else:
+                    del self._entries[key]
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        self._emit_metric('miss' if value is None else 'hit')
+        return value
+
+    def put(self, key: Hashable, version: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (version, time.monotonic() + self.ttl_sec, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+        self._emit_metric('invalidation')
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+            }
+
+    def _emit_metric(self, name: str) -> None:
+        if not current_app.config.get(config.STATS_FEATURE_KEY):
+            return
+        statsd_client = _get_statsd_client(prefix=__name__)
+        if statsd_client:
+            statsd_client.incr(name)
+
+
+def get_search_result_cache() -> Optional[SearchResultCache]:
+    """
+    Provides the singleton search result cache based on the config
+    :return: None if SEARCH_RESULT_CACHE_MAX_ENTRIES is not set
+    """
+    global _search_result_cache
+
+    max_entries = current_app.config.get(config.SEARCH_RESULT_CACHE_MAX_ENTRIES)
+    if not max_entries:
+        return None
+
+    if _search_result_cache is None:
+        with _search_result_cache_lock:
+            if _search_result_cache is None:
+                _search_result_cache = SearchResultCache(
+                    max_entries=max_entries,
+                    ttl_sec=current_app.config[config.SEARCH_RESULT_CACHE_TTL_SEC])
+
+    return _search_result_cache
+
+
+def clear_search_result_cache() -> None:
+    """
+    Drops the cached search results, if the cache is enabled. To be called whenever documents are updated.
+    """
+    search_result_cache = get_search_result_cache()
+    if search_result_cache is not None:
+        search_result_cache.clear()
+
+
+def get_search_cache_key(*,
+                         query_term: str,
+                         page_index: int,
+                         results_per_page: int,
+                         resource_types: List[Resource],
+                         filters: List[Filter],
+                         highlight_options: Dict[Resource, HighlightOptions]) -> Hashable:
+    """
+    Normalizes a search request into a cache key: the order of resources, filters and filter values does not
+    change the results. The query term is kept as is since it is also matched against case sensitive fields.
+    """
+    normalized_filters = tuple(sorted((f.name, f.operation, tuple(sorted(f.values))) for f in filters))
+    highlighted_resources = tuple(sorted(resource.value for resource, options in highlight_options.items()
+                                         if options.enable_highlight))
+    return (query_term,
+            page_index,
+            results_per_page,
+            tuple(sorted({resource.value for resource in resource_types})),
+            normalized_filters,
+            highlighted_resources)
@@ -0,0 +1,119 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import unittest
+from http import HTTPStatus
+from typing import (
+    Any, Dict, Iterator,
+)
+from unittest.mock import MagicMock, patch
+
+from elasticsearch.exceptions import NotFoundError
+
+from search_service import create_app
+from search_service.proxy.es_proxy_utils import Resource
+
+
+class TestSearchPageAPI(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='search_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        self.client = self.app.test_client()
+        self.mock_proxy = MagicMock()
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def _post(self, url: str, body: Dict[str, Any]) -> Any:
+        with patch('search_service.api.search.get_proxy_client', return_value=self.mock_proxy):
+            return self.client.post(url, json=body)
+
+    def test_search_page(self) -> None:
+        self.mock_proxy.search_page.return_value = {'results': [], 'total_results': 0, 'cursor': None}
+
+        response = self._post('/v2/search/page', {'query_term': 'foo',
+                                                  'resource_types': ['table'],
+                                                  'results_per_page': 5,
+                                                  'cursor': 'mock_cursor'})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json, {'results': [], 'total_results': 0, 'cursor': None})
+        self.mock_proxy.search_page.assert_called_once_with(query_term='foo',
+                                                            resource_type=Resource.TABLE,
+                                                            filters=[],
+                                                            results_per_page=5,
+                                                            cursor='mock_cursor')
+
+    def test_search_page_requires_single_resource(self) -> None:
+        response = self._post('/v2/search/page', {'query_term': 'foo', 'resource_types': ['table', 'user']})
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.search_page.assert_not_called()
+
+    def test_search_page_expired_cursor(self) -> None:
+        self.mock_proxy.search_page.side_effect = NotFoundError(404, 'search_context_missing_exception')
+
+        response = self._post('/v2/search/page', {'query_term': 'foo',
+                                                  'resource_types': ['table'],
+                                                  'cursor': 'mock_cursor'})
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_search_export(self) -> None:
+        def export_search_results(*, resource_type: Resource, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+            for i in range(2):
+                yield {'key': f'{resource_type.name.lower()}_{i}'}
+
+        self.mock_proxy.export_search_results.side_effect = export_search_results
+
+        response = self._post('/v2/search/export', {'query_term': 'foo', 'resource_types': ['table', 'user']})
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        self.assertEqual([json.loads(line) for line in response.get_data(as_text=True).splitlines()],
+                         [{'key': 'table_0'}, {'key': 'table_1'}, {'key': 'user_0'}, {'key': 'user_1'}])
+
+
+class TestSuggestAPI(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='search_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        self.client = self.app.test_client()
+        self.mock_proxy = MagicMock()
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def _get(self, url: str) -> Any:
+        with patch('search_service.api.search.get_proxy_client', return_value=self.mock_proxy):
+            return self.client.get(url)
+
+    def test_suggest(self) -> None:
+        suggestions = {'table': [{'key': 'k1', 'name': 'orders', 'score': 10}], 'user': []}
+        self.mock_proxy.suggest.return_value = suggestions
+
+        response = self._get('/v2/suggest?prefix=ord&resource_types=table&resource_types=user&size=3')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json, suggestions)
+        self.mock_proxy.suggest.assert_called_once_with(prefix='ord',
+                                                        resource_types=[Resource.TABLE, Resource.USER],
+                                                        size=3)
+
+    def test_suggest_defaults(self) -> None:
+        self.mock_proxy.suggest.return_value = {}
+
+        response = self._get('/v2/suggest?prefix=ord')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.mock_proxy.suggest.assert_called_once_with(prefix='ord', resource_types=[], size=5)
+
+    def test_suggest_invalid_request(self) -> None:
+        self.assertEqual(self._get('/v2/suggest?prefix=ord&resource_types=foo').status_code,
+                         HTTPStatus.BAD_REQUEST)
+        self.assertEqual(self._get('/v2/suggest?prefix=ord&size=1000').status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(self._get('/v2/suggest').status_code, HTTPStatus.BAD_REQUEST)
+        self.mock_proxy.suggest.assert_not_called()
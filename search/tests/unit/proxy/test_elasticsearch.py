@@ -275,6 +275,18 @@ class TestElasticsearchProxy(unittest.TestCase):
         self.assertDictEqual(vars(resp.results[0]), vars(expected.results[0]),
                              "Search Result doesn't match with expected result!")
 
+    @patch('elasticsearch_dsl.Search.scan')
+    @patch('elasticsearch_dsl.Search.count')
+    def test_search_all_results(self, mock_count: MagicMock, mock_scan: MagicMock) -> None:
+        mock_scan.return_value = iter([TableResponse(result=vars(self.mock_result1))])
+
+        resp = self.es_proxy.fetch_table_search_results(query_term='test_query_term', page_index=-1)
+
+        # every result is scrolled through instead of counted first
+        mock_count.assert_not_called()
+        self.assertEqual(resp.total_results, 1)
+        self.assertEqual(resp.results[0].key, 'test_key')
+
     @patch('elasticsearch_dsl.Search.execute')
     def test_search_with_multiple_result(self,
                                          mock_search: MagicMock) -> None:
@@ -0,0 +1,85 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from search_service.proxy import es_alias_registry
+from search_service.proxy.es_alias_registry import ElasticsearchAliasRegistry
+
+
+class TestElasticsearchAliasRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mock_client = MagicMock()
+        self.mock_client.indices.get_alias.return_value = {
+            'table_search_index_1': {'aliases': {'table_search_index_v2_1': {}}},
+            'user_search_index_1': {'aliases': {}},
+        }
+        self.registry = ElasticsearchAliasRegistry(client=self.mock_client, ttl_sec=60, max_stale_sec=600)
+
+    def test_exists(self) -> None:
+        self.assertTrue(self.registry.exists('table_search_index_v2_1'))
+        self.assertTrue(self.registry.exists('user_search_index_1'))
+        self.assertFalse(self.registry.exists('dashboard_search_index_v2_1'))
+        self.assertEqual(self.registry.get_indices('table_search_index_v2_1'), {'table_search_index_1'})
+
+        # fresh entries are served from the cache
+        self.assertEqual(self.mock_client.indices.get_alias.call_count, 1)
+
+    def test_stale_entries_are_revalidated_in_background(self) -> None:
+        with patch.object(es_alias_registry.time, 'monotonic', return_value=0):
+            self.registry.exists('table_search_index_v2_1')
+
+        # swap a new index in behind the alias
+        self.mock_client.indices.get_alias.return_value = {
+            'table_search_index_2': {'aliases': {'table_search_index_v2_1': {}}},
+        }
+        with patch.object(es_alias_registry.time, 'monotonic', return_value=120), \
+                patch.object(es_alias_registry.threading, 'Thread') as mock_thread:
+            # the stale entries are served while the refresh is scheduled only once
+            self.assertEqual(self.registry.get_indices('table_search_index_v2_1'), {'table_search_index_1'})
+            self.registry.exists('table_search_index_v2_1')
+            mock_thread.assert_called_once()
+
+            mock_thread.call_args[1]['target']()
+            self.assertEqual(self.registry.get_indices('table_search_index_v2_1'), {'table_search_index_2'})
+            self.assertEqual(self.mock_client.indices.get_alias.call_count, 2)
+
+    def test_expired_entries_are_refreshed(self) -> None:
+        with patch.object(es_alias_registry.time, 'monotonic', return_value=0):
+            self.registry.exists('table_search_index_v2_1')
+
+        self.mock_client.indices.get_alias.return_value = {}
+        with patch.object(es_alias_registry.time, 'monotonic', return_value=601):
+            self.assertFalse(self.registry.exists('table_search_index_v2_1'))
+        self.assertEqual(self.mock_client.indices.get_alias.call_count, 2)
+
+    def test_invalidate(self) -> None:
+        self.registry.exists('table_search_index_v2_1')
+        self.registry.invalidate()
+        self.registry.exists('table_search_index_v2_1')
+        self.assertEqual(self.mock_client.indices.get_alias.call_count, 2)
+
+    def test_failed_background_refresh_keeps_entries(self) -> None:
+        with patch.object(es_alias_registry.time, 'monotonic', return_value=0):
+            self.registry.exists('table_search_index_v2_1')
+
+        self.mock_client.indices.get_alias.side_effect = Exception('unavailable')
+        with patch.object(es_alias_registry.time, 'monotonic', return_value=120), \
+                patch.object(es_alias_registry.threading, 'Thread') as mock_thread:
+            self.registry.exists('table_search_index_v2_1')
+            mock_thread.call_args[1]['target']()
+            self.assertTrue(self.registry.exists('table_search_index_v2_1'))
+
+    def test_version(self) -> None:
+        version = self.registry.version
+
+        # refreshing the same aliases keeps the version
+        self.registry.invalidate()
+        self.assertEqual(self.registry.version, version)
+
+        self.mock_client.indices.get_alias.return_value = {
+            'table_search_index_2': {'aliases': {'table_search_index_v2_1': {}}},
+        }
+        self.registry.invalidate()
+        self.assertNotEqual(self.registry.version, version)
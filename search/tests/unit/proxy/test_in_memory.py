@@ -0,0 +1,249 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+import unittest
+from typing import Any, Dict
+
+from amundsen_common.models.search import Filter, UpdateDocumentRequest
+
+from search_service import create_app
+from search_service.models.table import Table
+from search_service.proxy import in_memory
+from search_service.proxy.es_proxy_utils import Resource
+from search_service.proxy.in_memory import InMemorySearchProxy
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _table_document(name: str, **kwargs: Any) -> Dict[str, Any]:
+    # as written by FSElasticsearchJSONLoader for a TableESDocument
+    document: Dict[str, Any] = {
+        'badges': [],
+        'cluster': 'gold',
+        'column_descriptions': [],
+        'column_names': [],
+        'database': 'hive',
+        'description': None,
+        'display_name': f'core.{name}',
+        'key': f'hive://gold.core/{name}',
+        'last_updated_timestamp': 1527283287,
+        'name': name,
+        'programmatic_descriptions': [],
+        'schema': 'core',
+        'schema_description': None,
+        'tags': [],
+        'total_usage': 0,
+        'unique_usage': 0,
+    }
+    document.update(kwargs)
+    return document
+
+
+class TestInMemorySearchProxy(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='search_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        self.proxy = InMemorySearchProxy()
+        self.proxy.add_documents(resource_type=Resource.TABLE, documents=[
+            _table_document('orders', description='all orders placed by customers', tags=['sales'],
+                            total_usage=10),
+            _table_document('order_items', description='items of the orders', column_names=['order_id', 'sku']),
+            _table_document('customers', schema='crm', description='customer accounts', badges=['pii'],
+                            total_usage=500),
+        ])
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def _search(self, query_term: str, **kwargs: Any) -> Dict[str, Any]:
+        response = self.proxy.search(query_term=query_term,
+                                     page_index=kwargs.get('page_index', 0),
+                                     results_per_page=kwargs.get('results_per_page', 10),
+                                     resource_types=[Resource.TABLE],
+                                     filters=kwargs.get('filters', []),
+                                     highlight_options={})
+        self.assertEqual(response.status_code, 200)
+        return response.results['table']
+
+    def _search_names(self, query_term: str, **kwargs: Any) -> list:
+        return [result['table'] for result in self._search(query_term, **kwargs)['results']]
+
+    def _suggest_names(self, prefix: str, size: int = 5) -> list:
+        suggestions = self.proxy.suggest(prefix=prefix, resource_types=[Resource.TABLE], size=size)
+        return [suggestion['name'] for suggestion in suggestions['table']]
+
+    def test_load_ndjson(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'table_search_data.json')
+            with open(file_path, 'w') as f:
+                f.write(json.dumps(_table_document('payments')) + '\n')
+                f.write('\n')
+                f.write(json.dumps(_table_document('refunds')) + '\n')
+
+            proxy = InMemorySearchProxy(data_files={'table': file_path})
+
+        self.assertEqual(proxy.health().checks['InMemorySearchProxy:documents']['table'], 2)
+        result = proxy.search(query_term='payments',
+                              page_index=0,
+                              results_per_page=10,
+                              resource_types=[Resource.TABLE],
+                              filters=[],
+                              highlight_options={}).results['table']
+        self.assertEqual(result['total_results'], 1)
+        self.assertEqual(result['results'][0]['key'], 'hive://gold.core/payments')
+        self.assertEqual(result['results'][0]['resource_type'], 'table')
+        self.assertEqual(result['results'][0]['highlight'], {})
+
+    def test_search_ranking(self) -> None:
+        # name matches are boosted over description matches
+        self.assertEqual(self._search_names('orders'), ['orders', 'order_items'])
+        # snake case names are split into their words
+        self.assertEqual(self._search_names('items'), ['order_items'])
+        self.assertEqual(self._search_names('sku'), ['order_items'])
+        self.assertEqual(self._search_names('unknown'), [])
+
+    def test_fuzzy_search(self) -> None:
+        self.assertEqual(self._search_names('custmoers')[0], 'customers')
+        self.assertEqual(self._search_names('ordrs'), ['orders', 'order_items'])
+        # short terms must match exactly
+        self.assertEqual(self._search_names('pi'), [])
+
+    def test_usage_boost(self) -> None:
+        self.proxy.add_documents(resource_type=Resource.TABLE, documents=[
+            _table_document('accounts', total_usage=0),
+            _table_document('accounts_v2', total_usage=1000),
+        ])
+        names = self._search_names('accounts')
+        self.assertLess(names.index('accounts_v2'), names.index('accounts'))
+
+    def test_filters(self) -> None:
+        self.assertEqual(self._search_names('', filters=[Filter(name='schema', values=['crm'], operation='OR')]),
+                         ['customers'])
+        self.assertEqual(self._search_names('', filters=[Filter(name='table', values=['order*'], operation='OR')]),
+                         ['orders', 'order_items'])
+        self.assertEqual(self._search_names('', filters=[Filter(name='table', values=['order*', '*items'],
+                                                                operation='AND')]),
+                         ['order_items'])
+        self.assertEqual(self._search_names('', filters=[Filter(name='badges', values=['pii'], operation='OR')]),
+                         ['customers'])
+        with self.assertRaises(ValueError):
+            self._search_names('', filters=[Filter(name='schema', values=['crm'], operation='NOT')])
+
+    def test_pagination(self) -> None:
+        result = self._search('', page_index=1, results_per_page=2)
+        self.assertEqual(result['total_results'], 3)
+        self.assertEqual([r['table'] for r in result['results']], ['customers'])
+
+        first_page = self.proxy.search_page(query_term='', resource_type=Resource.TABLE, filters=[],
+                                            results_per_page=2)
+        second_page = self.proxy.search_page(query_term='', resource_type=Resource.TABLE, filters=[],
+                                             results_per_page=2, cursor=first_page['cursor'])
+        self.assertEqual(len(first_page['results']), 2)
+        self.assertEqual(len(second_page['results']), 1)
+        self.assertIsNone(second_page['cursor'])
+
+        exported = list(self.proxy.export_search_results(query_term='', resource_type=Resource.TABLE, filters=[]))
+        self.assertEqual([r['table'] for r in exported], ['orders', 'order_items', 'customers'])
+
+    def test_incremental_updates(self) -> None:
+        self.proxy.add_documents(resource_type=Resource.TABLE,
+                                 documents=[_table_document('orders', description='new description', total_usage=10)])
+        self.assertEqual(self._search_names('placed'), [])
+        self.assertEqual(self._search('orders')['results'][0]['description'], 'new description')
+
+        self.assertEqual(self.proxy.delete_documents(resource_type=Resource.TABLE,
+                                                     keys=['hive://gold.core/order_items', 'missing']), 1)
+        self.assertEqual(self._search_names('orders'), ['orders'])
+        self.assertEqual(self._search('')['total_results'], 2)
+
+    def test_compaction(self) -> None:
+        index = self.proxy._indices[Resource.TABLE]
+        for i in range(10):
+            self.proxy.add_documents(resource_type=Resource.TABLE,
+                                     documents=[_table_document('orders', description=f'version {i}', total_usage=10)])
+
+        # replaced documents are dropped from the postings once they add up
+        self.assertLessEqual(index._deleted_count, in_memory.COMPACTION_THRESHOLD * len(index._documents))
+        self.assertEqual(len(index), 3)
+        self.assertEqual(self._search('orders')['results'][0]['description'], 'version 9')
+
+    def test_update_document_by_key(self) -> None:
+        key = 'hive://gold.core/orders'
+        self.proxy.update_document_by_key(resource_key=key, resource_type=Resource.TABLE, field='tag', value='finance')
+        self.assertEqual(self._search_names('finance'), ['orders'])
+
+        self.proxy.delete_document_by_key(resource_key=key, resource_type=Resource.TABLE, field='tag', value='sales')
+        self.proxy.update_document_by_key(resource_key=key, resource_type=Resource.TABLE, field='description',
+                                          value='purchases', operation='overwrite')
+        result = self._search('orders')['results'][0]
+        self.assertEqual(result['tag'], ['finance'])
+        self.assertEqual(result['description'], 'purchases')
+
+        msg = self.proxy.update_documents_by_key(updates=[
+            UpdateDocumentRequest(resource_key=key, resource_type='table', field='tag', value='a', operation='add'),
+            UpdateDocumentRequest(resource_key='missing', resource_type='table', field='tag', value='a',
+                                  operation='add'),
+        ])
+        self.assertIn('Failed to update 1 of 2 document fields', msg)
+        self.assertEqual(self._search('orders')['results'][0]['tag'], ['finance', 'a'])
+
+    def test_v1_documents(self) -> None:
+        table = Table(id='hive://gold.core/shipments', database='hive', cluster='gold', schema='core',
+                      name='shipments', key='hive://gold.core/shipments', tags=[], badges=[])
+        self.proxy.create_document(data=[table], index='table_search_index')
+        self.assertEqual(self._search_names('shipments'), ['shipments'])
+
+        self.proxy.delete_document(data=['hive://gold.core/shipments'], index='table_search_index')
+        self.assertEqual(self._search_names('shipments'), [])
+
+    def test_suggest(self) -> None:
+        suggestions = self.proxy.suggest(prefix='ord', resource_types=[Resource.TABLE, Resource.USER], size=5)
+        self.assertEqual(suggestions, {
+            'table': [{'key': 'hive://gold.core/orders', 'name': 'orders', 'score': 10.0},
+                      {'key': 'hive://gold.core/order_items', 'name': 'order_items', 'score': 0.0}],
+            'user': [],
+        })
+
+        # names are completed from any of their words, and keys from their beginning
+        self.assertEqual(self._suggest_names('items'), ['order_items'])
+        self.assertEqual(self._suggest_names('hive://gold.core/c'), ['customers'])
+        # the most used resources are suggested first
+        self.assertEqual(self._suggest_names('hive', size=2), ['customers', 'orders'])
+
+        self.proxy.delete_documents(resource_type=Resource.TABLE, keys=['hive://gold.core/orders'])
+        self.assertEqual(self._suggest_names('ord'), ['order_items'])
+
+    def test_search_benchmark(self) -> None:
+        words = ['order', 'customer', 'payment', 'invoice', 'shipment', 'account', 'event', 'session', 'daily',
+                 'summary', 'raw', 'clean', 'dim', 'fact', 'agg', 'user', 'product', 'inventory']
+        rng = random.Random(0)
+        proxy = InMemorySearchProxy()
+
+        start = time.perf_counter()
+        proxy.add_documents(resource_type=Resource.TABLE, documents=(
+            _table_document(f'{"_".join(rng.sample(words, 3))}_{i}',
+                            description=' '.join(rng.sample(words, 6)),
+                            column_names=[f'{word}_id' for word in rng.sample(words, 10)],
+                            total_usage=rng.randint(0, 1000))
+            for i in range(5000)))
+        index_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for query_term in ['order', 'custmer payment', 'daily summary', 'inventry']:
+            result = proxy.search(query_term=query_term,
+                                  page_index=0,
+                                  results_per_page=10,
+                                  resource_types=[Resource.TABLE],
+                                  filters=[],
+                                  highlight_options={}).results['table']
+            self.assertEqual(len(result['results']), 10)
+        search_duration = time.perf_counter() - start
+
+        LOGGER.info('Indexed 5000 tables in %.2fs, ran 4 searches in %.2fs', index_duration, search_duration)
@@ -0,0 +1,172 @@
+# Copyright Contributors to the Amundsen project.
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+from http import HTTPStatus
+from typing import cast
+from unittest.mock import MagicMock, patch
+
+from amundsen_common.models.search import (
+    Filter, HighlightOptions, SearchResponse,
+)
+
+from search_service import create_app
+from search_service.proxy import search_result_cache
+from search_service.proxy.es_proxy_utils import Resource
+from search_service.proxy.search_result_cache import SearchResultCache, get_search_cache_key
+
+
+class TestSearchResultCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='search_service.config.LocalConfig')
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        self.cache = SearchResultCache(max_entries=2, ttl_sec=60)
+
+    def tearDown(self) -> None:
+        self.app_context.pop()
+
+    def test_lru_eviction(self) -> None:
+        self.cache.put('a', version=1, value='result_a')
+        self.cache.put('b', version=1, value='result_b')
+        self.assertEqual(self.cache.get('a', version=1), 'result_a')
+
+        # 'b' is the least recently used entry
+        self.cache.put('c', version=1, value='result_c')
+        self.assertIsNone(self.cache.get('b', version=1))
+        self.assertEqual(self.cache.get('a', version=1), 'result_a')
+        self.assertEqual(self.cache.get('c', version=1), 'result_c')
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['hits'], 3)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hit_rate'], 0.75)
+
+    def test_expiry(self) -> None:
+        with patch.object(search_result_cache.time, 'monotonic', return_value=0):
+            self.cache.put('a', version=1, value='result_a')
+        with patch.object(search_result_cache.time, 'monotonic', return_value=59):
+            self.assertEqual(self.cache.get('a', version=1), 'result_a')
+        with patch.object(search_result_cache.time, 'monotonic', return_value=61):
+            self.assertIsNone(self.cache.get('a', version=1))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_version_mismatch(self) -> None:
+        self.cache.put('a', version=1, value='result_a')
+        self.assertIsNone(self.cache.get('a', version=2))
+        self.assertIsNone(self.cache.get('a', version=1))
+
+    def test_clear(self) -> None:
+        self.cache.put('a', version=1, value='result_a')
+        self.cache.clear()
+        self.assertIsNone(self.cache.get('a', version=1))
+        self.assertEqual(self.cache.stats()['invalidations'], 1)
+
+    def test_cache_key(self) -> None:
+        key = get_search_cache_key(query_term='foo',
+                                   page_index=0,
+                                   results_per_page=10,
+                                   resource_types=[Resource.TABLE, Resource.USER],
+                                   filters=[Filter(name='schema', values=['b', 'a'], operation='OR'),
+                                            Filter(name='database', values=['hive'], operation='OR')],
+                                   highlight_options={Resource.TABLE: HighlightOptions(enable_highlight=True),
+                                                      Resource.USER: HighlightOptions(enable_highlight=False)})
+        same_key = get_search_cache_key(query_term='foo',
+                                        page_index=0,
+                                        results_per_page=10,
+                                        resource_types=[Resource.USER, Resource.TABLE],
+                                        filters=[Filter(name='database', values=['hive'], operation='OR'),
+                                                 Filter(name='schema', values=['a', 'b'], operation='OR')],
+                                        highlight_options={Resource.TABLE: HighlightOptions(enable_highlight=True)})
+        other_page_key = get_search_cache_key(query_term='foo',
+                                              page_index=1,
+                                              results_per_page=10,
+                                              resource_types=[Resource.TABLE, Resource.USER],
+                                              filters=[],
+                                              highlight_options={})
+        self.assertEqual(key, same_key)
+        self.assertEqual(hash(key), hash(same_key))
+        self.assertNotEqual(key, other_page_key)
+
+
+class TestSearchResultCacheAPI(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = create_app(config_module_class='search_service.config.LocalConfig')
+        self.app.config['SEARCH_RESULT_CACHE_MAX_ENTRIES'] = 10
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        self.client = self.app.test_client()
+        search_result_cache._search_result_cache = None
+
+        self.mock_proxy = MagicMock()
+        self.mock_proxy.alias_registry.version = 1
+        self.mock_proxy.search.return_value = SearchResponse(msg='Success',
+                                                             page_index=0,
+                                                             results_per_page=10,
+                                                             results={'table': {'results': [], 'total_results': 0}},
+                                                             status_code=200)
+        self.search_request = {
+            'query_term': 'foo',
+            'resource_types': ['table'],
+            'page_index': 0,
+            'results_per_page': 10,
+            'filters': [],
+            'highlight_options': {},
+        }
+
+    def tearDown(self) -> None:
+        search_result_cache._search_result_cache = None
+        self.app_context.pop()
+
+    def _search(self) -> dict:
+        with patch('search_service.api.search.get_proxy_client', return_value=self.mock_proxy):
+            response = self.client.post('/v2/search', json=self.search_request)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return cast(dict, response.json)
+
+    def test_search_results_are_cached(self) -> None:
+        first = self._search()
+        self.assertEqual(self._search(), first)
+        self.assertEqual(self.mock_proxy.search.call_count, 1)
+
+        # a new index swapped in behind the alias invalidates the cached results
+        self.mock_proxy.alias_registry.version = 2
+        self._search()
+        self.assertEqual(self.mock_proxy.search.call_count, 2)
+
+        stats = cast(dict, self.client.get('/v2/search/cache').json)
+        self.assertTrue(stats['enabled'])
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+
+    def test_failed_searches_are_not_cached(self) -> None:
+        self.mock_proxy.search.return_value.status_code = 500
+        self._search()
+        self._search()
+        self.assertEqual(self.mock_proxy.search.call_count, 2)
+
+    def test_document_update_invalidates_cache(self) -> None:
+        self.mock_proxy.update_document_by_key.return_value = 'Updated'
+        self._search()
+        with patch('search_service.api.document_update.get_proxy_client', return_value=self.mock_proxy):
+            response = self.client.post('/v2/document', json={'resource_key': 'key',
+                                                              'resource_type': 'table',
+                                                              'field': 'tags',
+                                                              'value': 'tag',
+                                                              'operation': 'add'})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self._search()
+        self.assertEqual(self.mock_proxy.search.call_count, 2)
+
+    def test_cache_disabled(self) -> None:
+        self.app.config['SEARCH_RESULT_CACHE_MAX_ENTRIES'] = 0
+        self._search()
+        self._search()
+        self.assertEqual(self.mock_proxy.search.call_count, 2)
+        self.assertEqual(self.client.get('/v2/search/cache').json, {'enabled': False})
+
+
+if __name__ == '__main__':
+    unittest.main()
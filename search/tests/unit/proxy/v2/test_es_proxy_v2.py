@@ -2,9 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from amundsen_common.models.search import Filter
+from amundsen_common.models.search import Filter, UpdateDocumentRequest
 
 from search_service import create_app
 from search_service.proxy.es_proxy_v2 import ElasticsearchProxyV2, Resource
@@ -31,6 +31,7 @@ class TestElasticsearchProxyV2(unittest.TestCase):
             client=mock_elasticsearch_client,
             page_size=10,
         )
+        self.mock_elasticsearch_client = mock_elasticsearch_client
 
     def test_build_elasticsearch_query_term_filters(self) -> None:
         actual = self.es_proxy._build_elasticsearch_query(
@@ -73,3 +74,258 @@ class TestElasticsearchProxyV2(unittest.TestCase):
         )
         expected = FILTER_QUERY
         self.assertDictEqual(actual.to_dict(), expected)
+
+    def test_update_document_by_key(self) -> None:
+        mock_update_by_query = self.mock_elasticsearch_client.update_by_query
+        mock_update_by_query.return_value = {"total": 1, "version_conflicts": 0, "failures": []}
+
+        msg = self.es_proxy.update_document_by_key(
+            resource_key="mock_key", resource_type=Resource.TABLE, field="tag", value="pii", operation="add"
+        )
+
+        self.assertEqual(msg, "ES document field tag for mock_key with value pii was updated successfully")
+        mock_update_by_query.assert_called_once()
+        call_kwargs = mock_update_by_query.call_args[1]
+        self.assertEqual(call_kwargs["index"], "table_search_index")
+        self.assertEqual(call_kwargs["conflicts"], "proceed")
+        self.assertEqual(call_kwargs["body"]["query"], {"term": {"key": "mock_key"}})
+        self.assertEqual(
+            call_kwargs["body"]["script"]["params"], {"field": "tags", "value": "pii", "operation": "add"}
+        )
+
+    def test_update_document_by_key_retries_conflicts(self) -> None:
+        mock_update_by_query = self.mock_elasticsearch_client.update_by_query
+        mock_update_by_query.side_effect = [
+            {"total": 1, "version_conflicts": 1, "failures": []},
+            {"total": 1, "version_conflicts": 0, "failures": []},
+        ]
+
+        msg = self.es_proxy.delete_document_by_key(
+            resource_key="mock_key", resource_type=Resource.FEATURE, field="badges", value="pii"
+        )
+
+        self.assertIn("was deleted successfully", msg)
+        self.assertEqual(mock_update_by_query.call_count, 2)
+        self.assertEqual(mock_update_by_query.call_args[1]["body"]["script"]["params"]["operation"], "delete")
+
+    def test_delete_document_by_key_empty_value(self) -> None:
+        mock_update_by_query = self.mock_elasticsearch_client.update_by_query
+        mock_update_by_query.return_value = {"total": 1, "version_conflicts": 0, "failures": []}
+
+        for value in (None, ""):
+            self.es_proxy.delete_document_by_key(
+                resource_key="mock_key", resource_type=Resource.TABLE, field="tag", value=value
+            )
+
+            # as before the updates were made server side, the whole list is cleared
+            self.assertEqual(
+                mock_update_by_query.call_args[1]["body"]["script"]["params"],
+                {"field": "tags", "value": None, "operation": "delete"}
+            )
+
+    def test_update_document_by_key_not_found(self) -> None:
+        self.mock_elasticsearch_client.update_by_query.return_value = {
+            "total": 0, "version_conflicts": 0, "failures": []
+        }
+
+        msg = self.es_proxy.update_document_by_key(
+            resource_key="missing_key", resource_type=Resource.TABLE, field="tag", value="pii"
+        )
+
+        self.assertIn("Requested key missing_key query returned no results in ES", msg)
+
+    def test_update_documents_by_key(self) -> None:
+        mock_client = self.mock_elasticsearch_client
+        mock_client.msearch.return_value = {
+            "responses": [
+                {
+                    "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+                    "timed_out": False,
+                    "hits": {
+                        "total": {"value": 2, "relation": "eq"},
+                        "hits": [
+                            {"_index": "table_index_1", "_id": "id_1", "_source": {"key": "key_1"}},
+                            {"_index": "table_index_1", "_id": "id_2", "_source": {"key": "key_2"}},
+                        ],
+                    },
+                }
+            ]
+        }
+        mock_client.bulk.return_value = {"errors": False, "items": []}
+
+        msg = self.es_proxy.update_documents_by_key(updates=[
+            UpdateDocumentRequest(resource_key="key_1", resource_type="table", field="tag", value="a",
+                                  operation="add"),
+            UpdateDocumentRequest(resource_key="key_2", resource_type="table", field="tag", value="b",
+                                  operation="delete"),
+            UpdateDocumentRequest(resource_key="key_1", resource_type="table", field="tag", value="c",
+                                  operation="overwrite"),
+        ])
+
+        self.assertEqual(msg, "3 ES document fields were updated successfully")
+        mock_client.msearch.assert_called_once()
+        mock_client.bulk.assert_called_once()
+        actions = mock_client.bulk.call_args[1]["body"]
+        self.assertEqual(len(actions), 6)
+        self.assertEqual(actions[0], {"update": {"_index": "table_index_1", "_id": "id_1", "retry_on_conflict": 3}})
+        self.assertEqual(actions[3]["script"]["params"], {"field": "tags", "value": "b", "operation": "delete"})
+        self.assertEqual(actions[4]["update"]["_id"], "id_1")
+
+    def test_update_documents_by_key_missing_key(self) -> None:
+        mock_client = self.mock_elasticsearch_client
+        mock_client.msearch.return_value = {
+            "responses": [
+                {
+                    "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+                    "timed_out": False,
+                    "hits": {"total": {"value": 0, "relation": "eq"}, "hits": []},
+                }
+            ]
+        }
+
+        msg = self.es_proxy.update_documents_by_key(updates=[
+            UpdateDocumentRequest(resource_key="key_1", resource_type="feature", field="tags", value="a",
+                                  operation="add"),
+        ])
+
+        self.assertIn("Failed to update 1 of 1 ES document fields", msg)
+        mock_client.bulk.assert_not_called()
+
+    def _mock_search_after_response(self, keys: list, pit_id: str) -> dict:
+        return {
+            "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+            "timed_out": False,
+            "pit_id": pit_id,
+            "hits": {
+                "total": {"value": 3, "relation": "eq"},
+                "hits": [
+                    {"_index": "feature_index", "_id": key, "_score": 1.0, "sort": [1.0, i],
+                     "_source": {"key": key, "feature_name": key}}
+                    for i, key in enumerate(keys)
+                ],
+            },
+        }
+
+    def test_search_page(self) -> None:
+        mock_client = self.mock_elasticsearch_client
+        mock_client.open_point_in_time.return_value = {"id": "pit_1"}
+        mock_client.search.side_effect = [
+            self._mock_search_after_response(["key_1", "key_2"], pit_id="pit_2"),
+            self._mock_search_after_response(["key_3"], pit_id="pit_3"),
+        ]
+
+        first_page = self.es_proxy.search_page(
+            query_term="mock_feature", resource_type=Resource.FEATURE, filters=[], results_per_page=2
+        )
+        self.assertEqual([r["key"] for r in first_page["results"]], ["key_1", "key_2"])
+        self.assertEqual(first_page["total_results"], 3)
+        self.assertIsNotNone(first_page["cursor"])
+        mock_client.open_point_in_time.assert_called_once_with(index="feature_search_index", keep_alive="1m")
+
+        first_body = mock_client.search.call_args_list[0][1]["body"]
+        self.assertEqual(first_body["pit"], {"id": "pit_1", "keep_alive": "1m"})
+        self.assertEqual(first_body["sort"], ["_score", {"_shard_doc": "asc"}])
+        self.assertNotIn("search_after", first_body)
+
+        second_page = self.es_proxy.search_page(
+            query_term="mock_feature",
+            resource_type=Resource.FEATURE,
+            filters=[],
+            results_per_page=2,
+            cursor=first_page["cursor"],
+        )
+        self.assertEqual([r["key"] for r in second_page["results"]], ["key_3"])
+        self.assertIsNone(second_page["cursor"])
+
+        second_body = mock_client.search.call_args_list[1][1]["body"]
+        self.assertEqual(second_body["pit"]["id"], "pit_2")
+        self.assertEqual(second_body["search_after"], [1.0, 1])
+        # the point in time is only opened for the first page, and closed after the last one
+        mock_client.open_point_in_time.assert_called_once()
+        mock_client.close_point_in_time.assert_called_once_with(body={"id": "pit_3"})
+
+    def test_search_page_invalid_cursor(self) -> None:
+        with self.assertRaises(ValueError):
+            self.es_proxy.search_page(
+                query_term="", resource_type=Resource.TABLE, filters=[], results_per_page=2, cursor="foo"
+            )
+
+    def test_export_search_results(self) -> None:
+        mock_client = self.mock_elasticsearch_client
+        mock_client.open_point_in_time.return_value = {"id": "pit_1"}
+        mock_client.search.side_effect = [
+            self._mock_search_after_response(["key_1", "key_2"], pit_id="pit_1"),
+            self._mock_search_after_response(["key_3"], pit_id="pit_1"),
+        ]
+
+        with patch.object(ElasticsearchProxyV2, "EXPORT_BATCH_SIZE", 2):
+            results = self.es_proxy.export_search_results(
+                query_term="mock_feature", resource_type=Resource.FEATURE, filters=[]
+            )
+            self.assertEqual([r["key"] for r in results], ["key_1", "key_2", "key_3"])
+
+        self.assertEqual(mock_client.search.call_count, 2)
+        self.assertEqual(mock_client.search.call_args_list[1][1]["body"]["size"], 2)
+        mock_client.close_point_in_time.assert_called_once_with(body={"id": "pit_1"})
+
+    def _mock_suggest_response(self, options: list) -> dict:
+        return {
+            "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+            "timed_out": False,
+            "hits": {"total": {"value": 0, "relation": "eq"}, "hits": []},
+            "suggest": {"completions": [{"text": "ord", "offset": 0, "length": 3, "options": options}]},
+            "status": 200,
+        }
+
+    def test_suggest(self) -> None:
+        mock_client = self.mock_elasticsearch_client
+        mock_client.msearch.return_value = {"responses": [
+            self._mock_suggest_response([
+                {"text": "orders", "_score": 1.0, "_source": {"name": "orders", "key": "k1"}},
+                {"text": "order_items", "_score": 1.0,
+                 "_source": {"name": "order_items", "key": "k2", "total_usage": 50}},
+                {"text": "order_log", "_score": 1.0,
+                 "_source": {"name": "order_log", "key": "k3", "total_usage": 5}},
+            ]),
+            self._mock_suggest_response([
+                {"text": "Ord Ina", "_score": 1.0, "_source": {"full_name": "Ord Ina", "email": "ord@example.com"}},
+            ]),
+        ]}
+
+        suggestions = self.es_proxy.suggest(prefix="ord", resource_types=[Resource.TABLE, Resource.USER], size=2)
+
+        # the unweighted completions are ordered by usage
+        self.assertEqual(suggestions, {
+            "table": [{"key": "k2", "name": "order_items", "score": 50},
+                      {"key": "k3", "name": "order_log", "score": 5}],
+            "user": [{"key": "ord@example.com", "name": "Ord Ina", "score": 0}],
+        })
+
+        body = mock_client.msearch.call_args[1]["body"]
+        self.assertEqual(body[0], {"index": ["table_search_index"]})
+        self.assertEqual(body[1]["size"], 0)
+        self.assertEqual(body[1]["suggest"]["completions"],
+                         {"text": "ord", "completion": {"field": "name.suggest", "size": 8}})
+        self.assertEqual(body[3]["suggest"]["completions"]["completion"]["field"], "full_name.suggest")
+        self.assertEqual(mock_client.msearch.call_args[1]["request_timeout"], 1.0)
+
+    def test_suggest_failure(self) -> None:
+        self.mock_elasticsearch_client.msearch.side_effect = Exception("mock_failure")
+
+        self.assertEqual(self.es_proxy.suggest(prefix="ord", resource_types=[Resource.TABLE], size=5), {"table": []})
+        self.assertEqual(self.es_proxy.suggest(prefix="", resource_types=[Resource.TABLE], size=5), {"table": []})
+
+    def test_query_templates(self) -> None:
+        filters = [Filter(name="tag", values=["tag_*"], operation="AND"),
+                   Filter(name="badges", values=["pii", "beta"], operation="OR")]
+        for resource in [Resource.TABLE, Resource.DASHBOARD, Resource.FEATURE, Resource.USER]:
+            for query_term in ["mock_term", ""]:
+                self.assertEqual(
+                    self.es_proxy._build_query_dict(resource=resource, query_term=query_term, filters=filters),
+                    self.es_proxy._build_elasticsearch_query(resource=resource, query_term=query_term,
+                                                             filters=filters).to_dict())
+
+        with patch.object(ElasticsearchProxyV2, "USE_QUERY_TEMPLATES", False), \
+                patch.object(ElasticsearchProxyV2, "_get_query_template") as mock_get_query_template:
+            self.es_proxy._build_query_dict(resource=Resource.TABLE, query_term="mock_term", filters=[])
+            mock_get_query_template.assert_not_called()
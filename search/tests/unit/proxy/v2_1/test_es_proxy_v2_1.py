@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from amundsen_common.models.search import Filter, HighlightOptions
 from elasticsearch_dsl import Search
@@ -108,3 +108,135 @@ class TestElasticsearchProxyV2_1(unittest.TestCase):
         }
 
         self.assertDictEqual(actual, expected)
+
+    def test_search_round_trips(self) -> None:
+        """
+        Counts the round trips to a stubbed cluster per search: aliases are fetched once, then every search is
+        a single multi search
+        """
+        self.mock_elasticsearch_client.indices.get_alias.reset_mock()
+        self.mock_elasticsearch_client.indices.get_alias.return_value = {
+            'table_search_index_1': {'aliases': {'table_search_index_v2_1': {}}},
+            'user_search_index_1': {'aliases': {'user_search_index_v2_1': {}}},
+        }
+        empty_response = {'_shards': {'total': 1, 'successful': 1, 'failed': 0},
+                          'timed_out': False, 'hits': {'total': {'value': 0}, 'hits': []}, 'status': 200}
+        self.mock_elasticsearch_client.msearch.return_value = {'responses': [empty_response, empty_response]}
+
+        searches = 10
+        for _ in range(searches):
+            response = self.es_proxy.search(query_term='mock_table',
+                                            page_index=0,
+                                            results_per_page=10,
+                                            resource_types=[],
+                                            filters=[],
+                                            highlight_options={})
+            self.assertEqual(response.status_code, 200)
+
+        round_trips = self.mock_elasticsearch_client.indices.get_alias.call_count \
+            + self.mock_elasticsearch_client.msearch.call_count
+        self.assertEqual(self.mock_elasticsearch_client.indices.get_alias.call_count, 1)
+        self.assertEqual(self.mock_elasticsearch_client.msearch.call_count, searches)
+        self.assertEqual(round_trips / searches, 1.1)
+        self.mock_elasticsearch_client.cat.aliases.assert_not_called()
+
+        # only the resources with an index are searched
+        body = self.mock_elasticsearch_client.msearch.call_args[1]['body']
+        self.assertEqual([header['index'] for header in body[::2]],
+                         [['table_search_index_v2_1'], ['user_search_index_v2_1']])
+
+    def test_search_failure_invalidates_aliases(self) -> None:
+        self.mock_elasticsearch_client.indices.get_alias.reset_mock()
+        self.mock_elasticsearch_client.indices.get_alias.return_value = {
+            'table_search_index_1': {'aliases': {'table_search_index_v2_1': {}}},
+        }
+        self.mock_elasticsearch_client.msearch.side_effect = Exception('index_not_found_exception')
+
+        for _ in range(2):
+            self.es_proxy.search(query_term='mock_table',
+                                 page_index=0,
+                                 results_per_page=10,
+                                 resource_types=[Resource.TABLE],
+                                 filters=[],
+                                 highlight_options={})
+
+        self.assertEqual(self.mock_elasticsearch_client.indices.get_alias.call_count, 2)
+
+    def test_suggest(self) -> None:
+        self.mock_elasticsearch_client.indices.get_alias.return_value = {
+            'table_search_index_1': {'aliases': {'table_search_index_v2_1': {}}},
+        }
+        self.mock_elasticsearch_client.msearch.return_value = {'responses': [{
+            '_shards': {'total': 1, 'successful': 1, 'failed': 0},
+            'timed_out': False,
+            'hits': {'total': {'value': 0}, 'hits': []},
+            'suggest': {'completions': [{'text': 'ord', 'offset': 0, 'length': 3, 'options': [
+                {'text': 'orders', '_score': 40.0, '_source': {'name': 'orders', 'key': 'k1'}},
+                {'text': 'order_items', '_score': 3.0, '_source': {'name': 'order_items', 'key': 'k2'}},
+            ]}]},
+            'status': 200,
+        }]}
+
+        suggestions = self.es_proxy.suggest(prefix='ord', resource_types=[], size=5)
+
+        # completions are weighted by usage at index time, and resources without an index are not suggested
+        self.assertEqual(suggestions, {
+            'table': [{'key': 'k1', 'name': 'orders', 'score': 40.0},
+                      {'key': 'k2', 'name': 'order_items', 'score': 3.0}],
+            'dashboard': [],
+            'feature': [],
+            'user': [],
+        })
+        body = self.mock_elasticsearch_client.msearch.call_args[1]['body']
+        self.assertEqual(body[0], {'index': ['table_search_index_v2_1']})
+        self.assertEqual(body[1]['suggest']['completions']['completion'], {'field': 'suggest', 'size': 5})
+        self.assertEqual(body[1]['_source'], ['name', 'key'])
+
+    def test_query_templates(self) -> None:
+        filters = [Filter(name='tag', values=['tag_*', 'tag_2'], operation='AND'),
+                   Filter(name='badges', values=['pii'], operation='OR')]
+        for resource in Resource:
+            for query_term in ['mock_table', 'with "quotes" and \\backslashes\\', '']:
+                # filling in the template gives the same query as building it from DSL objects
+                self.assertEqual(
+                    self.es_proxy._build_query_dict(resource=resource, query_term=query_term, filters=filters),
+                    self.es_proxy._build_elasticsearch_query(resource=resource, query_term=query_term,
+                                                             filters=filters).to_dict())
+
+            highlight = self.es_proxy._get_highlight_template(resource)
+            self.assertEqual(highlight, self.es_proxy._search_highlight(
+                resource=resource,
+                search=Search(),
+                highlight_options={resource: HighlightOptions(enable_highlight=True)}).to_dict()['highlight'])
+
+        # templates are only built once
+        with patch.object(ElasticsearchProxyV2_1, '_build_must_query') as mock_build_must_query:
+            self.es_proxy._build_query_dict(resource=Resource.TABLE, query_term='foo', filters=[])
+            mock_build_must_query.assert_not_called()
+
+    def test_search_body(self) -> None:
+        self.mock_elasticsearch_client.indices.get_alias.return_value = {
+            'table_search_index_1': {'aliases': {'table_search_index_v2_1': {}}},
+        }
+        self.mock_elasticsearch_client.msearch.return_value = {'responses': [
+            {'_shards': {'total': 1, 'successful': 1, 'failed': 0},
+             'timed_out': False, 'hits': {'total': {'value': 0}, 'hits': []}, 'status': 200}]}
+
+        with patch('search_service.proxy.es_proxy_v2_1.json.dumps') as mock_dumps:
+            self.es_proxy.search(query_term='mock_table',
+                                 page_index=2,
+                                 results_per_page=5,
+                                 resource_types=[Resource.TABLE],
+                                 filters=[],
+                                 highlight_options={Resource.TABLE: HighlightOptions(enable_highlight=True)})
+            # the search is only serialized for logging when debug logging is on
+            mock_dumps.assert_not_called()
+
+        body = self.mock_elasticsearch_client.msearch.call_args[1]['body']
+        expected_search = Search().query(
+            self.es_proxy._build_elasticsearch_query(resource=Resource.TABLE, query_term='mock_table', filters=[]))
+        expected_search = self.es_proxy._search_highlight(
+            resource=Resource.TABLE,
+            search=expected_search,
+            highlight_options={Resource.TABLE: HighlightOptions(enable_highlight=True)})[10:15]
+        self.assertEqual(body, [{'index': ['table_search_index_v2_1']}, expected_search.to_dict()])